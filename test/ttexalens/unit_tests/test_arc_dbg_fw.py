@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+import struct
+import unittest
+
+from test.ttexalens.unit_tests.test_base import init_cached_test_context
+from ttexalens import tt_exalens_lib as lib
+from ttexalens.hardware.arc_dbg_fw import (
+    LOG_HEADER_SIZE,
+    NUM_LOG_CALLS_OFFSET,
+    ArcDbgFwLogReader,
+    arc_dbg_fw_get_buffer_start_addr,
+)
+
+
+class TestArcDbgFwLogReader(unittest.TestCase):
+    """Fills the log buffer in DRAM the way the firmware does and reads it back."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.context = init_cached_test_context()
+
+    def setUp(self):
+        # Header + 4 entries of two words.
+        self.reader = ArcDbgFwLogReader(("id", "value"), LOG_HEADER_SIZE + 4 * 8, context=self.context)
+        self.log_calls = 0
+        self._write_count()
+
+    def _write_count(self):
+        lib.write_to_device("ch0", NUM_LOG_CALLS_OFFSET, struct.pack("<I", self.log_calls), context=self.context)
+
+    def _log(self, count: int):
+        for _ in range(count):
+            slot = self.log_calls % self.reader.capacity
+            address = arc_dbg_fw_get_buffer_start_addr() + LOG_HEADER_SIZE + slot * 8
+            lib.write_to_device(
+                "ch0", address, struct.pack("<II", self.log_calls, self.log_calls * 10), context=self.context
+            )
+            self.log_calls += 1
+        self._write_count()
+
+    def test_poll_reads_only_new_entries(self):
+        self.assertEqual(self.reader.capacity, 4)
+        self._log(3)
+        entries = self.reader.poll()
+        self.assertEqual([entry.index for entry in entries], [0, 1, 2])
+        self.assertEqual(entries[2].values, {"id": 2, "value": 20})
+        self.assertEqual(self.reader.poll(), [])
+
+        # Wraps around the end of the ring.
+        self._log(3)
+        entries = self.reader.poll()
+        self.assertEqual([entry.values["id"] for entry in entries], [3, 4, 5])
+        self.assertEqual(self.reader.dropped_count, 0)
+
+    def test_overwritten_entries_are_dropped(self):
+        self._log(7)
+        entries = self.reader.poll()
+        self.assertEqual([entry.values["id"] for entry in entries], [3, 4, 5, 6])
+        self.assertEqual(self.reader.dropped_count, 3)
+
+    def test_restart_and_seek_to_end(self):
+        self._log(2)
+        self.reader.seek_to_end()
+        self.assertEqual(self.reader.poll(), [])
+        # Logging set up again: the counter starts from zero.
+        self.log_calls = 0
+        self._log(1)
+        self.assertEqual([entry.values["id"] for entry in self.reader.poll()], [0])
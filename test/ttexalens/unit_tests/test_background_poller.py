@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from ttexalens.background_poller import BackgroundPoller
+from ttexalens.exceptions import HardwareError, TTException
+
+
+class CountingPoller(BackgroundPoller):
+    def __init__(self, interval: float = 0.001, max_workers: int = 1, fail_after: int | None = None):
+        super().__init__("Counting poller", interval, max_workers)
+        self.fail_after = fail_after
+        self.events: list[str] = []
+        self.worker_threads: set[str] = set()
+
+    def _on_start(self) -> None:
+        self.events.append("start")
+
+    def _on_stop(self) -> None:
+        self.events.append("stop")
+
+    def _sweep(self) -> None:
+        if self.fail_after is not None and self._sweep_count >= self.fail_after:
+            raise HardwareError("device is gone")
+        self._map(lambda _: self.worker_threads.add(threading.current_thread().name), range(4))
+        self._sweep_count += 1
+
+
+class TestBackgroundPoller(unittest.TestCase):
+    def test_run_on_calling_thread(self):
+        poller = CountingPoller(interval=0).run(5)
+        self.assertEqual(poller.sweep_count, 5)
+        self.assertFalse(poller.is_running)
+
+    def test_start_and_stop(self):
+        with CountingPoller() as poller:
+            self.assertTrue(poller.is_running)
+            with self.assertRaises(TTException):
+                poller.start()
+            deadline = time.monotonic() + 5
+            while poller.sweep_count < 3 and time.monotonic() < deadline:
+                time.sleep(0.001)
+            self.assertGreaterEqual(poller.sweep_count, 3)
+        self.assertFalse(poller.is_running)
+        self.assertEqual(poller.events, ["start", "stop"])
+
+    def test_hardware_error_stops_thread(self):
+        poller = CountingPoller(fail_after=2)
+        with patch("ttexalens.util.ERROR"):
+            poller.start()
+            assert poller._thread is not None
+            poller._thread.join(timeout=5)
+        self.assertFalse(poller.is_running)
+        self.assertIsInstance(poller.error, HardwareError)
+        self.assertEqual(poller.sweep_count, 2)
+        poller.stop()
+
+    def test_executor_is_kept_across_sweeps(self):
+        poller = CountingPoller(interval=0, max_workers=2).run(10)
+        # Threads of one pool are reused, so ten sweeps run on at most two workers.
+        self.assertLessEqual(len(poller.worker_threads), 2)
+        self.assertTrue(all(name.startswith("ttexalens-counting-poller") for name in poller.worker_threads))
+        poller.stop()
+        self.assertIsNone(poller._executor)
+
+    def test_failed_read_is_reported_once(self):
+        poller = CountingPoller()
+        with patch("ttexalens.util.WARN") as warn:
+            for _ in range(3):
+                poller._report_failed_read("key", "read failed")
+            poller._report_failed_read("other key", "other read failed")
+        self.assertEqual(warn.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+import os
+import tempfile
+import unittest
+
+from test.ttexalens.unit_tests.test_base import get_parsed_elf_file, init_cached_test_context
+from ttexalens import tt_exalens_lib as lib
+from ttexalens.core_dump import CoreDump, CoreDumpRiscDebug, capture_core_dump, load_core_dump
+from ttexalens.coordinate import OnChipCoordinate
+from ttexalens.elf_loader import ElfLoader
+from ttexalens.exceptions import TTException
+from ttexalens.register_store import ConfigurationRegisterDescription
+from ttexalens.tt_exalens_init import set_active_context
+
+
+class TestCoreDumpFile(unittest.TestCase):
+    def test_rejects_other_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "not_a_dump")
+            with open(file_name, "wb") as f:
+                f.write(os.urandom(256))
+            with self.assertRaises(TTException):
+                CoreDump(file_name)
+
+
+class TestCoreDump(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.context = init_cached_test_context()
+        cls.device = cls.context.devices[0]
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.file_name = os.path.join(cls.directory.name, "device0.ttxdump")
+
+        cls.address = 0x1000
+        cls.data = os.urandom(64)
+        lib.write_to_device("0,0", cls.address, cls.data, context=cls.context)
+        capture_core_dump(cls.file_name, ["0,0"], blocks=["l1"], context=cls.context)
+        cls.replay = load_core_dump(cls.file_name)
+        set_active_context(cls.context)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.replay.close()
+        cls.directory.cleanup()
+
+    def test_memory(self):
+        self.assertEqual(lib.read_from_device("0,0", self.address, num_bytes=64, context=self.replay), self.data)
+        with self.assertRaises(TTException):
+            lib.write_to_device("0,0", self.address, b"\x00", context=self.replay)
+        # Only L1 of 0,0 was captured.
+        with self.assertRaises(TTException):
+            lib.read_from_device("1,0", self.address, context=self.replay)
+
+    def test_riscs(self):
+        location = OnChipCoordinate.create("0,0", device=self.device)
+        replay_location = OnChipCoordinate.create("0,0", device=self.replay.devices[0])
+        for risc_debug in location.noc_block.all_riscs:
+            risc_name = risc_debug.risc_location.risc_name
+            replay_risc_debug = replay_location.noc_block.get_risc_debug(risc_name)
+            self.assertIsInstance(replay_risc_debug, CoreDumpRiscDebug)
+            self.assertEqual(replay_risc_debug.is_in_reset(), risc_debug.is_in_reset())
+            with self.assertRaises(TTException):
+                replay_risc_debug.halt()
+            if not replay_risc_debug.is_in_reset() and risc_debug.can_debug():
+                state = replay_risc_debug.state
+                assert state is not None
+                self.assertEqual(replay_risc_debug.read_gpr(32), state.pc)
+                buffer = bytearray(16)
+                replay_risc_debug.read_memory_bytes(self.address, buffer)
+                self.assertEqual(buffer, self.data[:16])
+
+    def test_config_registers(self):
+        location = OnChipCoordinate.create("0,0", device=self.device)
+        replay_location = OnChipCoordinate.create("0,0", device=self.replay.devices[0])
+        register_store = location.noc_block.get_register_store()
+        replay_register_store = replay_location.noc_block.get_register_store()
+        names = [
+            name
+            for name, register in register_store.registers.items()
+            if isinstance(register, ConfigurationRegisterDescription)
+        ][:8]
+        for name in names:
+            self.assertEqual(replay_register_store.read_register(name), register_store.read_register(name))
+
+
+class TestCoreDumpOfKernel(unittest.TestCase):
+    """A kernel is halted in a known callstack, dumped, and inspected from the dump only."""
+
+    RECURSION_COUNT = 3
+
+    @classmethod
+    def setUpClass(cls):
+        cls.context = init_cached_test_context()
+        cls.device = cls.context.devices[0]
+        cls.location = OnChipCoordinate.create("0,0", device=cls.device)
+        cls.risc_debug = cls.location.noc_block.get_risc_debug("brisc")
+        arch = str(cls.device._arch).lower()
+        if arch == "wormhole_b0":
+            arch = "wormhole"
+        cls.elf_path = f"build/riscv-src/{arch}/callstack.release.brisc.elf"
+        cls.elf = get_parsed_elf_file(cls.elf_path)
+
+        # The recursion count is read from right after .text, see test_lib.TestCallStack.
+        text_section = cls.elf.get_section_by_name(".text")
+        assert text_section is not None and text_section.address is not None
+        address = text_section.address + text_section.size
+        lib.write_to_device(
+            cls.location, address, cls.RECURSION_COUNT.to_bytes(4, byteorder="little"), context=cls.context
+        )
+        ElfLoader(cls.risc_debug).run_elf(cls.elf)
+
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.file_name = os.path.join(cls.directory.name, "device0.ttxdump")
+        cls.errors = capture_core_dump(cls.file_name, ["0,0"], context=cls.context)
+        cls.replay = load_core_dump(cls.file_name)
+        set_active_context(cls.context)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.risc_debug.set_reset_signal(True)
+        cls.replay.close()
+        cls.directory.cleanup()
+
+    def test_callstack(self):
+        expected = lib.callstack("0,0", self.elf, risc_name="brisc", context=self.context)
+        callstack = lib.callstack("0,0", self.elf_path, risc_name="brisc", context=self.replay)
+        self.assertEqual(len(callstack), self.RECURSION_COUNT + 3)
+        self.assertEqual(callstack[0].function_name, "halt")
+        self.assertEqual(callstack[-1].function_name, "main")
+        self.assertEqual(
+            [(entry.function_name, entry.pc) for entry in callstack],
+            [(entry.function_name, entry.pc) for entry in expected],
+        )
+
+    def test_get_global(self):
+        expected = lib.get_global("0,0", self.elf, "g_MAILBOX", "brisc", context=self.context)
+        mailbox = lib.get_global("0,0", self.elf, "g_MAILBOX", "brisc", context=self.replay)
+        self.assertEqual(mailbox.get_address(), expected.get_address())
+        self.assertEqual(mailbox.read_value(), expected.read_value())
+        with self.assertRaises(TTException):
+            mailbox.write_value(0)
+
+    def test_tensix_state(self):
+        self.assertEqual(
+            lib.get_tensix_state("0,0", context=self.replay), lib.get_tensix_state("0,0", context=self.context)
+        )
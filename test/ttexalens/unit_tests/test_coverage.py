@@ -12,7 +12,7 @@ import tempfile
 from ttexalens import Context, OnChipCoordinate, Device, TTException
 from ttexalens.elf_loader import ElfLoader
 from ttexalens.hardware.risc_debug import RiscDebug
-from ttexalens.coverage import dump_coverage
+from ttexalens.coverage import GcdaFile, dump_coverage, harvest_coverage, merge_gcda
 
 ELFS = ["run_elf_test.coverage", "cov_test.coverage"]  # We only run ELFs that don't halt.
 
@@ -63,6 +63,46 @@ def summarize_gcda(data: bytes) -> tuple[int, int, int]:
     return functions, counters, nonzero
 
 
+def build_gcda(arcs: list[int], runs: int = 1, stamp: int = 0x1234, sum_max: int | None = None) -> bytes:
+    """Build a minimal gcda stream: one function with arc counters and an object summary."""
+    sum_max = max(arcs, default=0) if sum_max is None else sum_max
+    data = struct.pack("<4I", 0x67636461, 0x42323020, stamp, 0x5678)
+    data += struct.pack("<II", 0xA1000000, 8) + struct.pack("<II", runs, sum_max)
+    data += struct.pack("<II", GCOV_TAG_FUNCTION, 12) + struct.pack("<III", 1, 2, 3)
+    if any(arcs):
+        data += struct.pack(f"<Ii{len(arcs)}q", GCOV_TAG_COUNTER_BASE, len(arcs) * 8, *arcs)
+    else:
+        data += struct.pack("<Ii", GCOV_TAG_COUNTER_BASE, -len(arcs) * 8)
+    return data
+
+
+class TestGcdaMerge(unittest.TestCase):
+    def test_roundtrip(self):
+        for arcs in ([1, 0, 5], [0, 0, 0]):
+            data = build_gcda(arcs)
+            self.assertEqual(data, GcdaFile.parse(data).to_bytes())
+
+    def test_merge_adds_arc_counters(self):
+        merged = merge_gcda([build_gcda([1, 0, 5]), build_gcda([0, 0, 0]), build_gcda([2, 3, 0])])
+        self.assertEqual(build_gcda([3, 3, 5], runs=3, sum_max=5 + 0 + 3), merged)
+        self.assertEqual((1, 3, 3), summarize_gcda(merged))
+
+    def test_merge_sums_sum_max(self):
+        merged = merge_gcda([build_gcda([1], sum_max=7), build_gcda([2], runs=2, sum_max=4)])
+        self.assertEqual(build_gcda([3], runs=3, sum_max=11), merged)
+
+    def test_parse_rejects_truncated_data(self):
+        data = build_gcda([1, 0, 5])
+        with self.assertRaises(TTException):
+            GcdaFile.parse(data[:-4])  # counter record cut short
+        with self.assertRaises(TTException):
+            GcdaFile.parse(data + b"\x00\x00")  # trailing bytes
+
+    def test_merge_rejects_different_compilations(self):
+        with self.assertRaises(TTException):
+            merge_gcda([build_gcda([1]), build_gcda([1], stamp=0x4321)])
+
+
 @parameterized_class(
     [
         {"core_desc": "ETH0", "risc_name": "ERISC"},
@@ -201,3 +241,30 @@ class TestCoverage(unittest.TestCase):
             self.assertGreater(functions, 0, f"{gcda}: no function records in coverage data")
             self.assertGreater(counters, 0, f"{gcda}: no counters in coverage data")
             self.assertGreater(nonzero, 0, f"{gcda}: all counters are zero - kernel produced no coverage")
+
+    @parameterized.expand(ELFS)
+    def test_harvest_coverage(self, elf):
+        with tempfile.TemporaryDirectory(prefix="cov_test_") as temp_root:
+            elf_path = self.get_elf_name(elf)
+            elf = get_parsed_elf_file(elf_path)
+            self.loader.run_elf(elf)
+
+            single_gcda = os.path.join(temp_root, "single.gcda")
+            dump_coverage(elf, self.location, single_gcda)
+            with open(single_gcda, "rb") as f:
+                single = GcdaFile.parse(f.read())
+
+            # Reading the same core twice must yield one gcda with every arc counter doubled.
+            harvest_root = os.path.join(temp_root, "harvest")
+            harvest = harvest_coverage([(self.location, elf), (self.location, elf)], harvest_root)
+            self.assertEqual([], harvest.errors)
+            self.assertEqual(1, len(harvest.gcda_files))
+            gcda_path, runs = next(iter(harvest.gcda_files.items()))
+            self.assertEqual(2, runs)
+            self.assertTrue(os.path.exists(gcda_path[:-4] + "gcno"), f"{gcda_path}: gcno was not copied")
+            with open(gcda_path, "rb") as f:
+                merged = GcdaFile.parse(f.read())
+            self.assertEqual(single.stamp, merged.stamp)
+            for (tag, value), (_, merged_value) in zip(single.records, merged.records):
+                if GcdaFile.is_counter_tag(tag):
+                    self.assertEqual([2 * v for v in value], merged_value)
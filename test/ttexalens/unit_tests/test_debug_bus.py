@@ -358,3 +358,39 @@ class TestDebugBus(unittest.TestCase):
                         # single signal
                         single_value = self.debug_bus.read_signal(signal_name)
                         self.assertEqual(first_val, single_value, f"Signal {signal_name} value mismatch.")
+
+    @parameterized.expand(
+        [
+            (1, 3, 2),  # samples_per_buffer, bursts, sampling_interval
+            (16, 4, 10),
+            (64, 2, 2),
+        ]
+    )
+    def test_debug_bus_signal_store_capture_signal_group(self, samples_per_buffer, bursts, sampling_interval):
+        """Continuous capture must decode to the same values as per-sample decoding."""
+        if self.device.is_quasar():
+            self.skipTest("This test does not work on quasar.")
+
+        l1_addr = 0x1000
+        for group in self.debug_bus.group_names:
+            series = self.debug_bus.capture_signal_group(group, l1_addr, samples_per_buffer, bursts, sampling_interval)
+            self.assertEqual(len(series), samples_per_buffer * bursts)
+            self.assertEqual(series.burst_starts, [i * samples_per_buffer for i in range(bursts)])
+            self.assertEqual(len(series.burst_timestamps), bursts)
+            for signal_name, values in series.items():
+                expected = [series.sample(i)[signal_name] for i in range(len(series))]
+                self.assertEqual(values, expected, f"{group}/{signal_name}: column decode mismatch")
+
+    def test_debug_bus_signal_store_stream_signal_group_close(self):
+        """Closing an endless stream stops the armed burst, and the group can be captured again."""
+        if self.device.is_quasar():
+            self.skipTest("This test does not work on quasar.")
+
+        l1_addr = 0x1000
+        group = sorted(self.debug_bus.group_names)[0]
+        stream = self.debug_bus.stream_signal_group(group, l1_addr, samples_per_buffer=16)
+        self.assertEqual(len(next(stream)), 16)
+        stream.close()
+        series = self.debug_bus.capture_signal_group(group, l1_addr, samples_per_buffer=16, bursts=2)
+        self.assertEqual(len(series), 32)
+        self.assertIsInstance(series.raw_data, bytearray)
@@ -10,7 +10,7 @@ from test.ttexalens.unit_tests.core_simulator import RiscvCoreSimulator
 from test.ttexalens.unit_tests.test_base import init_cached_test_context
 from ttexalens import OnChipCoordinate
 from ttexalens.context import Context
-from ttexalens.elf import ElfFile, ElfVariable
+from ttexalens.elf import DwarfDieTag, ElfFile, ElfVariable, read_structured
 from ttexalens.exceptions import RiscHaltError
 from ttexalens.memory_access import MemoryAccess, create_memory_access
 from ttexalens.exceptions import RestrictedMemoryAccessError
@@ -339,6 +339,96 @@ class TestDebugSymbols(unittest.TestCase):
         # Distinct symbols have distinct addresses.
         self.assertNotEqual(addr1, addr2)
 
+    def test_read_structured(self):
+        g_global_struct = self.parsed_elf.get_global("g_global_struct", TestDebugSymbols.mem_access)
+        TestDebugSymbols.mem_access.reset_stats()
+        records = read_structured(g_global_struct)
+        self.assertEqual(1, TestDebugSymbols.mem_access.read_count)
+        self.assertEqual(1, len(records))
+        record = records[0]
+        self.assertEqual(0xAA, record["base_field1"])
+        self.assertEqual(0x04030201, record["packed"])
+        self.assertEqual(0x04, record["v4"])
+        self.assertEqual(0xDDDD, record["bs2_base_field2"])
+        self.assertEqual(0x5566778899AABBCC, record["b"])
+        self.assertEqual(list(range(16)), record["c"])
+        self.assertEqual(5, record["d[2].y"])
+        self.assertEqual(2.718281828459, record["g"])
+        self.assertEqual([i % 2 == 0 for i in range(8)], record["h"])
+        self.assertEqual(0.5, record["u.f32"])
+        self.assertEqual(0xAA, record["msg.signal"])
+        self.assertEqual(2, record["enum_class_field"])
+        self.assertEqual(-123456789, record["signed_int_field"])
+
+        inner = read_structured(g_global_struct.d)
+        self.assertEqual(4, len(inner))
+        self.assertEqual(["x", "y"], inner.layout.names)
+        self.assertEqual([0, 2, 4, 6], inner.column("x"))
+        self.assertEqual({"x": 6, "y": 7}, inner[-1])
+
+        uint_array = read_structured(g_global_struct.uint_array)
+        self.assertTrue(uint_array.layout.is_scalar)
+        self.assertEqual([0x11111111, 0x22222222, 0x33333333, 0x44444444], list(uint_array))
+
+    def test_symbolize_matches_single_lookups(self):
+        main_die = self.parsed_elf.find_die_by_name("main")
+        assert main_die is not None
+        ranges = main_die.get_address_ranges()
+        self.assertGreater(len(ranges), 0)
+        addresses = [address for low, high in ranges for address in range(low, high, 2)]
+        # Repeated addresses and an address no function covers.
+        addresses += addresses[:4] + [0xFFFFFFF0]
+
+        dwarf = self.parsed_elf.dwarf_info
+        results = dwarf.symbolize(addresses)
+        self.assertEqual(len(addresses), len(results))
+        for address, result in zip(addresses, results):
+            self.assertEqual(address, result.address)
+            die = dwarf.find_function_by_address(address)
+            if die is None:
+                self.assertEqual([], result.functions)
+            else:
+                self.assertGreater(len(result.functions), 0)
+                self.assertEqual("main", result.functions[-1])
+            file_line = dwarf.find_file_line_by_address(address)
+            if file_line is None:
+                self.assertIsNone(result.file_line)
+            else:
+                assert result.file_line is not None
+                self.assertEqual((file_line.file, file_line.line), (result.file_line.file, result.file_line.line))
+        self.assertEqual([], results[-1].functions)
+
+    def test_find_function_by_address_picks_innermost_scope(self):
+        # Compare the interval index against a walk over every code scope nested in main, for every
+        # address of main, including addresses of main that no nested scope covers.
+        code_scopes = {DwarfDieTag.subprogram, DwarfDieTag.inlined_subroutine, DwarfDieTag.lexical_block}
+        main_die = self.parsed_elf.find_die_by_name("main")
+        assert main_die is not None
+        scopes = []  # (die, depth)
+
+        def collect(die, depth):
+            if die.tag in code_scopes:
+                scopes.append((die, depth))
+            child = die.get_first_child()
+            while child is not None:
+                collect(child, depth + 1)
+                child = child.get_next_sibling()
+
+        collect(main_die, 0)
+        dwarf = self.parsed_elf.dwarf_info
+        for low, high in main_die.get_address_ranges():
+            for address in range(low, high, 2):
+                covering = [
+                    (scope_high - scope_low, -depth, die.offset)
+                    for die, depth in scopes
+                    for scope_low, scope_high in die.get_address_ranges()
+                    if scope_low <= address < scope_high
+                ]
+                expected = min(covering)[2]
+                die = dwarf.find_function_by_address(address)
+                assert die is not None
+                self.assertEqual(expected, die.offset, f"Wrong scope at 0x{address:x}")
+
     def test_file_static_resolution(self):
         def read_u32(address: int) -> int:
             buf = bytearray(4)
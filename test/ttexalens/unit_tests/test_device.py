@@ -49,3 +49,18 @@ class TestDevice(unittest.TestCase):
 
         self.assertTrue(set_active_eth.isdisjoint(set_idle_eth), "Active and idle ETH blocks must not overlap")
         self.assertTrue((set_active_eth | set_idle_eth) == set_eth, "All eth blocks must be either idle or active")
+
+    def test_lazy_device_creation(self):
+        context = Context(self.context.umd_api, self.context.file_api, noc_id=self.context.noc_id)
+        self.assertEqual(context.devices.loaded(), [])
+        self.assertIn(self.device_id, context.devices)
+
+        device = context.devices[self.device_id]
+        self.assertEqual(context.devices.loaded(), [device])
+        self.assertIs(context.devices[self.device_id], device)
+
+        context.devices.load_all()
+        loaded = context.devices.loaded()
+        self.assertEqual([d.id for d in loaded], list(context.device_ids))
+        self.assertIs(context.devices[self.device_id], device)
+        self.assertEqual(device.local_device.id, self.device.local_device.id)
@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+import unittest
+
+from ttexalens.eth_routing import EthLinkRouter
+from ttexalens.exceptions import TimeoutDeviceRegisterError
+
+LINK_A = (20, 25)
+LINK_B = (21, 25)
+
+
+class FakeLinks:
+    """Records the selected link and fails transfers over broken links."""
+
+    def __init__(self):
+        self.selected = None
+        self.broken: set[tuple[int, int]] = set()
+        self.transfers: list[tuple[tuple[int, int], int, int]] = []
+
+    def select(self, link):
+        self.selected = link
+
+    def transfer(self, offset, length):
+        if self.selected in self.broken:
+            raise RuntimeError(f"ETH core {self.selected} is not responding")
+        self.transfers.append((self.selected, offset, length))
+
+
+class TestEthLinkRouter(unittest.TestCase):
+    def setUp(self):
+        self.links = FakeLinks()
+        self.router = EthLinkRouter(
+            [LINK_A, LINK_B], self.links.select, passthrough_errors=(TimeoutDeviceRegisterError,)
+        )
+
+    def test_probe_stops_at_first_working_link(self):
+        self.assertTrue(self.router.probe(lambda: self.links.transfer(0, 4)))
+        self.assertEqual(self.links.transfers, [(LINK_A, 0, 4)])
+        stats = {stats.link: stats for stats in self.router.stats()}
+        self.assertIsNotNone(stats[LINK_A].ns_per_byte)
+        self.assertIsNone(stats[LINK_B].ns_per_byte)
+
+    def test_probe_skips_broken_links(self):
+        self.links.broken.add(LINK_A)
+        self.assertTrue(self.router.probe(lambda: self.links.transfer(0, 4)))
+        stats = {stats.link: stats for stats in self.router.stats()}
+        self.assertFalse(stats[LINK_A].is_healthy())
+        self.assertEqual(stats[LINK_A].failures, 1)
+        self.assertIsNotNone(stats[LINK_B].ns_per_byte)
+
+        self.links.broken.add(LINK_B)
+        self.assertFalse(self.router.probe(lambda: self.links.transfer(0, 4)))
+
+    def test_failover_to_next_link(self):
+        self.links.broken.add(LINK_A)
+        self.router.run(lambda: self.links.transfer(0, 4), 4)
+        self.assertEqual(self.links.transfers, [(LINK_B, 0, 4)])
+        self.assertEqual(self.router.selected_link, LINK_B)
+
+        # The broken link is quarantined, so the next transfer does not try it first.
+        self.links.transfers.clear()
+        self.router.run(lambda: self.links.transfer(0, 4), 4)
+        self.assertEqual(self.links.transfers, [(LINK_B, 0, 4)])
+        self.assertEqual([stats.failures for stats in self.router.stats()], [1, 0])
+
+    def test_all_links_failing_raises(self):
+        self.links.broken.update([LINK_A, LINK_B])
+        with self.assertRaises(RuntimeError):
+            self.router.run(lambda: self.links.transfer(0, 4), 4)
+        self.assertTrue(all(not stats.is_healthy() for stats in self.router.stats()))
+
+    def test_passthrough_errors_do_not_fail_over(self):
+        def hung_core():
+            raise TimeoutDeviceRegisterError(1, (0, 0), 0x100, 4, True, None)
+
+        with self.assertRaises(TimeoutDeviceRegisterError):
+            self.router.run(hung_core, 4)
+        self.assertEqual([stats.failures for stats in self.router.stats()], [0, 0])
+
+    def test_transfers_stay_on_selected_link(self):
+        selections = []
+        router = EthLinkRouter([LINK_A, LINK_B], lambda link: selections.append(link) or self.links.select(link))
+        router.probe(lambda: self.links.transfer(0, 4))
+        for _ in range(10):
+            router.run(lambda: self.links.transfer(0, 1 << 20), 1 << 20)
+        # Transfers cannot overlap, so there is no reason to switch to the unmeasured link.
+        self.assertEqual(selections, [LINK_A])
+        self.assertEqual({link for link, _, _ in self.links.transfers}, {LINK_A})
+
+    def test_link_used_after_failover_is_measured(self):
+        self.router.probe(lambda: self.links.transfer(0, 4))
+        self.links.broken.add(LINK_A)
+        self.router.run(lambda: self.links.transfer(0, 4096), 4096)
+        stats = {stats.link: stats for stats in self.router.stats()}
+        self.assertIsNotNone(stats[LINK_B].ns_per_byte)
+        self.assertEqual(stats[LINK_B].bytes_transferred, 4096)
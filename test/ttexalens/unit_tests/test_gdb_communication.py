@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+import io
+import unittest
+
+from ttexalens.gdb.gdb_communication import (
+    GdbInputStream,
+    GdbMessageParser,
+    GdbMessageWriter,
+    gdb_escape,
+    gdb_unescape,
+)
+from ttexalens.gdb.gdb_data import GdbThreadId
+
+
+class FakeSocket:
+    """Returns queued chunks on read and records everything written."""
+
+    def __init__(self, chunks: list[bytes] | None = None):
+        self.chunks = list(chunks or [])
+        self.written = bytearray()
+
+    def read(self, packet_size=None):
+        return self.chunks.pop(0) if self.chunks else b""
+
+    def write(self, data: bytes | bytearray):
+        self.written += data
+
+
+def make_packet(data: bytes) -> bytes:
+    return b"$" + data + b"#" + f"{sum(data) % 256:02x}".encode()
+
+
+class TestGdbCommunication(unittest.TestCase):
+    def test_escape_round_trip(self):
+        data = bytes(range(256)) * 2
+        escaped = gdb_escape(data)
+        for special in b"#$*":
+            self.assertNotIn(special, escaped)
+        self.assertEqual(gdb_unescape(escaped), data)
+        self.assertEqual(gdb_escape(b"plain"), b"plain")
+
+    def test_writer_framing(self):
+        socket = FakeSocket()
+        writer = GdbMessageWriter(socket)  # type: ignore[arg-type]
+        writer.append(b"a#b")
+        writer.append_hex(0x1F, 4)
+        writer.append_hex(0xABC)
+        writer.append_register_hex(0x12345678)
+        writer.append_string_as_hex("Hi")
+        writer.append_thread_id(GdbThreadId(2, 1))
+        writer.send()
+
+        payload = b"a}\x03b" + b"001F" + b"ABC" + b"78563412" + b"4869" + b"p2.1"
+        self.assertEqual(bytes(socket.written), b"$" + payload + b"#" + f"{sum(payload) % 256:02X}".encode())
+        self.assertTrue(writer.is_empty)
+
+    def test_input_stream_reads_split_packets(self):
+        data = b"X1000,4:" + gdb_escape(b"\x00#}*")
+        packet = make_packet(data)
+        chunks = [b"+"] + [packet[i : i + 3] for i in range(0, len(packet), 3)] + [make_packet(b"g")]
+        stream = GdbInputStream(FakeSocket(chunks))  # type: ignore[arg-type]
+
+        self.assertTrue(stream.read().is_ack_ok)
+        message = stream.read()
+        self.assertEqual(message.data, b"X1000,4:\x00#}*")
+        self.assertEqual(stream.read().data, b"g")
+        self.assertIsNone(stream.read())
+
+    def test_input_stream_rejects_bad_checksum(self):
+        socket = FakeSocket([b"$g#00", make_packet(b"m0,4")])
+        stream = GdbInputStream(socket, error_stream=io.StringIO())  # type: ignore[arg-type]
+
+        self.assertEqual(stream.read().data, b"m0,4")
+        self.assertEqual(bytes(socket.written), b"-")
+
+    def test_parser(self):
+        parser = GdbMessageParser(b"m1a2B,10;rest")
+        self.assertTrue(parser.parse(b"m"))
+        self.assertFalse(parser.parse(b","))
+        self.assertEqual(parser.parse_hex(), 0x1A2B)
+        self.assertTrue(parser.parse(b","))
+        self.assertEqual(parser.read_hex(2), 0x10)
+        self.assertEqual(parser.read_until(ord(";")), b"")
+        self.assertEqual(parser.read_rest(), b"rest")
+        self.assertIsNone(parser.parse_hex())
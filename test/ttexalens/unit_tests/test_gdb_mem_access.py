@@ -341,3 +341,38 @@ class TestGdbMemAccessFromClient(unittest.TestCase):
             self._assert_packet_result(output, "M", addr_hex, length_hex, expect_e04)
             self._assert_packet_result(output, "x", addr_hex, length_hex, expect_e04)
             self._assert_packet_result(output, "X", addr_hex, length_hex, expect_e04)
+
+    def test_gdb_memory_map(self) -> None:
+        """GDB uses the memory map reported by the server and can still read inside L1."""
+        port = self.server_socket.port
+        assert port is not None
+
+        with tempfile.TemporaryDirectory(prefix="gdb_mem_access_") as tmpdir:
+            script_path = os.path.join(tmpdir, "commands_memory_map.gdb")
+
+            gdb_commands = textwrap.dedent(
+                f"""
+                set pagination off
+                set confirm off
+                set verbose off
+
+                target extended-remote localhost:{port}
+                attach 1
+                add-symbol-file {self.elf_path}
+
+                info mem
+                x/4xb 0x{self.inside_addr:x}
+
+                quit
+                """
+            ).strip()
+
+            with open(script_path, "w", encoding="utf-8") as f:
+                f.write(gdb_commands + "\n")
+
+            rc, output = self._run_gdb_script(script_path)
+            util.INFO("GDB integration test output (memory map):\n" + output)
+
+            self.assertEqual(rc, 0, f"GDB exited with non-zero code {rc}\nOutput:\n{output}")
+            self.assertIn("Using memory regions provided by the target.", output)
+            self.assertNotIn("Cannot access memory", output)
@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+import unittest
+
+from test.ttexalens.unit_tests.core_simulator import RiscvCoreSimulator
+from test.ttexalens.unit_tests.program_writer import RiscvProgramWriter
+from test.ttexalens.unit_tests.test_base import init_cached_test_context
+from ttexalens.hang_detector import CoreState, HangDetector
+
+
+class TestHangDetector(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.context = init_cached_test_context()
+
+    def setUp(self):
+        self.core_sim = RiscvCoreSimulator(self.context, "FW0", "brisc")
+        if not self.core_sim.has_debug_hardware() or not self.core_sim.has_debug_bus():
+            self.skipTest("Debug hardware or debug bus is not available.")
+
+    def tearDown(self):
+        self.core_sim.set_reset(True)
+
+    def _state(self, detector: HangDetector) -> CoreState:
+        (core,) = detector.report().cores
+        return core.state
+
+    def test_classification(self):
+        program_writer = RiscvProgramWriter(self.core_sim)
+        program_writer.append_while_true()
+        program_writer.write_program()
+
+        detector = HangDetector([self.core_sim.location], ["brisc"], window=3, interval=0, max_duty_cycle=1)
+        self.core_sim.set_reset(True)
+        detector.run(1)
+        self.assertEqual(self._state(detector), CoreState.IN_RESET)
+
+        self.core_sim.set_reset(False)
+        detector.run(2)
+        self.assertEqual(self._state(detector), CoreState.PROGRESSING, "Core left reset within the window.")
+        detector.run(3)
+        report = detector.report()
+        self.assertEqual(self._state(detector), CoreState.SPINNING)
+        self.assertEqual(report.cores[0].pc_span, 0)
+        self.assertTrue(report.is_hung)
+        self.assertEqual([core.risc_name for core in report.suspects()], ["brisc"])
+
+        self.core_sim.halt()
+        detector.run(1)
+        self.assertEqual(self._state(detector), CoreState.HALTED)
+
+    def test_duty_cycle(self):
+        detector = HangDetector([self.core_sim.location], window=2, interval=0, max_duty_cycle=0.5)
+        detector.run(2)
+        self.assertEqual(detector.sweep_count, 2)
+        self.assertGreater(detector.busy_time, 0)
@@ -14,7 +14,7 @@ from parameterized import parameterized, parameterized_class
 from test.ttexalens.unit_tests.test_base import get_core_location, get_parsed_elf_file, init_cached_test_context
 import ttexalens as lib
 from ttexalens import util
-from ttexalens.exceptions import TTException
+from ttexalens.exceptions import ReadOnlyMemoryError, TTException
 from ttexalens.elf import ElfFile
 from ttexalens.memory_map import MemoryMap, MemoryMapBlockInfo
 
@@ -1347,6 +1347,32 @@ class TestRunElf(unittest.TestCase):
         # Enable branch prediction
         rdbg.set_branch_prediction(True)
 
+    def test_gather_global(self):
+        """Gathering a global from several cores matches reading it from each core."""
+        if self.device.is_blackhole():
+            self.skipTest("This test doesn't work as expected on blackhole. Disabling it until bug #120 is fixed.")
+
+        risc_name = "brisc"
+        locations = ["0,0", "1,0"]
+        elf_path = self.get_elf_path("sample.debug", risc_name)
+        elf = lib.parse_elf(elf_path, self.context)
+        for location in locations:
+            lib.run_elf(elf, location, risc_name, context=self.context)
+
+        for max_workers in [1, 4]:
+            gathered = lib.gather_global(
+                locations, elf, "g_MAILBOX", risc_name, context=self.context, max_workers=max_workers
+            )
+            self.assertEqual(len(gathered), len(locations))
+            for location in locations:
+                coordinate = OnChipCoordinate.create(location, device=self.device)
+                expected = lib.get_global(location, elf, "g_MAILBOX", risc_name, context=self.context)
+                snapshot = gathered[(coordinate, risc_name)]
+                self.assertEqual(snapshot.get_address(), expected.get_address())
+                self.assertEqual(snapshot.read_value(), expected.read_value())
+                with self.assertRaises(ReadOnlyMemoryError):
+                    snapshot.write_value(0)
+
 
 class TestARC(unittest.TestCase):
     context: Context
@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+
+# Unit test for ttexalens/memory_map.py: AccessPermissionTable.
+import unittest
+from ttexalens.hardware.device_address import DeviceAddress
+from ttexalens.hardware.memory_block import MemoryBlock
+from ttexalens.memory_map import AccessPermissionTable, MemoryMap, MemoryMapBlockInfo
+
+READ = AccessPermissionTable.READ
+WRITE = AccessPermissionTable.WRITE
+
+
+def _block(name: str, address: int, size: int, **kwargs) -> MemoryMapBlockInfo:
+    return MemoryMapBlockInfo(name, MemoryBlock(size, DeviceAddress(noc_address=address)), **kwargs)
+
+
+class TestAccessPermissionTable(unittest.TestCase):
+    def setUp(self):
+        self.memory_map = MemoryMap()
+        self.memory_map.initialize_blocks(
+            [
+                _block("l1", 0x0, 0x1000, safe_to_write=True),
+                _block("scratch", 0x1000, 0x1000, safe_to_write=True),
+                _block("regs", 0x2000, 0x100),
+                _block("no_read", 0x2100, 0x100, safe_to_read=False),
+                _block("dynamic", 0x3000, 0x100, access_check=lambda: True),
+            ]
+        )
+        self.table = self.memory_map.noc_access_table
+
+    def test_access_within_block(self):
+        self.assertTrue(self.table.allows(0x10, 4, READ))
+        self.assertTrue(self.table.allows(0x10, 4, WRITE))
+        self.assertTrue(self.table.allows(0x2000, 0x100, READ))
+        self.assertFalse(self.table.allows(0x2000, 4, WRITE))
+
+    def test_access_across_merged_blocks(self):
+        # l1 and scratch have the same permissions, so one lookup covers both.
+        self.assertTrue(self.table.allows(0xFF0, 0x20, WRITE))
+        # regs have different permissions, so accesses crossing into them are left to the slow path.
+        self.assertFalse(self.table.allows(0x1FF0, 0x20, WRITE))
+        self.assertFalse(self.table.allows(0x1FF0, 0x20, READ))
+
+    def test_unmapped_and_unsafe(self):
+        self.assertFalse(self.table.allows(0x2100, 4, READ))
+        self.assertFalse(self.table.allows(0x2800, 4, READ))
+        self.assertFalse(self.table.allows(0x3100, 4, READ))
+        self.assertFalse(self.table.allows(0x20F0, 0x20, READ))
+
+    def test_dynamic_blocks_are_never_approved(self):
+        self.assertFalse(self.table.allows(0x3000, 4, READ))
+
+    def test_access_table_shared_per_cache_key(self):
+        def build_map():
+            memory_map = MemoryMap()
+            # Every core gets its own access check, but the table does not depend on it.
+            memory_map.initialize_blocks(
+                [
+                    _block("l1", 0x0, 0x1000, safe_to_write=True),
+                    _block("dynamic", 0x3000, 0x100, access_check=lambda: True),
+                ],
+                access_table_cache_key=(TestAccessPermissionTable, "noc_memory_map"),
+            )
+            return memory_map
+
+        first, second = build_map(), build_map()
+        self.assertIsNot(first, second)
+        self.assertIs(first.noc_access_table, second.noc_access_table)
+        self.assertIsNot(first.noc_access_table, self.table)
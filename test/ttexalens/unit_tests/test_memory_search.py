@@ -0,0 +1,108 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+import os
+import unittest
+
+from test.ttexalens.unit_tests.test_base import init_cached_test_context
+from ttexalens import tt_exalens_lib as lib
+from ttexalens.coordinate import OnChipCoordinate
+from ttexalens.exceptions import TTException
+from ttexalens.memory_search import UNKNOWN_BLOCK, SearchPattern, get_search_ranges, scan_ranges, search_memory
+
+
+class TestSearchPattern(unittest.TestCase):
+    def test_from_values(self):
+        self.assertEqual(SearchPattern.from_values([0x1234, 0x5678], 2).data, b"\x34\x12\x78\x56")
+        self.assertEqual(SearchPattern.from_values([-1], 4).data, b"\xff\xff\xff\xff")
+        with self.assertRaises(TTException):
+            SearchPattern.from_values([], 4)
+        with self.assertRaises(TTException):
+            SearchPattern(b"\x01\x02", b"\xff")
+
+    def test_find_all_overlapping(self):
+        self.assertEqual(list(SearchPattern(b"aa").find_all(b"aaaa")), [0, 1, 2])
+        self.assertEqual(list(SearchPattern(b"aa").find_all(b"aaaa", 2)), [0, 1])
+
+    def test_find_all_masked(self):
+        pattern = SearchPattern.from_values([0xDEAD0000], 4, [0xFFFF0000])
+        self.assertTrue(pattern.is_masked)
+        data = bytes(8) + (0xDEAD1234).to_bytes(4, "little") + (0xDEADBEEF).to_bytes(4, "little")
+        self.assertEqual(list(pattern.find_all(data)), [8, 12])
+        # Partially masked bytes, and the lookahead may look past ``end``.
+        pattern = SearchPattern(b"\x10\x20", b"\xf0\xff")
+        self.assertEqual(list(pattern.find_all(b"\x1f\x20\x2f\x20\x10\x20", 5)), [0, 4])
+        # A full mask matches like an unmasked pattern.
+        self.assertFalse(SearchPattern(b"\x01", b"\xff").is_masked)
+
+
+class FakeLocation:
+    """NOC memory filled with a repeating pattern, where reads that include ``fail_at`` fail."""
+
+    def __init__(self, fail_at: int | None = None):
+        self.fail_at = fail_at
+        self.noc_block = None  # memory map must not be used
+
+    def noc_read(self, address: int, buffer: bytearray, safe_mode=None) -> None:
+        if self.fail_at is not None and address <= self.fail_at < address + len(buffer):
+            raise TTException(f"Cannot read 0x{address:08x}")
+        buffer[:] = b"\xab\xcd" * (len(buffer) // 2)
+
+
+class TestScanRanges(unittest.TestCase):
+    def test_unsafe_with_end_is_one_raw_range(self):
+        location = FakeLocation()
+        (search_range,) = get_search_ranges(location, 0x100, 0x20000, unsafe=True)  # type: ignore[arg-type]
+        self.assertEqual((search_range.start, search_range.end), (0x100, 0x20000))
+        self.assertEqual(search_range.block_name, UNKNOWN_BLOCK)
+
+    def test_matches_after_failed_read_are_dropped(self):
+        location = FakeLocation(fail_at=0x280)
+        ranges = get_search_ranges(location, 0, 0x1000, unsafe=True)  # type: ignore[arg-type]
+        for max_workers in [1, 4]:
+            matches = list(scan_ranges(ranges, [SearchPattern(b"\xab\xcd")], True, 0x100, None, max_workers))
+            # The chunk at 0x200 fails; later chunks can be read, but the search of the range stops at the failure.
+            self.assertEqual([match.address for match in matches], list(range(0, 0x200, 2)))
+
+
+class TestSearchMemory(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.context = init_cached_test_context()
+        cls.device = cls.context.devices[0]
+
+    def test_search_multiple_locations(self):
+        locations: list[str | OnChipCoordinate] = ["0,0", "1,0"]
+        address = 0x1000
+        data = os.urandom(16)
+        for location in locations:
+            lib.write_to_device(location, address, data, context=self.context)
+
+        for max_workers in [1, 4]:
+            matches = list(
+                search_memory(
+                    locations,
+                    [data, SearchPattern(data[:4] + bytes(4), b"\xff" * 4 + bytes(4))],
+                    end=0x10000,
+                    read_size=0x100,
+                    max_results=2,
+                    max_workers=max_workers,
+                    context=self.context,
+                )
+            )
+            for location in locations:
+                coordinate = OnChipCoordinate.create(location, device=self.device)
+                location_matches = [(m.address, m.pattern_index) for m in matches if m.location == coordinate]
+                self.assertEqual(location_matches, [(address, 0), (address, 1)])
+
+    def test_search_progress(self):
+        address = 0x2000
+        data = os.urandom(8)
+        lib.write_to_device("0,0", address, data, context=self.context)
+
+        progress: list[tuple[int, int]] = []
+        matches = search_memory(
+            "0,0", data, end=0x4000, max_results=None, context=self.context, progress=lambda *p: progress.append(p)
+        )
+        self.assertIn(address, [match.address for match in matches])
+        self.assertEqual(progress[-1], (0x4000, 0x4000))
@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+import unittest
+
+from test.ttexalens.unit_tests.test_base import init_cached_test_context
+from ttexalens import tt_exalens_lib as lib
+from ttexalens.coordinate import OnChipCoordinate
+from ttexalens.memory_watch import MemoryWatch, WatchRegion
+
+
+class TestMemoryWatch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.context = init_cached_test_context()
+        cls.device = cls.context.devices[0]
+
+    def setUp(self):
+        self.address = 0x4000
+        self.size = 0x1000
+        self.regions = [
+            WatchRegion(OnChipCoordinate.create(location, device=self.device), self.address, self.size)
+            for location in ["0,0", "1,0"]
+        ]
+        for region in self.regions:
+            lib.write_to_device(region.location, self.address, bytes(self.size), context=self.context)
+
+    def test_changes(self):
+        watch = MemoryWatch(self.regions, page_size=64, max_workers=2)
+        watch.take_baseline()
+        self.assertEqual(watch.poll_once(), [])
+
+        # Write across a page boundary of the first region only.
+        data = bytes(range(1, 9))
+        lib.write_to_device("0,0", self.address + 60, data, context=self.context)
+        changes = watch.poll_once()
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(changes[0].location, self.regions[0].location)
+        self.assertEqual(changes[0].sweep, 2)
+        self.assertEqual(changes[0].address, self.address + 60)
+        self.assertEqual(changes[0].old, bytes(len(data)))
+        self.assertEqual(changes[0].new, data)
+
+        self.assertEqual(watch.memory_at(1, self.regions[0]), bytes(self.size))
+        self.assertEqual(
+            watch.memory_at(2, self.regions[0]),
+            lib.read_from_device("0,0", self.address, num_bytes=self.size, context=self.context),
+        )
+        self.assertEqual(watch.changes(location=self.regions[1].location), [])
+
+        # Cores are read on one thread pool for all sweeps; stop() shuts it down.
+        executor = watch._executor
+        self.assertIsNotNone(executor)
+        watch.poll_once()
+        self.assertIs(watch._executor, executor)
+        watch.stop()
+        self.assertIsNone(watch._executor)
+
+    def test_history_folding(self):
+        watch = MemoryWatch(self.regions[:1], page_size=64, history_size=1, max_workers=1)
+        watch.take_baseline()
+        for value in [1, 2, 3]:
+            lib.write_to_device("0,0", self.address, bytes([value]), context=self.context)
+            watch.poll_once()
+        self.assertEqual(len(watch.changes()), 1)
+        self.assertEqual(watch.memory_at(3, self.regions[0])[0], 3)
+        self.assertEqual(watch.memory_at(2, self.regions[0])[0], 2)
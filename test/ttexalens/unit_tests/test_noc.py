@@ -6,6 +6,7 @@ import unittest
 from parameterized import parameterized_class
 from test.ttexalens.unit_tests.test_base import init_test_context
 from ttexalens import OnChipCoordinate, write_words_to_device, NocId
+from ttexalens.noc_snapshot import NIU_TRANSACTION_COUNTERS, snapshot_noc_registers
 from ttexalens.register_store import RegisterStore
 
 
@@ -35,6 +36,28 @@ class TestNOC(unittest.TestCase):
         after = self.register_store.read_register("NIU_SLV_NONPOSTED_WR_REQ_RECEIVED")
         self.assertGreaterEqual(after, before + 6)
 
+    def test_read_registers(self):
+        # Bulk reads decode the same values as reading registers one by one
+        register_names = ["NIU_CFG_0", "ROUTER_CFG_0", "NOC_NODE_ID", "NOC_ID_LOGICAL"]
+        plan = self.register_store.get_read_plan(register_names)
+        self.assertLess(len(plan.ranges), len(register_names))
+        self.assertIs(plan, self.register_store.get_read_plan(register_names))
+        values = self.register_store.read_registers(register_names)
+        self.assertEqual(list(values.keys()), register_names)
+        for name in register_names:
+            self.assertEqual(values[name], self.register_store.read_register(name))
+
+    def test_noc_snapshot_delta(self):
+        locations = [self.loc, OnChipCoordinate(0, 0, "logical", self.device, core_type="tensix")]
+        before = snapshot_noc_registers(locations, noc_ids=[self.noc_id], context=self.context)
+        self.assertEqual(set(before.values.keys()), {(location, self.noc_id) for location in locations})
+        self.assertEqual(list(before.values[(self.loc, self.noc_id)].keys()), NIU_TRANSACTION_COUNTERS)
+        for _ in range(3):
+            write_words_to_device(self.loc, 0x333, 1, noc_id=self.noc_id)
+        after = snapshot_noc_registers(locations, noc_ids=[self.noc_id], context=self.context)
+        self.assertGreaterEqual(after.delta(before)[(self.loc, self.noc_id)]["NIU_SLV_NONPOSTED_WR_REQ_RECEIVED"], 3)
+        self.assertGreater(after.rates(before)[(self.loc, self.noc_id)]["NIU_SLV_NONPOSTED_WR_REQ_RECEIVED"], 0)
+
 
 @parameterized_class(
     [
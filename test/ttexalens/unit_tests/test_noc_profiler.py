@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+
+# Unit test for ttexalens/noc_profiler.py.
+import unittest
+from ttexalens import noc_profiler
+from ttexalens.exceptions import TTException
+from ttexalens.noc_profiler import NocProfiler
+
+
+class TestNocProfiler(unittest.TestCase):
+    def test_frames_are_noop_when_inactive(self):
+        self.assertIsNone(noc_profiler.get_active_profiler())
+        with noc_profiler.frame("read_words_from_device"):
+            self.assertEqual(noc_profiler._frame_stack(), [])
+
+    def test_transactions_are_attributed_to_frames(self):
+        with NocProfiler() as profiler:
+            with noc_profiler.frame("read_words_from_device"):
+                with noc_profiler.frame("noc_read"):
+                    profiler.record_transaction("read", 4, False, 2000)
+                    profiler.record_transaction("read", 4, False, 1000)
+            profiler.record_transaction("write", 64, True, 5000)
+        self.assertIsNone(noc_profiler.get_active_profiler())
+
+        transactions = profiler.transactions()
+        stats = transactions[(("read_words_from_device", "noc_read"), "read", "mmio")]
+        self.assertEqual((stats.count, stats.num_bytes, stats.total_ns, stats.max_ns), (2, 8, 3000, 2000))
+        self.assertEqual(transactions[((), "write", "dma")].count, 1)
+
+        self.assertEqual(
+            list(profiler.collapsed_stacks("count")),
+            ["<no_api>;write;dma 1", "read_words_from_device;noc_read;read;mmio 2"],
+        )
+        summary = {row[0]: row for row in profiler.summary()}
+        self.assertEqual(summary["read_words_from_device"][1:9], [1, 2, 2, 0, 0, 2, 8, 4])
+
+    def test_single_active_profiler(self):
+        with NocProfiler():
+            with self.assertRaises(TTException):
+                NocProfiler().start()
+
+    def test_invalid_weight(self):
+        with self.assertRaises(TTException):
+            list(NocProfiler().collapsed_stacks("cycles"))
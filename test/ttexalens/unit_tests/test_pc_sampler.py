@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+import unittest
+
+from test.ttexalens.unit_tests.core_simulator import RiscvCoreSimulator
+from test.ttexalens.unit_tests.program_writer import RiscvProgramWriter
+from test.ttexalens.unit_tests.test_base import init_cached_test_context
+from ttexalens.pc_sampler import UNKNOWN_FUNCTION, PcSampler
+
+
+class TestPcSampler(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.context = init_cached_test_context()
+
+    def setUp(self):
+        if self.context.devices[0].is_quasar():
+            self.skipTest("Debug bus PC signals are not used on quasar.")
+        self.core_sim = RiscvCoreSimulator(self.context, "FW0", "brisc")
+        if not self.core_sim.has_debug_bus():
+            self.skipTest("Debug bus is not available.")
+
+    def tearDown(self):
+        self.core_sim.set_reset(True)
+
+    def test_sampling_halted_core(self):
+        program_writer = RiscvProgramWriter(self.core_sim)
+        program_writer.append_ebreak()
+        program_writer.write_program()
+        self.core_sim.set_reset(False)
+        self.assertTrue(self.core_sim.is_halted())
+        expected_pc = self.core_sim.get_pc_from_debug_bus()
+
+        sampler = PcSampler([self.core_sim.location], ["brisc"], interval=0).run(20)
+
+        self.assertEqual(sampler.sweep_count, 20)
+        counts = sampler.pc_counts()[(self.core_sim.location, "brisc")]
+        self.assertEqual(dict(counts), {expected_pc: 20})
+        function = f"{UNKNOWN_FUNCTION}@0x{expected_pc:x}"
+        self.assertEqual(sampler.function_histogram(), {("brisc", function): 20})
+        self.assertEqual(list(sampler.collapsed_stacks(per_core=False)), [f"brisc;{function} 20"])
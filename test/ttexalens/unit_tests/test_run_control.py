@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+import unittest
+
+from test.ttexalens.unit_tests.core_simulator import RiscvCoreSimulator
+from test.ttexalens.unit_tests.program_writer import RiscvProgramWriter
+from test.ttexalens.unit_tests.test_base import init_cached_test_context
+from ttexalens.run_control import RiscGroup
+
+
+class TestRiscGroup(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.context = init_cached_test_context()
+
+    def setUp(self):
+        self.core_sims = [
+            RiscvCoreSimulator(self.context, core_desc, risc_name)
+            for core_desc in ["FW0", "FW1"]
+            for risc_name in ["brisc", "trisc0"]
+        ]
+        if not all(core_sim.has_debug_hardware() for core_sim in self.core_sims):
+            self.skipTest("Debug hardware is not available.")
+        for core_sim in self.core_sims:
+            core_sim.set_reset(True)
+            program_writer = RiscvProgramWriter(core_sim)
+            program_writer.append_while_true()
+            program_writer.write_program()
+        self.group = RiscGroup([core_sim.risc_debug for core_sim in self.core_sims])
+
+    def tearDown(self):
+        for core_sim in self.core_sims:
+            core_sim.set_reset(True)
+
+    def test_reset_halt_continue(self):
+        result = self.group.set_reset(False)
+        self.assertEqual(result.risc_count, 4)
+        self.assertEqual(result.transaction_count, 2, "RISCs of one core share one soft-reset write.")
+        self.assertTrue(all(not core_sim.is_in_reset() for core_sim in self.core_sims))
+
+        result = self.group.halt()
+        self.assertEqual(result.risc_count, 4)
+        self.assertGreaterEqual(result.skew_ns, 0)
+        self.assertTrue(all(core_sim.is_halted() for core_sim in self.core_sims))
+        # Already halted RISCs are skipped.
+        self.assertEqual(self.group.halt().risc_count, 0)
+
+        result = self.group.cont()
+        self.assertEqual(result.risc_count, 4)
+        self.assertTrue(all(not core_sim.is_halted() for core_sim in self.core_sims))
+
+        self.group.set_reset(True)
+        self.assertTrue(all(core_sim.is_in_reset() for core_sim in self.core_sims))
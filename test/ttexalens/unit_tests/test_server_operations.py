@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+import os
+import unittest
+
+from test.ttexalens.unit_tests.test_base import init_cached_test_context
+from ttexalens import tt_exalens_lib as lib
+from ttexalens.exceptions import TTException
+from ttexalens.server import start_server
+from ttexalens.server_operations import list_server_operations, run_server_operation
+from ttexalens.tt_exalens_init import init_ttexalens_remote, set_active_context
+
+
+class TestServerOperations(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.context = init_cached_test_context()
+        cls.server = start_server(5566, cls.context)
+        cls.remote_context = init_ttexalens_remote(port=5566)
+        set_active_context(cls.context)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def test_operations_are_listed(self):
+        self.assertIn("callstack", list_server_operations())
+        self.assertIn("get_tensix_state", list_server_operations())
+
+    def test_read_from_device(self):
+        address = 0x1000
+        data = os.urandom(64)
+        lib.write_to_device("0,0", address, data, context=self.context)
+        for context in [self.context, self.remote_context]:
+            self.assertEqual(
+                run_server_operation("read_from_device", context, location="0,0", addr=address, num_bytes=64), data
+            )
+            self.assertEqual(
+                run_server_operation("read_words_from_device", context, locations=["0,0"], addr=address, word_count=2),
+                {"0,0": lib.read_words_from_device("0,0", address, word_count=2, context=self.context)},
+            )
+
+    def test_errors(self):
+        for context in [self.context, self.remote_context]:
+            with self.assertRaises(TTException):
+                run_server_operation("no_such_operation", context)
+            with self.assertRaises(TTException):
+                run_server_operation("read_from_device", context, location="0,0", addr=0x1000, num_bytes=0)
@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+import unittest
+
+from ttexalens.server import _ThreadSafeProxy
+
+
+class FakeProxy:
+    """Mimics a Pyro5 proxy: it may only be used by its owning thread, one call at a time."""
+
+    def __init__(self, stats):
+        self.stats = stats
+        self.owner = threading.get_ident()
+        self.busy = False
+
+    def __copy__(self):
+        with self.stats["lock"]:
+            self.stats["copies"] += 1
+        return FakeProxy(self.stats)
+
+    def _pyroClaimOwnership(self):
+        self.owner = threading.get_ident()
+
+    def read(self, value):
+        assert self.owner == threading.get_ident(), "proxy used by a thread that does not own it"
+        assert not self.busy, "proxy used by two calls at once"
+        self.busy = True
+        with self.stats["lock"]:
+            self.stats["active"] += 1
+            self.stats["max_active"] = max(self.stats["max_active"], self.stats["active"])
+        time.sleep(0.01)
+        with self.stats["lock"]:
+            self.stats["active"] -= 1
+        self.busy = False
+        return value
+
+
+class TestThreadSafeProxy(unittest.TestCase):
+    def setUp(self):
+        self.stats = {"lock": threading.Lock(), "copies": 0, "active": 0, "max_active": 0}
+        self.proxy = _ThreadSafeProxy(FakeProxy(self.stats))
+
+    def test_calls_from_one_thread_reuse_one_connection(self):
+        self.assertEqual([self.proxy.read(i) for i in range(5)], list(range(5)))
+        self.assertEqual(self.stats["copies"], 0)
+
+    def test_parallel_calls_use_bounded_connection_pool(self):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(self.proxy.read, range(32)))
+        self.assertEqual(results, list(range(32)))
+        self.assertGreater(self.stats["max_active"], 1)
+        self.assertLessEqual(self.stats["max_active"], _ThreadSafeProxy.max_connections)
+        self.assertLessEqual(self.stats["copies"], _ThreadSafeProxy.max_connections - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import unittest
+
+from test.ttexalens.unit_tests.test_base import init_cached_test_context
+from ttexalens.context import NocId
+from ttexalens.server_sessions import DeviceAccessScheduler, ScheduledUmdApi, SessionManager
+
+
+class TestDeviceAccessScheduler(unittest.TestCase):
+    def test_identical_reads_are_coalesced(self):
+        scheduler = DeviceAccessScheduler()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def read():
+            calls.append(1)
+            started.set()
+            release.wait()
+            return b"data"
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(scheduler.read, 0, ("noc_read_bytes", 0x100), read)
+            started.wait()
+            second = executor.submit(scheduler.read, 0, ("noc_read_bytes", 0x100), read)
+            while scheduler.coalesced_read_count == 0:
+                pass
+            release.set()
+            self.assertEqual((first.result(), second.result()), (b"data", b"data"))
+        self.assertEqual(len(calls), 1)
+        # A finished read is not reused.
+        self.assertEqual(scheduler.read(0, ("noc_read_bytes", 0x100), lambda: b"new"), b"new")
+
+    def test_reads_after_write_are_not_coalesced(self):
+        scheduler = DeviceAccessScheduler()
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_read():
+            started.set()
+            release.wait()
+            return b"old"
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            first = executor.submit(scheduler.read, 0, ("noc_read_bytes", 0x100), slow_read)
+            started.wait()
+            scheduler.write(0, lambda: None)
+            # The in-flight read started before the write, so it must not be joined.
+            self.assertEqual(scheduler.read(0, ("noc_read_bytes", 0x100), lambda: b"new"), b"new")
+            release.set()
+            self.assertEqual(first.result(), b"old")
+        self.assertEqual(scheduler.coalesced_read_count, 0)
+
+    def test_reads_issued_after_write_finished_are_not_coalesced(self):
+        scheduler = DeviceAccessScheduler()
+        write_started = threading.Event()
+        release_write = threading.Event()
+        read_started = threading.Event()
+        release_read = threading.Event()
+
+        def slow_write():
+            write_started.set()
+            release_write.wait()
+
+        def slow_read():
+            read_started.set()
+            release_read.wait()
+            return b"old"
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            write = executor.submit(scheduler.write, 0, slow_write)
+            write_started.wait()
+            # This read started while the write was in flight, so it may return pre-write data.
+            first = executor.submit(scheduler.read, 0, ("noc_read_bytes", 0x100), slow_read)
+            read_started.wait()
+            release_write.set()
+            write.result()
+            # Issued after the write finished: must not join the read above.
+            self.assertEqual(scheduler.read(0, ("noc_read_bytes", 0x100), lambda: b"new"), b"new")
+            release_read.set()
+            self.assertEqual(first.result(), b"old")
+        self.assertEqual(scheduler.coalesced_read_count, 0)
+
+    def test_exclusive_blocks_accesses_of_other_owners(self):
+        scheduler = DeviceAccessScheduler()
+        order = []
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with scheduler.exclusive(0, "first"):
+                write = executor.submit(scheduler.write, 0, lambda: order.append("write"), "second")
+                read = executor.submit(scheduler.read, 0, ("noc_read_bytes", 0x100), lambda: order.append("read"))
+                # Accesses of the owner and accesses to other devices are not blocked.
+                scheduler.read(0, ("noc_read_bytes", 0x100), lambda: order.append("owner read"), "first")
+                scheduler.write(1, lambda: order.append("other device"), "second")
+                order.append("exclusive")
+            write.result()
+            read.result()
+        self.assertEqual(order[:3], ["owner read", "other device", "exclusive"])
+        self.assertEqual(sorted(order[3:]), ["read", "write"])
+
+
+class TestSessionManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.context = init_cached_test_context()
+
+    def test_sessions_have_own_settings(self):
+        sessions = SessionManager(self.context, DeviceAccessScheduler())
+        first = sessions.open(NocId.NOC0.name, safe_mode=False)
+        second = sessions.open(NocId.NOC1.name, safe_mode=True)
+        self.assertEqual(sessions.get(first).context.noc_id, NocId.NOC0)
+        self.assertFalse(sessions.get(first).context.safe_mode)
+        self.assertEqual(sessions.get(second).context.noc_id, NocId.NOC1)
+        self.assertIsNot(sessions.get(first).context, sessions.get(second).context)
+        # Device accesses of session contexts go through the scheduler.
+        self.assertIsInstance(sessions.get(first).context.umd_api, ScheduledUmdApi)
+
+        data = sessions.run(first, "read_from_device", {"location": "0,0", "addr": 0x1000, "num_bytes": 8})
+        self.assertEqual(len(data), 8)
+        sessions.close(first)
+        self.assertEqual([session.session_id for session in sessions.sessions()], [second])
+
+    def test_idle_sessions_are_closed(self):
+        sessions = SessionManager(self.context, DeviceAccessScheduler(), idle_timeout=60.0)
+        idle = sessions.open()
+        active = sessions.open()
+        sessions.get(idle).last_used -= 120.0
+        self.assertEqual(sessions.close_idle(), [idle])
+        self.assertEqual([session.session_id for session in sessions.sessions()], [active])
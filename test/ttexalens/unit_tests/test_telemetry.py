@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+import unittest
+
+from test.ttexalens.unit_tests.test_base import init_cached_test_context
+from ttexalens.context import Context
+from ttexalens.telemetry import TelemetryPoller, TelemetryRingBuffer, TelemetrySample
+
+
+class TestTelemetryRingBuffer(unittest.TestCase):
+    def _sample(self, i: int) -> TelemetrySample:
+        return TelemetrySample(timestamp=float(i), device_id=0, tag_name="AICLK", value=i)
+
+    def test_empty(self):
+        buffer = TelemetryRingBuffer(4)
+        self.assertEqual(len(buffer), 0)
+        self.assertIsNone(buffer.latest())
+        self.assertEqual(buffer.to_list(), [])
+
+    def test_wraparound_keeps_newest(self):
+        buffer = TelemetryRingBuffer(4)
+        for i in range(10):
+            buffer.append(self._sample(i))
+        self.assertEqual(len(buffer), 4)
+        self.assertEqual([s.value for s in buffer.to_list()], [6, 7, 8, 9])
+        latest = buffer.latest()
+        assert latest is not None
+        self.assertEqual(latest.value, 9)
+
+    def test_since(self):
+        buffer = TelemetryRingBuffer(8)
+        for i in range(5):
+            buffer.append(self._sample(i))
+        self.assertEqual([s.value for s in buffer.to_list(since=2.0)], [3, 4])
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            TelemetryRingBuffer(0)
+
+
+class TestTelemetryPoller(unittest.TestCase):
+    context: Context
+
+    @classmethod
+    def setUpClass(cls):
+        cls.context = init_cached_test_context()
+
+    def setUp(self):
+        device = self.context.devices[0]
+        if device._umd_device.is_simulation or device.arc_block.telemetry_tags is None:
+            self.skipTest("ARC telemetry is not available on this platform")
+
+    def test_poller_records_history(self):
+        with TelemetryPoller(self.context, ["TIMER_HEARTBEAT"], [0], interval=0.01, history_size=4) as poller:
+            self.assertTrue(poller.wait_for_samples(6, timeout=10))
+        history = poller.history(0, "TIMER_HEARTBEAT")
+        self.assertEqual(len(history), 4)
+        self.assertEqual(history, sorted(history, key=lambda sample: sample.timestamp))
+        self.assertFalse(poller.is_running)
+
+
+if __name__ == "__main__":
+    unittest.main()
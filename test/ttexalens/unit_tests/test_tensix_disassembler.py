@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+import inspect
+import unittest
+
+from parameterized import parameterized
+
+import ttexalens.hardware.blackhole.tensix_ops as blackhole_ops
+import ttexalens.hardware.wormhole.tensix_ops as wormhole_ops
+from ttexalens.exceptions import TTException
+from ttexalens.tensix_disassembler import TensixDisassembler
+
+
+class TestTensixDisassembler(unittest.TestCase):
+    @parameterized.expand([("wormhole", wormhole_ops), ("blackhole", blackhole_ops)])
+    def test_every_encoder_round_trips(self, _, ops):
+        disassembler = TensixDisassembler(ops)
+        self.assertEqual(len(disassembler.formats), len([name for name in dir(ops) if name.startswith("TT_OP_")]))
+        for instruction_format in disassembler.formats.values():
+            encoder = getattr(ops, f"TT_OP_{instruction_format.mnemonic}")
+            # Largest value of every field, so a wrong width would spill into its neighbour.
+            values = {field.name: field.mask for field in instruction_format.fields}
+            args = [values.get(name, 0) for name in inspect.signature(encoder).parameters]
+            instruction = disassembler.disassemble(encoder(*args))[0]
+            self.assertEqual(instruction.mnemonic, instruction_format.mnemonic)
+            self.assertEqual(instruction.fields, values)
+
+    def test_buffer(self):
+        disassembler = TensixDisassembler(wormhole_ops)
+        data = wormhole_ops.TT_OP_SETRWC(0, 1, 2, 3, 4, 5) + (0xFF << 24).to_bytes(4, "little")
+        instructions = disassembler.disassemble(data, address=0x100)
+        self.assertEqual([instruction.address for instruction in instructions], [0x100, 0x104])
+        self.assertEqual(str(instructions[0]), "SETRWC clear_ab_vld=0, rwc_cr=1, rwc_d=2, rwc_b=3, rwc_a=4, BitMask=5")
+        self.assertIsNone(instructions[1].format)
+        self.assertEqual(instructions[1].mnemonic, "UNKNOWN_0xff")
+        # Words can be given directly, e.g. when captured from the debug bus.
+        self.assertEqual(disassembler.disassemble([instructions[0].word])[0].fields, instructions[0].fields)
+        with self.assertRaises(TTException):
+            disassembler.disassemble(data[:6])
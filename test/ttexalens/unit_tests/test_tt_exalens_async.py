@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+import unittest
+
+from test.ttexalens.unit_tests.test_base import init_cached_test_context
+import ttexalens as lib
+from ttexalens.context import NocId
+from ttexalens.tt_exalens_async import AsyncTTExaLens
+
+
+class TestAsyncTTExaLens(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.context = init_cached_test_context()
+        cls.locations = cls.context.devices[0].get_block_locations(block_type="functional_workers")[:8]
+
+    def test_overlapped_reads_match_sync_reads(self):
+        address = 0x100
+        for i, location in enumerate(self.locations):
+            lib.write_words_to_device(location, address, [0x1000 + i, 0x2000 + i], context=self.context)
+
+        async def read_all():
+            async with AsyncTTExaLens(self.context) as exalens:
+                return await exalens.gather(
+                    exalens.read_words_from_device(location, address, word_count=2) for location in self.locations
+                )
+
+        results = asyncio.run(read_all())
+        self.assertEqual(results, [[0x1000 + i, 0x2000 + i] for i in range(len(self.locations))])
+
+    def test_reads_on_both_nocs(self):
+        location = self.locations[0]
+        address = 0x100
+        lib.write_words_to_device(location, address, [0xCAFEBABE], context=self.context)
+
+        async def read_on_nocs():
+            async with AsyncTTExaLens(self.context) as exalens:
+                return await exalens.gather(
+                    exalens.read_word_from_device(location, address, noc_id=noc_id)
+                    for noc_id in [NocId.NOC0, NocId.NOC1] * 4
+                )
+
+        self.assertEqual(asyncio.run(read_on_nocs()), [0xCAFEBABE] * 8)
@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+import unittest
+
+from test.ttexalens.unit_tests.core_simulator import RiscvCoreSimulator
+from test.ttexalens.unit_tests.program_writer import RiscvProgramWriter
+from test.ttexalens.unit_tests.test_base import init_cached_test_context
+from ttexalens.watchpoint_tracer import WatchpointTracer
+
+
+class TestWatchpointTracer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.context = init_cached_test_context()
+
+    def setUp(self):
+        self.core_sim = RiscvCoreSimulator(self.context, "FW0", "brisc")
+        if not self.core_sim.has_debug_hardware() or self.core_sim.risc_debug.baby_risc_info.max_watchpoints == 0:
+            self.skipTest("Watchpoints are not available.")
+
+    def tearDown(self):
+        self.core_sim.set_reset(True)
+
+    def test_write_log(self):
+        address = 0x10000
+        values = [0x11111000, 0x22222000]
+        program_writer = RiscvProgramWriter(self.core_sim)
+        program_writer.append_ebreak()
+        for value in values:
+            program_writer.append_store_word_to_memory(address, value, 10, 11)
+        program_writer.append_while_true()
+        program_writer.write_program()
+
+        tracer = WatchpointTracer([self.core_sim.risc_debug], [address, address + 0x100])
+        self.core_sim.set_reset(False)
+        self.assertTrue(self.core_sim.is_ebreak_hit())
+        tracer.arm()
+        # A core halted for another reason is left alone.
+        self.assertEqual(tracer.poll_once(), [])
+        self.core_sim.continue_execution()
+        for _ in range(100):
+            tracer.poll_once()
+            if len(tracer.hits()) == len(values):
+                break
+        tracer.disarm()
+
+        hits = tracer.hits()
+        self.assertEqual([hit.value for hit in hits], values)
+        self.assertEqual([hit.address for hit in hits], [address, address])
+        self.assertEqual([hit.sequence for hit in hits], [0, 1])
+        self.assertLess(hits[0].pc, hits[1].pc)
+        self.assertEqual(tracer.hits(address=address + 0x100), [])
+        self.assertFalse(self.core_sim.is_halted(), "Core should be continued after every hit.")
+        self.assertFalse(self.core_sim.risc_debug.read_watchpoints_state()[0].is_enabled)
+
+    def test_stop_continues_core_halted_after_last_sweep(self):
+        address = 0x10000
+        program_writer = RiscvProgramWriter(self.core_sim)
+        program_writer.append_store_word_to_memory(address, 0x33333000, 10, 11)
+        program_writer.append_while_true()
+        program_writer.write_program()
+
+        tracer = WatchpointTracer([self.core_sim.risc_debug], [address])
+        tracer.arm()
+        self.core_sim.set_reset(False)
+        for _ in range(100):
+            if self.core_sim.is_halted():
+                break
+        self.assertTrue(self.core_sim.is_halted(), "Core should halt on the watchpoint.")
+        tracer.stop()
+
+        self.assertEqual([hit.value for hit in tracer.hits()], [0x33333000])
+        self.assertFalse(self.core_sim.is_halted(), "stop() should continue a core halted on a traced watchpoint.")
+        self.assertFalse(tracer.is_armed)
@@ -9,6 +9,7 @@ from .tt_exalens_lib import (
     check_context,
     convert_coordinate,
     coverage,
+    gather_global,
     get_global,
     get_tensix_state,
     load_elf,
@@ -36,6 +37,68 @@ from .perf_counters import (
     PerfCounterBlockDescription,
     TensixPerfCounters,
 )
+from .noc_profiler import (
+    start_noc_profiler,
+    stop_noc_profiler,
+    NocProfiler,
+)
+from .pc_sampler import (
+    start_pc_sampler,
+    PcSampler,
+)
+from .noc_snapshot import (
+    snapshot_noc_registers,
+    NocRegisterSnapshot,
+)
+from .memory_search import (
+    search_memory,
+    SearchMatch,
+    SearchPattern,
+)
+from .core_dump import (
+    capture_core_dump,
+    load_core_dump,
+    CoreDump,
+    CoreDumpContext,
+)
+from .memory_watch import (
+    start_memory_watch,
+    MemoryChange,
+    MemoryWatch,
+    WatchRegion,
+)
+from .watchpoint_tracer import (
+    start_watchpoint_tracer,
+    WatchpointHit,
+    WatchpointTracer,
+)
+from .server_operations import (
+    list_server_operations,
+    run_server_operation,
+    server_operation,
+)
+from .run_control import (
+    risc_group,
+    RiscGroup,
+    RunControlResult,
+)
+from .hang_detector import (
+    start_hang_detector,
+    CoreState,
+    HangDetector,
+    HangReport,
+)
+from .tensix_disassembler import (
+    disassemble_tensix_instructions,
+    TensixDisassembler,
+    TensixInstruction,
+)
+from .telemetry import (
+    start_telemetry_poller,
+    TelemetryPoller,
+    TelemetrySample,
+)
+from .tt_exalens_async import AsyncTTExaLens
 from .coordinate import OnChipCoordinate
 from .context import Context, NocId, to_noc_id
 from .device import Device
@@ -49,7 +112,6 @@ from .exceptions import (
     UnsafeAccessException,
 )
 
-
 __all__ = [
     # context.py
     "Context",
@@ -74,6 +136,7 @@ __all__ = [
     "check_context",
     "convert_coordinate",
     "coverage",
+    "gather_global",
     "get_global",
     "get_tensix_state",
     "load_elf",
@@ -99,6 +162,57 @@ __all__ = [
     "start_perf_counters",
     "stop_perf_counters",
     "TensixPerfCounters",
+    # noc_profiler.py
+    "NocProfiler",
+    "start_noc_profiler",
+    "stop_noc_profiler",
+    # pc_sampler.py
+    "PcSampler",
+    "start_pc_sampler",
+    # noc_snapshot.py
+    "NocRegisterSnapshot",
+    "snapshot_noc_registers",
+    # memory_search.py
+    "search_memory",
+    "SearchMatch",
+    "SearchPattern",
+    # core_dump.py
+    "capture_core_dump",
+    "load_core_dump",
+    "CoreDump",
+    "CoreDumpContext",
+    # memory_watch.py
+    "start_memory_watch",
+    "MemoryChange",
+    "MemoryWatch",
+    "WatchRegion",
+    # watchpoint_tracer.py
+    "start_watchpoint_tracer",
+    "WatchpointHit",
+    "WatchpointTracer",
+    # server_operations.py
+    "list_server_operations",
+    "run_server_operation",
+    "server_operation",
+    # run_control.py
+    "risc_group",
+    "RiscGroup",
+    "RunControlResult",
+    # hang_detector.py
+    "start_hang_detector",
+    "CoreState",
+    "HangDetector",
+    "HangReport",
+    # tensix_disassembler.py
+    "disassemble_tensix_instructions",
+    "TensixDisassembler",
+    "TensixInstruction",
+    # telemetry.py
+    "start_telemetry_poller",
+    "TelemetryPoller",
+    "TelemetrySample",
+    # tt_exalens_async.py
+    "AsyncTTExaLens",
     # util.py
     "TTException",
     "TTFatalException",
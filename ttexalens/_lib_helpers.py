@@ -10,6 +10,7 @@ from ttexalens.coordinate import OnChipCoordinate
 from ttexalens.device import Device
 from ttexalens.tt_exalens_init import init_ttexalens
 from ttexalens.exceptions import TTException
+from ttexalens import noc_profiler
 from ttexalens import util
 
 # Parameter name to formatter function mapping for trace_api decorator
@@ -21,7 +22,7 @@ F = TypeVar("F", bound=Callable[..., Any])
 
 
 def trace_api(func: F) -> F:
-    """Decorator to log API calls when verbosity is set to TRACE."""
+    """Decorator to log API calls when verbosity is set to TRACE and attribute NOC traffic to them when profiling."""
 
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -35,7 +36,8 @@ def trace_api(func: F) -> F:
                 formatter = _TRACE_FORMATTERS.get(k, repr)
                 formatted_args.append(f"{k}={formatter(v)}")
             util.TRACE(f"[API] {func.__name__}({', '.join(formatted_args)})")
-        return func(*args, **kwargs)
+        with noc_profiler.frame(func.__name__):
+            return func(*args, **kwargs)
 
     return cast(F, wrapper)
 
@@ -0,0 +1,153 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""Base class of tools that sample devices in sweeps on a background thread.
+
+A ``BackgroundPoller`` owns the thread lifecycle (``start``/``stop`` and the context manager),
+schedules sweeps at a fixed rate and stops on the first ``HardwareError``, which is then
+exposed through ``error``. Subclasses implement ``_sweep`` and keep their own results.
+"""
+
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+import traceback
+from typing import Callable, Hashable, Iterable, TypeVar
+
+from ttexalens import util
+from ttexalens.exceptions import HardwareError, TTException
+
+__all__ = [
+    "BackgroundPoller",
+]
+
+T = TypeVar("T")
+R = TypeVar("R")
+P = TypeVar("P", bound="BackgroundPoller")
+
+
+class BackgroundPoller:
+    """Runs ``_sweep`` on a background thread every ``interval`` seconds until stopped.
+
+    Args:
+        name (str): Name used in messages (e.g. "Telemetry poller").
+        interval (float): Time between the starts of two sweeps in seconds.
+        max_workers (int, default 1): Number of threads ``_map`` uses to read from devices in parallel.
+    """
+
+    # Whether the background thread sweeps right away or waits one interval first.
+    _sweep_on_start = True
+
+    def __init__(self, name: str, interval: float, max_workers: int = 1):
+        self._name = name
+        self._thread_name = f"ttexalens-{name.lower().replace(' ', '-')}"
+        self._interval = interval
+        self._max_workers = max(1, max_workers)
+        self._sweep_count = 0
+        self._failed_reads: set[Hashable] = set()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._executor: ThreadPoolExecutor | None = None  # created on the first parallel sweep, shut down by stop()
+        self._error: HardwareError | None = None
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def error(self) -> HardwareError | None:
+        """Hardware error that stopped the background thread, if any."""
+        return self._error
+
+    @property
+    def sweep_count(self) -> int:
+        """Number of completed sweeps."""
+        return self._sweep_count
+
+    def _sweep(self) -> object:
+        raise NotImplementedError
+
+    def _on_start(self) -> None:
+        """Called by ``start`` before the thread is created."""
+
+    def _on_stop(self) -> None:
+        """Called by ``stop`` after the thread has finished."""
+
+    def _next_sweep_time(self, scheduled: float, sweep_start: float) -> float:
+        # Schedule against a fixed grid so slow sweeps do not accumulate drift.
+        return max(scheduled + self._interval, time.monotonic())
+
+    def _report_failed_read(self, key: Hashable, message: str) -> None:
+        """Warns about a failed read once per ``key`` and keeps the traceback for debug output."""
+        if key not in self._failed_reads:
+            self._failed_reads.add(key)
+            util.WARN(message)
+        if util.DEBUG_ENABLED:
+            util.DEBUG(traceback.format_exc())
+
+    def _map(self, function: Callable[[T], R], items: Iterable[T]) -> list[R]:
+        """Calls ``function`` on every item, in parallel on a thread pool that is kept across sweeps."""
+        items = list(items)
+        if self._max_workers == 1 or len(items) <= 1:
+            return [function(item) for item in items]
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix=self._thread_name)
+        return list(self._executor.map(function, items))
+
+    def run(self: P, sweeps: int) -> P:
+        """Performs ``sweeps`` sweeps on the calling thread, at the same rate as the background thread."""
+        next_sweep = time.monotonic()
+        for _ in range(sweeps):
+            sweep_start = time.monotonic()
+            self._sweep()
+            next_sweep = self._next_sweep_time(next_sweep, sweep_start)
+            self._stop_event.wait(max(0.0, next_sweep - time.monotonic()))
+        return self
+
+    def _run(self) -> None:
+        next_sweep = time.monotonic()
+        if not self._sweep_on_start:
+            next_sweep = self._next_sweep_time(next_sweep, next_sweep)
+        while not self._stop_event.wait(max(0.0, next_sweep - time.monotonic())):
+            sweep_start = time.monotonic()
+            try:
+                self._sweep()
+            except HardwareError as e:
+                # Hardware failures are not retried in the background; surface them through `error`.
+                self._error = e
+                util.ERROR(f"{self._name} stopped: {e}")
+                return
+            next_sweep = self._next_sweep_time(next_sweep, sweep_start)
+
+    def start(self: P) -> P:
+        if self._thread is not None:
+            raise TTException(f"{self._name} already started.")
+        self._on_start()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name=self._thread_name, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self: P) -> P:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._thread = None
+        try:
+            self._on_stop()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+        return self
+
+    def __enter__(self: P) -> P:
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, tb) -> None:
+        self.stop()
@@ -59,6 +59,7 @@ except ModuleNotFoundError as e:
 from ttexalens import init_ttexalens, init_ttexalens_remote
 from ttexalens.server import start_server
 from ttexalens import util as util
+from ttexalens import noc_profiler
 from ttexalens.exceptions import TTException
 from ttexalens.context import Context, to_noc_id
 from ttexalens.uistate import UIState
@@ -303,7 +304,8 @@ def main_loop(args, context: Context):
                                 print(f"{eval_str} = {eval(eval_str)}")
                             else:
                                 assert found_command._module is not None
-                                new_navigation_suggestions = found_command._module.run(cmd_raw, context, ui_state)
+                                with noc_profiler.frame(f"cli:{found_command.long_name}"):
+                                    new_navigation_suggestions = found_command._module.run(cmd_raw, context, ui_state)
                                 navigation_suggestions = new_navigation_suggestions
 
             except CommandParsingException as e:
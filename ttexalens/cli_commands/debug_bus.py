@@ -5,7 +5,7 @@
 Usage:
   debug-bus list-signals [-d <device>] [-l <loc>] [--search <pattern>] [--max <max-sigs>] [-s]
   debug-bus list-groups [-d <device>] [-l <loc>] [--search <pattern>] [--max <max-groups>] [-s]
-  debug-bus group <group-name> <l1-address> [--samples <num>] [--sampling-interval <cycles>] [--search <pattern>] [--max <max-sigs>] [-d <device>] [-l <loc>] [-s]
+  debug-bus group <group-name> <l1-address> [--samples <num>] [--sampling-interval <cycles>] [--bursts <num>] [--output <file>] [--search <pattern>] [--max <max-sigs>] [-d <device>] [-l <loc>] [-s]
   debug-bus <signals> [-d <device>] [-l <loc>] [-s]
 
 Options:
@@ -14,6 +14,8 @@ Options:
     --max <max-sigs>                    Limit --search output (default: 10, use --max "all" to print all matches). [default: 10].
     --samples <num>                     (L1 sampling only) Number of 128-bit samples to capture. [default: 1]
     --sampling-interval <cycles>        (L1 sampling only, if --samples > 1) Delay in clock cycles between samples. Must be 2-256.[ default: 2]
+    --bursts <num>                      (L1 sampling only) Continuous capture: number of bursts of --samples samples, double-buffered in L1.
+    --output <file>                     (continuous capture only) Write the decoded time series to a CSV file.
 
 Description:
   Commands for RISC-V debugging:
@@ -27,6 +29,9 @@ Description:
         --search:    Search for signals by pattern (wildcard format)
         --samples:   Number of samples
         --sampling-interval: Delay between samples
+        --bursts:    Keep re-arming sampling into two L1 buffers (2 * samples * 16 bytes at <l1-address>) and print
+                     a per-signal summary of the whole time series instead of every sample
+        --output:    Write all decoded samples of the time series to a CSV file
         <l1-address>:      Byte address in L1 memory for L1 sampling mode (must be 16-byte aligned).
                                 Enables L1 sampling: signal(s) are captured as 128-bit words to L1 memory at the given address
                                 instead of direct 32-bit register read. Each sample uses 16 bytes. All samples must fit in the first 1 MiB (0x0 - 0xFFFFF).
@@ -44,12 +49,12 @@ Examples:
   debug-bus list-groups                                         # List all debug bus signal groups
   debug-bus list-groups --search brisc*                         # List groups whose names match pattern 'brisc'
   debug-bus group brisc_group_a 0x1000 --samples 4 --sampling-interval 10 # List all signals in group 'brisc_group_a' using L1 sampling, 4 samples, 10 cycles interval
+  debug-bus group brisc_group_a 0x1000 --samples 256 --bursts 100 --output pc.csv # Capture 100 bursts of 256 samples and save them to pc.csv
   debug-bus group brisc_group_a 0x1000 --search *pc             # List all signals in group 'brisc_group_a' that ends with 'pc' using L1 sampling
   debug-bus trisc0_pc,trisc1_pc                                 # Print values for trisc0_pc and trisc1_pc
   debug-bus {7,0,12,0x3ffffff},trisc2_pc                        # Print value for a custom signal and trisc2_pc
 """
 
-
 import re
 from typing import Any
 
@@ -281,6 +286,10 @@ def handle_group_reading_command(device: Device, loc: OnChipCoordinate, params:
     if samples == 1 and params.get("sampling-interval") is not None:
         util.WARN("Sampling interval is ignored when --samples=1.")
 
+    if params.get("bursts") is not None:
+        handle_group_capture_command(device, loc, debug_bus_signal_store, params)
+        return
+
     # Read all signals in the group using L1 sampling
     signal_group_sample = debug_bus_signal_store.sample_signal_group(
         group_name,
@@ -327,6 +336,64 @@ def handle_group_reading_command(device: Device, loc: OnChipCoordinate, params:
     )
 
 
+def handle_group_capture_command(
+    device: Device, loc: OnChipCoordinate, debug_bus_signal_store: DebugBusSignalStore, params: dict[str, Any]
+) -> None:
+    """Handle 'dbus group --bursts': continuously capture a group and summarize the decoded time series."""
+    group_name: str = params["group-name"]
+    series = debug_bus_signal_store.capture_signal_group(
+        group_name,
+        params["l1-address"],
+        samples_per_buffer=params["samples"] or 1,
+        bursts=params["bursts"],
+        sampling_interval=params["sampling-interval"] or 2,
+    )
+
+    signal_names = search(list(series.keys()), params["search"], params["max"])
+    if not signal_names:
+        print("No matches found.")
+        return
+
+    columns = {signal_name: series[signal_name] for signal_name in signal_names}
+    summary = []
+    for signal_name, values in columns.items():
+        signal_desc = debug_bus_signal_store.signals.get(signal_name)
+        transitions = sum(1 for previous, current in zip(values, values[1:]) if previous != current)
+        summary.append(
+            (
+                signal_name,
+                _format_signal_value(values[0], signal_desc=signal_desc),
+                _format_signal_value(values[-1], signal_desc=signal_desc),
+                str(len(set(values))),
+                str(transitions),
+            )
+        )
+
+    header = (
+        f"=== Device {device.id} - location {loc.to_str('logical')} - Group: {group_name} - "
+        f"{len(series)} samples in {len(series.burst_starts)} bursts ==="
+    )
+    formatter.print_header(header, style="bold")
+    formatter.display_grouped_data(
+        {group_name: summary},
+        [("Name", ""), ("First", ""), ("Last", ""), ("Distinct", ""), ("Transitions", "")],
+        [[group_name]],
+        simple_print=params["simple"],
+    )
+
+    output_file = params.get("output")
+    if output_file:
+        burst_ends = series.burst_starts[1:] + [len(series)]
+        with open(output_file, "w") as f:
+            f.write(",".join(["sample", "burst", *signal_names]) + "\n")
+            for burst, (start, end) in enumerate(zip(series.burst_starts, burst_ends)):
+                for index in range(start, end):
+                    row = [str(index), str(burst)]
+                    row.extend(f"0x{columns[signal_name][index]:x}" for signal_name in signal_names)
+                    f.write(",".join(row) + "\n")
+        print(f"Time series written to {output_file}")
+
+
 def handle_signal_reading_command(device: Device, loc: OnChipCoordinate, params: dict[str, Any]) -> None:
     """Handle signal reading commands - read specific signals with optional L1 sampling."""
     debug_bus_signal_store = _get_debug_bus_signal_store(device, loc)
@@ -390,9 +457,11 @@ def run(cmd_text: str, context: Context, ui_state: UIState):
         "search": dopt.args["--search"] if dopt.args.get("--search") is not None else "*",
         "max": dopt.args["--max"] if dopt.args.get("--max") is not None else "10",
         "samples": int(dopt.args["--samples"]) if dopt.args.get("--samples") is not None else None,
-        "sampling-interval": int(dopt.args["--sampling-interval"])
-        if dopt.args.get("--sampling-interval") is not None
-        else None,
+        "sampling-interval": (
+            int(dopt.args["--sampling-interval"]) if dopt.args.get("--sampling-interval") is not None else None
+        ),
+        "bursts": int(dopt.args["--bursts"]) if dopt.args.get("--bursts") is not None else None,
+        "output": dopt.args.get("--output"),
         "group-name": dopt.args.get("<group-name>"),
         "l1-address": int(dopt.args["<l1-address>"], 0) if dopt.args.get("<l1-address>") is not None else None,
         "signals": parse_command_arguments(dopt.args) if dopt.args.get("<signals>") is not None else None,
@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""
+Usage:
+  hang-detect [--window <n>] [--interval <seconds>] [--duty-cycle <fraction>] [--follow] [--all] [-r <risc>] [-d <device>] [-l <loc>]
+
+Options:
+  --window=<n>              Number of sweeps every RISC is classified over. [default: 8]
+  --interval=<seconds>      Minimum time between two sweeps in seconds. [default: 0.2]
+  --duty-cycle=<fraction>   Largest fraction of time spent reading from the device. [default: 0.05]
+  --follow                  Keep monitoring and print a report after every window until interrupted with Ctrl+C.
+  --all                     Show all RISCs, not only the ones that are not progressing.
+  -r <risc>                 RISC cores to monitor, comma separated (e.g. brisc,trisc0). [default: all]
+
+Description:
+  Samples the reset and debug status, the debug-bus PC and the NIU transaction counters of every
+  RISC without halting it, and classifies each RISC as progressing, spinning (looping with an idle
+  NOC), blocked_on_noc (looping with NOC requests that get no response), halted or in_reset.
+  Cores blocked on the NOC are listed first, as they are the most likely root of a hang.
+  Reads are issued one at a time and take at most the given duty cycle of the time.
+
+Examples:
+  hang-detect -l all                      # Classify all cores of the current device
+  hang-detect -l all -d all --follow      # Keep monitoring all devices
+  hang-detect -r brisc,ncrisc -l 0,0      # Monitor only data movement RISCs of one core
+"""
+
+import time
+
+from ttexalens import util as util
+from ttexalens.command_parser import CommandMetadata, CommonCommandOptions, tt_docopt
+from ttexalens.context import Context
+from ttexalens.exceptions import TTException
+from ttexalens.hang_detector import HangDetector
+from ttexalens.uistate import UIState
+
+command_metadata = CommandMetadata(
+    short_name="hang",
+    long_name="hang-detect",
+    type="dev",
+    description=__doc__,
+    common_option_names=[CommonCommandOptions.Device, CommonCommandOptions.Location],
+)
+
+
+def run(cmd_text: str, context: Context, ui_state: UIState):
+    dopt = tt_docopt(command_metadata, cmd_text)
+    args = dopt.args
+    risc_option = args["-r"]
+    risc_names = [name.lower() for name in risc_option.split(",")] if risc_option and risc_option != "all" else None
+
+    locations = [
+        location
+        for device in dopt.for_each(CommonCommandOptions.Device, context, ui_state)
+        for location in dopt.for_each(CommonCommandOptions.Location, context, ui_state, device=device)
+    ]
+    try:
+        detector = HangDetector(
+            locations,
+            risc_names,
+            window=int(args["--window"]),
+            interval=float(args["--interval"]),
+            max_duty_cycle=float(args["--duty-cycle"]),
+        )
+    except TTException as e:
+        util.ERROR(str(e))
+        return []
+
+    window = int(args["--window"])
+    start_time = time.monotonic()
+    util.INFO(f"Monitoring {len(locations)} core(s). Press Ctrl+C to stop.")
+    try:
+        while True:
+            detector.run(window)
+            report = detector.report()
+            print(report.summary())
+            print(report.table(suspects_only=not args["--all"]))
+            if report.is_hung:
+                util.WARN("No monitored RISC is making progress.")
+            if not args["--follow"]:
+                break
+    except KeyboardInterrupt:
+        pass
+    except TTException as e:
+        util.ERROR(str(e))
+    elapsed = time.monotonic() - start_time
+    if elapsed > 0:
+        print(f"Spent {100 * detector.busy_time / elapsed:.1f}% of the time reading from the device.")
+    return []
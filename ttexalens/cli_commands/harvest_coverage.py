@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+#
+# SPDX-License-Identifier: Apache-2.0
+"""
+Usage:
+  harvest-coverage <output_dir> --elf=<files> [--no-gcno] [--threads=<n>] [-d <device>...] [-l <loc>]
+
+Arguments:
+  output_dir      Directory for the merged gcda (and gcno) files
+
+Options:
+  --elf=<files>   Comma-separated <risc>=<elf> pairs: the ELF each RISC ran (e.g. brisc=b.elf,trisc0=t0.elf).
+  --no-gcno       Do not copy gcno files next to the merged gcda files.
+  --threads=<n>   Number of threads reading from the device. [default: 16]
+
+Description:
+  Collect coverage of every given core and RISC, and merge the counters of all runs of the same
+  source object into one gcda per object. Use it instead of dump-coverage when kernels ran on many cores.
+
+Examples:
+  hcov coverage --elf brisc=build/riscv-src/wormhole/cov_test.coverage.brisc.elf -l all
+  hcov coverage --elf brisc=b.elf,ncrisc=nc.elf -d all -l all
+"""
+
+from ttexalens import util
+from ttexalens.context import Context
+from ttexalens.coordinate import OnChipCoordinate
+from ttexalens.coverage import harvest_coverage
+from ttexalens.elf import ElfFile
+from ttexalens.tt_exalens_lib import check_context, parse_elf
+from ttexalens.uistate import UIState
+from ttexalens.command_parser import CommandMetadata, tt_docopt, CommonCommandOptions
+
+command_metadata = CommandMetadata(
+    short_name="hcov",
+    long_name="harvest-coverage",
+    type="high-level",
+    description=__doc__,
+    common_option_names=[CommonCommandOptions.Device, CommonCommandOptions.Location],
+)
+
+
+def run(cmd_text: str, context: Context, ui_state: UIState) -> list[dict[str, str]]:
+    dopt = tt_docopt(command_metadata, cmd_text)
+    context = check_context(context)
+
+    elfs: dict[str, ElfFile] = {}
+    for item in dopt.args["--elf"].split(","):
+        if "=" not in item:
+            util.ERROR(f"harvest-coverage: expected <risc>=<elf>, got '{item}'")
+            return []
+        risc_name, elf_path = item.split("=", 1)
+        elfs[risc_name.lower()] = parse_elf(elf_path, context)
+
+    targets: list[tuple[OnChipCoordinate, ElfFile]] = []
+    for device in dopt.for_each(CommonCommandOptions.Device, context, ui_state):
+        for loc in dopt.for_each(CommonCommandOptions.Location, context, ui_state, device=device):
+            block_riscs = [risc_name.lower() for risc_name in loc.noc_block.risc_names]
+            targets.extend((loc, elf) for risc_name, elf in elfs.items() if risc_name in block_riscs)
+
+    harvest = harvest_coverage(
+        targets, dopt.args["<output_dir>"], not dopt.args["--no-gcno"], int(dopt.args["--threads"])
+    )
+    for gcda_path, runs in harvest.gcda_files.items():
+        print(f"{gcda_path}: {runs} run(s) merged")
+    for loc, elf_path, e in harvest.errors:
+        util.WARN(f"harvest-coverage: {loc.to_user_str()} {elf_path}: {e}")
+    return []
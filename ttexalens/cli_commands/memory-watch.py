@@ -0,0 +1,132 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""
+Usage:
+  memory-watch [<address>] [--size <size>] [--block <name>] [--interval <seconds>] [--count <n>] [--page-size <n>] [--threads <n>] [--unsafe] [-d <device>] [-l <loc>]
+
+Arguments:
+  address                 NOC address of the watched region. If omitted, the whole block given by --block is watched.
+
+Options:
+  --size=<size>           Size of the watched region in bytes. Required together with <address>.
+  --block=<name>          Memory block to watch when <address> is omitted. [default: l1]
+  --interval=<seconds>    Time between two sweeps in seconds. [default: 0.5]
+  --count=<n>             Number of sweeps before returning; 0 keeps sweeping until interrupted with Ctrl+C. [default: 10]
+  --page-size=<n>         Granularity in bytes at which changes are detected. [default: 256]
+  --threads=<n>           Number of threads reading from the device. [default: 8]
+  --unsafe                Expert mode, allow reading everywhere (bypass safety checks).
+
+Description:
+  Reads a baseline of a memory region on all given cores and then re-reads it every interval,
+  printing which addresses changed and when. Unchanged pages are skipped, and every changed page
+  is shown once per sweep with its old and new bytes from the first to the last modified byte.
+
+Examples:
+  memory-watch -l all                             # Watch L1 of all cores for 10 sweeps
+  memory-watch 0x1000 --size 64 --count 0         # Watch 64 bytes of the current core until Ctrl+C
+  memory-watch --interval 0.1 --page-size 64 -l 0,0
+"""
+
+import time
+
+from tabulate import tabulate
+
+from ttexalens import util as util
+from ttexalens.command_parser import CommandMetadata, CommonCommandOptions, tt_docopt
+from ttexalens.context import Context
+from ttexalens.exceptions import TTException
+from ttexalens.memory_watch import MemoryChange, MemoryWatch, WatchRegion
+from ttexalens.uistate import UIState
+
+command_metadata = CommandMetadata(
+    short_name="mwatch",
+    long_name="memory-watch",
+    type="dev",
+    description=__doc__,
+    common_option_names=[CommonCommandOptions.Device, CommonCommandOptions.Location],
+)
+
+_MAX_SHOWN_BYTES = 16
+
+
+def _format_bytes(data: bytes) -> str:
+    text = data[:_MAX_SHOWN_BYTES].hex(" ")
+    if len(data) > _MAX_SHOWN_BYTES:
+        text += f" ... ({len(data)} bytes)"
+    return text
+
+
+def _render(changes: list[MemoryChange], start_time: float) -> str:
+    rows = [
+        [
+            f"+{change.timestamp - start_time:.3f}s",
+            change.sweep,
+            change.location.device_id,
+            change.location.to_user_str(),
+            f"0x{change.address:08x}",
+            _format_bytes(change.old),
+            _format_bytes(change.new),
+        ]
+        for change in changes
+    ]
+    return tabulate(
+        rows, headers=["Time", "Sweep", "Device", "Location", "Address", "Old", "New"], disable_numparse=True
+    )
+
+
+def run(cmd_text: str, context: Context, ui_state: UIState):
+    dopt = tt_docopt(command_metadata, cmd_text)
+    args = dopt.args
+
+    address = int(args["<address>"], 0) if args["<address>"] else None
+    size = int(args["--size"], 0) if args["--size"] else None
+    if address is not None and (size is None or size <= 0):
+        util.ERROR("--size must be given and greater than 0 together with <address>.")
+        return []
+    block_name = args["--block"] or "l1"
+
+    regions: list[WatchRegion] = []
+    for device in dopt.for_each(CommonCommandOptions.Device, context, ui_state):
+        for location in dopt.for_each(CommonCommandOptions.Location, context, ui_state, device=device):
+            if address is not None and size is not None:
+                regions.append(WatchRegion(location, address, size))
+                continue
+            try:
+                regions.append(WatchRegion.from_block(location, block_name))
+            except TTException as e:
+                util.ERROR(f"Device {device.id} | Location {location.to_user_str()}: {e}")
+    if not regions:
+        return []
+
+    try:
+        watch = MemoryWatch(
+            regions,
+            interval=float(args["--interval"]),
+            page_size=int(args["--page-size"], 0),
+            max_workers=int(args["--threads"]),
+            safe_mode=False if args["--unsafe"] else None,
+        )
+    except TTException as e:
+        util.ERROR(str(e))
+        return []
+    count = int(args["--count"])
+
+    try:
+        watch.take_baseline()
+        start_time = watch.start_time
+        assert start_time is not None
+        total_bytes = sum(region.size for region in regions)
+        util.INFO(f"Watching {len(regions)} region(s), {total_bytes:,} bytes. Press Ctrl+C to stop.")
+        while count == 0 or watch.sweep_count < count:
+            time.sleep(watch.interval)
+            changes = watch.poll_once()
+            if changes:
+                print(_render(changes, start_time))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # Sweeps were run with poll_once, so this only shuts down the read pool.
+        watch.stop()
+    print(f"{len(watch.changes())} change(s) in {watch.sweep_count} sweep(s).")
+    return []
@@ -89,23 +89,6 @@ def get_noc_register_names(register_store: RegisterStore) -> list[str]:
 ###############################################################################
 # Register Definitions and Extraction
 ###############################################################################
-def read_register_with_address(register_store: RegisterStore, reg_name: str) -> tuple[str, int, int]:
-    """
-    Read a register and return its name, address, and value.
-
-    Args:
-        register_store: The register store to read from
-        reg_name: Name of the register to read
-
-    Returns:
-        Tuple containing (name, address, value)
-    """
-    desc = register_store.get_register_description(reg_name)
-    address = desc.noc_address if desc.noc_address is not None else 0
-    value = register_store.read_register(reg_name)
-    return (reg_name, address, value)
-
-
 def get_noc_status_registers(
     loc: OnChipCoordinate, device: Device, noc_id: NocId
 ) -> dict[str, list[tuple[str, int, int]]]:
@@ -144,11 +127,14 @@ def get_noc_status_registers(
     }
 
     register_store = device.get_block(loc).get_register_store(noc_id)
+    values = register_store.read_registers(
+        [name for registers in register_groups.values() for name in registers.values()]
+    )
     noc_registers: dict[str, list[tuple[str, int, int]]] = {group_name: [] for group_name in register_groups.keys()}
     for group_name, registers in register_groups.items():
         for register_desc, reg_name in registers.items():
-            _, address, value = read_register_with_address(register_store, reg_name)
-            noc_registers[group_name].append((register_desc, address, value))
+            address = register_store.get_register_description(reg_name).noc_address or 0
+            noc_registers[group_name].append((register_desc, address, values[reg_name]))
     return noc_registers
 
 
@@ -189,9 +175,12 @@ def get_noc_registers(
         List of tuples containing (name, address, value)
     """
     register_store = device.get_block(loc).get_register_store(noc_id)
+    values = register_store.read_registers(register_names)
     result = []
     for name in register_names:
-        result.append(read_register_with_address(register_store, name))
+        desc = register_store.get_register_description(name)
+        address = desc.noc_address if desc.noc_address is not None else 0
+        result.append((name, address, values[name]))
     return result
 
 
@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""
+Usage:
+  noc-profile start
+  noc-profile stop
+  noc-profile reset
+  noc-profile report [--depth=<n>] [--collapsed=<file>] [--weight=<weight>]
+
+Options:
+  --depth=<n>           Number of outermost call frames used to group the summary table. [default: 1]
+  --collapsed=<file>    Also write collapsed stacks (flame graph input) to this file.
+  --weight=<weight>     Value of collapsed stacks: time (microseconds), bytes or count. [default: time]
+
+Description:
+  Records every NOC transaction (byte count, DMA or MMIO path, latency) and attributes it to the CLI
+  command and library calls that issued it.
+
+  Subcommands:
+    start     Start recording.
+    stop      Stop recording. Recorded data is kept for 'report'.
+    reset     Drop recorded data.
+    report    Show a summary table of the recorded data.
+
+Examples:
+  noc-profile start
+  noc-profile report --depth 2
+  noc-profile report --collapsed noc.folded --weight count   # flamegraph.pl noc.folded > noc.svg
+"""
+
+from ttexalens import util as util
+from ttexalens.command_parser import CommandMetadata, tt_docopt
+from ttexalens.context import Context
+from ttexalens.noc_profiler import NocProfiler, get_active_profiler
+from ttexalens.uistate import UIState
+
+command_metadata = CommandMetadata(
+    short_name="nprof",
+    long_name="noc-profile",
+    type="dev",
+    description=__doc__,
+)
+
+# Last profiler started from the CLI; kept after 'stop' so it can still be reported.
+_profiler: NocProfiler | None = None
+
+
+def run(cmd_text: str, context: Context, ui_state: UIState):
+    global _profiler
+    dopt = tt_docopt(command_metadata, cmd_text)
+    args = dopt.args
+
+    if args["start"]:
+        if get_active_profiler() is not None:
+            util.WARN("NOC profiler is already running.")
+            return []
+        _profiler = NocProfiler().start()
+        print("NOC profiler started.")
+        return []
+
+    if _profiler is None:
+        util.ERROR("NOC profiler was not started. Use 'noc-profile start'.")
+        return []
+
+    if args["stop"]:
+        _profiler.stop()
+        print("NOC profiler stopped.")
+    elif args["reset"]:
+        _profiler.reset()
+    elif args["report"]:
+        print(_profiler.summary_table(int(args["--depth"])))
+        if args["--collapsed"]:
+            _profiler.write_collapsed_stacks(args["--collapsed"], args["--weight"])
+            print(f"Collapsed stacks written to {args['--collapsed']}")
+    return []
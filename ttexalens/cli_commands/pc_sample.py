@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""
+Usage:
+  pc-sample [--elf=<files>] [--duration=<seconds>] [--interval=<seconds>] [--top=<n>] [--per-core] [--collapsed=<file>] [-d <device>] [-l <loc>] [-r <risc>]
+
+Options:
+  --elf=<files>           Comma-separated ELF files used to symbolize PCs. Prefix a file with <risc>= to use it
+                          only for that RISC (e.g. brisc=brisc.elf,trisc0=trisc0.elf).
+  --duration=<seconds>    How long to sample. [default: 1]
+  --interval=<seconds>    Time between two sampling sweeps; 0 samples as fast as possible. [default: 0]
+  --top=<n>               Number of rows shown in the histogram. [default: 20]
+  --per-core              Show the histogram per core instead of per RISC.
+  --collapsed=<file>      Also write collapsed stacks (flame graph input) to this file.
+
+Description:
+  Samples program counters of running RISC cores through the debug bus, without halting them,
+  and shows in which functions the cores spend their time.
+
+Examples:
+  pc-sample -l all -r brisc --elf brisc.elf                    # Profile brisc on all functional workers for 1 second
+  pc-sample -l 0,0/1,0 --elf trisc0=t0.elf,trisc1=t1.elf --per-core
+  pc-sample -l all --duration 5 --collapsed pc.folded          # flamegraph.pl pc.folded > pc.svg
+"""
+
+import time
+
+from ttexalens import util as util
+from ttexalens.command_parser import CommandMetadata, CommonCommandOptions, tt_docopt
+from ttexalens.context import Context
+from ttexalens.elf import ElfFile
+from ttexalens.pc_sampler import PcSampler
+from ttexalens.tt_exalens_lib import parse_elfs
+from ttexalens.uistate import UIState
+
+command_metadata = CommandMetadata(
+    short_name="pcs",
+    long_name="pc-sample",
+    type="dev",
+    description=__doc__,
+    common_option_names=[CommonCommandOptions.Device, CommonCommandOptions.Location, CommonCommandOptions.Risc],
+)
+
+
+def _parse_elf_option(elf_option: str | None, context: Context) -> dict[str, list[ElfFile]] | list[ElfFile] | None:
+    if not elf_option:
+        return None
+    shared: list[str] = []
+    per_risc: dict[str, list[str]] = {}
+    for item in elf_option.split(","):
+        if "=" in item:
+            risc_name, elf_path = item.split("=", 1)
+            per_risc.setdefault(risc_name.lower(), []).append(elf_path)
+        else:
+            shared.append(item)
+    if not per_risc:
+        return parse_elfs(shared, None, context)
+    return {risc_name: parse_elfs(paths + shared, None, context) for risc_name, paths in per_risc.items()}
+
+
+def run(cmd_text: str, context: Context, ui_state: UIState):
+    dopt = tt_docopt(command_metadata, cmd_text)
+    args = dopt.args
+
+    locations = [
+        location
+        for device in dopt.for_each(CommonCommandOptions.Device, context, ui_state)
+        for location in dopt.for_each(CommonCommandOptions.Location, context, ui_state, device=device)
+    ]
+    risc_option = args["-r"]
+    risc_names = risc_option.split(",") if risc_option and risc_option != "all" else None
+    elfs = _parse_elf_option(args["--elf"], context)
+    duration = float(args["--duration"])
+
+    sampler = PcSampler(locations, risc_names, elfs, float(args["--interval"]))
+    with sampler:
+        try:
+            time.sleep(duration)
+        except KeyboardInterrupt:
+            pass
+    if sampler.error is not None:
+        util.ERROR(f"Sampling stopped early: {sampler.error}")
+
+    print(f"{sampler.sweep_count} sweeps over {len(locations)} location(s) in {duration} s")
+    print(sampler.histogram_table(per_core=args["--per-core"], limit=int(args["--top"])))
+    if args["--collapsed"]:
+        sampler.write_collapsed_stacks(args["--collapsed"])
+        print(f"Collapsed stacks written to {args['--collapsed']}")
+    return []
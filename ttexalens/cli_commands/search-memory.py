@@ -3,7 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 """
 Usage:
-  search <pattern>... [--start <start>] [--end <end>] [--width <width>] [--read-size <rs>] [--max-results <n>] [--unsafe] [-r <risc_name>] [-d <device>] [-l <loc>]
+  search <pattern>... [--start <start>] [--end <end>] [--width <width>] [--read-size <rs>] [--max-results <n>] [--mask <mask>] [--threads <n>] [--progress] [--unsafe] [-r <risc_name>] [-d <device>] [-l <loc>]
 
 Arguments:
   pattern         One or more integer values forming the byte pattern to search for.
@@ -15,9 +15,13 @@ Options:
   --width=<width>    Bytes per pattern element (any positive integer) or auto. [default: auto]
                      auto = minimum power-of-2 byte count needed to represent the largest element,
                      applied uniformly to all elements.
-  --read-size=<rs>   Maximum bytes per device read. Defaults to 4 when -r is used (RISC debug hardware),
-                     or 1MB otherwise.
-  --max-results=<n>  Maximum number of matches to return, or 'all'. [default: 1]
+  --read-size=<rs>   Maximum bytes per device read. Defaults to 1MB for memory reachable over NOC,
+                     or 256 bytes for RISC private memory read through the debug hardware.
+  --max-results=<n>  Maximum number of matches per location, or 'all'. [default: 1]
+  --mask=<mask>      Comma-separated masks, one per pattern element (same width). Bits that are 0 in
+                     the mask are ignored when matching.
+  --threads=<n>      Number of threads reading from the device. [default: 8]
+  --progress         Print search progress.
   -r <risc_name>     RISC core name to search in private memory instead of NOC memory.
   --unsafe           Expert mode, allow searching everywhere (bypass safety checks).
 
@@ -26,6 +30,7 @@ Description:
   little-endian integers. With --width=auto (default), the width is determined once
   as the minimum power-of-2 byte count needed to represent the largest element, and
   applied uniformly to all elements.
+  All given devices and locations are searched in parallel; matches are printed as they are found.
 
 Examples:
   search 0xDEADBEEF                              # Search for pattern in the block containing address 0
@@ -35,11 +40,13 @@ Examples:
   search 0x1234 0x5678 --width 2                 # Search for two 2-byte LE values (0x34 0x12 0x78 0x56)
   search 0xDEADBEEF --read-size 64               # Search using 64-byte reads
   search 0xAB --unsafe                           # Search with safety checks bypassed
-  search 0xBEEF -r brisc                         # Search brisc private memory (4-byte reads by default)
+  search 0xBEEF -r brisc                         # Search brisc private memory
   search 0xBEEF -r brisc --read-size 256         # Search brisc private memory with 256-byte reads
+  search 0xDEAD0000 --mask 0xFFFF0000 -l all     # Search all cores for a value whose upper half is 0xDEAD
 """
 
 import math
+import sys
 
 from ttexalens.context import Context
 from ttexalens.device import Device
@@ -48,7 +55,7 @@ from ttexalens.coordinate import OnChipCoordinate
 from ttexalens import util as util
 from ttexalens.exceptions import TTException
 from ttexalens.command_parser import CommandMetadata, tt_docopt, CommonCommandOptions
-from ttexalens.cli_commands.read import execute_safe_read, execute_unsafe_read
+from ttexalens.memory_search import SearchPattern, SearchRange, get_search_ranges, scan_ranges
 
 command_metadata = CommandMetadata(
     short_name="search",
@@ -57,9 +64,6 @@ command_metadata = CommandMetadata(
     common_option_names=[CommonCommandOptions.Device, CommonCommandOptions.Location],
 )
 
-_DEFAULT_READ_SIZE = 0x100000  # 1MB default for NOC reads
-_DEFAULT_READ_SIZE_RISC = 4  # 4 bytes default for RISC debug hardware reads
-
 
 def _auto_pattern_width(values: list[int]) -> int:
     """Return minimum power-of-2 byte count needed to represent the largest element in values."""
@@ -72,152 +76,10 @@ def _auto_pattern_width(values: list[int]) -> int:
     return max(_min_bytes(v) for v in values)
 
 
-def _build_pattern_bytes(values: list[int], width: int) -> bytes:
-    """Convert pattern values to a byte string using little-endian encoding with a uniform width.
-
-    Negative values are masked to the given width (two's-complement), so -1 at width 4
-    produces the same bytes as 0xFFFFFFFF.
-    """
-    mask = (1 << (width * 8)) - 1
-    result = b""
-    for v in values:
-        result += (v & mask).to_bytes(width, byteorder="little", signed=False)
-    return result
-
-
-def _find_in_data(data: bytes, pattern: bytes, base_addr: int, max_results: int | None = None) -> list[int]:
-    """Return absolute addresses of occurrences of pattern in data, up to max_results (None = unlimited)."""
-    matches = []
-    start = 0
-    while True:
-        idx = data.find(pattern, start)
-        if idx == -1:
-            break
-        matches.append(base_addr + idx)
-        if max_results is not None and len(matches) >= max_results:
-            break
-        start = idx + 1
-    return matches
-
-
-def _get_noc_search_ranges(
-    location: OnChipCoordinate, start_addr: int, end_addr: int | None, unsafe: bool
-) -> list[tuple[int, int, str]]:
-    """Return list of (range_start, range_end, block_name) for consecutive NOC blocks from start_addr.
-
-    With unsafe=True and an explicit end_addr the block map is skipped entirely and a single
-    raw range is returned.  Raises TTException if start_addr is not inside any known block.
-    """
-    if unsafe and end_addr is not None:
-        return [(start_addr, end_addr, "???")]
-
-    memory_map = location.noc_block.noc_memory_map
-    ranges: list[tuple[int, int, str]] = []
-    current = start_addr
-
-    while end_addr is None or current < end_addr:
-        block_info = memory_map.find_by_noc_address(current)
-        if block_info is None:
-            if not ranges:
-                raise TTException(f"Address 0x{current:08x} is not in a known NOC memory block")
-            break  # Gap after the last found block — stop here
-
-        assert block_info.memory_block.address.noc_address is not None
-        block_end = block_info.memory_block.address.noc_address + block_info.memory_block.size
-        eff_end = block_end if end_addr is None else min(block_end, end_addr)
-        ranges.append((current, eff_end, block_info.name))
-        current = block_end
-
-    return ranges
-
-
-def _get_risc_search_ranges(
-    location: OnChipCoordinate, risc_name: str, start_addr: int, end_addr: int | None, unsafe: bool
-) -> list[tuple[int, int, str]]:
-    """Return list of (range_start, range_end, block_name) for consecutive RISC private blocks from start_addr.
-
-    With unsafe=True and an explicit end_addr the block map is skipped entirely and a single
-    raw range is returned.  Raises TTException if start_addr is not inside any known block.
-    """
-    if unsafe and end_addr is not None:
-        return [(start_addr, end_addr, "???")]
-
-    risc_debug = location.noc_block.get_risc_debug(risc_name)
-    memory_map = risc_debug.risc_info.memory_map
-    ranges: list[tuple[int, int, str]] = []
-    current = start_addr
-
-    while end_addr is None or current < end_addr:
-        block_info = memory_map.find_by_private_address(current)
-        if block_info is None:
-            if not ranges:
-                raise TTException(f"Address 0x{current:08x} is not in a known {risc_name} private memory block")
-            break  # Gap after the last found block — stop here
-
-        assert block_info.memory_block.address.private_address is not None
-        block_end = block_info.memory_block.address.private_address + block_info.memory_block.size
-        eff_end = block_end if end_addr is None else min(block_end, end_addr)
-        ranges.append((current, eff_end, block_info.name))
-        current = block_end
-
-    return ranges
-
-
-def _search_in_range(
-    location: OnChipCoordinate,
-    range_start: int,
-    range_end: int,
-    block_name: str,
-    pattern_bytes: bytes,
-    unsafe: bool,
-    risc_name: str | None,
-    read_size: int,
-    max_results: int | None,
-) -> list[tuple[int, str]]:
-    """
-    Read memory in [range_start, range_end) in chunks and search for pattern_bytes.
-
-    Returns list of (match_address, block_name) pairs. Handles patterns that span
-    chunk boundaries by keeping a (len(pattern)-1) byte overlap between chunks.
-    Stops early once max_results matches are collected (None means no limit).
-    """
-    matches: list[tuple[int, str]] = []
-    overlap = len(pattern_bytes) - 1
-    current_addr = range_start
-    prev_tail = b""
-
-    while current_addr < range_end:
-        chunk_size = min(read_size, range_end - current_addr)
-        try:
-            if unsafe:
-                data, _ = execute_unsafe_read(location, current_addr, chunk_size, risc_name)
-            else:
-                data, _ = execute_safe_read(location, current_addr, chunk_size, risc_name)
-        except TTException as e:
-            if util.DEBUG_ENABLED:
-                util.DEBUG(f"search: skipping 0x{current_addr:08x}: {e}")
-            break
-
-        if not data:
-            break
-
-        # Prepend tail of previous chunk so patterns spanning the boundary are found.
-        # The base address of search_data = current_addr - len(prev_tail).
-        search_data = prev_tail + data
-        base = current_addr - len(prev_tail)
-
-        # All positions in search_data correspond to unique, not-yet-reported addresses
-        # (the math ensures no duplicates between iterations).
-        remaining = None if max_results is None else max_results - len(matches)
-        for match_addr in _find_in_data(search_data, pattern_bytes, base, remaining):
-            matches.append((match_addr, block_name))
-        if max_results is not None and len(matches) >= max_results:
-            return matches
-
-        prev_tail = search_data[-overlap:] if overlap > 0 else b""
-        current_addr += len(data)
-
-    return matches
+def _print_progress(done: int, total: int) -> None:
+    print(f"\rSearched {done:,} / {total:,} bytes ({100 * done // max(total, 1)}%)", end="", file=sys.stderr)
+    if done >= total:
+        print(file=sys.stderr)
 
 
 def run(cmd_text: str, context: Context, ui_state: UIState):
@@ -246,14 +108,22 @@ def run(cmd_text: str, context: Context, ui_state: UIState):
             util.ERROR(f"--width must be at least 1, got {width_str!r}.")
             return
 
-    try:
-        pattern_bytes = _build_pattern_bytes(pattern_values, width)
-    except (OverflowError, ValueError) as e:
-        util.ERROR(f"Pattern value does not fit in the specified width: {e}")
-        return
+    # --- Parse --mask ---
+    mask_values: list[int] | None = None
+    if args["--mask"]:
+        try:
+            mask_values = [int(v, 0) for v in args["--mask"].split(",")]
+        except ValueError as e:
+            util.ERROR(f"Invalid --mask value: {e}")
+            return
+        if len(mask_values) != len(pattern_values):
+            util.ERROR(f"--mask has {len(mask_values)} value(s), pattern has {len(pattern_values)}.")
+            return
 
-    if not pattern_bytes:
-        util.ERROR("Pattern is empty.")
+    try:
+        pattern = SearchPattern.from_values(pattern_values, width, mask_values)
+    except TTException as e:
+        util.ERROR(str(e))
         return
 
     # --- Parse address range ---
@@ -272,6 +142,7 @@ def run(cmd_text: str, context: Context, ui_state: UIState):
     risc_name: str | None = args["-r"]
 
     # --- Parse --read-size ---
+    read_size: int | None = None
     if args["--read-size"]:
         try:
             read_size = int(args["--read-size"], 0)
@@ -281,8 +152,6 @@ def run(cmd_text: str, context: Context, ui_state: UIState):
         if read_size < 1:
             util.ERROR(f"--read-size must be at least 1, got {read_size}.")
             return
-    else:
-        read_size = _DEFAULT_READ_SIZE_RISC if risc_name else _DEFAULT_READ_SIZE
 
     # --- Parse --max-results ---
     max_results_arg: str = args["--max-results"] if args["--max-results"] else "1"
@@ -298,10 +167,22 @@ def run(cmd_text: str, context: Context, ui_state: UIState):
             util.ERROR(f"--max-results must be at least 1, got {max_results_arg!r}.")
             return
 
-    # --- Display pattern summary ---
-    pattern_hex = " ".join(f"0x{b:02x}" for b in pattern_bytes)
-    util.INFO(f"Searching for pattern [{pattern_hex}] ({len(pattern_bytes)} byte(s))")
+    # --- Parse --threads ---
+    try:
+        threads = int(args["--threads"] or "8")
+    except ValueError:
+        util.ERROR(f"Invalid --threads value: {args['--threads']!r}. Must be a positive integer.")
+        return
 
+    # --- Display pattern summary ---
+    pattern_hex = " ".join(f"0x{b:02x}" for b in pattern.data)
+    if pattern.mask is not None:
+        pattern_hex += " mask " + " ".join(f"0x{b:02x}" for b in pattern.mask)
+    util.INFO(f"Searching for pattern [{pattern_hex}] ({len(pattern.data)} byte(s))")
+
+    # --- Resolve search ranges of all locations ---
+    headers: dict[OnChipCoordinate, str] = {}
+    ranges: list[SearchRange] = []
     device: Device
     location: OnChipCoordinate
     for device in dopt.for_each(CommonCommandOptions.Device, context, ui_state):
@@ -310,35 +191,28 @@ def run(cmd_text: str, context: Context, ui_state: UIState):
             device_id_str += f" [0x{device.unique_id:x}]"
 
         for location in dopt.for_each(CommonCommandOptions.Location, context, ui_state, device=device):
-            location_str = location.to_user_str()
-
+            header = f"Device {device_id_str} | Location {location.to_user_str()}"
             try:
-                if risc_name:
-                    ranges = _get_risc_search_ranges(location, risc_name, start_addr, end_addr, unsafe)
-                else:
-                    ranges = _get_noc_search_ranges(location, start_addr, end_addr, unsafe)
+                location_ranges = get_search_ranges(location, start_addr, end_addr, risc_name, unsafe)
             except TTException as e:
-                util.ERROR(f"Device {device_id_str} | Location {location_str}: {e}")
+                util.ERROR(f"{header}: {e}")
                 continue
 
-            if not ranges:
-                util.INFO(f"Device {device_id_str} | Location {location_str}: no accessible memory in search range.")
+            if not location_ranges:
+                util.INFO(f"{header}: no accessible memory in search range.")
                 continue
-
-            all_matches: list[tuple[int, str]] = []
-            for r_start, r_end, block_name in ranges:
-                remaining = None if max_results is None else max_results - len(all_matches)
-                block_matches = _search_in_range(
-                    location, r_start, r_end, block_name, pattern_bytes, unsafe, risc_name, read_size, remaining
-                )
-                all_matches.extend(block_matches)
-                if max_results is not None and len(all_matches) >= max_results:
-                    break
-
-            header = f"Device {device_id_str} | Location {location_str}"
-            if all_matches:
-                util.INFO(f"{header}: {len(all_matches)} match(es) found:")
-                for match_addr, block_name in all_matches:
-                    print(f"  0x{match_addr:08x}  ({block_name})")
-            else:
-                util.INFO(f"{header}: pattern not found.")
+            headers[location] = header
+            ranges.extend(location_ranges)
+
+    # --- Search all ranges in parallel, printing matches as they arrive ---
+    progress = _print_progress if args["--progress"] else None
+    match_counts: dict[OnChipCoordinate, int] = {}
+    for match in scan_ranges(ranges, [pattern], unsafe, read_size, max_results, threads, progress):
+        if match.location not in match_counts:
+            util.INFO(f"{headers[match.location]}: match(es) found:")
+        match_counts[match.location] = match_counts.get(match.location, 0) + 1
+        print(f"  0x{match.address:08x}  ({match.block_name})")
+
+    for location, header in headers.items():
+        if location not in match_counts:
+            util.INFO(f"{header}: pattern not found.")
@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""
+Usage:
+  telemetry list [-d <device>]
+  telemetry [<tags>] [--interval=<seconds>] [--count=<n>] [--history=<n>] [-d <device>]
+
+Arguments:
+  tags                    Comma-separated telemetry tag names. [default: ASIC_TEMPERATURE,AICLK,VCORE,TDP]
+
+Options:
+  --interval=<seconds>    Polling interval in seconds. [default: 0.5]
+  --count=<n>             Number of refreshes to show before returning; 0 keeps refreshing until
+                          interrupted with Ctrl+C. [default: 1]
+  --history=<n>           Number of samples to keep per device and tag. [default: 1000]
+
+Description:
+  Polls ARC telemetry tags on a background thread and shows a live view of the latest values
+  together with the minimum and maximum seen since polling started.
+
+Examples:
+  telemetry list                               # List available telemetry tags
+  telemetry                                    # Show default tags once
+  telemetry ASIC_TEMPERATURE,AICLK --count 0   # Keep refreshing until Ctrl+C
+  telemetry TDP --interval 0.1 --count 20 -d all
+"""
+
+from tabulate import tabulate
+
+from ttexalens import util as util
+from ttexalens.command_parser import CommandMetadata, CommonCommandOptions, tt_docopt
+from ttexalens.context import Context
+from ttexalens.hardware.arc_block import telemetry_tags_map
+from ttexalens.telemetry import TelemetryPoller
+from ttexalens.uistate import UIState
+
+command_metadata = CommandMetadata(
+    short_name="tel",
+    long_name="telemetry",
+    type="dev",
+    description=__doc__,
+    common_option_names=[CommonCommandOptions.Device],
+)
+
+
+def _render(poller: TelemetryPoller) -> str:
+    latest = poller.latest()
+    rows = []
+    for device_id in poller.device_ids:
+        for tag_name in poller.tag_names:
+            values = [sample.value for sample in poller.history(device_id, tag_name)]
+            if not values:
+                rows.append([device_id, tag_name, "-", "-", "-", 0])
+                continue
+            value = latest[(device_id, tag_name)].value
+            rows.append([device_id, tag_name, f"{value} (0x{value:x})", min(values), max(values), len(values)])
+    return tabulate(rows, headers=["Device", "Tag", "Value", "Min", "Max", "Samples"], disable_numparse=True)
+
+
+def run(cmd_text: str, context: Context, ui_state: UIState):
+    dopt = tt_docopt(command_metadata, cmd_text)
+    args = dopt.args
+    devices = list(dopt.for_each(CommonCommandOptions.Device, context, ui_state))
+
+    if args["list"]:
+        for device in devices:
+            tags = device.arc_block.telemetry_tags or {}
+            print(f"Device {device.id}:")
+            for name, tag_id in sorted(tags.items(), key=lambda item: item[1]):
+                print(f"  {tag_id:3d}  {name}")
+        return []
+
+    tags_arg = args["<tags>"] or "ASIC_TEMPERATURE,AICLK,VCORE,TDP"
+    tags = [tag.strip() for tag in tags_arg.split(",") if tag.strip()]
+    unknown = [tag for tag in tags if tag.upper() not in telemetry_tags_map]
+    if unknown:
+        util.ERROR(f"Unknown telemetry tag(s): {', '.join(unknown)}. Use 'telemetry list' to see available tags.")
+        return []
+    interval = float(args["--interval"])
+    count = int(args["--count"])
+    history_size = int(args["--history"])
+
+    poller = TelemetryPoller(context, tags, [device.id for device in devices], interval, history_size)
+    with poller:
+        refresh = 0
+        try:
+            while count == 0 or refresh < count:
+                refresh += 1
+                if not poller.wait_for_samples(refresh, timeout=max(10 * interval, 5.0)):
+                    util.ERROR("Timed out waiting for telemetry samples.")
+                    break
+                if count != 1:
+                    print(f"\n--- refresh {refresh} ({poller.sample_count} sweeps) ---")
+                print(_render(poller))
+        except KeyboardInterrupt:
+            pass
+    return []
@@ -0,0 +1,86 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""
+Usage:
+  tensix-disasm <address> [<word-count>] [--unsafe] [-d <device>] [-l <loc>]
+  tensix-disasm --words <words> [-d <device>]
+
+Arguments:
+  address         NOC address of the first instruction word.
+  word-count      Number of instruction words to disassemble. [default: 16]
+
+Options:
+  --words=<words> Comma-separated instruction words to decode instead of reading memory (e.g. captured from the debug bus).
+  --unsafe        Expert mode, allow reading everywhere (bypass safety checks).
+
+Description:
+  Disassembles 32-bit Tensix instruction words into mnemonics and fields, using the instruction
+  encodings of the device's architecture. Words with an unknown opcode are shown as UNKNOWN.
+
+Examples:
+  tensix-disasm 0x6000 32 -l 0,0                  # Disassemble 32 words from L1 of core 0,0
+  tensix-disasm --words 0x37000000,0x7e000000    # Decode instruction words given on the command line
+"""
+
+from tabulate import tabulate
+
+from ttexalens import util as util
+from ttexalens.command_parser import CommandMetadata, CommonCommandOptions, tt_docopt
+from ttexalens.context import Context
+from ttexalens.coordinate import OnChipCoordinate
+from ttexalens.device import Device
+from ttexalens.exceptions import TTException
+from ttexalens.tensix_disassembler import TensixInstruction, disassemble_tensix_instructions
+from ttexalens.uistate import UIState
+
+command_metadata = CommandMetadata(
+    short_name="tdis",
+    long_name="tensix-disasm",
+    type="dev",
+    description=__doc__,
+    common_option_names=[CommonCommandOptions.Device, CommonCommandOptions.Location],
+)
+
+
+def _render(instructions: list[TensixInstruction]) -> str:
+    rows = [
+        [f"0x{instruction.address:08x}", f"0x{instruction.word:08x}", instruction.mnemonic, instruction.operands_str()]
+        for instruction in instructions
+    ]
+    return tabulate(rows, headers=["Address", "Word", "Instruction", "Fields"], disable_numparse=True)
+
+
+def run(cmd_text: str, context: Context, ui_state: UIState):
+    dopt = tt_docopt(command_metadata, cmd_text)
+    args = dopt.args
+
+    device: Device
+    if args["--words"]:
+        try:
+            words = [int(word, 0) & 0xFFFFFFFF for word in args["--words"].split(",")]
+        except ValueError:
+            util.ERROR(f"Invalid instruction words: {args['--words']}")
+            return
+        for device in dopt.for_each(CommonCommandOptions.Device, context, ui_state):
+            print(_render(disassemble_tensix_instructions(words, device_id=device.id, context=context)))
+        return
+
+    address = int(args["<address>"], 0)
+    word_count = int(args["<word-count>"], 0) if args["<word-count>"] else 16
+    if word_count < 1:
+        util.ERROR(f"Number of words to disassemble must be at least 1, but specified {word_count}")
+        return
+
+    location: OnChipCoordinate
+    for device in dopt.for_each(CommonCommandOptions.Device, context, ui_state):
+        for location in dopt.for_each(CommonCommandOptions.Location, context, ui_state, device=device):
+            data = bytearray(4 * word_count)
+            try:
+                location.noc_read(address, data, safe_mode=False if args["--unsafe"] else None)
+                instructions = disassemble_tensix_instructions(data, address, device.id, context)
+            except TTException as e:
+                util.ERROR(f"{location.to_user_str()}: {e}")
+                continue
+            util.INFO(f"Device {device.id} | Location {location.to_user_str()}")
+            print(_render(instructions))
@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""
+Usage:
+  watch-writes <address>... [--access] [--elf=<files>] [--duration=<seconds>] [--interval=<seconds>] [-d <device>] [-l <loc>] [-r <risc>]
+
+Arguments:
+  address                 Addresses to watch, in the RISC address space. One watchpoint is used per address.
+
+Options:
+  --access                Log reads as well as writes.
+  --elf=<files>           Comma-separated ELF files used to symbolize PCs. Prefix a file with <risc>= to use it
+                          only for that RISC (e.g. brisc=brisc.elf,trisc0=trisc0.elf).
+  --duration=<seconds>    How long to trace; 0 traces until interrupted with Ctrl+C. [default: 0]
+  --interval=<seconds>    Time between two polling sweeps. [default: 0.001]
+
+Description:
+  Sets write watchpoints on the given addresses on all selected RISC cores. Every time a core halts
+  on one of them, its PC, the value at the address and the function that wrote it are recorded and
+  the core is continued. When tracing ends, replaced watchpoints are restored and the ordered log
+  of hits is printed.
+
+Examples:
+  watch-writes 0x1000 -l all -r brisc --elf brisc.elf        # Who writes to 0x1000 on any brisc
+  watch-writes 0x1000 0x1004 --access -l 0,0 --duration 5    # Reads and writes of two words for 5 seconds
+"""
+
+import time
+
+from ttexalens import util as util
+from ttexalens.cli_commands.pc_sample import _parse_elf_option
+from ttexalens.command_parser import CommandMetadata, CommonCommandOptions, tt_docopt
+from ttexalens.context import Context
+from ttexalens.exceptions import TTException
+from ttexalens.uistate import UIState
+from ttexalens.watchpoint_tracer import WatchpointTracer
+
+command_metadata = CommandMetadata(
+    short_name="ww",
+    long_name="watch-writes",
+    type="dev",
+    description=__doc__,
+    common_option_names=[CommonCommandOptions.Device, CommonCommandOptions.Location, CommonCommandOptions.Risc],
+)
+
+
+def run(cmd_text: str, context: Context, ui_state: UIState):
+    dopt = tt_docopt(command_metadata, cmd_text)
+    args = dopt.args
+
+    addresses = [int(address, 0) for address in args["<address>"]]
+    risc_option = args["-r"]
+    risc_names = [name.lower() for name in risc_option.split(",")] if risc_option and risc_option != "all" else None
+    risc_debugs = [
+        risc_debug
+        for device in dopt.for_each(CommonCommandOptions.Device, context, ui_state)
+        for location in dopt.for_each(CommonCommandOptions.Location, context, ui_state, device=device)
+        for risc_debug in location.noc_block.all_riscs
+        if (risc_names is None or risc_debug.risc_location.risc_name.lower() in risc_names) and risc_debug.can_debug()
+    ]
+    duration = float(args["--duration"])
+
+    try:
+        tracer = WatchpointTracer(
+            risc_debugs,
+            addresses,
+            args["--access"],
+            _parse_elf_option(args["--elf"], context),
+            float(args["--interval"]),
+        )
+        tracer.start()
+    except TTException as e:
+        util.ERROR(str(e))
+        return []
+    util.INFO(f"Tracing {len(addresses)} address(es) on {len(risc_debugs)} RISC(s). Press Ctrl+C to stop.")
+    try:
+        if duration > 0:
+            time.sleep(duration)
+        else:
+            while tracer.is_running:
+                time.sleep(0.1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        tracer.stop()
+    if tracer.error is not None:
+        util.ERROR(f"Tracing stopped early: {tracer.error}")
+
+    hits = tracer.hits()
+    print(f"{len(hits)} hit(s) in {tracer.sweep_count} sweep(s)")
+    if hits:
+        print(tracer.hits_table(hits))
+    return []
@@ -2,7 +2,10 @@
 
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
+import threading
 import traceback
 from typing import Iterable, TYPE_CHECKING
 
@@ -17,8 +20,8 @@ from ttexalens import util as util
 if TYPE_CHECKING:
     from ttexalens.command_parser import CommandMetadata
     from ttexalens.device import Device
-    from ttexalens.hardware.risc_debug import RiscLocation
-    from ttexalens.server import FileAccessApi
+    from ttexalens.hardware.risc_debug import RiscDebug, RiscLocation
+    from ttexalens.server import FileAccessApi, RemoteOperationApi
     from ttexalens.umd_api import UmdApi
 
 
@@ -44,6 +47,101 @@ def to_noc_id(value: NocId | int | str) -> NocId:
     return noc_id
 
 
+class DeviceDict(Mapping[int, "Device"]):
+    """
+    Devices of a context keyed by device ID. A device object is created on first access,
+    so looking up one device does not initialize the rest of the cluster.
+
+    Iterating over values() or items() needs every device; missing ones are then created by
+    load_all(), concurrently for each local (MMIO) chip together with its remote chips.
+    """
+
+    def __init__(self, context: Context):
+        self._context = context
+        self._devices: dict[int, Device] = {}
+        self._lock = threading.Lock()
+        self._device_locks: dict[int, threading.Lock] = {}
+
+    def __getitem__(self, device_id: int) -> Device:
+        device = self._devices.get(device_id)
+        if device is not None:
+            return device
+        if device_id not in self._context.device_ids:
+            raise KeyError(device_id)
+        with self._lock:
+            device_lock = self._device_locks.setdefault(device_id, threading.Lock())
+        with device_lock:
+            device = self._devices.get(device_id)
+            if device is None:
+                from ttexalens.device import Device
+
+                if util.DEBUG_ENABLED:
+                    util.DEBUG(f"Loading device {device_id}")
+                device = Device.create(device_id, self._context)
+                self._devices[device_id] = device
+        return device
+
+    def __contains__(self, device_id: object) -> bool:
+        return device_id in self._context.device_ids
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._context.device_ids)
+
+    def __len__(self) -> int:
+        return len(self._context.device_ids)
+
+    def values(self):
+        self.load_all()
+        return super().values()
+
+    def items(self):
+        self.load_all()
+        return super().items()
+
+    def loaded(self) -> list[Device]:
+        """Returns devices that were already created, without creating the others."""
+        return [self._devices[device_id] for device_id in self._context.device_ids if device_id in self._devices]
+
+    def _local_chip_groups(self) -> list[list[int]]:
+        # Remote chips are reached through ETH of their closest MMIO chip, so they are created on that chip's thread.
+        cluster_descriptor = self._context.cluster_descriptor
+        groups: dict[int, list[int]] = {}
+        for device_id in self._context.device_ids:
+            if device_id in self._devices:
+                continue
+            if cluster_descriptor.is_chip_mmio_capable(device_id):
+                local_id = device_id
+            else:
+                local_id = cluster_descriptor.get_closest_mmio_capable_chip(device_id)
+            groups.setdefault(local_id, []).append(device_id)
+        return list(groups.values())
+
+    def load_all(self, max_workers: int | None = None) -> None:
+        """
+        Creates all devices that were not created yet.
+
+        Args:
+            max_workers (int | None, optional): Maximum number of local chips initialized at the same time. If None, all of them.
+        """
+        if len(self._devices) == len(self._context.device_ids):
+            return
+        groups = self._local_chip_groups()
+
+        def load_group(device_ids: list[int]) -> None:
+            for device_id in device_ids:
+                self[device_id]
+
+        if len(groups) <= 1 or max_workers == 1:
+            for group in groups:
+                load_group(group)
+            return
+        with ThreadPoolExecutor(
+            max_workers=max_workers or len(groups), thread_name_prefix="ttexalens-device"
+        ) as executor:
+            for future in [executor.submit(load_group, group) for group in groups]:
+                future.result()
+
+
 # All-encompassing structure representing a TTExaLens context
 class Context:
     def __init__(
@@ -70,6 +168,8 @@ class Context:
 
         self.commands: list[CommandMetadata] = []
         self.loaded_elfs: dict[RiscLocation, str] = {}
+        # Set when connected to a ttexalens server that can run library operations next to the device.
+        self.server_operations: RemoteOperationApi | None = None
 
     @property
     def noc_id(self) -> NocId:
@@ -81,7 +181,8 @@ class Context:
             return
 
         self._noc_id = value
-        for device in self.devices.values():
+        # Devices created later pick up the new NOC from the context.
+        for device in self.devices.loaded():
             device.switch_noc(value)
 
     def assign_commands(self, commands: list[CommandMetadata]):
@@ -91,16 +192,12 @@ class Context:
                 self.commands.append(cmd)
 
     @cached_property
-    def devices(self) -> dict[int, Device]:
-        from ttexalens.device import Device
+    def devices(self) -> DeviceDict:
+        return DeviceDict(self)
 
-        device_ids = self.device_ids
-        devices: dict[int, Device] = dict()
-        for device_id in device_ids:
-            if util.DEBUG_ENABLED:
-                util.DEBUG(f"Loading device {device_id}")
-            devices[device_id] = Device.create(device_id, self)
-        return devices
+    def create_risc_debug(self, risc_debug: RiscDebug) -> RiscDebug:
+        """Returns the RiscDebug that serves ``risc_debug``'s core. Called once per RISC core, on first access."""
+        return risc_debug
 
     @cached_property
     def cluster_descriptor(self) -> tt_umd.ClusterDescriptor:
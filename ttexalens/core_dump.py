@@ -0,0 +1,1127 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""Post-mortem core dumps of a device and offline replay.
+
+``capture_core_dump`` writes one self-describing file per device:
+
+* a 16 byte header: magic ``TTXDUMP\\0``, format version, reserved word,
+* raw segment data, every segment aligned to 64 bytes,
+* a JSON index describing the device, its coordinate tables and every segment,
+* a 24 byte trailer: index offset, index size and the magic again.
+
+Segments are memory blocks of the NOC memory map of a core (``l1``, register blocks, ...), extra
+ranges requested by the caller (e.g. DRAM), RISC private memory and Tensix GPRs read through the
+debug hardware, and the configuration register space read through its indirect interface. The index
+also holds GPRs, PC and debug status of every RISC, which are read while the core is halted, and
+every debug bus signal group of worker cores.
+
+``load_core_dump`` opens dump files with mmap and returns a ``Context`` whose devices are backed by
+``CoreDumpUmdApi``, so memory reads, register stores, ``callstack``, ``get_global``,
+``get_tensix_state`` and the ELF/DWARF layer work without hardware. RISC cores are served by
+``CoreDumpRiscDebug``: they stay in the captured state, anything that would change the device raises.
+"""
+
+from __future__ import annotations
+from bisect import bisect_right
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import datetime
+import json
+import mmap
+import struct
+from typing import IO, Any, Generator, Sequence, cast
+
+import tt_umd
+
+from ttexalens import _lib_helpers
+from ttexalens import util
+from ttexalens.context import Context, NocId
+from ttexalens.coordinate import OnChipCoordinate
+from ttexalens.debug_bus_signal_store import DebugBusSignalDescription
+from ttexalens.device import Device
+from ttexalens.exceptions import CoordinateTranslationError, MemoryAccessException, ReadOnlyMemoryError, TTException
+from ttexalens.hardware.memory_block import MemoryBlock
+from ttexalens.hardware.noc_block import NocBlock
+from ttexalens.hardware.risc_debug import RiscDebug, RiscDebugStatus, RiscDebugWatchpointState
+from ttexalens.register_store import TensixGeneralPurposeRegisterDescription
+from ttexalens.umd_api import UmdApi
+from ttexalens.umd_device import UmdDevice
+
+__all__ = [
+    "CoreDump",
+    "CoreDumpContext",
+    "CoreDumpRiscDebug",
+    "CoreDumpRiscState",
+    "CoreDumpSegment",
+    "capture_core_dump",
+    "load_core_dump",
+    "write_core_dump",
+]
+
+FORMAT_VERSION = 1
+DEFAULT_BLOCK_TYPES = ["functional_workers", "eth", "dram"]
+DEFAULT_MAX_BLOCK_SIZE = 0x1000000  # Skips huge blocks (e.g. DRAM banks) unless requested by name or range
+
+_MAGIC = b"TTXDUMP\0"
+_HEADER = struct.Struct("<8sII")  # magic, version, reserved
+_TRAILER = struct.Struct("<QQ8s")  # index offset, index size, magic
+_SEGMENT_ALIGNMENT = 64
+_GPR_COUNT = 33  # x0-x31 and PC
+_COORDINATE_SYSTEMS = ["noc1", "logical", "translated"]
+_CONFIG_REGISTERS_BLOCK = "config_regs"
+_TENSIX_GPRS_BLOCK = "tensix_gprs"
+
+
+@dataclass(frozen=True)
+class CoreDumpSegment:
+    """Bytes of one address range. Ranges without a NOC address are private memory of ``risc_name``."""
+
+    location: tuple[int, int]  # noc0
+    block_name: str
+    size: int
+    offset: int  # in the dump file
+    noc_address: int | None = None
+    private_address: int | None = None
+    risc_name: str | None = None
+    neo_id: int | None = None
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "location": list(self.location),
+            "block": self.block_name,
+            "size": self.size,
+            "offset": self.offset,
+            "noc_address": self.noc_address,
+            "private_address": self.private_address,
+            "risc": self.risc_name,
+            "neo_id": self.neo_id,
+        }
+
+    @staticmethod
+    def from_json(value: dict[str, Any]) -> CoreDumpSegment:
+        return CoreDumpSegment(
+            (value["location"][0], value["location"][1]),
+            value["block"],
+            value["size"],
+            value["offset"],
+            value["noc_address"],
+            value["private_address"],
+            value["risc"],
+            value["neo_id"],
+        )
+
+
+@dataclass
+class CoreDumpRiscState:
+    """State of one RISC core at capture time. ``gprs`` and ``status`` are None if the core could not be halted."""
+
+    location: tuple[int, int]  # noc0
+    risc_name: str
+    neo_id: int | None
+    in_reset: bool | None = None
+    is_halted: bool | None = None  # before the capture halted it
+    status: RiscDebugStatus | None = None
+    gprs: list[int] | None = None
+    watchpoints: list[tuple[RiscDebugWatchpointState, int]] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def pc(self) -> int | None:
+        return self.gprs[32] if self.gprs is not None else None
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "location": list(self.location),
+            "risc": self.risc_name,
+            "neo_id": self.neo_id,
+            "in_reset": self.in_reset,
+            "is_halted": self.is_halted,
+            "status": (
+                {
+                    "is_halted": self.status.is_halted,
+                    "is_pc_watchpoint_hit": self.status.is_pc_watchpoint_hit,
+                    "is_memory_watchpoint_hit": self.status.is_memory_watchpoint_hit,
+                    "is_ebreak_hit": self.status.is_ebreak_hit,
+                    "watchpoints_hit": list(self.status.watchpoints_hit),
+                }
+                if self.status is not None
+                else None
+            ),
+            "gprs": self.gprs,
+            "watchpoints": [
+                {
+                    "is_enabled": state.is_enabled,
+                    "is_memory": state.is_memory,
+                    "is_read": state.is_read,
+                    "is_write": state.is_write,
+                    "address": address,
+                }
+                for state, address in self.watchpoints
+            ],
+            "error": self.error,
+        }
+
+    @staticmethod
+    def from_json(value: dict[str, Any]) -> CoreDumpRiscState:
+        status = value["status"]
+        return CoreDumpRiscState(
+            location=(value["location"][0], value["location"][1]),
+            risc_name=value["risc"],
+            neo_id=value["neo_id"],
+            in_reset=value["in_reset"],
+            is_halted=value["is_halted"],
+            status=RiscDebugStatus(**status) if status is not None else None,
+            gprs=value["gprs"],
+            watchpoints=[
+                (
+                    RiscDebugWatchpointState(w["is_enabled"], w["is_memory"], w["is_read"], w["is_write"]),
+                    w["address"],
+                )
+                for w in value["watchpoints"]
+            ],
+            error=value["error"],
+        )
+
+
+class CoreDump:
+    """A core dump file mapped into memory. Segment data is read straight from the mapping."""
+
+    def __init__(self, file_name: str):
+        self.file_name = file_name
+        self._file: IO[bytes] = open(file_name, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.header = self._read_index()
+        except Exception:
+            self.close()
+            raise
+
+        self.device_info: dict[str, Any] = self.header["device"]
+        self.cores: list[dict[str, Any]] = self.header["cores"]
+        self.segments = [CoreDumpSegment.from_json(segment) for segment in self.header["segments"]]
+        self.risc_states = {
+            (state.location, state.neo_id, state.risc_name): state
+            for state in (CoreDumpRiscState.from_json(value) for value in self.header["riscs"])
+        }
+        self.bar0: dict[int, int] = {int(address): value for address, value in self.header["bar0"].items()}
+        self.errors: list[str] = self.header["errors"]
+
+        noc_segments: dict[tuple[int, int], list[CoreDumpSegment]] = {}
+        private_segments: dict[tuple[tuple[int, int], int | None, str], list[CoreDumpSegment]] = {}
+        for segment in self.segments:
+            if segment.noc_address is not None:
+                noc_segments.setdefault(segment.location, []).append(segment)
+            elif segment.private_address is not None and segment.risc_name is not None:
+                key = (segment.location, segment.neo_id, segment.risc_name)
+                private_segments.setdefault(key, []).append(segment)
+        self._noc_segments = {
+            location: sorted(segments, key=lambda s: s.noc_address or 0) for location, segments in noc_segments.items()
+        }
+        self._private_segments = {
+            key: sorted(segments, key=lambda s: s.private_address or 0) for key, segments in private_segments.items()
+        }
+
+    def _read_index(self) -> dict[str, Any]:
+        size = len(self._mmap)
+        if size < _HEADER.size + _TRAILER.size:
+            raise TTException(f"{self.file_name} is not a core dump: file is too small.")
+        magic, version, _ = _HEADER.unpack_from(self._mmap, 0)
+        index_offset, index_size, trailer_magic = _TRAILER.unpack_from(self._mmap, size - _TRAILER.size)
+        if magic != _MAGIC or trailer_magic != _MAGIC:
+            raise TTException(f"{self.file_name} is not a core dump or is truncated.")
+        if version > FORMAT_VERSION:
+            raise TTException(
+                f"{self.file_name} has core dump format version {version}, newest supported is {FORMAT_VERSION}."
+            )
+        return json.loads(self._mmap[index_offset : index_offset + index_size])
+
+    def close(self) -> None:
+        if getattr(self, "_mmap", None) is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> CoreDump:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def device_id(self) -> int:
+        return self.device_info["id"]
+
+    @property
+    def arch(self) -> tt_umd.ARCH:
+        return tt_umd.ARCH[self.device_info["arch"]]
+
+    @property
+    def locations(self) -> list[tuple[int, int]]:
+        """NOC0 coordinates of all cores that have captured memory."""
+        return sorted(self._noc_segments.keys())
+
+    def read_segment(self, segment: CoreDumpSegment) -> bytes:
+        return self._mmap[segment.offset : segment.offset + segment.size]
+
+    def get_segment(self, location: tuple[int, int], block_name: str) -> CoreDumpSegment | None:
+        for segment in self.segments:
+            if segment.location == location and segment.block_name == block_name:
+                return segment
+        return None
+
+    @staticmethod
+    def _find(segments: list[CoreDumpSegment], starts: list[int], address: int) -> tuple[CoreDumpSegment, int] | None:
+        index = bisect_right(starts, address) - 1
+        if index < 0:
+            return None
+        segment = segments[index]
+        offset = address - starts[index]
+        return (segment, offset) if offset < segment.size else None
+
+    def _read(self, segments: list[CoreDumpSegment], starts: list[int], address: int, buffer: memoryview) -> bool:
+        # Adjacent segments (e.g. neighbouring register blocks) may serve one read together.
+        position = 0
+        while position < len(buffer):
+            found = self._find(segments, starts, address + position)
+            if found is None:
+                return False
+            segment, offset = found
+            size = min(len(buffer) - position, segment.size - offset)
+            start = segment.offset + offset
+            buffer[position : position + size] = self._mmap[start : start + size]
+            position += size
+        return True
+
+    def read_noc(self, location: tuple[int, int], address: int, buffer: bytearray | memoryview) -> None:
+        """Fills ``buffer`` with captured bytes from NOC ``address`` of the core at noc0 ``location``."""
+        segments = self._noc_segments.get(location, [])
+        starts = [s.noc_address or 0 for s in segments]
+        if not self._read(segments, starts, address, memoryview(buffer).cast("B")):
+            raise MemoryAccessException(
+                f"Range [0x{address:08x}, 0x{address + len(buffer):08x}) of core {location[0]}-{location[1]} "
+                f"was not captured in {self.file_name}"
+            )
+
+    def read_private(
+        self,
+        location: tuple[int, int],
+        neo_id: int | None,
+        risc_name: str,
+        address: int,
+        buffer: bytearray | memoryview,
+    ) -> bool:
+        """Fills ``buffer`` from captured private memory of a RISC core. Returns False if it was not captured."""
+        segments = self._private_segments.get((location, neo_id, risc_name), [])
+        starts = [s.private_address or 0 for s in segments]
+        return self._read(segments, starts, address, memoryview(buffer).cast("B"))
+
+    def get_risc_state(
+        self, location: tuple[int, int], risc_name: str, neo_id: int | None = None
+    ) -> CoreDumpRiscState | None:
+        return self.risc_states.get((location, neo_id, risc_name))
+
+    def has_riscs(self, location: tuple[int, int]) -> bool:
+        return any(key[0] == location for key in self.risc_states)
+
+
+class _CoreDumpWriter:
+    def __init__(self, file_name: str):
+        self.file = open(file_name, "wb")
+        self.file.write(_HEADER.pack(_MAGIC, FORMAT_VERSION, 0))
+        self.segments: list[CoreDumpSegment] = []
+
+    def add_segment(
+        self, data: bytes | bytearray | memoryview, location: tuple[int, int], block_name: str, **kwargs
+    ) -> CoreDumpSegment:
+        padding = -self.file.tell() % _SEGMENT_ALIGNMENT
+        self.file.write(bytes(padding))
+        segment = CoreDumpSegment(location, block_name, len(data), self.file.tell(), **kwargs)
+        self.file.write(data)
+        self.segments.append(segment)
+        return segment
+
+    def finish(self, index: dict[str, Any]) -> None:
+        index["segments"] = [segment.to_json() for segment in self.segments]
+        index_data = json.dumps(index).encode()
+        index_offset = self.file.tell()
+        self.file.write(index_data)
+        self.file.write(_TRAILER.pack(index_offset, len(index_data), _MAGIC))
+        self.file.close()
+
+
+def _capture_cores(device: Device) -> list[dict[str, Any]]:
+    cores = []
+    for block_type in device.block_types:
+        for location in device.get_block_locations(block_type):
+            noc0 = location._noc0_coord
+            coordinates = {}
+            for coord_system in _COORDINATE_SYSTEMS:
+                converted = device._from_noc0.get((noc0, coord_system))
+                if converted is not None:
+                    coordinates[coord_system] = list(converted[0])
+            cores.append({"noc0": list(noc0), "block_type": block_type, "coordinates": coordinates})
+    return cores
+
+
+def _capture_risc(writer: _CoreDumpWriter, risc_debug: RiscDebug) -> CoreDumpRiscState:
+    location = risc_debug.risc_location.location._noc0_coord
+    state = CoreDumpRiscState(location, risc_debug.risc_location.risc_name, risc_debug.risc_location.neo_id)
+    try:
+        state.in_reset = risc_debug.is_in_reset()
+        if state.in_reset or not risc_debug.can_debug():
+            return state
+        state.is_halted = risc_debug.is_halted()
+        with risc_debug.ensure_halted():
+            state.status = risc_debug.read_status()
+            state.gprs = [risc_debug.read_gpr(index) for index in range(_GPR_COUNT)]
+            for index, watchpoint in enumerate(risc_debug.read_watchpoints_state()):
+                state.watchpoints.append((watchpoint, risc_debug.read_watchpoint_address(index)))
+
+        # Private memory is read through the debug hardware even if it has a NOC address, which may be unsafe to read.
+        private_blocks: list[tuple[str, MemoryBlock | None]] = [
+            ("data_private_memory", risc_debug.get_data_private_memory()),
+            ("code_private_memory", risc_debug.get_code_private_memory()),
+        ]
+        for block_name, memory_block in private_blocks:
+            if memory_block is None or memory_block.address.private_address is None:
+                continue
+            buffer = bytearray(memory_block.size)
+            with risc_debug.ensure_private_memory_access():
+                risc_debug.read_memory_bytes(memory_block.address.private_address, buffer)
+            writer.add_segment(
+                buffer,
+                location,
+                block_name,
+                private_address=memory_block.address.private_address,
+                risc_name=state.risc_name,
+                neo_id=state.neo_id,
+            )
+    except Exception as e:
+        state.error = str(e)
+    return state
+
+
+def _capture_config_registers(writer: _CoreDumpWriter, noc_block: NocBlock) -> dict[str, Any] | None:
+    register_store = noc_block.get_register_store()
+    if "RISCV_DEBUG_REG_CFGREG_RD_CNTL" not in register_store.registers:
+        return None
+    config_regs = noc_block.get_default_risc_debug().risc_info.memory_map.find_by_name(_CONFIG_REGISTERS_BLOCK)
+    if config_regs is None:
+        return None
+    select_address = register_store.get_register_noc_address("RISCV_DEBUG_REG_CFGREG_RD_CNTL")
+    data_address = register_store.get_register_noc_address("RISCV_DEBUG_REG_CFGREG_RDDATA")
+    assert select_address is not None and data_address is not None
+
+    location = noc_block.location
+    values = bytearray()
+    for index in range(config_regs.memory_block.size // 4):
+        location.noc_write32(select_address, index)
+        values += location.noc_read32(data_address).to_bytes(4, byteorder="little")
+    segment = writer.add_segment(values, location._noc0_coord, _CONFIG_REGISTERS_BLOCK)
+    return {
+        "location": list(location._noc0_coord),
+        "select_address": select_address,
+        "data_address": data_address,
+        "offset": segment.offset,
+        "size": segment.size,
+    }
+
+
+def _capture_tensix_gprs(writer: _CoreDumpWriter, noc_block: NocBlock) -> None:
+    register_store = noc_block.get_register_store()
+    addresses = [
+        register_store.get_register_description(name).private_address
+        for name, register in register_store.registers.items()
+        if isinstance(register, TensixGeneralPurposeRegisterDescription)
+    ]
+    private_addresses = [address for address in addresses if address is not None]
+    if not private_addresses:
+        return
+    # Register stores read Tensix GPRs through the private memory of the default RISC core.
+    risc_debug = noc_block.get_default_risc_debug()
+    start = min(private_addresses)
+    buffer = bytearray(max(private_addresses) + 4 - start)
+    with risc_debug.ensure_private_memory_access():
+        risc_debug.read_memory_bytes(start, buffer)
+    writer.add_segment(
+        buffer,
+        noc_block.location._noc0_coord,
+        _TENSIX_GPRS_BLOCK,
+        private_address=start,
+        risc_name=risc_debug.risc_location.risc_name,
+        neo_id=risc_debug.risc_location.neo_id,
+    )
+
+
+def _capture_debug_bus(noc_block: NocBlock) -> dict[str, Any] | None:
+    debug_bus = noc_block.debug_bus
+    if debug_bus is None:
+        return None
+    register_store = noc_block.get_register_store()
+    select_address = register_store.get_register_noc_address("RISCV_DEBUG_REG_DBG_BUS_CNTL_REG")
+    data_address = register_store.get_register_noc_address("RISCV_DEBUG_REG_DBG_RD_DATA")
+    if select_address is None or data_address is None:
+        return None
+
+    # Every 32 bit word of every signal group, as read_signal_group_unsafe reads them.
+    location = noc_block.location
+    values = []
+    for daisy_sel, sig_sel in sorted(set(debug_bus.group_map.values())):
+        for rd_sel in range(4):
+            select = DebugBusSignalDescription(rd_sel=rd_sel, daisy_sel=daisy_sel, sig_sel=sig_sel).encode()
+            location.noc_write32(select_address, select)
+            values.append([select, location.noc_read32(data_address)])
+    return {
+        "location": list(location._noc0_coord),
+        "select_address": select_address,
+        "data_address": data_address,
+        "values": values,
+    }
+
+
+def _capture_bar0(device: Device) -> dict[str, int]:
+    register_store = device.arc_block.get_register_store()
+    values: dict[str, int] = {}
+    for register in register_store.registers.values():
+        address = register.bar0_address
+        if address is not None and str(address) not in values:
+            values[str(address)] = device.bar0_read32(address)
+    return values
+
+
+def _capture_memory_blocks(
+    writer: _CoreDumpWriter,
+    location: OnChipCoordinate,
+    blocks: list[str] | None,
+    max_block_size: int,
+    errors: list[str],
+) -> None:
+    for interval in location.noc_block.noc_memory_map.noc_address_intervals():
+        block_info = interval.block
+        size = interval.end - interval.start
+        if blocks is not None:
+            if block_info.name not in blocks:
+                continue
+        elif size > max_block_size:
+            continue
+        if not block_info.is_accessible or not block_info.is_safe_to_read(interval.start, size):
+            continue
+        buffer = bytearray(size)
+        try:
+            location.noc_read(interval.start, buffer)
+        except Exception as e:
+            errors.append(f"{location.to_user_str()} {block_info.name}: {e}")
+            continue
+        writer.add_segment(buffer, location._noc0_coord, block_info.name, noc_address=interval.start)
+
+
+def write_core_dump(
+    file_name: str,
+    device: Device,
+    locations: list[OnChipCoordinate],
+    blocks: list[str] | None = None,
+    ranges: list[tuple[OnChipCoordinate, int, int]] | None = None,
+    riscs: bool = True,
+    config_registers: bool = True,
+    max_block_size: int = DEFAULT_MAX_BLOCK_SIZE,
+    tensix_state: bool = True,
+) -> list[str]:
+    """Writes a core dump of ``locations`` on ``device``. See capture_core_dump. Returns problems hit on the way."""
+    errors: list[str] = []
+    writer = _CoreDumpWriter(file_name)
+    try:
+        risc_states: list[CoreDumpRiscState] = []
+        config_windows = []
+        debug_bus_windows = []
+        for location in locations:
+            noc_block = location.noc_block
+            # RISC state first: reading it halts each core only for a moment.
+            if riscs:
+                risc_states.extend(_capture_risc(writer, risc_debug) for risc_debug in noc_block.all_riscs)
+            _capture_memory_blocks(writer, location, blocks, max_block_size, errors)
+            if config_registers and noc_block.has_risc_cores:
+                try:
+                    window = _capture_config_registers(writer, noc_block)
+                    if window is not None:
+                        config_windows.append(window)
+                except Exception as e:
+                    errors.append(f"{location.to_user_str()} {_CONFIG_REGISTERS_BLOCK}: {e}")
+            if tensix_state and noc_block.block_type == "functional_workers" and noc_block.has_risc_cores:
+                try:
+                    _capture_tensix_gprs(writer, noc_block)
+                    window = _capture_debug_bus(noc_block)
+                    if window is not None:
+                        debug_bus_windows.append(window)
+                except Exception as e:
+                    errors.append(f"{location.to_user_str()} tensix state: {e}")
+
+        for location, address, size in ranges or []:
+            buffer = bytearray(size)
+            try:
+                location.noc_read(address, buffer)
+            except Exception as e:
+                errors.append(f"{location.to_user_str()} 0x{address:08x}+{size}: {e}")
+                continue
+            block_info = location.noc_block.noc_memory_map.find_by_noc_address(address)
+            block_name = block_info.name if block_info is not None else "???"
+            writer.add_segment(buffer, location._noc0_coord, block_name, noc_address=address)
+
+        bar0: dict[str, int] = {}
+        if device.is_local:
+            try:
+                bar0 = _capture_bar0(device)
+            except Exception as e:
+                errors.append(f"bar0: {e}")
+        try:
+            firmware_version = device.firmware_version
+            firmware = [firmware_version.major, firmware_version.minor, firmware_version.patch]
+        except Exception:
+            firmware = None
+        try:
+            board_type = device.board_type.name
+        except Exception:
+            board_type = None
+
+        for error in errors + [f"{s.location}/{s.risc_name}: {s.error}" for s in risc_states if s.error]:
+            util.WARN(f"Core dump of device {device.id}: {error}")
+
+        writer.finish(
+            {
+                "format": "ttexalens-core-dump",
+                "created": datetime.datetime.now().isoformat(),
+                "device": {
+                    "id": device.id,
+                    "unique_id": device.unique_id,
+                    "arch": device._arch.name,
+                    "board_type": board_type,
+                    "is_mmio_capable": device.is_local,
+                    "is_simulation": device._umd_device.is_simulation,
+                    "firmware_version": firmware,
+                    "noc_id": device.active_noc.name,
+                },
+                "cores": _capture_cores(device),
+                "riscs": [state.to_json() for state in risc_states],
+                "indirect_registers": config_windows,
+                "debug_bus": debug_bus_windows,
+                "bar0": bar0,
+                "errors": errors,
+            }
+        )
+    except BaseException:
+        writer.file.close()
+        raise
+    return errors
+
+
+@_lib_helpers.trace_api
+def capture_core_dump(
+    file_name: str,
+    locations: list[str | OnChipCoordinate] | None = None,
+    blocks: list[str] | None = None,
+    ranges: list[tuple[str | OnChipCoordinate, int, int]] | None = None,
+    riscs: bool = True,
+    config_registers: bool = True,
+    max_block_size: int = DEFAULT_MAX_BLOCK_SIZE,
+    tensix_state: bool = True,
+    device_id: int = 0,
+    context: Context | None = None,
+) -> list[str]:
+    """
+    Writes a post-mortem dump of one device to a file that load_core_dump can replay without hardware.
+
+    For every location, the dump holds all readable blocks of its NOC memory map, GPRs, PC and debug status
+    of its RISC cores (read while halted), their private memory and the configuration registers.
+    Cores that were running are resumed after their state is read.
+
+    Args:
+        file_name (str): Path of the dump file to write.
+        locations (list[str | OnChipCoordinate], optional): Cores to dump. If None, all worker, ETH and DRAM cores are dumped.
+        blocks (list[str], optional): Names of NOC memory blocks to dump (e.g. ["l1"]). If None, all blocks not larger than max_block_size are dumped.
+        ranges (list[tuple[str | OnChipCoordinate, int, int]], optional): Extra (location, NOC address, size) ranges to dump, e.g. parts of DRAM.
+        riscs (bool, default True): Dump RISC state and private memory.
+        config_registers (bool, default True): Dump the configuration register space of cores that have one.
+        max_block_size (int, default 16MB): Blocks larger than this are skipped unless named in blocks.
+        tensix_state (bool, default True): Dump Tensix GPRs and debug bus signal groups of worker cores, so get_tensix_state works on the dump.
+        device_id (int, default 0): ID of the device to dump.
+        context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
+
+    Returns:
+        list[str]: Problems hit while dumping. Whatever could be read is still written.
+    """
+    context = _lib_helpers.check_context(context)
+    device = _lib_helpers.validate_device_id(device_id, context)
+    if locations is None:
+        coordinates = [
+            location for block_type in DEFAULT_BLOCK_TYPES for location in device.get_block_locations(block_type)
+        ]
+    else:
+        coordinates = [_lib_helpers.convert_coordinate(location, device.id, context) for location in locations]
+    extra_ranges = [
+        (_lib_helpers.convert_coordinate(location, device.id, context), address, size)
+        for location, address, size in ranges or []
+    ]
+    return write_core_dump(
+        file_name, device, coordinates, blocks, extra_ranges, riscs, config_registers, max_block_size, tensix_state
+    )
+
+
+class _CoreDumpSocDescriptor:
+    """The part of tt_umd.SocDescriptor that Device uses, served from the recorded coordinate tables."""
+
+    def __init__(self, cores: list[dict[str, Any]]):
+        self._cores = cores
+
+    def _get_cores(self, core_type: tt_umd.CoreType, coord_system: tt_umd.CoordSystem, harvested: bool):
+        result = []
+        for core in self._cores:
+            block_type = Device.block_types[core["block_type"]]
+            if block_type.core_harvesting != harvested or block_type.core_type.upper() != core_type.name:
+                continue
+            if coord_system == tt_umd.CoordSystem.NOC0:
+                x, y = core["noc0"]
+            else:
+                coordinates = core["coordinates"].get(coord_system.name.lower())
+                if coordinates is None:
+                    continue
+                x, y = coordinates
+            result.append(tt_umd.CoreCoord(x, y, core_type, coord_system))
+        return result
+
+    def get_cores(self, core_type: tt_umd.CoreType, coord_system: tt_umd.CoordSystem = tt_umd.CoordSystem.NOC0):
+        return self._get_cores(core_type, coord_system, harvested=False)
+
+    def get_harvested_cores(
+        self, core_type: tt_umd.CoreType, coord_system: tt_umd.CoordSystem = tt_umd.CoordSystem.NOC0
+    ):
+        return self._get_cores(core_type, coord_system, harvested=True)
+
+
+class CoreDumpUmdDevice(UmdDevice):
+    """
+    UmdDevice backed by a core dump instead of a TTDevice. Every replayed device is a local one.
+    UmdDevice.__init__ is not called: there is no TTDevice to open, and every method is served from the dump.
+    """
+
+    def __init__(self, core_dump: CoreDump):
+        self.core_dump = core_dump
+        self._soc_descriptor = cast(tt_umd.SocDescriptor, _CoreDumpSocDescriptor(core_dump.cores))
+        self._coordinates: dict[tuple[tuple[int, int], str], tuple[int, int]] = {}
+        for core in core_dump.cores:
+            for coord_system, (x, y) in core["coordinates"].items():
+                self._coordinates[((core["noc0"][0], core["noc0"][1]), coord_system)] = (x, y)
+
+        # Configuration registers are read by writing an index to one register and reading another.
+        self._indirect_selects: dict[tuple[int, int, int], int] = {}
+        self._indirect_data: dict[tuple[int, int, int], tuple[tuple[int, int, int], int, int]] = {}
+        for window in core_dump.header["indirect_registers"]:
+            x, y = window["location"]
+            select_key = (x, y, window["select_address"])
+            self._indirect_selects[select_key] = 0
+            self._indirect_data[(x, y, window["data_address"])] = (select_key, window["offset"], window["size"])
+        # The debug bus works the same way, but only the selected signal words were captured.
+        self._debug_bus_data: dict[tuple[int, int, int], tuple[tuple[int, int, int], dict[int, int]]] = {}
+        for window in core_dump.header.get("debug_bus", []):
+            x, y = window["location"]
+            select_key = (x, y, window["select_address"])
+            self._indirect_selects[select_key] = 0
+            values = {select: value for select, value in window["values"]}
+            self._debug_bus_data[(x, y, window["data_address"])] = (select_key, values)
+
+    @property
+    def device_id(self) -> int:
+        return self.core_dump.device_id
+
+    @property
+    def unique_id(self) -> int:
+        return self.core_dump.device_info["unique_id"]
+
+    @property
+    def arch(self) -> tt_umd.ARCH:
+        return self.core_dump.arch
+
+    @property
+    def soc_descriptor(self) -> tt_umd.SocDescriptor:
+        return self._soc_descriptor
+
+    @property
+    def is_mmio_capable(self) -> bool:
+        return True
+
+    @property
+    def is_jtag_capable(self) -> bool:
+        return False
+
+    @property
+    def is_simulation(self) -> bool:
+        return self.core_dump.device_info["is_simulation"]
+
+    @property
+    def can_use_dma(self) -> bool:
+        return False
+
+    def noc_read(
+        self, noc_id: NocId, noc0_x: int, noc0_y: int, address: int, buffer: bytearray | memoryview, dma_threshold: int
+    ) -> None:
+        window = self._indirect_data.get((noc0_x, noc0_y, address))
+        if window is not None and len(buffer) == 4:
+            select_key, offset, size = window
+            index = self._indirect_selects[select_key]
+            if index * 4 + 4 > size:
+                raise MemoryAccessException(f"Register index {index} was not captured in {self.core_dump.file_name}")
+            start = offset + index * 4
+            buffer[:] = self.core_dump._mmap[start : start + 4]
+            return
+        debug_bus = self._debug_bus_data.get((noc0_x, noc0_y, address))
+        if debug_bus is not None and len(buffer) == 4:
+            select_key, values = debug_bus
+            select = self._indirect_selects[select_key]
+            if select not in values:
+                raise MemoryAccessException(
+                    f"Debug bus signal 0x{select:08x} was not captured in {self.core_dump.file_name}"
+                )
+            buffer[:] = values[select].to_bytes(4, byteorder="little")
+            return
+        self.core_dump.read_noc((noc0_x, noc0_y), address, buffer)
+
+    def noc_read_bytes(
+        self, noc_id: NocId, noc0_x: int, noc0_y: int, address: int, size: int, dma_threshold: int
+    ) -> bytes:
+        buffer = bytearray(size)
+        self.noc_read(noc_id, noc0_x, noc0_y, address, buffer, dma_threshold)
+        return bytes(buffer)
+
+    def noc_write(
+        self,
+        noc_id: NocId,
+        noc0_x: int,
+        noc0_y: int,
+        address: int,
+        data: bytes | bytearray | memoryview,
+        dma_threshold: int,
+    ) -> None:
+        select_key = (noc0_x, noc0_y, address)
+        if select_key in self._indirect_selects and len(data) == 4:
+            self._indirect_selects[select_key] = int.from_bytes(data, byteorder="little")
+            return
+        raise ReadOnlyMemoryError(address, len(data))
+
+    def bar0_read32(self, address: int) -> int:
+        value = self.core_dump.bar0.get(address)
+        if value is None:
+            raise MemoryAccessException(f"BAR0 address 0x{address:08x} was not captured in {self.core_dump.file_name}")
+        return value
+
+    def bar0_write32(self, address: int, data: int) -> None:
+        raise ReadOnlyMemoryError(address, 4)
+
+    def convert_from_noc0(self, noc_x: int, noc_y: int, core_type: str, coord_system: str) -> tuple[int, int]:
+        coordinates = self._coordinates.get(((noc_x, noc_y), coord_system))
+        if coordinates is None:
+            raise CoordinateTranslationError(f"{coord_system} coordinates of {noc_x}-{noc_y} were not captured")
+        return coordinates
+
+    def arc_msg(
+        self,
+        noc_id: NocId,
+        msg_code: int,
+        wait_for_done: bool,
+        args: Sequence[int],
+        timeout: datetime.timedelta | float,
+    ) -> tuple[int, int, int]:
+        raise TTException("ARC messages cannot be sent to a core dump.")
+
+    def read_arc_telemetry_entry(self, noc_id: NocId, telemetry_tag: int) -> int:
+        raise TTException("ARC telemetry was not captured in the core dump.")
+
+    def get_firmware_version(self, noc_id: NocId) -> tt_umd.FirmwareBundleVersion:
+        firmware_version = self.core_dump.device_info["firmware_version"]
+        if firmware_version is None:
+            raise TTException("Firmware version was not captured in the core dump.")
+        # Device only reads major, minor and patch.
+        return cast(tt_umd.FirmwareBundleVersion, util.FirmwareVersion(*firmware_version))
+
+    def get_remote_transfer_eth_core(self) -> tuple[int, int] | None:
+        return None
+
+    def get_remote_transfer_eth_link_stats(self) -> list[dict[str, Any]]:
+        return []
+
+    def get_local_tt_device(self) -> tt_umd.TTDevice:
+        raise TTException("A device replayed from a core dump has no TTDevice.")
+
+    def _update_device_after_sigbus(self, new_device: tt_umd.TTDevice):
+        raise TTException("A device replayed from a core dump cannot be reinitialized.")
+
+
+class _CoreDumpClusterDescriptor:
+    """The part of tt_umd.ClusterDescriptor that Context and Device use. Replayed devices are not connected."""
+
+    def __init__(self, devices: dict[int, CoreDumpUmdDevice]):
+        self._devices = devices
+
+    def get_all_chips(self) -> set[int]:
+        return set(self._devices.keys())
+
+    def is_chip_mmio_capable(self, chip_id: int) -> bool:
+        return True
+
+    def get_closest_mmio_capable_chip(self, chip_id: int) -> int:
+        return chip_id
+
+    def get_board_type(self, chip_id: int) -> tt_umd.BoardType:
+        board_type = self._devices[chip_id].core_dump.device_info["board_type"]
+        return tt_umd.BoardType[board_type] if board_type is not None else tt_umd.BoardType.UNKNOWN
+
+    def get_chip_unique_ids(self) -> dict[int, int]:
+        return {chip_id: device.unique_id for chip_id, device in self._devices.items()}
+
+    def get_ethernet_connections(self) -> dict:
+        return {}
+
+    def get_active_eth_channels(self, chip_id: int) -> set[int]:
+        return set()
+
+    def get_unhealthy_devices(self) -> list[int]:
+        return []
+
+    def get_health_errors(self) -> dict:
+        return {}
+
+
+class CoreDumpUmdApi(UmdApi):
+    """
+    UmdApi backed by core dumps, one per device, instead of a UMD cluster.
+    UmdApi.__init__ is not called: there is no cluster to discover.
+    """
+
+    def __init__(self, core_dumps: list[CoreDump]):
+        self.core_dump_devices: dict[int, CoreDumpUmdDevice] = {}
+        for core_dump in core_dumps:
+            if core_dump.device_id in self.core_dump_devices:
+                raise TTException(f"More than one core dump of device {core_dump.device_id}.")
+            self.core_dump_devices[core_dump.device_id] = CoreDumpUmdDevice(core_dump)
+        self.devices: dict[int, UmdDevice] = dict(self.core_dump_devices)
+        self.cluster_descriptor = cast(tt_umd.ClusterDescriptor, _CoreDumpClusterDescriptor(self.core_dump_devices))
+        first = core_dumps[0].device_info["noc_id"] if core_dumps else "NOC0"
+        self._initialization_noc_id = NocId[first]
+
+    @property
+    def initialization_noc_id(self) -> NocId:
+        return self._initialization_noc_id
+
+    def get_device(self, chip_id: int) -> CoreDumpUmdDevice:
+        if chip_id not in self.core_dump_devices:
+            raise RuntimeError(f"Device with chip id {chip_id} not found.")
+        return self.core_dump_devices[chip_id]
+
+    def get_cluster_descriptor(self) -> tt_umd.ClusterDescriptor:
+        return self.cluster_descriptor
+
+    def _reinit_devices_after_sigbus(self):
+        raise TTException("Devices replayed from a core dump cannot be reinitialized.")
+
+    def warm_reset(self, noc_id: NocId, is_galaxy_configuration: bool = False) -> None:
+        raise TTException("A core dump cannot be reset.")
+
+    def close(self) -> None:
+        for device in self.core_dump_devices.values():
+            device.core_dump.close()
+
+
+class CoreDumpRiscDebug(RiscDebug):
+    """
+    RiscDebug of a core in a core dump. The core stays in its captured state: halting is a no-op,
+    GPRs and status come from the dump and anything that would change the core raises.
+    """
+
+    def __init__(self, risc_debug: RiscDebug, core_dump: CoreDump):
+        super().__init__(risc_debug.risc_location, risc_debug.risc_info)
+        self._risc_debug = risc_debug
+        self._core_dump = core_dump
+        location = risc_debug.risc_location
+        self.state = core_dump.get_risc_state(location.location._noc0_coord, location.risc_name, location.neo_id)
+
+    def _captured_state(self) -> CoreDumpRiscState:
+        if self.state is None:
+            raise TTException(f"RISC {self.risc_location} was not captured in {self._core_dump.file_name}")
+        return self.state
+
+    def _halted_state(self) -> CoreDumpRiscState:
+        state = self._captured_state()
+        if state.gprs is None or state.status is None:
+            reason = state.error or ("it was in reset" if state.in_reset else "it could not be halted")
+            raise TTException(f"Registers of RISC {self.risc_location} were not captured: {reason}")
+        return state
+
+    def _read_only(self) -> TTException:
+        return TTException(f"RISC {self.risc_location} is replayed from a core dump and cannot be changed.")
+
+    def is_in_reset(self) -> bool:
+        return bool(self._captured_state().in_reset)
+
+    def set_reset_signal(self, value: bool) -> None:
+        raise self._read_only()
+
+    def is_halted(self) -> bool:
+        return bool(self._captured_state().is_halted)
+
+    def is_ebreak_hit(self) -> bool:
+        status = self._captured_state().status
+        return status is not None and status.is_ebreak_hit
+
+    def halt(self) -> None:
+        raise self._read_only()
+
+    def step(self) -> None:
+        raise self._read_only()
+
+    def cont(self) -> None:
+        raise self._read_only()
+
+    @contextmanager
+    def ensure_halted(self) -> Generator[None, Any, None]:
+        yield
+
+    @contextmanager
+    def ensure_private_memory_access(self) -> Generator[None, Any, None]:
+        yield
+
+    def read_gpr(self, register_index: int) -> int:
+        gprs = self._halted_state().gprs
+        assert gprs is not None
+        return gprs[register_index]
+
+    def write_gpr(self, register_index: int, value: int) -> None:
+        raise self._read_only()
+
+    def get_pc(self) -> int:
+        return self.read_gpr(32)
+
+    def _read_memory(self, address: int) -> int:
+        buffer = bytearray(4)
+        self.read_memory_bytes(address, buffer)
+        return int.from_bytes(buffer, byteorder="little")
+
+    def read_memory_bytes(self, address: int, buffer: bytearray | memoryview, safe_mode: bool | None = None) -> None:
+        location = self.risc_location
+        if self._core_dump.read_private(
+            location.location._noc0_coord, location.neo_id, location.risc_name, address, buffer
+        ):
+            return
+        block_info = self.risc_info.memory_map.find_by_private_address(address)
+        noc_address = block_info.memory_block.translate_to_noc_address(address) if block_info is not None else None
+        if noc_address is None:
+            raise MemoryAccessException(
+                f"Private address 0x{address:08x} of RISC {location} was not captured in {self._core_dump.file_name}"
+            )
+        location.location.noc_read(noc_address, buffer, safe_mode=False)
+
+    def _write_memory(self, address: int, data: int) -> None:
+        raise ReadOnlyMemoryError(address, 4)
+
+    def write_memory_bytes(
+        self, address: int, data: bytes | bytearray | memoryview, safe_mode: bool | None = None
+    ) -> None:
+        raise ReadOnlyMemoryError(address, len(data))
+
+    def read_status(self) -> RiscDebugStatus:
+        status = self._halted_state().status
+        assert status is not None
+        return status
+
+    def read_watchpoints_state(self) -> list[RiscDebugWatchpointState]:
+        return [watchpoint for watchpoint, _ in self._halted_state().watchpoints]
+
+    def read_watchpoint_address(self, watchpoint_index: int) -> int:
+        return self._halted_state().watchpoints[watchpoint_index][1]
+
+    def disable_watchpoint(self, watchpoint_index: int) -> None:
+        raise self._read_only()
+
+    def set_watchpoint_on_pc_address(self, watchpoint_index: int, address: int) -> None:
+        raise self._read_only()
+
+    def set_watchpoint_on_memory_read(self, watchpoint_index: int, address: int) -> None:
+        raise self._read_only()
+
+    def set_watchpoint_on_memory_write(self, watchpoint_index: int, address: int) -> None:
+        raise self._read_only()
+
+    def set_watchpoint_on_memory_access(self, watchpoint_index: int, address: int) -> None:
+        raise self._read_only()
+
+    def set_branch_prediction(self, enable: bool) -> None:
+        raise self._read_only()
+
+    def can_debug(self) -> bool:
+        return self._risc_debug.can_debug()
+
+    def set_code_start_address(self, address: int | None) -> None:
+        raise self._read_only()
+
+    def get_l1(self) -> MemoryBlock:
+        return self._risc_debug.get_l1()
+
+    def get_data_private_memory(self) -> MemoryBlock | None:
+        return self._risc_debug.get_data_private_memory()
+
+    def get_code_private_memory(self) -> MemoryBlock | None:
+        return self._risc_debug.get_code_private_memory()
+
+
+class CoreDumpContext(Context):
+    """Context whose devices are replayed from core dumps."""
+
+    def __init__(self, core_dumps: list[CoreDump], safe_mode: bool = True):
+        from ttexalens.server import FileAccessApi
+
+        umd_api = CoreDumpUmdApi(core_dumps)
+        self.core_dump_api = umd_api
+        super().__init__(
+            umd_api,
+            FileAccessApi(),
+            noc_id=umd_api.initialization_noc_id,
+            noc_failover=False,
+            safe_mode=safe_mode,
+        )
+
+    def create_risc_debug(self, risc_debug: RiscDebug) -> RiscDebug:
+        location = risc_debug.risc_location.location
+        core_dump = self.core_dump_api.get_device(location.device.id).core_dump
+        if not core_dump.has_riscs(location._noc0_coord):
+            return risc_debug
+        return CoreDumpRiscDebug(risc_debug, core_dump)
+
+    def close(self) -> None:
+        """Unmaps the dump files. Devices of this context cannot be used afterwards."""
+        self.core_dump_api.close()
+
+
+@_lib_helpers.trace_api
+def load_core_dump(file_names: str | list[str], safe_mode: bool = True) -> CoreDumpContext:
+    """
+    Opens core dumps written by capture_core_dump and returns a context that replays them.
+    The context is also set as the active one, so library functions use it by default.
+
+    Args:
+        file_names (str | list[str]): Dump file, or one dump file per device.
+        safe_mode (bool, default True): Whether to enable safe mode for memory access.
+
+    Returns:
+        CoreDumpContext: Context with one device per dump file.
+    """
+    from ttexalens.tt_exalens_init import set_active_context
+
+    if isinstance(file_names, str):
+        file_names = [file_names]
+    core_dumps: list[CoreDump] = []
+    try:
+        for file_name in file_names:
+            core_dumps.append(CoreDump(file_name))
+        context = CoreDumpContext(core_dumps, safe_mode)
+    except Exception:
+        for core_dump in core_dumps:
+            core_dump.close()
+        raise
+    set_active_context(context)
+    return context
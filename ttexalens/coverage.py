@@ -2,10 +2,17 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+import os
+import struct
+from typing import Iterable
+
 from ttexalens.coordinate import OnChipCoordinate
 from ttexalens.tt_exalens_lib import TTException
-from ttexalens.elf import ElfFile
-from ttexalens.memory_access import create_l1_memory_access
+from ttexalens.elf import ElfFile, ElfVariable
+from ttexalens.memory_access import NO_MEMORY_ACCESS, create_l1_memory_access
 
 """
 Extract the coverage data from the device into a .gcda file.
@@ -17,8 +24,98 @@ for finding the gcno. As the L1 offset is the same for all ELFs for a given baby
 on a given architecture, this script can be adjusted to take the arch and RISC type instead
 of the ELF, should that be necessary. That is, however, less flexible, as it requires
 hardcoding offsets, which would break in case of linker script changes.
+
+harvest_coverage does the same for many cores at once: the ELF layout is resolved once per
+ELF, every core's coverage region is read with one bulk read on a pool of threads, and the
+gcov counters of all cores that ran the same source object are merged in memory into a
+single .gcda file.
 """
 
+# gcda record tags (see GCC's gcov-io.h).
+GCOV_DATA_MAGIC = 0x67636461  # "gcda"
+GCOV_TAG_FUNCTION = 0x01000000
+GCOV_TAG_COUNTER_BASE = 0x01A10000
+GCOV_TAG_OBJECT_SUMMARY = 0xA1000000
+GCOV_COUNTER_ARCS = 0
+
+
+class CoverageLayout:
+    """Where and how an ELF stores its coverage data, resolved once from its symbols and DWARF."""
+
+    def __init__(self, elf: ElfFile):
+        self.elf = elf
+
+        # Find coverage region in ELF.
+        start_sym = elf.find_symbol_by_name("__coverage_start")
+        if start_sym is None or not start_sym.value:
+            raise TTException("__coverage_start not found")
+        self.coverage_start: int = start_sym.value
+        end_sym = elf.find_symbol_by_name("__coverage_end")
+        if end_sym is None or not end_sym.value:
+            raise TTException("__coverage_end not found")
+        self.coverage_end: int = end_sym.value
+
+        # Lay the header type over address 0: member addresses are then field offsets and
+        # no device memory is touched.
+        header_die = elf.find_die_by_name("coverage_header")
+        header_pointer_type = header_die.get_resolved_type() if header_die is not None else None
+        header_type = header_pointer_type.get_dereference_type() if header_pointer_type is not None else None
+        if header_type is None:
+            raise TTException("coverage_header not found")
+        header = ElfVariable(header_type, 0, NO_MEMORY_ACCESS)
+        self.header_size: int = header.get_size()
+        self._fields = {
+            name: (header.get_member(name).get_address(), header.get_member(name).get_size())
+            for name in ("bytes_written", "magic_number", "filename", "filename_length")
+        }
+        self.magic_number = elf.get_constant("COVERAGE_MAGIC_NUMBER")
+
+    def decode_header(self, header: bytes) -> dict[str, int]:
+        return {
+            name: int.from_bytes(header[offset : offset + size], "little")
+            for name, (offset, size) in self._fields.items()
+        }
+
+    def read_header(self, location: OnChipCoordinate) -> dict[str, int]:
+        """Reads and validates the coverage header of a core with a single read."""
+        header_bytes = bytearray(self.header_size)
+        location.noc_read(self.coverage_start, header_bytes)
+        header = self.decode_header(header_bytes)
+
+        # Check magic number.
+        if header["magic_number"] != self.magic_number:
+            raise TTException("COVERAGE_MAGIC_NUMBER does not match in ELF")
+
+        length = header["bytes_written"]
+        # 0xDEADBEEF will be written in place of length if overflow occurred.
+        if length == 0xDEADBEEF:
+            raise TTException("Coverage region overflowed")
+        if length > self.coverage_end - self.coverage_start:
+            raise TTException("Coverage length is larger than coverage region")
+        if length < self.header_size:
+            raise TTException("Kernel did not finish writing coverage data")
+        return header
+
+    def read_gcda(self, location: OnChipCoordinate, header: dict[str, int]) -> bytes:
+        data = bytearray(header["bytes_written"] - self.header_size)
+        location.noc_read(self.coverage_start + self.header_size, data)
+        return bytes(data)
+
+    def read_filename(self, location: OnChipCoordinate, header: dict[str, int]) -> str:
+        filename_buffer = bytearray(header["filename_length"])
+        location.noc_read(header["filename"], filename_buffer)
+        return filename_buffer.decode("ascii")
+
+
+def copy_gcno(location: OnChipCoordinate, gcda_filename: str, gcno_copy_path: str) -> None:
+    # The filename points to the expected gcda file, which is in the same directory where the compiler placed
+    # the gcno, so we just replace the extension and get the gcno path.
+    # We fetch it through context.file_api.get_binary in case this is a remote debugging session.
+    gcno_path = gcda_filename[:-4] + "gcno"
+    with location.context.file_api.get_binary(gcno_path) as gcno_reader:
+        with open(gcno_copy_path, "wb") as f:
+            f.write(gcno_reader.read())
+
 
 def dump_coverage(
     elf: ElfFile,
@@ -26,56 +123,215 @@ def dump_coverage(
     gcda_path: str,
     gcno_copy_path: str | None = None,
 ) -> None:
-
-    # Find coverage region in ELF.
-    start_sym = elf.find_symbol_by_name("__coverage_start")
-    if start_sym is None or not start_sym.value:
-        raise TTException("__coverage_start not found")
-    coverage_start = start_sym.value
-    end_sym = elf.find_symbol_by_name("__coverage_end")
-    if end_sym is None or not end_sym.value:
-        raise TTException("__coverage_end not found")
-    coverage_end = end_sym.value
+    layout = CoverageLayout(elf)
 
     # Find coverage header in device memory.
     coverage_header = elf.get_global("coverage_header", create_l1_memory_access(location))
-    coverage_header = coverage_header.dereference()
-    if coverage_header.get_address() != coverage_start:
+    if coverage_header.dereference().get_address() != layout.coverage_start:
         raise TTException("coverage_header address does not match __coverage_start")
 
-    # Check magic number.
-    magic_number = elf.get_constant("COVERAGE_MAGIC_NUMBER")
-    if coverage_header.magic_number != magic_number:
-        raise TTException("COVERAGE_MAGIC_NUMBER does not match in ELF")
-
-    header_size = coverage_header.get_size()
-    length = int(coverage_header.bytes_written)
-
-    # 0xDEADBEEF will be written in place of length if overflow occurred.
-    if length == 0xDEADBEEF:
-        raise TTException("Coverage region overflowed")
-    if length > coverage_end - coverage_start:
-        raise TTException("Coverage length is larger than coverage region")
-    if length < header_size:
-        raise TTException("Kernel did not finish writing coverage data")
+    header = layout.read_header(location)
 
     if gcno_copy_path:
-        filename_len = coverage_header.filename_length.read_value()
-        assert isinstance(filename_len, int)
-        filename_addr = coverage_header.filename.dereference().get_address()
-        filename_buffer = bytearray(filename_len)
-        location.noc_read(filename_addr, filename_buffer)
-        filename: str = filename_buffer.decode("ascii")
-
-        # This points to the expected gcda file, which is in the same directory where the compiler placed the gcno,
-        # so we just replace the extension and get the gcno path.
-        # We fetch it through context.file_api.get_binary in case this is a remote debugging session.
-        gcno_path = filename[:-4] + "gcno"
-        with location.context.file_api.get_binary(gcno_path) as gcno_reader:
-            with open(gcno_copy_path, "wb") as f:
-                f.write(gcno_reader.read())
-
-    data = bytearray(length - header_size)
-    location.noc_read(coverage_start + header_size, data)
+        copy_gcno(location, layout.read_filename(location, header), gcno_copy_path)
+
+    data = layout.read_gcda(location, header)
     with open(gcda_path, "wb") as f:
         f.write(data)
+
+
+@dataclass
+class GcdaFile:
+    """Parsed gcda stream as written on-device by libgcov's __gcov_info_to_gcda.
+
+    The stream is a 16-byte header (magic, version, stamp, checksum) followed by tag/length records.
+    Counter records hold 64-bit counters and use a negative length when every counter is zero
+    (the body is then omitted). Counters are kept decoded so runs can be merged.
+    """
+
+    version: int
+    stamp: int
+    checksum: int
+    # (tag, body) for plain records, (tag, counters) for counter records.
+    records: list[tuple[int, bytes | list[int]]] = field(default_factory=list)
+
+    @staticmethod
+    def is_counter_tag(tag: int) -> bool:
+        # GCOV_TAG_FOR_COUNTER(n) == GCOV_TAG_COUNTER_BASE + (n << 17), low 16 bits zero.
+        return GCOV_TAG_COUNTER_BASE <= tag < 0x02000000 and (tag & 0xFFFF) == 0
+
+    @staticmethod
+    def parse(data: bytes) -> GcdaFile:
+        if len(data) < 16:
+            raise TTException("gcda data is shorter than its header")
+        magic, version, stamp, checksum = struct.unpack_from("<4I", data, 0)
+        if magic != GCOV_DATA_MAGIC:
+            raise TTException(f"Invalid gcda magic 0x{magic:08x}")
+        gcda = GcdaFile(version, stamp, checksum)
+        offset, end = 16, len(data)
+        while offset + 8 <= end:
+            tag, length = struct.unpack_from("<Ii", data, offset)
+            offset += 8
+            if GcdaFile.is_counter_tag(tag):
+                if length % 8 != 0 or offset + max(length, 0) > end:
+                    raise TTException(f"Malformed gcda counter record 0x{tag:08x} at offset {offset - 8}")
+                if length < 0:
+                    counters = [0] * (-length // 8)
+                else:
+                    counters = list(struct.unpack_from(f"<{length // 8}q", data, offset))
+                    offset += length
+                gcda.records.append((tag, counters))
+            else:
+                if length < 0 or offset + length > end:
+                    raise TTException(f"Malformed gcda record 0x{tag:08x} at offset {offset - 8}")
+                if tag == GCOV_TAG_OBJECT_SUMMARY and length < 8:
+                    raise TTException(f"Malformed gcda object summary at offset {offset - 8}")
+                gcda.records.append((tag, bytes(data[offset : offset + length])))
+                offset += length
+        if offset != end:
+            raise TTException(f"gcda data has {end - offset} trailing bytes after the last record")
+        return gcda
+
+    def merge(self, other: GcdaFile) -> None:
+        """Adds the counters of another run of the same object to this one."""
+        if (self.version, self.stamp, self.checksum) != (other.version, other.stamp, other.checksum):
+            raise TTException("Cannot merge gcda data of different compilations")
+        if len(self.records) != len(other.records):
+            raise TTException("Cannot merge gcda data with different record layout")
+        for i, ((tag, value), (other_tag, other_value)) in enumerate(zip(self.records, other.records)):
+            if tag != other_tag or len(value) != len(other_value):
+                raise TTException(f"Cannot merge gcda record 0x{tag:08x} with 0x{other_tag:08x}")
+            if tag == GCOV_TAG_OBJECT_SUMMARY:
+                assert isinstance(value, bytes) and isinstance(other_value, bytes)
+                runs, sum_max = struct.unpack_from("<2I", value)
+                other_runs, other_sum_max = struct.unpack_from("<2I", other_value)
+                # libgcov accumulates sum_max over runs (gcov-io.h: gcov_summary), it is not a maximum.
+                summary = struct.pack("<2I", runs + other_runs, (sum_max + other_sum_max) & 0xFFFFFFFF)
+                self.records[i] = (tag, summary + value[8:])
+            elif isinstance(value, list):
+                assert isinstance(other_value, list)
+                if (tag - GCOV_TAG_COUNTER_BASE) >> 17 == GCOV_COUNTER_ARCS:
+                    self.records[i] = (tag, [a + b for a, b in zip(value, other_value)])
+                elif value != other_value:
+                    # Value profiles (-fprofile-values) have per-kind merge rules that are not implemented.
+                    raise TTException(f"Cannot merge differing counters of kind 0x{tag:08x}; only arc counters merge")
+            elif value != other_value:
+                raise TTException(f"Cannot merge differing gcda record 0x{tag:08x}")
+
+    def to_bytes(self) -> bytes:
+        chunks = [struct.pack("<4I", GCOV_DATA_MAGIC, self.version, self.stamp, self.checksum)]
+        for tag, value in self.records:
+            if isinstance(value, list):
+                if any(value):
+                    chunks.append(struct.pack(f"<Ii{len(value)}q", tag, len(value) * 8, *value))
+                else:
+                    chunks.append(struct.pack("<Ii", tag, -len(value) * 8))
+            else:
+                chunks.append(struct.pack("<Ii", tag, len(value)))
+                chunks.append(value)
+        return b"".join(chunks)
+
+
+def merge_gcda(runs: Iterable[bytes]) -> bytes:
+    """Merges gcda data of several runs of the same object file into one gcda."""
+    merged: GcdaFile | None = None
+    for data in runs:
+        gcda = GcdaFile.parse(data)
+        if merged is None:
+            merged = gcda
+        else:
+            merged.merge(gcda)
+    if merged is None:
+        raise TTException("No gcda data to merge")
+    return merged.to_bytes()
+
+
+@dataclass
+class CoverageHarvest:
+    # Written gcda path -> number of (core, RISC) runs merged into it.
+    gcda_files: dict[str, int] = field(default_factory=dict)
+    # (location, ELF path, error) of every core whose coverage could not be collected.
+    errors: list[tuple[OnChipCoordinate, str, Exception]] = field(default_factory=list)
+
+
+def harvest_coverage(
+    targets: Iterable[tuple[OnChipCoordinate, ElfFile]],
+    output_dir: str,
+    copy_gcno_files: bool = True,
+    max_workers: int | None = None,
+) -> CoverageHarvest:
+    """
+    Collects coverage of many cores and writes one merged .gcda (and .gcno) per source object.
+
+    Args:
+        targets (Iterable[tuple[OnChipCoordinate, ElfFile]]): Cores to read, each with the ELF its RISC ran.
+        output_dir (str): Directory where merged gcda (and gcno) files are written.
+        copy_gcno_files (bool, default True): Also copy the gcno of every source object next to its gcda.
+        max_workers (int, optional): Number of threads reading from the device. If None, a default is used.
+
+    Returns:
+        CoverageHarvest: Written files with the number of merged runs, and cores that failed.
+    """
+    result = CoverageHarvest()
+
+    # Resolve every distinct ELF once, on this thread: DWARF lookups are not thread-safe.
+    layouts: dict[int, CoverageLayout | Exception] = {}
+    jobs: list[tuple[OnChipCoordinate, CoverageLayout]] = []
+    for location, elf in targets:
+        layout = layouts.get(id(elf))
+        if layout is None:
+            try:
+                layout = CoverageLayout(elf)
+            except Exception as e:
+                layout = e
+            layouts[id(elf)] = layout
+        if isinstance(layout, Exception):
+            result.errors.append((location, elf.elf_file_path, layout))
+        else:
+            jobs.append((location, layout))
+
+    def read_core(location: OnChipCoordinate, layout: CoverageLayout) -> tuple[dict[str, int], bytes]:
+        header = layout.read_header(location)
+        return header, layout.read_gcda(location, header)
+
+    # Source object filename of every ELF, read from the device once.
+    filenames: dict[int, str] = {}
+    merged: dict[str, GcdaFile] = {}
+    run_counts: dict[str, int] = {}
+    gcno_sources: dict[str, OnChipCoordinate] = {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ttexalens-coverage") as executor:
+        futures = {executor.submit(read_core, location, layout): (location, layout) for location, layout in jobs}
+        for future in as_completed(futures):
+            location, layout = futures[future]
+            try:
+                header, data = future.result()
+                filename = filenames.get(id(layout))
+                if filename is None:
+                    filename = filenames[id(layout)] = layout.read_filename(location, header)
+                gcda = GcdaFile.parse(data)
+                if filename in merged:
+                    merged[filename].merge(gcda)
+                else:
+                    merged[filename] = gcda
+                    gcno_sources[filename] = location
+                run_counts[filename] = run_counts.get(filename, 0) + 1
+            except Exception as e:
+                result.errors.append((location, layout.elf.elf_file_path, e))
+
+    os.makedirs(output_dir, exist_ok=True)
+    used_names: set[str] = set()
+    for filename in sorted(merged):
+        # Name outputs after the source object; different directories with the same object name get a suffix.
+        stem = os.path.splitext(os.path.basename(filename))[0]
+        name, suffix = stem, 1
+        while name in used_names:
+            name = f"{stem}.{suffix}"
+            suffix += 1
+        used_names.add(name)
+        gcda_path = os.path.join(output_dir, f"{name}.gcda")
+        with open(gcda_path, "wb") as f:
+            f.write(merged[filename].to_bytes())
+        if copy_gcno_files:
+            copy_gcno(gcno_sources[filename], filename, os.path.join(output_dir, f"{name}.gcno"))
+        result.gcda_files[gcda_path] = run_counts[filename]
+    return result
@@ -33,44 +33,11 @@ DwarfInfo::DwarfInfo(DwarfInfo&&) noexcept = default;
 DwarfInfo& DwarfInfo::operator=(DwarfInfo&&) noexcept = default;
 
 std::optional<DwarfFileLine> DwarfInfo::find_file_line_by_address(uint64_t address) const {
-    const Dwarf_Addr target = static_cast<Dwarf_Addr>(address);
-    const auto& ranges = impl->get_line_ranges();
-
-    // Ranges are sorted by `low` but may overlap (inlining/LTO/COMDAT can make
-    // line tables from different CUs describe the same address). Binary search to
-    // the last range with low <= target, then walk left to the NARROWEST range
-    // still covering target -- the most-specific source location, matching
-    // find_function_by_address's narrowest-wins policy.
-    //
-    // The left-walk is bounded: any range covering target that starts at `low`
-    // has width > target - low, and target - low only grows as we move left. So
-    // once a candidate of width W is found, the first range with target - low >= W
-    // ends the scan; nothing further left can be narrower. On the common
-    // non-overlapping input this stops right after the single covering range.
-    // (An address in a gap has no candidate to bound the scan and walks to the
-    // start; that is acceptable here as lookups are per-frame, not in a hot loop.)
-    auto it = std::upper_bound(ranges.begin(), ranges.end(), target,
-                               [](Dwarf_Addr t, const details::LineRange& r) { return t < r.low; });
-
-    const details::LineRange* best = nullptr;
-    Dwarf_Addr best_width = 0;
-    while (it != ranges.begin()) {
-        --it;
-        // Every range here has low <= target, so target - it->low is well-defined
-        // and non-decreasing as we move left.
-        if (best != nullptr && target - it->low >= best_width) {
-            break;
-        }
-        if (target < it->high) {  // covers target (low <= target already holds)
-            const Dwarf_Addr width = it->high - it->low;
-            if (best == nullptr || width < best_width) {
-                best = &(*it);
-                best_width = width;
-            }
-        }
-    }
+    // Line tables may overlap (inlining/LTO/COMDAT); the index returns the
+    // narrowest row covering the address, the most specific source location.
+    const details::LineRange* best = impl->get_line_ranges().find(static_cast<Dwarf_Addr>(address));
     if (best == nullptr) {
-        return std::nullopt;  // target precedes all ranges or lies in a gap
+        return std::nullopt;  // address precedes all ranges or lies in a gap
     }
 
     Dwarf_Debug dbg = impl->dbg;
@@ -85,49 +52,65 @@ std::optional<DwarfFileLine> DwarfInfo::find_file_line_by_address(uint64_t addre
 }
 
 DwarfDiePtr DwarfInfo::find_function_by_address(uint64_t address) const {
-    const Dwarf_Addr target = static_cast<Dwarf_Addr>(address);
-    DwarfDiePtr best;
-    Dwarf_Addr best_width = 0;
+    // Nested scopes make overlaps the norm here; the index resolves them to
+    // the narrowest, then innermost, scope covering the address.
+    const details::FunctionRange* best = impl->get_function_ranges().find(static_cast<Dwarf_Addr>(address));
+    if (best == nullptr) {
+        return nullptr;
+    }
+    return impl->get_or_create_die(best->offset);
+}
 
-    auto range_contains = [target](const std::pair<Dwarf_Addr, Dwarf_Addr>& r) {
-        return r.first <= target && target < r.second;
-    };
+std::vector<DwarfSymbolizedAddress> DwarfInfo::symbolize(const std::vector<uint64_t>& addresses) const {
+    std::vector<DwarfSymbolizedAddress> result;
+    result.reserve(addresses.size());
 
-    for (auto& cu : impl->get_cus()) {
-        DwarfDiePtr match;
-        std::pair<Dwarf_Addr, Dwarf_Addr> match_range{0, 0};
-        bool found = true;
-        while (found) {
-            found = false;
-            const DwarfDie& current = match ? *match : *cu.get_die();
-            for (auto child = current.get_first_child(); child; child = child->get_next_sibling()) {
-                bool child_matches = false;
-                for (auto& r : child->get_address_ranges()) {
-                    if (range_contains(r)) {
-                        match_range = r;
-                        child_matches = true;
-                        break;
-                    }
-                }
-                if (child_matches) {
-                    match = std::move(child);
-                    found = true;
-                    break;
-                }
+    // Sampled PCs repeat heavily and many distinct PCs share a scope, so
+    // cache per address and per scope DIE.
+    std::unordered_map<uint64_t, size_t> resolved_addresses;
+    std::unordered_map<Dwarf_Off, std::vector<std::string>> scope_functions;
+
+    auto functions_for_scope = [&](DwarfDiePtr die) -> const std::vector<std::string>& {
+        const Dwarf_Off offset = die->get_offset();
+        auto it = scope_functions.find(offset);
+        if (it != scope_functions.end()) {
+            return it->second;
+        }
+        // Same walk as the callstack's virtual (inlined) frames: lexical
+        // blocks are skipped, every inlined subroutine adds the function it
+        // was inlined into.
+        std::vector<std::string> functions;
+        while (die) {
+            while (die && die->get_tag() == DwarfDieTag::lexical_block) {
+                die = die->get_parent();
             }
+            if (!die) {
+                break;
+            }
+            functions.push_back(die->get_path());
+            if (die->get_tag() != DwarfDieTag::inlined_subroutine) {
+                break;
+            }
+            die = die->get_parent();
         }
+        return scope_functions.emplace(offset, std::move(functions)).first->second;
+    };
 
-        if (!match) {
+    for (uint64_t address : addresses) {
+        auto found = resolved_addresses.find(address);
+        if (found != resolved_addresses.end()) {
+            DwarfSymbolizedAddress entry = result[found->second];
+            result.push_back(std::move(entry));
             continue;
         }
-        const Dwarf_Addr width = match_range.second - match_range.first;
-        if (!best || width < best_width) {
-            best_width = width;
-            best = std::move(match);
+        DwarfSymbolizedAddress entry{address, {}, find_file_line_by_address(address)};
+        if (DwarfDiePtr die = find_function_by_address(address)) {
+            entry.functions = functions_for_scope(std::move(die));
         }
+        resolved_addresses.emplace(address, result.size());
+        result.push_back(std::move(entry));
     }
-
-    return best;
+    return result;
 }
 
 DwarfDiePtr DwarfInfo::get_die_by_name(std::string_view name,
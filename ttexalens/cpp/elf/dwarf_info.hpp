@@ -9,6 +9,7 @@
 #include <optional>
 #include <string>
 #include <string_view>
+#include <vector>
 
 #include "dwarf_die.hpp"
 #include "dwarf_frame.hpp"
@@ -21,6 +22,16 @@ class ElfFileImpl;
 class DwarfInfoImpl;
 }  // namespace details
 
+// One address resolved by DwarfInfo::symbolize.
+struct DwarfSymbolizedAddress {
+    uint64_t address;
+    // Functions at `address`, innermost first: the (possibly inlined) function
+    // containing it, then every function it was inlined into. Empty when no
+    // function covers the address.
+    std::vector<std::string> functions;
+    std::optional<DwarfFileLine> file_line;
+};
+
 class DwarfInfo {
    public:
     DwarfInfo(std::weak_ptr<details::ElfFileImpl> elf_impl);
@@ -44,12 +55,20 @@ class DwarfInfo {
     DwarfDiePtr get_die_by_name(std::string_view name,
                                 const std::function<bool(const DwarfDiePtr&)>& filter = {}) const;
 
-    // Walks every CU and recursively drills into children to find the DIE
-    // whose address range contains `address`. When multiple CUs match (e.g.
-    // overlapping subprograms from inlining), the DIE with the narrowest
-    // range wins. Returns nullptr if no DIE covers the address.
+    // Finds the innermost code scope DIE (subprogram, inlined subroutine or
+    // lexical block) whose address range contains `address`. Uses an interval
+    // index over all CUs that is built on first use. When several ranges
+    // match (nested scopes, overlapping subprograms from inlining / COMDAT),
+    // the narrowest range wins, then the more deeply nested DIE. Returns
+    // nullptr if no DIE covers the address.
     DwarfDiePtr find_function_by_address(uint64_t address) const;
 
+    // Batch form of find_function_by_address + find_file_line_by_address:
+    // resolves every address to its function chain and source location in
+    // one call. Results are in input order; repeated addresses are resolved
+    // once.
+    std::vector<DwarfSymbolizedAddress> symbolize(const std::vector<uint64_t>& addresses) const;
+
     // Locates the FDE covering `pc` in .debug_frame (falling back to
     // .eh_frame) and returns a FrameDescription bound to `memory_access`.
     // Returns nullopt if no FDE covers `pc`.
@@ -0,0 +1,110 @@
+// SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+// SPDX-License-Identifier: Apache-2.0
+
+#pragma once
+
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <limits>
+#include <set>
+#include <utility>
+#include <vector>
+
+namespace ttexalens::native_elf::details {
+
+// Point lookup over possibly overlapping half-open ranges [low, high).
+//
+// The boundaries of all ranges cut the address space into elementary
+// segments; every segment remembers the preferred range covering it (or that
+// none does). A lookup is one binary search over the segments, however deeply
+// the ranges nest or overlap -- one wide range (a big function, a CU-wide
+// line row) no longer turns lookups into a scan. Building is a single sweep
+// over the sorted range boundaries, O(n log n).
+//
+// `prefer(a, b)` returns true when `a` should be returned instead of `b` for
+// an address both cover. When neither is preferred, the range that comes
+// first in the vector passed to build() wins.
+template <typename Range>
+class AddressRangeIndex {
+   public:
+    using Address = decltype(Range::low);
+
+    template <typename Prefer>
+    void build(std::vector<Range> new_ranges, Prefer prefer) {
+        ranges = std::move(new_ranges);
+        segments.clear();
+
+        struct Boundary {
+            Address address;
+            uint32_t range;
+            bool is_start;
+        };
+        std::vector<Boundary> boundaries;
+        boundaries.reserve(ranges.size() * 2);
+        for (uint32_t i = 0; i < ranges.size(); ++i) {
+            if (ranges[i].low < ranges[i].high) {
+                boundaries.push_back(Boundary{ranges[i].low, i, true});
+                boundaries.push_back(Boundary{ranges[i].high, i, false});
+            }
+        }
+        std::sort(boundaries.begin(), boundaries.end(),
+                  [](const Boundary& a, const Boundary& b) { return a.address < b.address; });
+
+        // Ranges covering the current segment, most preferred first. The index
+        // breaks ties, so the order is strict and erase() finds the range.
+        auto more_preferred = [&](uint32_t a, uint32_t b) {
+            if (prefer(ranges[a], ranges[b])) {
+                return true;
+            }
+            if (prefer(ranges[b], ranges[a])) {
+                return false;
+            }
+            return a < b;
+        };
+        std::set<uint32_t, decltype(more_preferred)> covering(more_preferred);
+
+        for (size_t i = 0; i < boundaries.size();) {
+            const Address address = boundaries[i].address;
+            for (; i < boundaries.size() && boundaries[i].address == address; ++i) {
+                if (boundaries[i].is_start) {
+                    covering.insert(boundaries[i].range);
+                } else {
+                    covering.erase(boundaries[i].range);
+                }
+            }
+            const uint32_t best = covering.empty() ? no_range : *covering.begin();
+            // Adjacent segments with the same answer are merged.
+            if (segments.empty() || segments.back().range != best) {
+                segments.push_back(Segment{address, best});
+            }
+        }
+    }
+
+    // Preferred range covering `address`, or nullptr if no range does.
+    const Range* find(Address address) const {
+        auto it = std::upper_bound(segments.begin(), segments.end(), address,
+                                   [](Address a, const Segment& s) { return a < s.low; });
+        if (it == segments.begin()) {
+            return nullptr;  // address precedes all ranges
+        }
+        --it;
+        return it->range == no_range ? nullptr : &ranges[it->range];
+    }
+
+    const std::vector<Range>& get_ranges() const { return ranges; }
+
+   private:
+    static constexpr uint32_t no_range = std::numeric_limits<uint32_t>::max();
+
+    // [low, next segment's low) is covered best by ranges[range].
+    struct Segment {
+        Address low;
+        uint32_t range;
+    };
+
+    std::vector<Range> ranges;
+    std::vector<Segment> segments;  // sorted by low
+};
+
+}  // namespace ttexalens::native_elf::details
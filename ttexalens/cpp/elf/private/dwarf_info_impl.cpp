@@ -218,7 +218,7 @@ std::vector<DwarfCompileUnit>& DwarfInfoImpl::get_cus() {
     return cus;
 }
 
-const std::vector<LineRange>& DwarfInfoImpl::get_line_ranges() {
+const AddressRangeIndex<LineRange>& DwarfInfoImpl::get_line_ranges() {
     if (!loaded_line_ranges) {
         loaded_line_ranges = true;
         load_line_ranges();
@@ -227,8 +227,9 @@ const std::vector<LineRange>& DwarfInfoImpl::get_line_ranges() {
 }
 
 void DwarfInfoImpl::load_line_ranges() {
-    // Flatten every CU's line table into half-open [low, high) ranges, sorted by
-    // `low`, so address lookups are a binary search plus a short left-scan.
+    // Flatten every CU's line table into half-open [low, high) ranges and index
+    // them, so an address lookup is a single binary search.
+    std::vector<LineRange> ranges;
     for (auto& cu : get_cus()) {
         DwarfLineContextHandle& line_context = cu.get_line_context();
         if (!line_context) {
@@ -259,12 +260,64 @@ void DwarfInfoImpl::load_line_ranges() {
             if (high <= low) {
                 continue;
             }
-            line_ranges.push_back(LineRange{low, high, lines[i]});
+            ranges.push_back(LineRange{low, high, lines[i]});
         }
     }
 
-    std::sort(line_ranges.begin(), line_ranges.end(),
-              [](const LineRange& a, const LineRange& b) { return a.low < b.low; });
+    // Overlapping line tables (inlining/LTO/COMDAT can make several CUs
+    // describe the same address): the narrowest row is the most specific
+    // source location, matching find_function_by_address's policy.
+    line_ranges.build(std::move(ranges),
+                      [](const LineRange& a, const LineRange& b) { return a.high - a.low < b.high - b.low; });
+}
+
+const AddressRangeIndex<FunctionRange>& DwarfInfoImpl::get_function_ranges() {
+    if (!loaded_function_ranges) {
+        loaded_function_ranges = true;
+        load_function_ranges();
+    }
+    return function_ranges;
+}
+
+void DwarfInfoImpl::load_function_ranges() {
+    // Flatten the address ranges of every code scope of every CU and index
+    // them, so find_function_by_address is a single binary search instead of
+    // a walk over all CU trees.
+    std::vector<FunctionRange> ranges;
+    for (auto& cu : get_cus()) {
+        if (DwarfDiePtr cu_die = cu.get_die()) {
+            index_function_ranges(*cu_die, 0, ranges);
+        }
+    }
+
+    // The narrowest range wins, then the inner scope. On a full tie the range
+    // collected first, i.e. from the first CU, wins (as the per-CU tree walk did).
+    function_ranges.build(std::move(ranges), [](const FunctionRange& a, const FunctionRange& b) {
+        const Dwarf_Addr a_width = a.high - a.low;
+        const Dwarf_Addr b_width = b.high - b.low;
+        return a_width != b_width ? a_width < b_width : a.depth > b.depth;
+    });
+}
+
+void DwarfInfoImpl::index_function_ranges(const DwarfDie& die, uint32_t depth, std::vector<FunctionRange>& ranges) {
+    for (auto child = die.get_first_child(); child; child = child->get_next_sibling()) {
+        const DwarfDieTag tag = child->get_tag();
+        if (tag == DwarfDieTag::subprogram || tag == DwarfDieTag::inlined_subroutine ||
+            tag == DwarfDieTag::lexical_block) {
+            const Dwarf_Off offset = child->get_offset();
+            for (const auto& [low, high] : child->get_address_ranges()) {
+                if (high <= low) {
+                    continue;
+                }
+                ranges.push_back(FunctionRange{low, high, depth + 1, offset});
+            }
+        } else if (child->is_type() && tag != DwarfDieTag::namespace_) {
+            // Types only hold declarations; their definitions live at CU /
+            // namespace level, so there is no code to find below them.
+            continue;
+        }
+        index_function_ranges(*child, depth + 1, ranges);
+    }
 }
 
 std::pair<Dwarf_Fde*, Dwarf_Signed> DwarfInfoImpl::get_fdes() {
@@ -10,6 +10,7 @@
 #include "../dwarf_die.hpp"
 #include "../dwarf_frame.hpp"
 #include "../dwarf_info.hpp"
+#include "address_range_index.hpp"
 
 namespace ttexalens::native_elf::details {
 
@@ -24,6 +25,17 @@ struct LineRange {
     Dwarf_Line line;
 };
 
+// One half-open address range [low, high) of a code scope DIE (subprogram,
+// inlined subroutine or lexical block). `depth` is the DIE's nesting level
+// below its CU DIE; it breaks ties between equally wide ranges in favour of
+// the inner scope. The DIE itself is materialized on demand from `offset`.
+struct FunctionRange {
+    Dwarf_Addr low;
+    Dwarf_Addr high;
+    uint32_t depth;
+    Dwarf_Off offset;
+};
+
 // Adapter that lets libdwarf read DWARF data from an already-parsed
 // ELFIO::elfio without opening the file again (path-loaded) or needing a path
 // at all (from_bytes). Implements the Dwarf_Obj_Access_Interface_a vtable.
@@ -63,8 +75,13 @@ class DwarfInfoImpl : public std::enable_shared_from_this<DwarfInfoImpl> {
     // Lazy CU cache (libdwarf's CU cursor is stateful and one-shot).
     std::vector<DwarfCompileUnit>& get_cus();
 
-    // Lazy, sorted address->line index across all CUs (see LineRange).
-    const std::vector<LineRange>& get_line_ranges();
+    // Lazy address->line index across all CUs (see LineRange). Where line
+    // tables overlap, the narrowest row wins.
+    const AddressRangeIndex<LineRange>& get_line_ranges();
+
+    // Lazy address->code scope index across all CUs (see FunctionRange). The
+    // narrowest range wins, then the more deeply nested DIE.
+    const AddressRangeIndex<FunctionRange>& get_function_ranges();
 
     // Lazy CFI loader. Returns the FDE array (libdwarf-owned, lifetime tied
     // to ~Impl) plus its count. Tries .debug_frame first, then .eh_frame —
@@ -92,6 +109,8 @@ class DwarfInfoImpl : public std::enable_shared_from_this<DwarfInfoImpl> {
 
     void load_compile_units();
     void load_line_ranges();
+    void load_function_ranges();
+    void index_function_ranges(const DwarfDie& die, uint32_t depth, std::vector<FunctionRange>& ranges);
     void load_symbols_table();
 
     ElfObjAccess obj_access;
@@ -102,10 +121,14 @@ class DwarfInfoImpl : public std::enable_shared_from_this<DwarfInfoImpl> {
     std::unordered_map<Dwarf_Off, DwarfDiePtr> die_cache;
     bool loaded_cus = false;
 
-    // Sorted (by low) address->line index; see get_line_ranges().
-    std::vector<LineRange> line_ranges;
+    // Address->line index; see get_line_ranges().
+    AddressRangeIndex<LineRange> line_ranges;
     bool loaded_line_ranges = false;
 
+    // Address->code scope index; see get_function_ranges().
+    AddressRangeIndex<FunctionRange> function_ranges;
+    bool loaded_function_ranges = false;
+
     // Call Frame Information state. cies/fdes are libdwarf-owned arrays
     // (allocated by dwarf_get_fde_list[_eh]) freed in ~Impl via
     // dwarf_dealloc_fde_cie_list. The pointers themselves are stable for
@@ -5,7 +5,9 @@
 #include <nanobind/stl/function.h>
 #include <nanobind/stl/optional.h>
 #include <nanobind/stl/shared_ptr.h>
+#include <nanobind/stl/string.h>
 #include <nanobind/stl/string_view.h>
+#include <nanobind/stl/vector.h>
 
 #include <variant>
 
@@ -19,6 +21,11 @@ namespace nb = nanobind;
 namespace ttexalens::native_elf::bindings {
 
 void bind_dwarf_info(nb::module_& m) {
+    nb::class_<DwarfSymbolizedAddress>(m, "DwarfSymbolizedAddress")
+        .def_ro("address", &DwarfSymbolizedAddress::address)
+        .def_ro("functions", &DwarfSymbolizedAddress::functions)
+        .def_ro("file_line", &DwarfSymbolizedAddress::file_line);
+
     nb::class_<DwarfInfo>(m, "DwarfInfo")
         .def("find_file_line_by_address", &DwarfInfo::find_file_line_by_address, nb::arg("address"))
         .def(
@@ -33,6 +40,10 @@ void bind_dwarf_info(nb::module_& m) {
         .def("find_function_by_address", &DwarfInfo::find_function_by_address, nb::arg("address"),
              nb::rv_policy::reference_internal,
              nb::sig("def find_function_by_address(self, address: int) -> DwarfDie | None"))
+        // One native call for many PCs (e.g. all PCs of a sampling profile);
+        // results are plain values, so no lifetime ties to self are needed.
+        .def("symbolize", &DwarfInfo::symbolize, nb::arg("addresses"),
+             nb::sig("def symbolize(self, addresses: collections.abc.Sequence[int]) -> list[DwarfSymbolizedAddress]"))
         // nb::rv_policy::reference_internal: the returned FrameDescription holds a raw
         // Dwarf_Fde owned by self (DwarfInfo). Tie its Python-side
         // lifetime to self so callers can't accidentally outlive the parent.
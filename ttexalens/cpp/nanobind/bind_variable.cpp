@@ -59,6 +59,9 @@ void bind_variable(nb::module_& m) {
         .def("dereference", &ElfVariable::dereference)
         .def("get_address", &ElfVariable::get_address)
         .def("get_size", &ElfVariable::get_size)
+        // Resolved type DIE; lets Python derive layouts (ttexalens.elf.structured).
+        .def_prop_ro("type_die", &ElfVariable::get_type_die, nb::rv_policy::reference_internal,
+                     nb::sig("def type_die(self) -> DwarfDie"))
         .def("read_bytes",
              [](const ElfVariable& self) {
                  auto v = self.read_bytes();
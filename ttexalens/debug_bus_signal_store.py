@@ -2,10 +2,11 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import cached_property
-from time import sleep
-from typing import Iterable, TYPE_CHECKING
+import struct
+from time import sleep, time
+from typing import Iterable, Iterator, TYPE_CHECKING
 
 from ttexalens.hardware.noc_block import NocBlock
 
@@ -29,6 +30,11 @@ class DebugBusSignalDescription:
     mask: int = 0xFFFFFFFF
     across_groups: bool = False
 
+    def encode(self) -> int:
+        """Value of the debug bus control register that selects this signal."""
+        en = 1
+        return (en << 29) | (self.rd_sel << 25) | (self.daisy_sel << 16) | (self.sig_sel << 0)
+
 
 @dataclass
 class L1MemReg2:
@@ -97,6 +103,85 @@ class SignalGroupSample:
         return (self.raw_data & mask) >> shift
 
 
+def _decode_signal_column(words: tuple[int, ...], shift_mask: ShiftMask, sample_count: int) -> list[int]:
+    """Decodes one signal from all samples at once, given the flat tuple of 32-bit sample words."""
+    mask = shift_mask.mask
+    if mask == 0:
+        return [0] * sample_count
+    first_word = shift_mask.shift // WORD_SIZE_BITS
+    last_word = (mask.bit_length() - 1) // WORD_SIZE_BITS
+    if first_word == last_word:
+        # Signal lives in a single 32-bit word: slice that word out of every sample and mask it in one pass.
+        word_mask = (mask >> (WORD_SIZE_BITS * first_word)) & 0xFFFFFFFF
+        word_shift = shift_mask.shift - WORD_SIZE_BITS * first_word
+        return [(word & word_mask) >> word_shift for word in words[first_word::4]]
+
+    # Signal spans multiple words: stitch only the words it touches.
+    columns = [words[w::4] for w in range(first_word, last_word + 1)]
+    base_shift = WORD_SIZE_BITS * first_word
+    values: list[int] = []
+    for parts in zip(*columns):
+        raw = 0
+        for i, part in enumerate(parts):
+            raw |= part << (WORD_SIZE_BITS * i)
+        values.append(((raw << base_shift) & mask) >> shift_mask.shift)
+    return values
+
+
+@dataclass
+class SignalGroupTimeSeries:
+    """Series of 128-bit samples of one signal group, decoded column-wise on demand.
+
+    Raw samples are kept as one contiguous byte buffer (16 bytes per sample). Samples are captured
+    in bursts; ``burst_starts`` holds the index of the first sample of every burst and
+    ``burst_timestamps`` the host time at which that burst was armed.
+    """
+
+    group_name: str
+    group: dict[str, ShiftMask]
+    raw_data: bytes | bytearray = b""
+    burst_starts: list[int] = field(default_factory=list)
+    burst_timestamps: list[float] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.raw_data) // 16
+
+    def keys(self):
+        """Return signal names in the group."""
+        return self.group.keys()
+
+    @cached_property
+    def _words(self) -> tuple[int, ...]:
+        return struct.unpack(f"<{len(self.raw_data) // 4}I", self.raw_data)
+
+    def __getitem__(self, key: str) -> list[int]:
+        """For the given signal name in the group, returns its values across all samples."""
+        if key not in self.group:
+            raise ValueError(f"Signal '{key}' does not exist in group.")
+        return _decode_signal_column(self._words, self.group[key], len(self))
+
+    def items(self) -> Iterable[tuple[str, list[int]]]:
+        """Returns (signal_name, list of sampled values) pairs."""
+        for signal in self.group:
+            yield signal, self[signal]
+
+    def sample(self, index: int) -> SignalGroupSample:
+        """Returns a single sample as SignalGroupSample."""
+        raw = int.from_bytes(self.raw_data[index * 16 : (index + 1) * 16], byteorder="little")
+        return SignalGroupSample(raw, self.group)
+
+    def extend(self, other: SignalGroupTimeSeries) -> None:
+        """Appends samples (and burst boundaries) of another series of the same group."""
+        offset = len(self)
+        self.burst_starts.extend(start + offset for start in other.burst_starts)
+        self.burst_timestamps.extend(other.burst_timestamps)
+        # Grow in place: concatenating bytes would copy the whole series for every burst.
+        if not isinstance(self.raw_data, bytearray):
+            self.raw_data = bytearray(self.raw_data)
+        self.raw_data += other.raw_data
+        self.__dict__.pop("_words", None)
+
+
 @dataclass
 class DebugBusSignalStoreInitialization:
     group_map: dict[str, tuple[int, int]]  # key: group_name, value: (daisy_sel, sig_sel)
@@ -247,9 +332,7 @@ class DebugBusSignalStore:
     def _read_signal_data(self, signal_desc: DebugBusSignalDescription) -> int:
         """Reads the 32 data register value from the debug bus using debug hardware"""
         # Configure debug bus to read the signal
-        en = 1
-        config = (en << 29) | (signal_desc.rd_sel << 25) | (signal_desc.daisy_sel << 16) | (signal_desc.sig_sel << 0)
-        self.location.noc_write32(self._control_register_address, config)
+        self.location.noc_write32(self._control_register_address, signal_desc.encode())
 
         # Read the data
         return self.location.noc_read32(self._data_register_address)
@@ -321,6 +404,10 @@ class DebugBusSignalStore:
         Relevant documentation for wormhole although it also works on blackhole and quasar in similar or the same way:
         - https://github.com/tenstorrent/tt-isa-documentation/blob/main/WormholeB0/TensixTile/DebugDaisychain.md
         """
+        self._select_signal_group(signal_group)
+        return self._configure_l1_sampling_registers(l1_address, samples, sampling_interval)
+
+    def _select_signal_group(self, signal_group: str) -> None:
         # get daisy and sig selection for group
         daisy_sel, sig_sel = self.group_map[signal_group]
 
@@ -329,6 +416,9 @@ class DebugBusSignalStore:
         config = (en << 29) | (daisy_sel << 16) | sig_sel
         self.location.noc_write32(self._control_register_address, config)
 
+    def _configure_l1_sampling_registers(
+        self, l1_address: int, samples: int = 1, sampling_interval: int = 2
+    ) -> tuple[int, L1MemReg2]:
         # Get L1 register addresses
         reg0_addr = self._l1_mem_reg0_address
         reg1_addr = self._l1_mem_reg1_address
@@ -370,6 +460,11 @@ class DebugBusSignalStore:
         Relevant documentation for wormhole although it also works on blackhole and quasar in similar or the same way:
         - https://github.com/tenstorrent/tt-isa-documentation/blob/main/WormholeB0/TensixTile/DebugDaisychain.md
         """
+        wait_addr = self._trigger_l1_sampling(reg2_addr, reg2_struct, l1_address, samples)
+        self._wait_for_l1_sampling(wait_addr)
+
+    def _trigger_l1_sampling(self, reg2_addr: int, reg2_struct: L1MemReg2, l1_address: int, samples: int = 1) -> int:
+        """Writes the sentinel into the last sample slot and triggers sampling. Returns the slot address to wait on."""
         # wait for the last memory location to be written to
         wait_addr = l1_address + ((samples - 1) * self.L1_SAMPLE_SIZE_BYTES)
         # Write sentinel value to all 4 32-bit words in the 128-bit location
@@ -380,24 +475,123 @@ class DebugBusSignalStore:
         self.location.noc_write32(reg2_addr, reg2_struct.encode())
         reg2_struct.write_trigger = 0
         self.location.noc_write32(reg2_addr, reg2_struct.encode())
+        return wait_addr
+
+    def _stop_l1_sampling(self) -> None:
+        """Stops armed L1 sampling by putting the L1 write interface back into its idle write mode."""
+        self.location.noc_write32(self._l1_mem_reg2_address, L1MemReg2(write_mode=0xF).encode())
 
+    def _wait_for_l1_sampling(self, wait_addr: int) -> None:
         # wait for the last memory location to be written to - using sentinel value as indicator
         while self.location.noc_read32(wait_addr) == SENTINEL_VALUE:
             sleep(WAIT_SLEEP_SECONDS)
 
+    def _read_l1_samples_raw(self, l1_address: int, samples: int) -> bytes:
+        """Reads all captured samples with a single bulk read."""
+        buffer = bytearray(samples * self.L1_SAMPLE_SIZE_BYTES)
+        self.location.noc_read(l1_address, buffer)
+        return bytes(buffer)
+
     def _process_l1_samples(self, l1_address: int, group_name: str, samples: int = 1) -> list[SignalGroupSample]:
         """Process L1 samples and extract signal data based on signal configuration"""
+        raw = self._read_l1_samples_raw(l1_address, samples)
+        group = self.signal_groups[group_name]
+        return [
+            SignalGroupSample(int.from_bytes(raw[i : i + self.L1_SAMPLE_SIZE_BYTES], byteorder="little"), group)
+            for i in range(0, len(raw), self.L1_SAMPLE_SIZE_BYTES)
+        ]
+
+    def stream_signal_group(
+        self,
+        signal_group: str,
+        l1_address: int,
+        samples_per_buffer: int,
+        bursts: int | None = None,
+        sampling_interval: int = 2,
+    ) -> Iterator[SignalGroupTimeSeries]:
+        """Continuously samples a signal group into an L1 double buffer and yields every captured burst.
 
-        def read_sample(addr: int) -> int:
-            """Read 4x32-bit words and combine them into a single 128-bit integer"""
-            buffer = bytearray(self.L1_SAMPLE_SIZE_BYTES)
-            self.location.noc_read(addr, buffer)
-            return int.from_bytes(buffer, byteorder="little")
+        Two buffers of ``samples_per_buffer`` samples are placed back to back starting at ``l1_address``.
+        As soon as one buffer is full, sampling is re-armed into the other one and the full buffer is
+        drained with a single bulk read while the hardware keeps sampling. Samples within a burst are
+        ``sampling_interval`` cycles apart; there is a short gap (the re-arm latency) between bursts.
 
-        # Read samples from L1 memory
-        sample_values = [read_sample(l1_address + (i * self.L1_SAMPLE_SIZE_BYTES)) for i in range(samples)]
+        Parameters
+        ----------
+        signal_group : str
+            The signal group to sample. It is signal group name from `group_map`.
+        l1_address : int
+            Byte-address of the double buffer in L1. Must be 16-byte aligned and the whole double buffer
+            (2 * samples_per_buffer * 16 bytes) must fit in the first 1 MiB of L1.
+        samples_per_buffer : int
+            Number of 128-bit samples captured in each burst.
+        bursts : int | None, default=None
+            Number of bursts to capture. If None, sampling continues until the generator is closed.
+        sampling_interval : int, default=2
+            Interval (in cycles) between consecutive samples inside a burst. Must be between 2 and 256.
 
-        return [SignalGroupSample(sample, self.signal_groups[group_name]) for sample in sample_values]
+        Yields
+        ------
+        SignalGroupTimeSeries
+            Decoded samples of a single burst.
+        """
+        if self.device.is_quasar():
+            raise NotImplementedError("Groups are only supported on Wormhole and Blackhole devices.")
+        if signal_group not in self.group_map:
+            raise ValueError(f"Unknown group name '{signal_group}'.")
+        if bursts is not None and bursts < 1:
+            raise ValueError(f"bursts must be at least 1, but got {bursts}")
+        # Both halves of the double buffer must fit in the sampling range.
+        self._validate_l1_parameters(l1_address, 2 * samples_per_buffer, sampling_interval)
+
+        group = self.signal_groups[signal_group]
+        buffer_size = samples_per_buffer * self.L1_SAMPLE_SIZE_BYTES
+        buffers = [l1_address, l1_address + buffer_size]
+
+        def arm(buffer_address: int) -> tuple[int, float]:
+            reg2_addr, reg2_struct = self._configure_l1_sampling_registers(
+                buffer_address, samples_per_buffer, sampling_interval
+            )
+            armed_at = time()
+            return self._trigger_l1_sampling(reg2_addr, reg2_struct, buffer_address, samples_per_buffer), armed_at
+
+        self._select_signal_group(signal_group)
+        current = 0
+        wait_addr, armed_at = arm(buffers[current])
+        armed = True
+        captured = 0
+        try:
+            while bursts is None or captured < bursts:
+                self._wait_for_l1_sampling(wait_addr)
+                armed = False
+                captured += 1
+                full_buffer, full_armed_at = buffers[current], armed_at
+                if bursts is None or captured < bursts:
+                    # Re-arm into the other buffer before draining this one so capture and drain overlap.
+                    current ^= 1
+                    wait_addr, armed_at = arm(buffers[current])
+                    armed = True
+                raw = self._read_l1_samples_raw(full_buffer, samples_per_buffer)
+                yield SignalGroupTimeSeries(signal_group, group, raw, [0], [full_armed_at])
+        finally:
+            if armed:
+                # Closed while a burst was armed: stop the hardware from writing into L1 after we return.
+                self._stop_l1_sampling()
+
+    def capture_signal_group(
+        self,
+        signal_group: str,
+        l1_address: int,
+        samples_per_buffer: int,
+        bursts: int,
+        sampling_interval: int = 2,
+    ) -> SignalGroupTimeSeries:
+        """Captures ``bursts`` double-buffered bursts of a signal group (see `stream_signal_group`)
+        and returns them concatenated into a single time series."""
+        series = SignalGroupTimeSeries(signal_group, self.signal_groups.get(signal_group, {}))
+        for burst in self.stream_signal_group(signal_group, l1_address, samples_per_buffer, bursts, sampling_interval):
+            series.extend(burst)
+        return series
 
     def sample_signal_group(
         self, signal_group: str, l1_address: int, samples: int = 1, sampling_interval: int = 2
@@ -9,7 +9,7 @@ import datetime
 from functools import cache, cached_property
 import traceback
 import tt_umd
-from typing import Callable, Iterable, Sequence, TypeVar
+from typing import Any, Callable, Iterable, Sequence, TypeVar
 
 from tabulate import tabulate
 from ttexalens.context import Context, NocId
@@ -19,6 +19,8 @@ from ttexalens.hardware.arc_block import ArcBlock
 from ttexalens.hardware.noc_block import NocBlock
 from ttexalens.hardware.risc_debug import RiscDebug
 from ttexalens.hardware.tensix_registers_description import TensixDebugBusDescription, TensixRegisterDescription
+from ttexalens.memory_map import AccessPermissionTable
+from ttexalens import noc_profiler
 from ttexalens.umd_device import UmdDevice, TimeoutDeviceRegisterError
 from ttexalens import util as util
 
@@ -35,6 +37,13 @@ class TensixInstructions:
             if callable(func):
                 static_method = staticmethod(func)
                 setattr(self.__class__, func_name, static_method)
+        self._ops = ops
+
+    @cached_property
+    def disassembler(self):
+        from ttexalens.tensix_disassembler import TensixDisassembler
+
+        return TensixDisassembler(self._ops)
 
     @staticmethod
     def TT_OP_SFPLOAD(lreg_ind, instr_mod0, sfpu_addr_mode, dest_reg_addr) -> int:
@@ -204,8 +213,12 @@ class Device:
         if self.is_local:
             return self
         local_tt_device = self._umd_device.get_local_tt_device()
-        for device in self._context.devices.values():
-            if device.is_local and device._umd_device.get_local_tt_device() == local_tt_device:
+        cluster_descriptor = self._context.cluster_descriptor
+        for device_id in self._context.device_ids:
+            if not cluster_descriptor.is_chip_mmio_capable(device_id):
+                continue
+            device = self._context.devices[device_id]
+            if device._umd_device.get_local_tt_device() == local_tt_device:
                 return device
         raise RuntimeError("Local device not found in context devices")
 
@@ -241,6 +254,12 @@ class Device:
         noc_block = location.noc_block
         noc_memory_map = noc_block.noc_memory_map
 
+        # Fast path: the precompiled table approves most accesses with a single lookup.
+        permission = AccessPermissionTable.WRITE if is_write else AccessPermissionTable.READ
+        if noc_memory_map.noc_access_table.allows(addr, num_bytes, permission):
+            return
+
+        # Slow path: walk the blocks to evaluate dynamic checks and report the exact unsafe address.
         bytes_checked = 0
         while bytes_checked < num_bytes:
             curr_addr = addr + bytes_checked
@@ -295,13 +314,13 @@ class Device:
         if safe_mode is None:
             safe_mode = self._context.safe_mode
 
-        if safe_mode:
-            self._validate_noc_access_is_safe(location, address, len(buffer), is_write=False)
-
         def noc_operation(noc_id: NocId) -> None:
             self._umd_device.noc_read(noc_id, noc_x, noc_y, address, buffer, dma_threshold)
 
-        self._with_noc_failover(noc_operation, noc_id)
+        with noc_profiler.frame("noc_read"):
+            if safe_mode:
+                self._validate_noc_access_is_safe(location, address, len(buffer), is_write=False)
+            self._with_noc_failover(noc_operation, noc_id)
 
     def noc_read32(
         self, location: OnChipCoordinate, address: int, noc_id: NocId | None = None, safe_mode: bool | None = None
@@ -326,13 +345,13 @@ class Device:
         if safe_mode is None:
             safe_mode = self._context.safe_mode
 
-        if safe_mode:
-            self._validate_noc_access_is_safe(location, address, len(data), is_write=True)
-
         def noc_operation(noc_id: NocId) -> None:
             self._umd_device.noc_write(noc_id, noc_x, noc_y, address, data, dma_threshold)
 
-        self._with_noc_failover(noc_operation, noc_id)
+        with noc_profiler.frame("noc_write"):
+            if safe_mode:
+                self._validate_noc_access_is_safe(location, address, len(data), is_write=True)
+            self._with_noc_failover(noc_operation, noc_id)
 
     def noc_write32(
         self,
@@ -381,6 +400,10 @@ class Device:
     def get_remote_transfer_eth_core(self) -> tuple[int, int] | None:
         return self._umd_device.get_remote_transfer_eth_core()
 
+    def get_remote_transfer_eth_link_stats(self) -> list[dict[str, Any]]:
+        """Health and latency statistics of the Ethernet links of the MMIO chip that carry transfers to this device."""
+        return self._umd_device.get_remote_transfer_eth_link_stats()
+
     # Coordinate conversion functions (see coordinate.py for description of coordinate systems)
     def __noc_to_die(self, noc_loc, noc_id=0):
         noc_x, noc_y = noc_loc
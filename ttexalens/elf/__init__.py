@@ -15,6 +15,7 @@ from ttexalens._native_ttexalens import (
     DwarfDieTag,
     DwarfFileLine,
     DwarfInfo,
+    DwarfSymbolizedAddress,
     ElfFile,
     ElfSection,
     ElfSymbol,
@@ -27,6 +28,7 @@ from ttexalens._native_ttexalens import (
     get_callstack,
     get_frame_callstack,
 )
+from ttexalens.elf.structured import StructuredArray, StructuredField, StructuredLayout, read_structured
 from ttexalens.server import FileAccessApi
 
 
@@ -58,6 +60,7 @@ __all__ = [
     "DwarfDieTag",
     "DwarfFileLine",
     "DwarfInfo",
+    "DwarfSymbolizedAddress",
     "ElfFile",
     "ElfSection",
     "ElfSymbol",
@@ -70,4 +73,8 @@ __all__ = [
     "get_callstack",
     "get_frame_callstack",
     "read_elf",
+    "read_structured",
+    "StructuredArray",
+    "StructuredField",
+    "StructuredLayout",
 ]
@@ -0,0 +1,253 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""Bulk views of DWARF-typed variables.
+
+``ElfVariable`` walks values member by member, which is convenient for single values but
+slow for firmware tables with thousands of entries. ``read_structured`` derives a flat
+record layout from the variable's type once, reads the whole variable with a single
+``read_bytes`` call and decodes records and columns from that snapshot with ``struct``.
+
+Nested members are flattened into dotted names (``cfg.tiles``), arrays of structs inside a
+record into indexed names (``d[2].x``) and arrays of scalars stay one field with a shape.
+Bit-field members cannot be described this way and are listed in
+``StructuredLayout.skipped_fields`` instead.
+
+When NumPy is installed, ``StructuredLayout.numpy_dtype`` and ``StructuredArray.to_numpy``
+expose the same layout as a structured dtype and a zero-copy ndarray over the snapshot.
+NumPy is optional; everything else works without it.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+import math
+import struct
+from typing import Any, Iterator
+
+from ttexalens._native_ttexalens import DwarfAttributeTag, DwarfDie, DwarfDieTag, ElfVariable, NoMemoryAccess
+from ttexalens.exceptions import TTException
+
+__all__ = [
+    "StructuredArray",
+    "StructuredField",
+    "StructuredLayout",
+    "read_structured",
+]
+
+_RECORD_TAGS = (DwarfDieTag.structure_type, DwarfDieTag.class_type, DwarfDieTag.union_type)
+_POINTER_TAGS = (DwarfDieTag.pointer_type, DwarfDieTag.reference_type, DwarfDieTag.rvalue_reference_type)
+_UNSIGNED_FORMATS = {1: "B", 2: "H", 4: "I", 8: "Q"}
+_SIGNED_FORMATS = {1: "b", 2: "h", 4: "i", 8: "q"}
+_FLOAT_FORMATS = {2: "e", 4: "f", 8: "d"}
+_DW_ATE_BOOLEAN = 0x02
+_DW_ATE_FLOAT = 0x04
+
+
+@dataclass(frozen=True)
+class StructuredField:
+    name: str  # flattened member path; empty when the record itself is a scalar
+    offset: int  # byte offset inside the record
+    format: str  # struct format character of one element
+    shape: tuple[int, ...] = ()  # array dimensions, empty for scalars
+
+    @property
+    def count(self) -> int:
+        return math.prod(self.shape)
+
+
+def _scalar_format(type_die: DwarfDie) -> str | None:
+    size = type_die.get_size()
+    tag = type_die.tag
+    if tag == DwarfDieTag.base_type:
+        encoding_attribute = type_die.get_attribute(DwarfAttributeTag.encoding)
+        encoding = encoding_attribute.value if encoding_attribute is not None else None
+        if encoding == _DW_ATE_FLOAT:
+            return _FLOAT_FORMATS.get(size)
+        if encoding == _DW_ATE_BOOLEAN and size == 1:
+            return "?"
+        return (_SIGNED_FORMATS if type_die.is_signed_type else _UNSIGNED_FORMATS).get(size)
+    if tag == DwarfDieTag.enumeration_type:
+        return (_SIGNED_FORMATS if type_die.is_signed_type else _UNSIGNED_FORMATS).get(size)
+    if tag in _POINTER_TAGS:
+        return _UNSIGNED_FORMATS.get(size)
+    return None
+
+
+def _resolved_type(variable: ElfVariable) -> DwarfDie:
+    type_die = variable.type_die
+    return type_die.get_resolved_type() or type_die
+
+
+def _member_names(type_die: DwarfDie) -> Iterator[tuple[str, DwarfDie]]:
+    """Yields data members reachable by name, including those of base classes and anonymous unions/structs."""
+    for child in type_die.iter_children():
+        if child.tag == DwarfDieTag.inheritance:
+            base_type = child.get_resolved_type()
+            if base_type is not None:
+                yield from _member_names(base_type)
+        elif child.tag == DwarfDieTag.member and not child.has_attribute(DwarfAttributeTag.external):
+            if child.name is not None:
+                yield child.name, child
+            else:
+                anonymous_type = child.get_resolved_type()
+                if anonymous_type is not None:
+                    yield from _member_names(anonymous_type)
+
+
+def _collect_fields(probe: ElfVariable, name: str, fields: list[StructuredField], skipped: list[str]) -> None:
+    # `probe` is laid over address 0, so its address is the offset inside the record.
+    type_die = _resolved_type(probe)
+    if type_die.tag in _RECORD_TAGS:
+        for member_name, member_die in _member_names(type_die):
+            full_name = f"{name}.{member_name}" if name else member_name
+            if member_die.has_attribute(DwarfAttributeTag.bit_size):
+                skipped.append(full_name)
+                continue
+            _collect_fields(probe.get_member(member_name), full_name, fields, skipped)
+    elif type_die.tag == DwarfDieTag.array_type:
+        length = len(probe)
+        if length == 0:
+            skipped.append(name)  # flexible array member
+            return
+        element_fields: list[StructuredField] = []
+        _collect_fields(probe[0], "", element_fields, [])
+        if len(element_fields) == 1 and element_fields[0].name == "":
+            # Array of scalars (or of scalar arrays): one field with a shape.
+            element = element_fields[0]
+            fields.append(StructuredField(name, probe.get_address(), element.format, (length, *element.shape)))
+        else:
+            for i in range(length):
+                _collect_fields(probe[i], f"{name}[{i}]", fields, skipped)
+    else:
+        element_format = _scalar_format(type_die)
+        if element_format is None:
+            skipped.append(name)
+        else:
+            fields.append(StructuredField(name, probe.get_address(), element_format))
+
+
+@dataclass
+class StructuredLayout:
+    """Flat description of one record: fields with offsets and struct formats."""
+
+    itemsize: int
+    fields: list[StructuredField]
+    skipped_fields: list[str] = field(default_factory=list)
+
+    def __post_init__(self):
+        self._structs = [struct.Struct(f"<{f.count}{f.format}") for f in self.fields]
+        self._field_index = {f.name: i for i, f in enumerate(self.fields)}
+
+    @staticmethod
+    def from_type(type_variable: ElfVariable) -> StructuredLayout:
+        """Derives the layout of the type of ``type_variable``. No memory is read."""
+        probe = ElfVariable(type_variable.type_die, 0, NoMemoryAccess.instance())
+        fields: list[StructuredField] = []
+        skipped: list[str] = []
+        _collect_fields(probe, "", fields, skipped)
+        return StructuredLayout(probe.get_size(), fields, skipped)
+
+    @property
+    def is_scalar(self) -> bool:
+        return len(self.fields) == 1 and self.fields[0].name == ""
+
+    @property
+    def names(self) -> list[str]:
+        return [f.name for f in self.fields]
+
+    def _unpack_field(self, index: int, buffer: bytes | memoryview, record_offset: int) -> Any:
+        layout_field = self.fields[index]
+        values = self._structs[index].unpack_from(buffer, record_offset + layout_field.offset)
+        if not layout_field.shape:
+            return values[0]
+        result: Any = list(values)
+        for dimension in reversed(layout_field.shape[1:]):
+            result = [result[i : i + dimension] for i in range(0, len(result), dimension)]
+        return result
+
+    def unpack(self, buffer: bytes | memoryview, record_offset: int = 0) -> Any:
+        """Decodes one record into a dict of field values (or the value itself for scalar records)."""
+        if self.is_scalar:
+            return self._unpack_field(0, buffer, record_offset)
+        return {f.name: self._unpack_field(i, buffer, record_offset) for i, f in enumerate(self.fields)}
+
+    def numpy_dtype(self):
+        """Returns the equivalent NumPy structured dtype. Requires NumPy."""
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise TTException("NumPy is required for structured dtypes; install numpy.") from e
+        if self.is_scalar:
+            only = self.fields[0]
+            return np.dtype((f"<{only.format}", only.shape)) if only.shape else np.dtype(f"<{only.format}")
+        return np.dtype(
+            {
+                "names": self.names,
+                "formats": [(f"<{f.format}", f.shape) if f.shape else f"<{f.format}" for f in self.fields],
+                "offsets": [f.offset for f in self.fields],
+                "itemsize": self.itemsize,
+            }
+        )
+
+
+class StructuredArray:
+    """Records decoded on demand from a single snapshot of a variable's bytes."""
+
+    def __init__(self, layout: StructuredLayout, data: bytes, count: int, address: int = 0):
+        if len(data) < count * layout.itemsize:
+            raise TTException(f"Expected {count * layout.itemsize} bytes for {count} records, got {len(data)}.")
+        self.layout = layout
+        self.data = data
+        self.count = count
+        self.address = address
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(f"Record index {index} out of range [0, {self.count})")
+        return self.layout.unpack(self.data, index * self.layout.itemsize)
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(self.count):
+            yield self.layout.unpack(self.data, index * self.layout.itemsize)
+
+    def column(self, name: str = "") -> list[Any]:
+        """Returns one field of every record."""
+        field_index = self.layout._field_index.get(name)
+        if field_index is None:
+            raise TTException(f"Unknown field '{name}'. Available fields: {', '.join(self.layout.names)}")
+        itemsize = self.layout.itemsize
+        return [self.layout._unpack_field(field_index, self.data, i * itemsize) for i in range(self.count)]
+
+    def to_numpy(self):
+        """Returns a read-only ndarray viewing the snapshot without copying. Requires NumPy."""
+        import numpy as np
+
+        return np.frombuffer(self.data, dtype=self.layout.numpy_dtype(), count=self.count)
+
+
+def read_structured(variable: ElfVariable) -> StructuredArray:
+    """
+    Reads a whole variable with a single memory read and returns it as an array of records.
+
+    Arrays (e.g. an array of descriptors) give one record per element; any other variable gives one record.
+
+    Args:
+        variable (ElfVariable): Variable to read, e.g. from ElfFile.get_global.
+
+    Returns:
+        StructuredArray: Records decoded on demand from the snapshot.
+    """
+    count = 1
+    element = variable
+    if _resolved_type(variable).tag == DwarfDieTag.array_type:
+        count = len(variable)
+        if count == 0:
+            raise TTException("Cannot read an array of unknown length.")
+        element = variable[0]
+    layout = StructuredLayout.from_type(element)
+    return StructuredArray(layout, variable.read_bytes(), count, variable.get_address())
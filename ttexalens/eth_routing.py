@@ -0,0 +1,206 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""Routing of remote-chip transfers over the ethernet links of the MMIO chip.
+
+A remote chip is reached through one of the active ETH cores of its MMIO chip, and UMD sends a
+transfer over the ETH core set with ``set_remote_transfer_ethernet_cores``. That setting belongs
+to the TTDevice and UMD remote transfers are blocking, so transfers to one device cannot overlap:
+the router holds a lock while it selects a link and runs a transfer on it.
+
+For every link the router keeps health and latency statistics: transfer and failure counts, an
+exponential moving average of the time per byte, and a quarantine deadline that is set when the
+link fails (and doubles with every consecutive failure).
+
+- A transfer runs whole on the fastest healthy link. Transfers only move off the selected link when
+  another one is clearly faster, so they do not pay for ``set_remote_transfer_ethernet_cores`` on
+  every call.
+- Links are measured lazily: ``probe`` stops at the first working link, and the others get their
+  statistics the first time a transfer uses them. Until then they count as average links.
+- When a transfer fails, its link is quarantined and the transfer is retried on the next best
+  link, so callers only see an error once every link failed.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, replace
+import threading
+import time
+import traceback
+from typing import Callable, Sequence, TypeVar
+
+from ttexalens import util
+from ttexalens.exceptions import TTException
+
+T = TypeVar("T")
+EthLink = tuple[int, int]  # ETH core on the MMIO chip, in translated coordinates
+
+# Transfers smaller than this are dominated by the round trip, so they are measured as this many bytes.
+_MIN_COST_BYTES = 64
+# Time per byte of a link before any link was measured. Only the ratio between links matters.
+_DEFAULT_NS_PER_BYTE = 1.0
+# Another link has to be this much faster before transfers move off the selected link.
+_SWITCH_MARGIN = 0.2
+
+
+@dataclass
+class EthLinkStats:
+    link: EthLink
+    transfers: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    bytes_transferred: int = 0
+    ns_per_byte: float | None = None  # moving average; None until the first successful transfer
+    quarantined_until: float = 0.0  # time.monotonic() until which the link is not used
+    last_error: str | None = None
+
+    def is_healthy(self, now: float | None = None) -> bool:
+        return (time.monotonic() if now is None else now) >= self.quarantined_until
+
+
+class EthLinkRouter:
+    """Selects the ETH link for every transfer to a remote chip and fails over between links."""
+
+    def __init__(
+        self,
+        links: Sequence[EthLink],
+        select_link: Callable[[EthLink], None],
+        quarantine_time: float = 1.0,
+        max_quarantine_time: float = 60.0,
+        smoothing: float = 0.2,
+        passthrough_errors: tuple[type[BaseException], ...] = (),
+    ):
+        """
+        Args:
+            links: Usable ETH cores, in order of preference when their statistics are equal.
+            select_link: Makes the device send the following transfers over the given link.
+            quarantine_time: Seconds a link is not used after its first failure.
+            max_quarantine_time: Upper limit of the quarantine after consecutive failures.
+            smoothing: Weight of the newest sample in the moving average of the time per byte.
+            passthrough_errors: Errors that are not caused by the link (e.g. a hung target core). They are raised without failover.
+        """
+        if len(links) == 0:
+            raise TTException("ETH link router needs at least one link.")
+        self.quarantine_time = quarantine_time
+        self.max_quarantine_time = max_quarantine_time
+        self.smoothing = smoothing
+        self._select_link = select_link
+        self._passthrough_errors = passthrough_errors
+        self._stats = {link: EthLinkStats(link) for link in links}
+        self._stats_lock = threading.Lock()
+        self._transfer_lock = threading.RLock()
+        self._selected_link: EthLink | None = None
+
+    @property
+    def links(self) -> list[EthLink]:
+        return list(self._stats)
+
+    @property
+    def selected_link(self) -> EthLink | None:
+        return self._selected_link
+
+    def stats(self) -> list[EthLinkStats]:
+        """Returns a snapshot of the statistics of every link."""
+        with self._stats_lock:
+            return [replace(stats) for stats in self._stats.values()]
+
+    def invalidate_selection(self) -> None:
+        """Forgets the selected link, e.g. after the device was reinitialized. The next transfer selects it again."""
+        with self._transfer_lock:
+            self._selected_link = None
+
+    def probe(self, operation: Callable[[], object]) -> bool:
+        """
+        Runs ``operation`` on the links in order of preference until it succeeds, so that the first transfer
+        does not wait for dead links. Returns False if no link works.
+        """
+        for link in self.links:
+            try:
+                self._run_on(link, operation, 0)
+                return True
+            except self._passthrough_errors:
+                raise
+            except Exception as error:
+                self._record_failure(link, error)
+        return False
+
+    def run(self, operation: Callable[[], T], size: int = 0) -> T:
+        """Runs ``operation``, which transfers ``size`` bytes, on the best link and fails over to the others."""
+        tried: set[EthLink] = set()
+        link = self._pick(tried)
+        assert link is not None
+        while True:
+            try:
+                return self._run_on(link, operation, size)
+            except self._passthrough_errors:
+                raise
+            except Exception as error:
+                self._record_failure(link, error)
+                tried.add(link)
+                next_link = self._pick(tried)
+                if next_link is None:
+                    raise
+                if util.DEBUG_ENABLED:
+                    util.DEBUG(
+                        f"Transfer over ETH link {link} failed, retrying over {next_link}:\n{traceback.format_exc()}"
+                    )
+                link = next_link
+
+    def _pick(self, exclude: set[EthLink]) -> EthLink | None:
+        with self._stats_lock:
+            now = time.monotonic()
+            remaining = [stats for stats in self._stats.values() if stats.link not in exclude]
+            if not remaining:
+                return None
+            healthy = [stats for stats in remaining if stats.is_healthy(now)]
+            if not healthy:
+                # Every link is quarantined: try the one that recovers first instead of failing without trying.
+                return min(remaining, key=lambda stats: stats.quarantined_until).link
+            # Ties go to the order of preference.
+            return min(healthy, key=self._switch_cost).link
+
+    def _switch_cost(self, stats: EthLinkStats) -> float:
+        estimate = self._estimate_ns_per_byte(stats)
+        if stats.link == self._selected_link:
+            estimate *= 1 - _SWITCH_MARGIN
+        return estimate
+
+    def _estimate_ns_per_byte(self, stats: EthLinkStats) -> float:
+        if stats.ns_per_byte is not None:
+            return stats.ns_per_byte
+        # Links that were not measured yet are assumed to be as fast as the measured ones on average.
+        measured = [other.ns_per_byte for other in self._stats.values() if other.ns_per_byte is not None]
+        return sum(measured) / len(measured) if measured else _DEFAULT_NS_PER_BYTE
+
+    def _run_on(self, link: EthLink, operation: Callable[[], T], size: int) -> T:
+        with self._transfer_lock:
+            if link != self._selected_link:
+                self._selected_link = None
+                self._select_link(link)
+                self._selected_link = link
+            start = time.perf_counter_ns()
+            result = operation()
+            elapsed = time.perf_counter_ns() - start
+        self._record_success(link, size, elapsed)
+        return result
+
+    def _record_success(self, link: EthLink, size: int, elapsed_ns: int) -> None:
+        sample = elapsed_ns / max(size, _MIN_COST_BYTES)
+        with self._stats_lock:
+            stats = self._stats[link]
+            stats.transfers += 1
+            stats.bytes_transferred += size
+            stats.consecutive_failures = 0
+            stats.quarantined_until = 0.0
+            if stats.ns_per_byte is None:
+                stats.ns_per_byte = sample
+            else:
+                stats.ns_per_byte += self.smoothing * (sample - stats.ns_per_byte)
+
+    def _record_failure(self, link: EthLink, error: Exception) -> None:
+        with self._stats_lock:
+            stats = self._stats[link]
+            stats.failures += 1
+            stats.consecutive_failures += 1
+            stats.last_error = str(error)
+            quarantine = min(self.quarantine_time * 2 ** (stats.consecutive_failures - 1), self.max_quarantine_time)
+            stats.quarantined_until = time.monotonic() + quarantine
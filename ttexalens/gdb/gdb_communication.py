@@ -1,7 +1,9 @@
 # SPDX-FileCopyrightText: © 2024 Tenstorrent AI ULC
 
 # SPDX-License-Identifier: Apache-2.0
+import binascii
 from contextlib import closing
+import re
 import select
 import socket
 import threading
@@ -31,11 +33,16 @@ def find_available_port() -> int:
         raise Exception(f"No available port found: {e}")
 
 
+# Maximum packet size advertised to GDB. Memory transfers are split by GDB into packets of this size,
+# so a large value avoids round trips when loading or dumping big buffers.
+GDB_PACKET_SIZE = 0x10000
+
+
 # Simple class that wraps reading/writing to a socket
 class ClientSocket:
     def __init__(self, socket: socket.socket | None = None, packet_size: int | None = None):
         self.socket = socket
-        self.packet_size = packet_size if packet_size is not None else 2048
+        self.packet_size = packet_size if packet_size is not None else GDB_PACKET_SIZE
 
     def __del__(self):
         self.close()
@@ -73,7 +80,7 @@ class ClientSocket:
 
     def write(self, data: bytes | bytearray):
         assert self.socket is not None
-        self.socket.send(data)
+        self.socket.sendall(data)
 
 
 # Simple class that wraps listening and accepting connections
@@ -126,105 +133,115 @@ GDB_ASCII_SEMICOLON = ord(";")
 GDB_ASCII_COLON = ord(":")
 GDB_ASCII_COMMA = ord(",")
 
+GDB_ESCAPE_XOR = 0x20
+
+# Characters that must be escaped in packet data: '#', '$', '*' and '}'
+_GDB_ESCAPE_PATTERN = re.compile(rb"[#$*}]")
+_GDB_HEX_PATTERN = re.compile(rb"[0-9a-fA-F]+")
+
+
+def _escape_match(match: re.Match[bytes]) -> bytes:
+    return bytes((GDB_ASCII_ESCAPE_CHAR, match[0][0] ^ GDB_ESCAPE_XOR))
+
+
+def gdb_escape(data: bytes | bytearray | memoryview) -> bytes:
+    """Escapes packet data. Data without special characters is returned unchanged."""
+    return _GDB_ESCAPE_PATTERN.sub(_escape_match, data)
+
+
+def gdb_unescape(data: bytes) -> bytes:
+    """Reverses gdb_escape: every '}' is dropped and the following byte is xored with 0x20."""
+    position = data.find(GDB_ASCII_ESCAPE_CHAR)
+    if position < 0:
+        return data
+    result = bytearray()
+    start = 0
+    while position >= 0 and position + 1 < len(data):
+        result += data[start:position]
+        result.append(data[position + 1] ^ GDB_ESCAPE_XOR)
+        start = position + 2
+        position = data.find(GDB_ASCII_ESCAPE_CHAR, start)
+    result += data[start:]
+    return bytes(result)
+
+
 # This class is used to read messages from GDB
 class GdbInputStream:
     def __init__(self, socket: ClientSocket, error_stream: IO[str] | None = None):
         self.socket = socket
         self.input_buffer = bytes()
-        self.next_message = bytearray()
         self.error_stream = error_stream
 
     def ensure_input_buffer(self, position: int = 0):
-        # Check if input buffer is empty
-        if position < len(self.input_buffer):
-            return True
-        self.input_buffer = self.socket.read()
-
-        # Check if there is data to read
-        return len(self.input_buffer) > 0
+        # Reads from socket until input buffer contains byte at position
+        while position >= len(self.input_buffer):
+            data = self.socket.read()
+            if len(data) == 0:
+                return False
+            self.input_buffer += data
+        return True
 
     def read(self):
-        # Check if input buffer is empty
-        if not self.ensure_input_buffer():
-            return None
-
-        # Check if it is ack ok
-        if self.input_buffer[0] == GDB_ASCII_PLUS:
-            self.input_buffer = self.input_buffer[1:]
-            return GdbMessageParser(b"+")
-
-        # Check if it is ack error
-        if self.input_buffer[0] == GDB_ASCII_MINUS:
-            self.input_buffer = self.input_buffer[1:]
-            return GdbMessageParser(b"-")
-
-        # Check if it is message start
-        if self.input_buffer[0] != GDB_ASCII_DOLLAR:
-            # Respond with ack error, discard input buffer and try to read next message
-            util.ERROR(
-                f"GDB message parsing error: Unexpected character at start of message '{self.input_buffer[0:1].decode()}'",
-                file=self.error_stream,
-            )
-            self.socket.write(b"-")
-            self.input_buffer = bytes()
-            return self.read()
-
-        # Parse message
-        self.next_message.clear()
-        position = 1
-        checksum = 0
-        should_escape = False
-
-        # Find message end
         while True:
             # Check if input buffer is empty
-            if not self.ensure_input_buffer(position):
+            if not self.ensure_input_buffer():
                 return None
 
-            # Check if we need to unescape character
-            next_char = self.input_buffer[position]
-            if should_escape:
-                should_escape = False
-                self.next_message.append(next_char ^ 0x20)
-            elif next_char == GDB_ASCII_ESCAPE_CHAR:
-                should_escape = True
-            elif next_char == GDB_ASCII_STAR:
-                raise Exception("GDB message parsing error: RLE is not supported")
-            elif next_char == GDB_ASCII_HASH:
-                position += 1
-                break
-            else:
-                self.next_message.append(next_char)
-            checksum += next_char
-            position += 1
-
-        # Verify checksum
-        checksum = checksum % 256
-        checksum1 = checksum // 16
-        checksum2 = checksum % 16
+            # Check if it is ack ok
+            if self.input_buffer[0] == GDB_ASCII_PLUS:
+                self.input_buffer = self.input_buffer[1:]
+                return GdbMessageParser(b"+")
+
+            # Check if it is ack error
+            if self.input_buffer[0] == GDB_ASCII_MINUS:
+                self.input_buffer = self.input_buffer[1:]
+                return GdbMessageParser(b"-")
+
+            # Check if it is message start
+            if self.input_buffer[0] != GDB_ASCII_DOLLAR:
+                # Respond with ack error, discard input buffer and try to read next message
+                util.ERROR(
+                    f"GDB message parsing error: Unexpected character at start of message '{self.input_buffer[0:1].decode()}'",
+                    file=self.error_stream,
+                )
+                self.socket.write(b"-")
+                self.input_buffer = bytes()
+                continue
+
+            # Find message end. '#' never appears escaped, so the first one ends the message.
+            end = self.input_buffer.find(GDB_ASCII_HASH, 1)
+            while end < 0:
+                searched = len(self.input_buffer)
+                if not self.ensure_input_buffer(searched):
+                    return None
+                end = self.input_buffer.find(GDB_ASCII_HASH, searched)
+
+            # Message end is followed by two checksum digits
+            if not self.ensure_input_buffer(end + 2):
+                return None
+            data = self.input_buffer[1:end]
+            received_checksum = self.input_buffer[end + 1 : end + 3]
 
-        # Check if input buffer is empty
-        if not self.ensure_input_buffer(position):
-            return None
-        correct_checksum = checksum1 != self.input_buffer[position]
-        position += 1
-        if not self.ensure_input_buffer(position):
-            return None
-        correct_checksum = correct_checksum and checksum2 != self.input_buffer[position]
-        position += 1
+            # Trim current message from input buffer
+            self.input_buffer = self.input_buffer[end + 3 :]
 
-        # Trim current message from input buffer
-        self.input_buffer = self.input_buffer[position:]
+            if GDB_ASCII_STAR in data:
+                raise Exception("GDB message parsing error: RLE is not supported")
 
-        # Was checksum correct
-        if not correct_checksum:
-            util.ERROR(
-                f"GDB message parsing error: Unexpected checksum. expected: '{checksum1:X}{checksum2:X}'",
-                file=self.error_stream,
-            )
-            self.socket.write(b"-")
-            return self.read()
-        return GdbMessageParser(bytes(self.next_message))
+            # Verify checksum
+            checksum = sum(data) % 256
+            try:
+                correct_checksum = int(received_checksum, 16) == checksum
+            except ValueError:
+                correct_checksum = False
+            if not correct_checksum:
+                util.ERROR(
+                    f"GDB message parsing error: Unexpected checksum. expected: '{checksum:02X}'",
+                    file=self.error_stream,
+                )
+                self.socket.write(b"-")
+                continue
+            return GdbMessageParser(gdb_unescape(data))
 
 
 class GdbMessageParser:
@@ -242,32 +259,18 @@ class GdbMessageParser:
 
     # Verifies next characters in the message and advances position if they match
     def parse(self, value: bytes):
-        length = len(value)
-        if self.position + length > len(self.data):
+        if not self.data.startswith(value, self.position):
             return False
-        value_position = 0
-        data_position = self.position
-        while value_position < length:
-            if self.data[data_position] != value[value_position]:
-                return False
-            data_position += 1
-            value_position += 1
-        self.position = data_position
+        self.position += len(value)
         return True
 
     # Reads hex characters from the message and return them as a number
     def parse_hex(self):
-        number = None
-        while self.position < len(self.data):
-            char = self.data[self.position]
-            if not GdbMessageParser.is_hex_digit(char):
-                break
-            if number is None:
-                number = 0
-            value = char - 87 if char >= 97 else char - 55 if char >= 65 else char - 48
-            number = number * 16 + value
-            self.position += 1
-        return number
+        match = _GDB_HEX_PATTERN.match(self.data, self.position)
+        if match is None:
+            return None
+        self.position = match.end()
+        return int(match[0], 16)
 
     def read_register_hex(self):
         number = 0
@@ -281,17 +284,13 @@ class GdbMessageParser:
         return number
 
     def read_hex(self, length: int):
-        number = 0
         if self.position + length >= len(self.data):
             return None
-        for _ in range(length):
-            char = self.data[self.position]
-            if not GdbMessageParser.is_hex_digit(char):
-                return None
-            value = char - 87 if char >= 97 else char - 55 if char >= 65 else char - 48
-            number = number * 16 + value
-            self.position += 1
-        return number
+        match = _GDB_HEX_PATTERN.match(self.data, self.position, self.position + length)
+        if match is None or match.end() != self.position + length:
+            return None
+        self.position += length
+        return int(match[0], 16)
 
     def parse_thread_id(self):
         # In addition, the remote protocol supports a multiprocess feature in which the thread-id syntax is extended to optionally include both process and thread ID fields, as ‘ppid.tid’.
@@ -323,13 +322,12 @@ class GdbMessageParser:
         if self.position >= len(self.data):
             return None
         start = self.position
-        while self.position < len(self.data):
-            if self.data[self.position] == char:
-                read = self.data[start : self.position]
-                self.position += 1
-                return read
-            self.position += 1
-        return self.data[start:]
+        end = self.data.find(char, start)
+        if end < 0:
+            self.position = len(self.data)
+            return self.data[start:]
+        self.position = end + 1
+        return self.data[start:end]
 
     def read_rest(self):
         if self.position >= len(self.data):
@@ -363,42 +361,30 @@ class GdbMessageWriter:
         self.data.append(GDB_ASCII_DOLLAR)
 
     def append_char(self, char: int):
-        # Append escaped char
-        if (
-            char == GDB_ASCII_DOLLAR
-            or char == GDB_ASCII_HASH
-            or char == GDB_ASCII_STAR
-            or char == GDB_ASCII_ESCAPE_CHAR
-        ):
-            char = char ^ 0x20
-            self.data.append(GDB_ASCII_ESCAPE_CHAR)
-            self.data.append(char)
-            self.checksum += GDB_ASCII_ESCAPE_CHAR + char
-        else:
-            self.data.append(char)
-            self.checksum += char
+        self.append(bytes((char,)))
 
     def append(self, data: bytes | bytearray | memoryview):
-        length = len(data)
-        position = 0
-        while position < length:
-            self.append_char(data[position])
-            position += 1
+        # Append escaped data
+        self.append_unescaped(gdb_escape(data))
 
     def append_unescaped(self, data: bytes | bytearray | memoryview):
         self.data.extend(data)
         self.checksum += sum(data)
 
     def append_register_hex(self, value: int):
-        self.append_hex(value % 256, 2)
-        self.append_hex(value // 256 % 256, 2)
-        self.append_hex(value // 256 // 256 % 256, 2)
-        self.append_hex(value // 256 // 256 // 256 % 256, 2)
+        # 32-bit register in target (little endian) byte order
+        self.append_bytes_as_hex((value & 0xFFFFFFFF).to_bytes(4, byteorder="little"))
 
     def append_hex(self, number: int, min_digits: int = 0):
-        if number >= 16 or min_digits > 1:
-            self.append_hex(number // 16, min_digits - 1)
-        self.append_hex_digit(number % 16)
+        if number < 0:
+            # Two's complement on min_digits digits
+            number &= (1 << (4 * max(min_digits, 1))) - 1
+        # Hex digits never need escaping
+        self.append_unescaped(format(number, "X").zfill(min_digits).encode())
+
+    def append_bytes_as_hex(self, data: bytes | bytearray | memoryview):
+        # Two hex digits per byte, in memory order
+        self.append_unescaped(binascii.hexlify(data).upper())
 
     def append_hex_digit(self, digit: int):
         if digit < 10:
@@ -412,9 +398,7 @@ class GdbMessageWriter:
         self.append(value.encode())
 
     def append_string_as_hex(self, value: str):
-        encoded = value.encode()
-        for char in encoded:
-            self.append_hex(char, 2)
+        self.append_bytes_as_hex(value.encode())
 
     def append_thread_id(self, thread_id: GdbThreadId):
         self.append(b"p")
@@ -4,7 +4,7 @@
 from dataclasses import dataclass, field
 from functools import cached_property
 from ttexalens.hardware.risc_debug import RiscDebug
-from ttexalens.memory_access import MemoryAccess, create_memory_access
+from ttexalens.memory_access import MemoryAccess, RiscDebugMemoryAccess, create_l1_memory_access
 
 
 @dataclass
@@ -23,15 +23,28 @@ class GdbProcess:
     risc_debug: RiscDebug
     virtual_core_id: int
     core_type: str
-    mem_access: MemoryAccess = field(init=False)
+    mem_access: RiscDebugMemoryAccess = field(init=False)
 
     def __post_init__(self):
-        self.mem_access = create_memory_access(self.risc_debug)
+        self.mem_access = RiscDebugMemoryAccess(self.risc_debug)
 
     @cached_property
     def thread_id(self):
         return GdbThreadId(self.process_id, self.virtual_core_id)
 
+    @cached_property
+    def l1_mem_access(self) -> MemoryAccess:
+        return create_l1_memory_access(self.risc_debug.risc_location.location)
+
+    def read_memory(self, address: int, buffer: bytearray | memoryview) -> None:
+        # Ranges inside L1 are read over NOC in a single transfer instead of word by word through the debug hardware
+        l1 = self.risc_debug.get_l1()
+        end = address + len(buffer) - 1
+        if len(buffer) > 0 and l1.contains_private_address(address) and l1.contains_private_address(end):
+            self.l1_mem_access.read(address, buffer)
+        else:
+            self.mem_access.read(address, buffer)
+
     def __eq__(self, other):
         if not isinstance(other, GdbProcess):
             return NotImplemented
@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: © 2024 Tenstorrent AI ULC
 
 # SPDX-License-Identifier: Apache-2.0
+import binascii
 from io import StringIO
 import threading
 import traceback
@@ -409,7 +410,7 @@ class GdbServer(threading.Thread):
                 # Read memory bytes
                 try:
                     buffer = bytearray(length)
-                    self.current_process.mem_access.read(address, buffer)
+                    self.current_process.read_memory(address, buffer)
                     writer.append_hex(int.from_bytes(buffer, byteorder="little"), 2 * length)
                 except RestrictedMemoryAccessError as e:
                     util.ERROR(str(e), file=self.error_stream)
@@ -429,22 +430,15 @@ class GdbServer(threading.Thread):
                 writer.append(b"E02")
             else:
                 # Parse all the hex data into bytes
-                # data is already bytes from read_rest(), convert hex string to bytes
-                parsed_data = bytearray()
-                for i in range(0, len(data), 2):
-                    if i + 1 >= len(data):
-                        writer.append(b"E03")
-                        return True
-                    try:
-                        byte_val = int(data[i : i + 2], 16)
-                        parsed_data.append(byte_val)
-                    except ValueError:
-                        writer.append(b"E03")
-                        return True
+                try:
+                    parsed_data = binascii.unhexlify(data)
+                except (binascii.Error, ValueError):
+                    writer.append(b"E03")
+                    return True
 
                 # Write memory bytes
                 try:
-                    self.current_process.mem_access.write(address, bytes(parsed_data))
+                    self.current_process.mem_access.write(address, parsed_data)
                     writer.append(b"OK")
                 except RestrictedMemoryAccessError as e:
                     util.ERROR(str(e), file=self.error_stream)
@@ -497,7 +491,7 @@ class GdbServer(threading.Thread):
             writer.append(b"PacketSize=")
             writer.append_hex(writer.socket.packet_size)
             writer.append(
-                b";multiprocess+;swbreak+;QStartNoAckMode+;qXfer:osdata:read+;qXfer:exec-file:read+;qXfer:features:read+"
+                b";multiprocess+;swbreak+;QStartNoAckMode+;qXfer:osdata:read+;qXfer:exec-file:read+;qXfer:features:read+;qXfer:memory-map:read+"
             )
         elif parser.parse(b"qTStatus"):  # Ask the stub if there is a trace experiment running right now.
             # Since we don't support trace experiments, we should return empty packet
@@ -568,6 +562,15 @@ class GdbServer(threading.Thread):
             elif object == "features" and operation == b"read" and annex == "target.xml":
                 self.prepared_responses_for_paging[paging_key] = self.create_features_target_response()
                 self.write_paged_message(self.prepared_responses_for_paging[paging_key], offset, length, writer)
+            elif object == "memory-map" and operation == b"read":
+                # Memory map of the core we are currently debugging
+                if self.current_process is None:
+                    writer.append(b"E01")
+                else:
+                    self.prepared_responses_for_paging[paging_key] = self.create_memory_map_response(
+                        self.current_process
+                    )
+                    self.write_paged_message(self.prepared_responses_for_paging[paging_key], offset, length, writer)
             elif object == "exec-file" and operation == b"read":
                 # Return path to elf file used to run on selected core. Annex represent process id (without p)
                 pid = int(annex, 16)
@@ -979,7 +982,7 @@ class GdbServer(threading.Thread):
                 # Read memory bytes
                 try:
                     buffer = bytearray(length)
-                    self.current_process.mem_access.read(address, buffer)
+                    self.current_process.read_memory(address, buffer)
                     writer.append(b"b")
                     writer.append(buffer)  # Reply with data should start with 'b'
                 except RestrictedMemoryAccessError as e:
@@ -995,7 +998,10 @@ class GdbServer(threading.Thread):
                 data = parser.read_rest()
 
                 # Check if we are debugging something
-                if data is None or length is None or address is None or len(data) != length or length <= 0:
+                if length == 0 and address is not None:
+                    # Zero length write is used by GDB to probe support for binary downloads
+                    writer.append(b"OK")
+                elif data is None or length is None or address is None or len(data) != length or length < 0:
                     # Return error if we didn't get all data
                     writer.append(b"E01")
                 elif self.current_process is None:
@@ -1230,6 +1236,25 @@ class GdbServer(threading.Thread):
             writer.append(b"m")
             writer.append_string(message[offset : offset + length])
 
+    def create_memory_map_response(self, process: GdbProcess):
+        # Regions that the core can access are reported as RAM. Blocks that are unsafe to read, currently
+        # inaccessible or rejected by the core's memory access are left out, so GDB treats them as unmapped.
+        regions = []
+        for interval in process.risc_debug.risc_info.memory_map.private_address_intervals():
+            size = interval.end - interval.start
+            block_info = interval.block
+            if not block_info.is_safe_to_read(interval.start, size) or not block_info.is_accessible:
+                continue
+            if not process.mem_access.is_access_allowed(interval.start, size):
+                continue
+            regions.append(f'    <memory type="ram" start="0x{interval.start:x}" length="0x{size:x}"/>')
+        return (
+            '<?xml version="1.0"?>\n'
+            '<!DOCTYPE memory-map PUBLIC "+//IDN gnu.org//DTD GDB Memory Map V1.0//EN" '
+            '"http://sourceware.org/gdb/gdb-memory-map.dtd">\n'
+            "<memory-map>\n" + "".join(region + "\n" for region in regions) + "</memory-map>\n"
+        )
+
     def create_osdata_types_response(self):
         # Currently we only support processes
         return GdbServer.serialize_to_xml(
@@ -0,0 +1,360 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""Grid-wide hang detection from non-intrusive progress indicators.
+
+A ``HangDetector`` periodically samples, for every RISC of a set of cores, the reset and debug
+status (``RiscDebug.read_status``) and the PC from the debug bus, and for every core the NIU
+transaction counters. None of these reads halts a core, so the detector can stay attached to a
+running job. Over a sliding window of samples every RISC is classified as:
+
+- ``progressing``: the PC moves through more than a small address range,
+- ``blocked_on_noc``: the PC stays in a small loop while NOC requests of the core are
+  outstanding and no responses arrive,
+- ``spinning``: the PC stays in a small loop and the core's NOC is idle (typically polling a
+  semaphore or a circular buffer that another core should update),
+- ``halted`` / ``in_reset``, or ``unknown`` until the window has enough samples.
+
+NIU counters belong to the core, not to one of its RISCs, so a RISC is never classified as
+progressing only because its core moves data: with a BRISC streaming tiles, a TRISC that loops
+would otherwise hide behind it. The counters only tell ``blocked_on_noc`` from ``spinning``, and
+they are the sole progress indicator of RISCs that have no PC on the debug bus. Such RISCs are
+``progressing`` while any RISC of their core moves data, and ``unknown`` otherwise.
+
+The NOC budget is bounded: reads are issued one at a time from a single thread, and after a
+sweep the detector waits long enough that sampling occupies at most ``max_duty_cycle`` of the
+wall-clock time, however many cores are monitored.
+"""
+
+from __future__ import annotations
+from collections import Counter, deque
+from dataclasses import dataclass
+from enum import Enum
+import threading
+import time
+from typing import Iterable
+
+from tabulate import tabulate
+
+from ttexalens import _lib_helpers
+from ttexalens.background_poller import BackgroundPoller
+from ttexalens.context import Context, NocId
+from ttexalens.coordinate import OnChipCoordinate
+from ttexalens.debug_bus_signal_store import DebugBusSignalStore
+from ttexalens.exceptions import HardwareError, TTException
+from ttexalens.hardware.risc_debug import RiscDebug
+from ttexalens.noc_snapshot import capture_noc_registers
+
+__all__ = [
+    "CoreProgress",
+    "CoreState",
+    "HangDetector",
+    "HangReport",
+    "start_hang_detector",
+]
+
+_COUNTER_MASK = 0xFFFFFFFF
+
+# (requests sent, responses received) pairs of NIU master counters. A difference means requests are outstanding.
+_OUTSTANDING_COUNTERS = [
+    ("NIU_MST_RD_REQ_SENT", "NIU_MST_RD_RESP_RECEIVED"),
+    ("NIU_MST_NONPOSTED_WR_REQ_SENT", "NIU_MST_WR_ACK_RECEIVED"),
+]
+_PROGRESS_COUNTERS = [
+    "NIU_MST_RD_REQ_SENT",
+    "NIU_MST_RD_RESP_RECEIVED",
+    "NIU_MST_NONPOSTED_WR_REQ_SENT",
+    "NIU_MST_POSTED_WR_REQ_SENT",
+    "NIU_MST_WR_ACK_RECEIVED",
+]
+_NIU_COUNTERS = list(dict.fromkeys(_PROGRESS_COUNTERS + [name for pair in _OUTSTANDING_COUNTERS for name in pair]))
+
+
+class CoreState(Enum):
+    PROGRESSING = "progressing"
+    SPINNING = "spinning"
+    BLOCKED_ON_NOC = "blocked_on_noc"
+    HALTED = "halted"
+    IN_RESET = "in_reset"
+    UNKNOWN = "unknown"
+
+
+# Order in which suspects of a hang are reported.
+_SUSPICION = [CoreState.BLOCKED_ON_NOC, CoreState.SPINNING, CoreState.HALTED]
+
+
+@dataclass(frozen=True)
+class _RiscSample:
+    in_reset: bool
+    halted: bool
+    pc: int | None
+
+
+@dataclass(frozen=True)
+class CoreProgress:
+    location: OnChipCoordinate
+    risc_name: str
+    state: CoreState
+    pc: int | None  # last sampled PC
+    pc_span: int | None  # max - min PC over the window
+    outstanding_noc_requests: int  # NOC requests of the core without a response, over all NOCs
+    samples: int
+
+
+@dataclass
+class HangReport:
+    cores: list[CoreProgress]
+    sweep_count: int
+    window: int
+
+    def counts(self) -> dict[CoreState, int]:
+        counter = Counter(core.state for core in self.cores)
+        return {state: counter[state] for state in CoreState if counter[state] > 0}
+
+    def suspects(self) -> list[CoreProgress]:
+        """Cores that are not progressing, most suspicious first: blocked on NOC, spinning, halted."""
+        rank = {state: index for index, state in enumerate(_SUSPICION)}
+        suspects = [core for core in self.cores if core.state in rank]
+        return sorted(suspects, key=lambda core: (rank[core.state], -core.outstanding_noc_requests))
+
+    @property
+    def is_hung(self) -> bool:
+        """True if some RISC runs and every RISC has been classified, but none of them is progressing."""
+        states = set(self.counts())
+        return not states & {CoreState.PROGRESSING, CoreState.UNKNOWN} and states != {CoreState.IN_RESET}
+
+    def summary(self) -> str:
+        counts = ", ".join(f"{state.value}: {count}" for state, count in self.counts().items())
+        return f"{len(self.cores)} RISCs after {self.sweep_count} sweeps (window {self.window}) - {counts}"
+
+    def table(self, suspects_only: bool = True, limit: int | None = None) -> str:
+        cores = self.suspects() if suspects_only else self.cores
+        rows = [
+            [
+                core.location.device_id,
+                core.location.to_user_str(),
+                core.risc_name,
+                core.state.value,
+                f"0x{core.pc:08x}" if core.pc is not None else "-",
+                core.pc_span if core.pc_span is not None else "-",
+                core.outstanding_noc_requests,
+            ]
+            for core in cores[:limit]
+        ]
+        return tabulate(
+            rows,
+            headers=["Device", "Location", "RISC", "State", "PC", "PC span", "Outstanding NOC"],
+            disable_numparse=True,
+        )
+
+
+class HangDetector(BackgroundPoller):
+    """Samples progress indicators of RISC cores on a background thread and classifies them.
+
+    Args:
+        locations (Iterable[OnChipCoordinate]): Cores to monitor.
+        risc_names (Iterable[str], optional): RISC cores to monitor on every location. If None, all RISCs are monitored.
+        window (int, default 8): Number of recent sweeps a RISC is classified over.
+        interval (float, default 0.5): Minimum time between two sweeps in seconds.
+        max_duty_cycle (float, default 0.05): Largest fraction of time spent reading from the devices.
+        spin_span (int, default 64): PC range in bytes within which a RISC is considered to be looping.
+    """
+
+    def __init__(
+        self,
+        locations: Iterable[OnChipCoordinate],
+        risc_names: Iterable[str] | None = None,
+        window: int = 8,
+        interval: float = 0.5,
+        max_duty_cycle: float = 0.05,
+        spin_span: int = 64,
+    ):
+        if window < 2:
+            raise TTException(f"Window must have at least 2 sweeps, got {window}.")
+        if interval < 0:
+            raise TTException(f"Sampling interval must not be negative, got {interval}.")
+        if not 0 < max_duty_cycle <= 1:
+            raise TTException(f"Duty cycle must be in (0, 1], got {max_duty_cycle}.")
+        super().__init__("Hang detector", interval)
+        self._window = window
+        self._max_duty_cycle = max_duty_cycle
+        self._spin_span = spin_span
+        requested_riscs = [risc_name.lower() for risc_name in risc_names] if risc_names is not None else None
+
+        # (location, [(risc_debug, debug bus, pc signal name)])
+        self._targets: list[tuple[OnChipCoordinate, list[tuple[RiscDebug, DebugBusSignalStore | None, str]]]] = []
+        for location in locations:
+            riscs = []
+            for risc_debug in location.noc_block.all_riscs:
+                risc_name = risc_debug.risc_location.risc_name.lower()
+                if requested_riscs is not None and risc_name not in requested_riscs:
+                    continue
+                debug_bus = location.noc_block.get_debug_bus(risc_debug.risc_location.neo_id)
+                signal_name = f"{risc_name}_pc"
+                if debug_bus is not None and signal_name not in debug_bus.signal_names:
+                    debug_bus = None
+                riscs.append((risc_debug, debug_bus, signal_name))
+            if riscs:
+                self._targets.append((location, riscs))
+        if not self._targets:
+            raise TTException("No RISC cores to monitor.")
+        self._locations = [location for location, _ in self._targets]
+        # NIU counters are captured per device, on the NOCs the device has.
+        self._noc_groups: dict[int, tuple[list[OnChipCoordinate], list[NocId]]] = {}
+        for location in self._locations:
+            noc_ids = [noc_id for noc_id in (NocId.NOC0, NocId.NOC1) if noc_id in location.device.available_nocs]
+            self._noc_groups.setdefault(location.device_id, ([], noc_ids))[0].append(location)
+
+        self._lock = threading.Lock()
+        self._risc_samples: dict[tuple[OnChipCoordinate, str], deque[_RiscSample]] = {
+            (location, risc_debug.risc_location.risc_name.lower()): deque(maxlen=window)
+            for location, riscs in self._targets
+            for risc_debug, _, _ in riscs
+        }
+        self._noc_samples: dict[OnChipCoordinate, deque[dict[NocId, dict[str, int]]]] = {
+            location: deque(maxlen=window) for location in self._locations
+        }
+        self._busy_time = 0.0
+
+    @property
+    def busy_time(self) -> float:
+        """Total time in seconds spent reading from the devices."""
+        return self._busy_time
+
+    def _sample_risc(
+        self, location: OnChipCoordinate, risc_debug: RiscDebug, debug_bus: DebugBusSignalStore | None, signal_name: str
+    ) -> _RiscSample | None:
+        try:
+            if risc_debug.is_in_reset():
+                return _RiscSample(True, False, None)
+            halted = risc_debug.can_debug() and risc_debug.read_status().is_halted
+            pc = debug_bus.read_signal(signal_name) if debug_bus is not None and not halted else None
+            return _RiscSample(False, halted, pc)
+        except HardwareError:
+            raise
+        except Exception:
+            risc_name = risc_debug.risc_location.risc_name
+            self._report_failed_read(
+                (location, risc_name), f"Failed to sample {risc_name} on {location.to_user_str()}."
+            )
+            return None
+
+    def sample_once(self) -> None:
+        """Samples every monitored RISC and the NOC counters of every monitored core once."""
+        start = time.monotonic()
+        risc_samples: list[tuple[tuple[OnChipCoordinate, str], _RiscSample]] = []
+        for location, riscs in self._targets:
+            for risc_debug, debug_bus, signal_name in riscs:
+                sample = self._sample_risc(location, risc_debug, debug_bus, signal_name)
+                if sample is not None:
+                    risc_samples.append(((location, risc_debug.risc_location.risc_name.lower()), sample))
+        noc_samples: dict[OnChipCoordinate, dict[NocId, dict[str, int]]] = {}
+        for locations, noc_ids in self._noc_groups.values():
+            snapshot = capture_noc_registers(locations, _NIU_COUNTERS, noc_ids, max_workers=1)
+            for location in locations:
+                noc_samples[location] = {noc_id: snapshot.values[(location, noc_id)] for noc_id in noc_ids}
+        with self._lock:
+            for key, sample in risc_samples:
+                self._risc_samples[key].append(sample)
+            for location, counters in noc_samples.items():
+                self._noc_samples[location].append(counters)
+            self._sweep_count += 1
+            self._busy_time += time.monotonic() - start
+
+    def _sweep(self) -> None:
+        self.sample_once()
+
+    def _next_sweep_time(self, scheduled: float, sweep_start: float) -> float:
+        # A sweep that took `elapsed` seconds must be followed by enough idle time to stay within the duty cycle.
+        elapsed = time.monotonic() - sweep_start
+        return sweep_start + max(self._interval, elapsed / self._max_duty_cycle)
+
+    def _classify(
+        self, samples: list[_RiscSample], noc_samples: list[dict[NocId, dict[str, int]]]
+    ) -> tuple[CoreState, int | None]:
+        last = samples[-1]
+        if last.in_reset:
+            return CoreState.IN_RESET, None
+        if last.halted:
+            return CoreState.HALTED, None
+        if len(samples) < self._window or len(noc_samples) < 2:
+            return CoreState.UNKNOWN, None
+        if any(sample.in_reset or sample.halted for sample in samples):
+            # Started running within the window.
+            return CoreState.PROGRESSING, None
+
+        first_noc, last_noc = noc_samples[0], noc_samples[-1]
+        pcs = [sample.pc for sample in samples if sample.pc is not None]
+        if len(pcs) < len(samples):
+            # Without a PC for every sample only the NOC counters tell whether the core, not this RISC, does anything.
+            noc_progress = _counters_advanced(first_noc, last_noc, _PROGRESS_COUNTERS)
+            return (CoreState.PROGRESSING if noc_progress else CoreState.UNKNOWN), None
+        pc_span = max(pcs) - min(pcs)
+        if pc_span > self._spin_span:
+            return CoreState.PROGRESSING, pc_span
+        responses = [received for _, received in _OUTSTANDING_COUNTERS]
+        if all(_outstanding(sample) > 0 for sample in noc_samples) and not _counters_advanced(
+            first_noc, last_noc, responses
+        ):
+            return CoreState.BLOCKED_ON_NOC, pc_span
+        return CoreState.SPINNING, pc_span
+
+    def report(self) -> HangReport:
+        """Classifies every monitored RISC over the most recent ``window`` sweeps."""
+        with self._lock:
+            risc_samples = {key: list(samples) for key, samples in self._risc_samples.items()}
+            noc_samples = {location: list(samples) for location, samples in self._noc_samples.items()}
+            sweep_count = self._sweep_count
+        cores = []
+        for (location, risc_name), samples in risc_samples.items():
+            if not samples:
+                cores.append(CoreProgress(location, risc_name, CoreState.UNKNOWN, None, None, 0, 0))
+                continue
+            state, pc_span = self._classify(samples, noc_samples[location])
+            outstanding = _outstanding(noc_samples[location][-1]) if noc_samples[location] else 0
+            cores.append(CoreProgress(location, risc_name, state, samples[-1].pc, pc_span, outstanding, len(samples)))
+        return HangReport(cores, sweep_count, self._window)
+
+
+def _counters_advanced(first: dict[NocId, dict[str, int]], last: dict[NocId, dict[str, int]], names: list[str]) -> bool:
+    return any(last[noc_id][name] != first[noc_id][name] for noc_id in last for name in names)
+
+
+def _outstanding(counters: dict[NocId, dict[str, int]]) -> int:
+    """Number of NOC requests sent by the core without a response, over all NOCs."""
+    return sum(
+        (registers[sent] - registers[received]) & _COUNTER_MASK
+        for registers in counters.values()
+        for sent, received in _OUTSTANDING_COUNTERS
+    )
+
+
+@_lib_helpers.trace_api
+def start_hang_detector(
+    locations: list[str | OnChipCoordinate],
+    risc_names: list[str] | None = None,
+    window: int = 8,
+    interval: float = 0.5,
+    max_duty_cycle: float = 0.05,
+    device_id: int = 0,
+    context: Context | None = None,
+) -> HangDetector:
+    """
+    Starts monitoring RISC cores for hangs on a background thread, without halting them.
+    Call report() on the returned detector for the current classification, and stop() to end monitoring.
+
+    Args:
+        locations (list[str | OnChipCoordinate]): Cores to monitor, given as strings or OnChipCoordinate objects.
+        risc_names (list[str], optional): RISC cores to monitor (e.g. "brisc", "trisc0"). If None, all RISCs are monitored.
+        window (int, default 8): Number of recent sweeps a RISC is classified over.
+        interval (float, default 0.5): Minimum time between two sweeps in seconds.
+        max_duty_cycle (float, default 0.05): Largest fraction of time spent reading from the device.
+        device_id (int, default 0): ID of the device the locations refer to.
+        context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
+
+    Returns:
+        HangDetector: Running detector.
+    """
+    context = _lib_helpers.check_context(context)
+    coordinates = [_lib_helpers.convert_coordinate(location, device_id, context) for location in locations]
+    return HangDetector(coordinates, risc_names, window, interval, max_duty_cycle).start()
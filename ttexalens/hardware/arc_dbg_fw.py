@@ -3,17 +3,32 @@
 # SPDX-License-Identifier: Apache-2.0
 
 # This code is used to interact with the ARC debug firmware on the device.
+from __future__ import annotations
+from dataclasses import dataclass
 import os
+import struct
+import threading
 import time
+from typing import Generator
 from ttexalens.context import Context
 from ttexalens.exceptions import TTException
-from ttexalens.tt_exalens_lib import check_context
+from ttexalens.tt_exalens_lib import check_context, read_from_device
 
 
 def arc_dbg_fw_get_buffer_start_addr():
     return 32
 
 
+def arc_dbg_fw_get_buffer_size(tt_metal_arc_debug_buffer_size: int = 1024) -> int:
+    DRAM_REGION_SIZE_str = os.getenv("TT_METAL_ARC_DEBUG_BUFFER_SIZE")
+    if DRAM_REGION_SIZE_str is None:
+        return tt_metal_arc_debug_buffer_size
+    return int(DRAM_REGION_SIZE_str, 0)
+
+
+# The log buffer starts with a header of 8 words; the last one counts log calls made since logging was set up.
+# Log entries follow the header as a ring: entry N is written to slot N % capacity.
+LOG_HEADER_SIZE = 8 * 4
 NUM_LOG_CALLS_OFFSET = arc_dbg_fw_get_buffer_start_addr() + 7 * 4
 
 DFW_MSG_CLEAR_DRAM = 0x1  # Calls dfw_clear_dram(start_addr, size)
@@ -82,12 +97,7 @@ def arc_dbg_fw_command(
         raise TTException("ARC debug firmware is not running.")
 
     DRAM_REGION_START_ADDR = arc_dbg_fw_get_buffer_start_addr()
-
-    DRAM_REGION_SIZE_str = os.getenv("TT_METAL_ARC_DEBUG_BUFFER_SIZE")
-    if DRAM_REGION_SIZE_str is None:
-        DRAM_REGION_SIZE = tt_metal_arc_debug_buffer_size
-    else:
-        DRAM_REGION_SIZE = int(DRAM_REGION_SIZE_str, 0)
+    DRAM_REGION_SIZE = arc_dbg_fw_get_buffer_size(tt_metal_arc_debug_buffer_size)
 
     if command == "start":
         arc_dbg_fw_send_message(DFW_MSG_SETUP_LOGGING, DRAM_REGION_START_ADDR, DRAM_REGION_SIZE, device_id, context)
@@ -105,3 +115,111 @@ def setup_pmon(
         f"Setting up PMON {pmon_id}, RO {ro_id}, wait_for_l1_trigger: {wait_for_l1_trigger}, stop_on_flatline: {stop_on_flatline} => {arg0:08x}"
     )
     arc_dbg_fw_send_message(DFW_MSG_SETUP_PMON, arg0, 0, device_id, context)
+
+
+@dataclass(frozen=True)
+class ArcDbgFwLogEntry:
+    index: int  # value of the log call counter when the entry was written
+    timestamp: float  # time.time() when the entry was read
+    values: dict[str, int]
+
+
+class ArcDbgFwLogReader:
+    """Incremental reader of the ARC debug firmware DRAM log.
+
+    The reader remembers how many log calls it has consumed. Every poll reads the log call counter and then only
+    the slots written since the previous poll, with at most two bulk reads (one if the new entries do not wrap
+    around the end of the ring). Entries that the firmware overwrote before they were read are counted in
+    ``dropped_count`` instead of being returned. If the counter goes backwards (logging was set up again or the
+    buffer was cleared), reading restarts from the first entry.
+
+    Each entry is ``len(fields)`` little-endian words, decoded into a dict keyed by field name.
+    """
+
+    def __init__(
+        self,
+        fields: tuple[str, ...] = ("value",),
+        tt_metal_arc_debug_buffer_size: int = 1024,
+        location: str = "ch0",
+        device_id: int = 0,
+        context: Context | None = None,
+    ):
+        if len(fields) == 0:
+            raise TTException("Log entry must have at least one field.")
+        self.context = check_context(context)
+        self.fields = tuple(fields)
+        self.location = location
+        self.device_id = device_id
+        self.entry_size = 4 * len(self.fields)
+        self.entries_addr = arc_dbg_fw_get_buffer_start_addr() + LOG_HEADER_SIZE
+        self.capacity = (
+            arc_dbg_fw_get_buffer_size(tt_metal_arc_debug_buffer_size) - LOG_HEADER_SIZE
+        ) // self.entry_size
+        if self.capacity <= 0:
+            raise TTException("ARC debug firmware log buffer is too small to hold a single entry.")
+        self.consumed = 0
+        self.dropped_count = 0
+
+    def read_log_call_count(self) -> int:
+        data = read_from_device(self.location, NUM_LOG_CALLS_OFFSET, self.device_id, 4, self.context)
+        return int.from_bytes(data, "little")
+
+    def seek_to_end(self) -> None:
+        """Skips entries already in the log, so that the next poll returns only entries written from now on."""
+        self.consumed = self.read_log_call_count()
+
+    def _read_slots(self, first: int, count: int) -> bytes:
+        # Reads log entries [first, first + count) with one bulk read per contiguous run of slots.
+        data = bytearray()
+        while count > 0:
+            slot = first % self.capacity
+            run = min(count, self.capacity - slot)
+            data += read_from_device(
+                self.location,
+                self.entries_addr + slot * self.entry_size,
+                self.device_id,
+                run * self.entry_size,
+                self.context,
+            )
+            first += run
+            count -= run
+        return bytes(data)
+
+    def poll(self) -> list[ArcDbgFwLogEntry]:
+        """Returns entries written since the previous poll, oldest first."""
+        count = self.read_log_call_count()
+        if count < self.consumed:
+            self.consumed = 0
+        if count - self.consumed > self.capacity:
+            self.dropped_count += count - self.consumed - self.capacity
+            self.consumed = count - self.capacity
+        first = self.consumed
+        if count == first:
+            return []
+        data = self._read_slots(first, count - first)
+        timestamp = time.time()
+
+        # The firmware keeps writing while we read. Slots of entries older than (new count - capacity) may
+        # already hold newer entries, so those entries are dropped rather than returned torn.
+        count_after = self.read_log_call_count()
+        valid_from = max(first, count_after - self.capacity) if count_after >= count else first
+        if valid_from > first:
+            self.dropped_count += min(valid_from, count) - first
+        self.consumed = count
+
+        word_format = f"<{len(self.fields)}I"
+        entries = []
+        for index in range(valid_from, count):
+            offset = (index - first) * self.entry_size
+            words = struct.unpack_from(word_format, data, offset)
+            entries.append(ArcDbgFwLogEntry(index, timestamp, dict(zip(self.fields, words))))
+        return entries
+
+    def follow(
+        self, interval: float = 0.1, stop_event: threading.Event | None = None
+    ) -> Generator[ArcDbgFwLogEntry, None, None]:
+        """Yields entries as the firmware writes them, like ``tail -f``, until ``stop_event`` is set."""
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            yield from self.poll()
+            stop_event.wait(interval)
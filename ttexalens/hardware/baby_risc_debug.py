@@ -663,11 +663,19 @@ class BabyRiscDebug(RiscDebug):
         assert self.debug_hardware is not None, "Debug hardware is not initialized"
         return self.debug_hardware.step()
 
+    def prepare_cont(self):
+        """
+        Applies architecture-specific hardware workarounds that must precede a CONTINUE command.
+        Called by cont(), and by collective run control before it continues many RISCs at once.
+        """
+        pass
+
     def cont(self):
         if self.enable_asserts:
             self.assert_not_in_reset()
         self.assert_debug_hardware()
         assert self.debug_hardware is not None, "Debug hardware is not initialized"
+        self.prepare_cont()
         return self.debug_hardware.cont()
 
     @contextmanager
@@ -16,7 +16,7 @@ class BlackholeBabyRiscDebug(BabyRiscDebug):
         super().step()
         super().step()
 
-    def cont(self):
+    def prepare_cont(self):
         # There is a bug in hardware: resuming from an ebreak with a plain CONTINUE
         # re-asserts the ebreak. The fetch pipeline re-runs the window after the ebreak
         # (the NOPs emitted by -mtt-fix-whbhebreak) and the core re-halts at the end of
@@ -25,7 +25,6 @@ class BlackholeBabyRiscDebug(BabyRiscDebug):
         if self.is_halted() and self.is_ebreak_hit():
             assert self.debug_hardware is not None, "Debug hardware is not initialized"
             self.debug_hardware.flush(self.get_pc())
-        super().cont()
 
     def read_gpr(self, register_index: int) -> int:
         if register_index != 32:
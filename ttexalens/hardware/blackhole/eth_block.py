@@ -337,8 +337,7 @@ class BlackholeEthBlock(BlackholeNocBlock):
     def get_default_risc_debug(self) -> RiscDebug:
         return self.get_risc_debug(self.erisc0.risc_name, self.erisc0.neo_id)
 
-    @cache
-    def get_risc_debug(self, risc_name: str, neo_id: int | None = None) -> RiscDebug:
+    def _create_risc_debug(self, risc_name: str, neo_id: int | None = None) -> RiscDebug:
         assert neo_id is None, "NEO ID is not applicable for Blackhole device."
         risc_name = risc_name.lower()
         if risc_name == self.erisc0.risc_name:
@@ -219,8 +219,7 @@ class BlackholeFunctionalWorkerBlock(BlackholeNocBlock):
     def get_default_risc_debug(self) -> RiscDebug:
         return self.get_risc_debug(self.brisc.risc_name, self.brisc.neo_id)
 
-    @cache
-    def get_risc_debug(self, risc_name: str, neo_id: int | None = None) -> RiscDebug:
+    def _create_risc_debug(self, risc_name: str, neo_id: int | None = None) -> RiscDebug:
         assert neo_id is None, "NEO ID is not applicable for Blackhole device."
         risc_name = risc_name.lower()
         if risc_name == self.brisc.risc_name:
@@ -250,7 +249,8 @@ class BlackholeFunctionalWorkerBlock(BlackholeNocBlock):
                 MemoryMapBlockInfo("noc0_regs", self.noc0_regs),
                 MemoryMapBlockInfo("noc1_regs", self.noc1_regs),
                 MemoryMapBlockInfo("noc_overlay", self.noc_overlay),
-            ]
+            ],
+            access_table_cache_key=(BlackholeFunctionalWorkerBlock, "noc_memory_map"),
         )
 
         self.brisc.memory_map.initialize_blocks(
@@ -82,6 +82,13 @@ class NocBlock:
     def get_risc_debug(self, risc_name: str, neo_id: int | None = None) -> RiscDebug:
         """
         Returns a RiscDebug instance for the specified RISC core.
+        The instance is created by _create_risc_debug and handed to the context, which can replace it (e.g. core dump replay).
+        """
+        return self.device._context.create_risc_debug(self._create_risc_debug(risc_name, neo_id))
+
+    def _create_risc_debug(self, risc_name: str, neo_id: int | None = None) -> RiscDebug:
+        """
+        Creates the hardware RiscDebug instance for the specified RISC core.
         This method should be overridden in subclasses to provide a specific implementation.
         """
         raise NotImplementedError(f"Noc block on location {self.location.to_user_str()} doesn't have RISC cores.")
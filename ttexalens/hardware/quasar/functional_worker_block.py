@@ -2,7 +2,7 @@
 
 # SPDX-License-Identifier: Apache-2.0
 
-from functools import cache, cached_property
+from functools import cached_property
 from ttexalens.context import NocId
 from ttexalens.coordinate import OnChipCoordinate
 from ttexalens.debug_bus_signal_store import DebugBusSignalStore
@@ -59,7 +59,8 @@ class QuasarFunctionalWorkerBlock(QuasarNocBlock):
             + self.neo0.noc_memory_list
             + self.neo1.noc_memory_list
             + self.neo2.noc_memory_list
-            + self.neo3.noc_memory_list
+            + self.neo3.noc_memory_list,
+            access_table_cache_key=(QuasarFunctionalWorkerBlock, "noc_memory_map"),
         )
 
     def get_debug_bus(self, neo_id: int | None = None) -> DebugBusSignalStore | None:
@@ -94,10 +95,9 @@ class QuasarFunctionalWorkerBlock(QuasarNocBlock):
         riscs.extend(self.neo2.all_riscs)
         riscs.extend(self.neo3.all_riscs)
         riscs.extend(self.overlay.all_riscs)
-        return riscs
+        return [self.get_risc_debug(risc.risc_location.risc_name, risc.risc_location.neo_id) for risc in riscs]
 
-    @cache
-    def get_risc_debug(self, risc_name: str, neo_id: int | None = None) -> RiscDebug:
+    def _create_risc_debug(self, risc_name: str, neo_id: int | None = None) -> RiscDebug:
         if neo_id == self.neo0.neo_id:
             return self.neo0.get_risc_debug(risc_name)
         elif neo_id == self.neo1.neo_id:
@@ -10,11 +10,10 @@ class WormholeBabyRiscDebug(BabyRiscDebug):
     def __init__(self, risc_info: BabyRiscInfo, enable_asserts: bool | None = None):
         super().__init__(risc_info, enable_asserts)
 
-    def cont(self):
+    def prepare_cont(self):
         # If this is functional worker core, we need to disable branch prediction as a hardware workaround
         if self.baby_risc_info.branch_prediction_register is not None:
             self.set_branch_prediction(False)
-            super().cont()
         else:
             # For erisc we cannot disable branch prediction: the eth tile has no DISABLE_RISC_BP config
             # register, the RISC debug module cannot reach CSRs to set cfg0.DisBp (its register-access
@@ -27,7 +26,6 @@ class WormholeBabyRiscDebug(BabyRiscDebug):
             self.assert_debug_hardware()
             assert self.debug_hardware is not None, "Debug hardware is not initialized"
             self.debug_hardware.flush(self.get_pc())
-            super().cont()
 
     def step(self):
         # We need to disable branch prediction as a hardware workaround, if there is an option to do so
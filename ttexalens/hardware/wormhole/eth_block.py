@@ -238,8 +238,7 @@ class WormholeEthBlock(WormholeNocBlock):
     def get_default_risc_debug(self) -> RiscDebug:
         return self.get_risc_debug(self.erisc.risc_name, self.erisc.neo_id)
 
-    @cache
-    def get_risc_debug(self, risc_name: str, neo_id: int | None = None) -> RiscDebug:
+    def _create_risc_debug(self, risc_name: str, neo_id: int | None = None) -> RiscDebug:
         assert neo_id is None, "NEO ID is not applicable for Wormhole device."
         risc_name = risc_name.lower()
         if risc_name == self.erisc.risc_name:
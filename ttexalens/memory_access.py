@@ -6,7 +6,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from ttexalens._native_ttexalens import MemoryAccess, NoMemoryAccess
-from ttexalens.exceptions import ReadOnlyMemoryError, RestrictedMemoryAccessError
+from ttexalens.exceptions import MemoryAccessException, ReadOnlyMemoryError, RestrictedMemoryAccessError
 from ttexalens.hardware.memory_block import MemoryBlock
 
 if TYPE_CHECKING:
@@ -96,18 +96,27 @@ class FixedMemoryAccess(MemoryAccess):
     Read-only MemoryAccess backed by an in-memory byte buffer.
 
     Used when DWARF evaluation has already produced the bytes for a value
-    (e.g. a temporary, non-addressable expression result), so further reads
-    should come from that snapshot rather than device memory. Writes are
+    (e.g. a temporary, non-addressable expression result), or when a variable
+    was read once and should be inspected later (tt_exalens_lib.gather_global),
+    so further reads come from that snapshot rather than device memory.
+    `base_address` is the address of the first byte of `data`. Writes are
     forbidden and will raise.
     """
 
-    def __init__(self, data: bytes):
+    def __init__(self, data: bytes, base_address: int = 0):
         super().__init__()
         self._data = data
+        self._base_address = base_address
 
     def read(self, address: int, buffer: memoryview | bytearray) -> None:
         size = len(buffer)
-        buffer[:] = self._data[address : address + size]
+        offset = address - self._base_address
+        if offset < 0 or offset + size > len(self._data):
+            raise MemoryAccessException(
+                f"Address range [0x{address:08x}, 0x{address + size:08x}) is outside of the snapshot "
+                f"[0x{self._base_address:08x}, 0x{self._base_address + len(self._data):08x})"
+            )
+        buffer[:] = self._data[offset : offset + size]
 
     def write(self, address: int, data: bytes | bytearray | memoryview) -> None:
         raise ReadOnlyMemoryError(address, len(data))
@@ -170,28 +179,32 @@ class RiscDebugMemoryAccess(MemoryAccess):
     def write_register(self, register_index: int, value: int) -> None:
         self._risc_debug.write_gpr(register_index, value)
 
+    def is_access_allowed(self, address: int, size_bytes: int) -> bool:
+        """Returns True if the range [address, address + size_bytes) passes the access restriction."""
+        if not self._restricted_access:
+            return True
+        l1: MemoryBlock = self._risc_debug.get_l1()
+        assert l1.address.private_address is not None, "L1 memory block has no private address"
+
+        data_private_memory: MemoryBlock | None = self._risc_debug.get_data_private_memory()
+        if data_private_memory is not None:
+            assert (
+                data_private_memory.address.private_address is not None
+            ), "Data Private Memory block has no private address"
+
+        address_end = address + size_bytes - 1
+        inside_l1: bool = l1.contains_private_address(address) and l1.contains_private_address(address_end)
+        inside_data_private_memory: bool = (
+            data_private_memory is not None
+            and data_private_memory.contains_private_address(address)
+            and data_private_memory.contains_private_address(address_end)
+        )
+        return inside_l1 or inside_data_private_memory
+
     def _validate_access(self, address: int, size_bytes: int) -> None:
-        if self._restricted_access:
-            l1: MemoryBlock = self._risc_debug.get_l1()
-            assert l1.address.private_address is not None, "L1 memory block has no private address"
-
-            data_private_memory: MemoryBlock | None = self._risc_debug.get_data_private_memory()
-            if data_private_memory is not None:
-                assert (
-                    data_private_memory.address.private_address is not None
-                ), "Data Private Memory block has no private address"
-
-            address_end = address + size_bytes - 1
-            inside_l1: bool = l1.contains_private_address(address) and l1.contains_private_address(address_end)
-            inside_data_private_memory: bool = (
-                data_private_memory is not None
-                and data_private_memory.contains_private_address(address)
-                and data_private_memory.contains_private_address(address_end)
+        if not self.is_access_allowed(address, size_bytes):
+            raise RestrictedMemoryAccessError(
+                access_start=address,
+                access_end=address + size_bytes - 1,
+                location=self._risc_debug.risc_location.location,
             )
-
-            if not inside_l1 and not inside_data_private_memory:
-                raise RestrictedMemoryAccessError(
-                    access_start=address,
-                    access_end=address_end,
-                    location=self._risc_debug.risc_location.location,
-                )
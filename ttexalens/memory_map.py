@@ -88,11 +88,58 @@ class IntervalMap:
             return self._intervals[index].block
         return None
 
+    @property
+    def intervals(self) -> list[Interval]:
+        return list(self._intervals)
+
+
+class AccessPermissionTable:
+    """Precompiled safe-mode permissions of a memory map.
+
+    Adjacent blocks with the same static permissions are merged into one range, so checking an access
+    costs a single bisect. Blocks whose safety depends on device state (callable ``safe_to_read``/``safe_to_write``
+    or an ``access_check``) get no permission bits here: the table never approves accesses to them and callers
+    fall back to evaluating the block checks.
+    """
+
+    READ = 1
+    WRITE = 2
+
+    def __init__(self, intervals: list[Interval]):
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        self._permissions: list[int] = []
+        for interval in sorted(intervals, key=lambda interval: interval.start):
+            permissions = AccessPermissionTable._static_permissions(interval.block)
+            if self._ends and self._ends[-1] == interval.start and self._permissions[-1] == permissions:
+                self._ends[-1] = interval.end
+            else:
+                self._starts.append(interval.start)
+                self._ends.append(interval.end)
+                self._permissions.append(permissions)
+
+    @staticmethod
+    def _static_permissions(block: MemoryMapBlockInfo) -> int:
+        if callable(block.safe_to_read) or callable(block.safe_to_write) or block.access_check is not None:
+            return 0
+        permissions = 0
+        if block.is_safe_to_read(0, 0):
+            permissions |= AccessPermissionTable.READ
+        if block.is_safe_to_write(0, 0):
+            permissions |= AccessPermissionTable.WRITE
+        return permissions
+
+    def allows(self, address: int, num_bytes: int, permission: int) -> bool:
+        """Returns True if the whole range is known to be safe for the given access; False means "check the blocks"."""
+        index = bisect_right(self._starts, address) - 1
+        return index >= 0 and address + num_bytes <= self._ends[index] and self._permissions[index] & permission != 0
+
 
 class MemoryMap:
     """Catalog of memory blocks with address or name based lookup."""
 
     __cache_of_memory_maps: dict[tuple[type, str], MemoryMap] = {}
+    __cache_of_access_tables: dict[tuple[type, str], AccessPermissionTable] = {}
     __cache_lock: threading.Lock = threading.Lock()
 
     def __init__(self):
@@ -100,8 +147,17 @@ class MemoryMap:
         self._private_addresses = IntervalMap([])
         self._bar0_addresses = IntervalMap([])
         self._blocks_info: dict[str, MemoryMapBlockInfo] = {}
+        self._noc_access_table = AccessPermissionTable([])
 
-    def initialize_blocks(self, blocks: list[MemoryMapBlockInfo]) -> None:
+    def initialize_blocks(
+        self, blocks: list[MemoryMapBlockInfo], access_table_cache_key: tuple[type, str] | None = None
+    ) -> None:
+        """Maps the given blocks.
+
+        Maps that cannot be shared through ``get_memory_map_from_cache`` (their blocks capture per-core state)
+        can still share the NOC access permission table: it only depends on block addresses and static
+        permissions, so blocks built by the same type under ``access_table_cache_key`` reuse one table.
+        """
         noc_intervals: list[Interval] = []
         private_intervals: list[Interval] = []
         bar0_intervals: list[Interval] = []
@@ -123,6 +179,19 @@ class MemoryMap:
         self._noc_addresses = IntervalMap(noc_intervals)
         self._private_addresses = IntervalMap(private_intervals)
         self._bar0_addresses = IntervalMap(bar0_intervals)
+        if access_table_cache_key is None:
+            self._noc_access_table = AccessPermissionTable(noc_intervals)
+        else:
+            with MemoryMap.__cache_lock:
+                access_table = MemoryMap.__cache_of_access_tables.get(access_table_cache_key)
+                if access_table is None:
+                    access_table = AccessPermissionTable(noc_intervals)
+                    MemoryMap.__cache_of_access_tables[access_table_cache_key] = access_table
+                self._noc_access_table = access_table
+
+    @property
+    def noc_access_table(self) -> AccessPermissionTable:
+        return self._noc_access_table
 
     def find_by_noc_address(self, noc_address: int) -> MemoryMapBlockInfo | None:
         return self._noc_addresses.find(noc_address)
@@ -130,12 +199,20 @@ class MemoryMap:
     def find_next_by_noc_address(self, noc_address: int) -> MemoryMapBlockInfo | None:
         return self._noc_addresses.find_next(noc_address)
 
+    def noc_address_intervals(self) -> list[Interval]:
+        """Returns NOC address ranges of all blocks that have one, sorted by address."""
+        return self._noc_addresses.intervals
+
     def find_by_private_address(self, private_address: int) -> MemoryMapBlockInfo | None:
         return self._private_addresses.find(private_address)
 
     def find_next_by_private_address(self, private_address: int) -> MemoryMapBlockInfo | None:
         return self._private_addresses.find_next(private_address)
 
+    def private_address_intervals(self) -> list[Interval]:
+        """Returns private address ranges of all blocks that have one, sorted by address."""
+        return self._private_addresses.intervals
+
     def find_by_bar0_address(self, bar0_address: int) -> MemoryMapBlockInfo | None:
         return self._bar0_addresses.find(bar0_address)
 
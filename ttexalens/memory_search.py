@@ -0,0 +1,404 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""Parallel search for byte patterns in device memory.
+
+A search is split into chunks of at most ``read_size`` bytes. Every chunk re-reads the first
+``len(longest pattern) - 1`` bytes of the next one, so chunks are independent and are read
+by a thread pool across cores and devices while the caller consumes results. Matches are
+still yielded in order: location by location, then by address.
+
+Patterns are matched with ``bytes.find``; masked patterns (``--mask`` in the CLI) are compiled
+once into a regular expression with a lookahead, so overlapping matches are found as well.
+
+Reads that go through the RISC debug hardware (private memory not reachable over NOC) are
+serialized per core, since the debug interface of a core cannot be shared between threads.
+
+As in a sequential scan, the first failed read ends the search of its range: chunks after it
+are not read, and matches of chunks after it that were already read are dropped.
+"""
+
+from __future__ import annotations
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
+import re
+import threading
+from typing import Callable, Iterable, Iterator
+
+from ttexalens import _lib_helpers
+from ttexalens import util
+from ttexalens.context import Context
+from ttexalens.coordinate import OnChipCoordinate
+from ttexalens.exceptions import TTException
+from ttexalens.memory_map import MemoryMapBlockInfo
+
+__all__ = [
+    "SearchMatch",
+    "SearchPattern",
+    "SearchRange",
+    "get_search_ranges",
+    "scan_ranges",
+    "search_memory",
+]
+
+UNKNOWN_BLOCK = "???"
+DEFAULT_READ_SIZE = 0x100000  # NOC reads
+DEFAULT_READ_SIZE_RISC_DEBUG = 0x100  # reads through RISC debug hardware
+
+
+@dataclass(frozen=True)
+class SearchPattern:
+    """Byte pattern to search for. Bits that are 0 in ``mask`` are ignored when matching."""
+
+    data: bytes
+    mask: bytes | None = None
+
+    def __post_init__(self):
+        if not self.data:
+            raise TTException("Pattern is empty.")
+        if self.mask is not None and len(self.mask) != len(self.data):
+            raise TTException(f"Mask has {len(self.mask)} byte(s), pattern has {len(self.data)}.")
+
+    @staticmethod
+    def from_values(values: Iterable[int], width: int, masks: Iterable[int] | None = None) -> SearchPattern:
+        """Encodes values (and optional per-value masks) as little-endian integers of ``width`` bytes.
+
+        Negative values are masked to the width (two's-complement), so -1 at width 4
+        produces the same bytes as 0xFFFFFFFF.
+        """
+        if width < 1:
+            raise TTException(f"Pattern width must be at least 1, got {width}.")
+        value_mask = (1 << (width * 8)) - 1
+        data = b"".join((v & value_mask).to_bytes(width, byteorder="little") for v in values)
+        if masks is None:
+            return SearchPattern(data)
+        mask = b"".join((m & value_mask).to_bytes(width, byteorder="little") for m in masks)
+        return SearchPattern(data, mask)
+
+    @property
+    def is_masked(self) -> bool:
+        return self.mask is not None and any(m != 0xFF for m in self.mask)
+
+    @cached_property
+    def _regex(self) -> re.Pattern[bytes]:
+        assert self.mask is not None
+        parts = []
+        for value, mask in zip(self.data, self.mask):
+            if mask == 0xFF:
+                parts.append(re.escape(bytes([value])))
+            elif mask == 0:
+                parts.append(b".")
+            else:
+                accepted = bytes(b for b in range(256) if b & mask == value & mask)
+                parts.append(b"[" + b"".join(b"\\x%02x" % b for b in accepted) + b"]")
+        # Lookahead keeps the match zero-width, so overlapping occurrences are all reported.
+        return re.compile(b"(?=" + b"".join(parts) + b")", re.DOTALL)
+
+    def find_all(self, data: bytes | bytearray, end: int | None = None) -> Iterator[int]:
+        """Yields offsets of all (possibly overlapping) occurrences that start before ``end``."""
+        end = len(data) if end is None else end
+        if self.is_masked:
+            # The lookahead may look past ``end``, so search the whole buffer and stop at ``end``.
+            for match in self._regex.finditer(data, 0, len(data)):
+                if match.start() >= end:
+                    return
+                yield match.start()
+            return
+        offset = data.find(self.data, 0)
+        while offset != -1 and offset < end:
+            yield offset
+            offset = data.find(self.data, offset + 1)
+
+
+@dataclass(frozen=True)
+class SearchRange:
+    """Address range [start, end) of one memory block to search."""
+
+    location: OnChipCoordinate
+    start: int
+    end: int
+    block_name: str
+    risc_name: str | None = None
+    # Offset to add to an address to get its NOC address, or None if the range is read through RISC debug hardware
+    noc_offset: int | None = 0
+
+    @property
+    def size(self) -> int:
+        return self.end - self.start
+
+
+@dataclass(frozen=True)
+class SearchMatch:
+    location: OnChipCoordinate
+    address: int
+    block_name: str
+    pattern_index: int = 0
+    risc_name: str | None = None
+
+
+def _block_range(location: OnChipCoordinate, block_info, risc_name: str | None, start: int, end: int) -> SearchRange:
+    address = block_info.memory_block.address
+    if risc_name is None:
+        return SearchRange(location, start, end, block_info.name)
+    noc_offset = address.noc_address - address.private_address if address.noc_address is not None else None
+    return SearchRange(location, start, end, block_info.name, risc_name, noc_offset)
+
+
+def _block_bounds(block_info, risc_name: str | None) -> tuple[int, int]:
+    address = (
+        block_info.memory_block.address.private_address if risc_name else block_info.memory_block.address.noc_address
+    )
+    assert address is not None
+    return address, address + block_info.memory_block.size
+
+
+def get_search_ranges(
+    location: OnChipCoordinate, start: int, end: int | None = None, risc_name: str | None = None, unsafe: bool = False
+) -> list[SearchRange]:
+    """
+    Resolves the memory blocks to search on one location.
+
+    Without ``end``, consecutive blocks are searched from ``start`` until the first gap in the memory map.
+    With ``unsafe`` and an explicit ``end``, the memory map is skipped and [start, end) is searched as one raw range.
+
+    Args:
+        location (OnChipCoordinate): Location to search.
+        start (int): First address to search. Private addresses of ``risc_name`` if given, NOC addresses otherwise.
+        end (int, optional): Address after the last one to search.
+        risc_name (str, optional): RISC whose private memory is searched instead of NOC memory.
+        unsafe (bool, default False): Search outside of known memory blocks and bypass safety checks.
+
+    Returns:
+        list[SearchRange]: Ranges to search, in address order.
+    """
+    if unsafe and end is not None:
+        return [SearchRange(location, start, end, UNKNOWN_BLOCK, risc_name, 0 if risc_name is None else None)]
+
+    find: Callable[[int], MemoryMapBlockInfo | None]
+    if risc_name is None:
+        memory_map = location.noc_block.noc_memory_map
+        find = memory_map.find_by_noc_address
+        memory_name = "NOC memory"
+    else:
+        memory_map = location.noc_block.get_risc_debug(risc_name).risc_info.memory_map
+        find = memory_map.find_by_private_address
+        memory_name = f"{risc_name} private memory"
+
+    ranges: list[SearchRange] = []
+    current = start
+    while end is None or current < end:
+        block_info = find(current)
+        if block_info is not None:
+            block_end = _block_bounds(block_info, risc_name)[1]
+            range_end = block_end if end is None else min(block_end, end)
+            ranges.append(_block_range(location, block_info, risc_name, current, range_end))
+        elif not ranges:
+            raise TTException(f"Address 0x{current:08x} is not in a known {memory_name} block")
+        else:
+            break  # Gap after the last found block — stop here
+        current = ranges[-1].end
+    return ranges
+
+
+class _Scan:
+    """State shared by the chunk readers of one scan_ranges call."""
+
+    def __init__(self, patterns: list[SearchPattern], unsafe: bool):
+        self.patterns = patterns
+        self.overlap = max(len(pattern.data) for pattern in patterns) - 1
+        self.unsafe = unsafe
+        self.finished_locations: set[OnChipCoordinate] = set()
+        # range index -> start of the first chunk of the range that could not be read
+        self.failed_ranges: dict[int, int] = {}
+        self._failed_ranges_lock = threading.Lock()
+        self._debug_locks: dict[tuple[OnChipCoordinate, str], threading.Lock] = {}
+        self._debug_locks_lock = threading.Lock()
+
+    def _debug_lock(self, location: OnChipCoordinate, risc_name: str) -> threading.Lock:
+        with self._debug_locks_lock:
+            return self._debug_locks.setdefault((location, risc_name), threading.Lock())
+
+    def _read(self, search_range: SearchRange, address: int, size: int) -> bytearray:
+        data = bytearray(size)
+        safe_mode = False if self.unsafe else None
+        if search_range.noc_offset is not None:
+            search_range.location.noc_read(address + search_range.noc_offset, data, safe_mode=safe_mode)
+            return data
+        assert search_range.risc_name is not None
+        risc_debug = search_range.location.noc_block.get_risc_debug(search_range.risc_name)
+        with self._debug_lock(search_range.location, search_range.risc_name):
+            if search_range.block_name == UNKNOWN_BLOCK:
+                with risc_debug.ensure_private_memory_access():
+                    risc_debug.read_memory_bytes(address, data, safe_mode=False)
+            else:
+                risc_debug.read_memory_bytes(address, data, safe_mode=safe_mode)
+        return data
+
+    def is_after_failure(self, range_index: int, start: int) -> bool:
+        """True if a read of the range failed before the chunk starting at ``start``."""
+        failed_start = self.failed_ranges.get(range_index)
+        return failed_start is not None and failed_start < start
+
+    def scan_chunk(self, range_index: int, search_range: SearchRange, start: int, end: int) -> list[tuple[int, int]]:
+        """Returns sorted (address, pattern_index) of matches starting in [start, end)."""
+        if search_range.location in self.finished_locations or self.is_after_failure(range_index, start):
+            return []
+        try:
+            data = self._read(search_range, start, min(end + self.overlap, search_range.end) - start)
+        except TTException as e:
+            with self._failed_ranges_lock:
+                self.failed_ranges[range_index] = min(start, self.failed_ranges.get(range_index, start))
+            if util.DEBUG_ENABLED:
+                util.DEBUG(f"search: skipping 0x{start:08x}: {e}")
+            return []
+        matches = [
+            (start + offset, index)
+            for index, pattern in enumerate(self.patterns)
+            for offset in pattern.find_all(data, end - start)
+        ]
+        matches.sort()
+        return matches
+
+
+def scan_ranges(
+    ranges: Iterable[SearchRange],
+    patterns: list[SearchPattern],
+    unsafe: bool = False,
+    read_size: int | None = None,
+    max_results: int | None = None,
+    max_workers: int = 8,
+    progress: Callable[[int, int], None] | None = None,
+) -> Iterator[SearchMatch]:
+    """
+    Searches ranges for patterns and yields matches as soon as they are found, in range and address order.
+
+    Args:
+        ranges (Iterable[SearchRange]): Ranges to search, e.g. from get_search_ranges.
+        patterns (list[SearchPattern]): Patterns to search for. Matches report the index of the pattern.
+        unsafe (bool, default False): Bypass safety checks.
+        read_size (int, optional): Maximum bytes per device read. Defaults to 1MB over NOC and 256 bytes through RISC debug hardware.
+        max_results (int, optional): Maximum number of matches per location. If None, all matches are reported.
+        max_workers (int, default 8): Number of threads reading from the device.
+        progress (Callable[[int, int], None], optional): Called with (bytes scanned, total bytes) after every chunk.
+
+    Returns:
+        Iterator[SearchMatch]: Matches. Reads are issued only while the iterator is consumed.
+    """
+    if not patterns:
+        raise TTException("No patterns to search for.")
+    if read_size is not None and read_size < 1:
+        raise TTException(f"Read size must be at least 1, got {read_size}.")
+    if max_results is not None and max_results < 1:
+        raise TTException(f"Maximum number of results must be at least 1, got {max_results}.")
+    ranges = list(ranges)
+    return _scan(ranges, _Scan(patterns, unsafe), read_size, max_results, max(1, max_workers), progress)
+
+
+def _scan(
+    ranges: list[SearchRange],
+    scan: _Scan,
+    read_size: int | None,
+    max_results: int | None,
+    max_workers: int,
+    progress: Callable[[int, int], None] | None,
+) -> Iterator[SearchMatch]:
+    def chunks() -> Iterator[tuple[int, SearchRange, int, int]]:
+        for range_index, search_range in enumerate(ranges):
+            chunk_size = read_size or (
+                DEFAULT_READ_SIZE if search_range.noc_offset is not None else DEFAULT_READ_SIZE_RISC_DEBUG
+            )
+            for chunk_start in range(search_range.start, search_range.end, chunk_size):
+                yield range_index, search_range, chunk_start, min(chunk_start + chunk_size, search_range.end)
+
+    total = sum(search_range.size for search_range in ranges)
+    done = 0
+    match_counts: dict[OnChipCoordinate, int] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: deque[tuple[int, SearchRange, int, int, Future[list[tuple[int, int]]]]] = deque()
+        chunk_iterator = chunks()
+        try:
+            while True:
+                # Keep every worker busy while the oldest chunk is being consumed.
+                while len(pending) < 2 * max_workers:
+                    chunk = next(chunk_iterator, None)
+                    if chunk is None:
+                        break
+                    range_index, search_range, chunk_start, chunk_end = chunk
+                    future = executor.submit(scan.scan_chunk, *chunk)
+                    pending.append((range_index, search_range, chunk_start, chunk_end - chunk_start, future))
+                if not pending:
+                    break
+                range_index, search_range, chunk_start, chunk_size, future = pending.popleft()
+                chunk_matches = future.result()
+                # Chunks are consumed in order, so a failure of an earlier chunk of the range is already recorded.
+                if scan.is_after_failure(range_index, chunk_start):
+                    chunk_matches = []
+                for address, pattern_index in chunk_matches:
+                    location = search_range.location
+                    if location in scan.finished_locations:
+                        break
+                    yield SearchMatch(location, address, search_range.block_name, pattern_index, search_range.risc_name)
+                    match_counts[location] = match_counts.get(location, 0) + 1
+                    if max_results is not None and match_counts[location] >= max_results:
+                        scan.finished_locations.add(location)
+                done += chunk_size
+                if progress is not None:
+                    progress(done, total)
+        finally:
+            # Chunks that did not start yet are dropped when the caller stops early.
+            for *_, future in pending:
+                future.cancel()
+
+
+def _to_patterns(patterns: list[SearchPattern | bytes] | SearchPattern | bytes) -> list[SearchPattern]:
+    if isinstance(patterns, (SearchPattern, bytes, bytearray)):
+        patterns = [patterns]
+    return [pattern if isinstance(pattern, SearchPattern) else SearchPattern(bytes(pattern)) for pattern in patterns]
+
+
+@_lib_helpers.trace_api
+def search_memory(
+    locations: list[str | OnChipCoordinate] | str | OnChipCoordinate,
+    patterns: list[SearchPattern | bytes] | SearchPattern | bytes,
+    start: int = 0,
+    end: int | None = None,
+    risc_name: str | None = None,
+    unsafe: bool = False,
+    read_size: int | None = None,
+    max_results: int | None = None,
+    max_workers: int = 8,
+    progress: Callable[[int, int], None] | None = None,
+    device_id: int = 0,
+    context: Context | None = None,
+) -> Iterator[SearchMatch]:
+    """
+    Searches memory of one or more cores for byte patterns. Cores are read in parallel and matches are yielded
+    as they are found, location by location in the order given, then by address.
+
+    Args:
+        locations (list[str | OnChipCoordinate] | str | OnChipCoordinate): Cores to search, given as strings or OnChipCoordinate objects.
+        patterns (list[SearchPattern | bytes] | SearchPattern | bytes): Patterns to search for. Use SearchPattern to give a mask.
+        start (int, default 0): First address to search.
+        end (int, optional): Address after the last one to search. If None, consecutive blocks from start are searched.
+        risc_name (str, optional): RISC whose private memory is searched instead of NOC memory.
+        unsafe (bool, default False): Search outside of known memory blocks and bypass safety checks (expert mode).
+        read_size (int, optional): Maximum bytes per device read. Defaults to 1MB over NOC and 256 bytes through RISC debug hardware.
+        max_results (int, optional): Maximum number of matches per location. If None, all matches are reported.
+        max_workers (int, default 8): Number of threads reading from the device.
+        progress (Callable[[int, int], None], optional): Called with (bytes scanned, total bytes) after every chunk.
+        device_id (int, default 0): ID of the device the locations refer to.
+        context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
+
+    Returns:
+        Iterator[SearchMatch]: Matches with their location, address, memory block and pattern index.
+    """
+    context = _lib_helpers.check_context(context)
+    if not isinstance(locations, list):
+        locations = [locations]
+    ranges: list[SearchRange] = []
+    for location in locations:
+        coordinate = _lib_helpers.convert_coordinate(location, device_id, context)
+        ranges.extend(get_search_ranges(coordinate, start, end, risc_name, unsafe))
+    return scan_ranges(ranges, _to_patterns(patterns), unsafe, read_size, max_results, max_workers, progress)
@@ -0,0 +1,292 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""Incremental change tracking of device memory.
+
+A ``MemoryWatch`` reads a baseline of a set of regions (by default L1 of the chosen cores) and
+then re-reads them in sweeps, with cores read in parallel. A region that did not change is
+skipped with a single comparison; otherwise it is compared page by page and only changed pages
+are looked at byte by byte. Every changed page becomes one ``MemoryChange`` that holds the old
+and the new bytes from its first to its last modified byte, so the timeline stores deltas
+only. Sweeps can run on a background thread at a fixed rate, like ``TelemetryPoller``. Cores are
+read on one thread pool that is kept across sweeps, so call ``stop`` when done, also when sweeps
+were run with ``poll_once``.
+
+When the timeline outgrows ``history_size``, the oldest changes are folded into the baseline,
+so memory at any sweep that is still in the timeline can be reconstructed with ``memory_at``.
+"""
+
+from __future__ import annotations
+from collections import deque
+from dataclasses import dataclass
+import threading
+import time
+from typing import Iterable
+
+from ttexalens import _lib_helpers
+from ttexalens.background_poller import BackgroundPoller
+from ttexalens.context import Context
+from ttexalens.coordinate import OnChipCoordinate
+from ttexalens.exceptions import TTException
+
+__all__ = [
+    "MemoryChange",
+    "MemoryWatch",
+    "WatchRegion",
+    "start_memory_watch",
+]
+
+DEFAULT_PAGE_SIZE = 256
+DEFAULT_BLOCK_NAME = "l1"
+
+
+@dataclass(frozen=True)
+class WatchRegion:
+    location: OnChipCoordinate
+    address: int  # NOC address
+    size: int
+    block_name: str | None = None
+
+    @staticmethod
+    def from_block(location: OnChipCoordinate, block_name: str = DEFAULT_BLOCK_NAME) -> WatchRegion:
+        block_info = location.noc_block.noc_memory_map.find_by_name(block_name)
+        if block_info is None or block_info.memory_block.address.noc_address is None:
+            raise TTException(f"Location {location.to_user_str()} has no memory block {block_name} reachable over NOC.")
+        return WatchRegion(
+            location, block_info.memory_block.address.noc_address, block_info.memory_block.size, block_name
+        )
+
+
+@dataclass(frozen=True)
+class MemoryChange:
+    timestamp: float  # time.time() at the end of the sweep
+    sweep: int  # 1 for the first sweep after the baseline
+    location: OnChipCoordinate
+    address: int
+    old: bytes
+    new: bytes
+
+
+def _changed_pages(
+    region: WatchRegion, old: bytearray, new: bytearray, page_size: int, sweep: int, timestamp: float
+) -> list[MemoryChange]:
+    changes: list[MemoryChange] = []
+    old_view = memoryview(old)
+    new_view = memoryview(new)
+    for page_start in range(0, len(new), page_size):
+        page_end = min(page_start + page_size, len(new))
+        if old_view[page_start:page_end] == new_view[page_start:page_end]:
+            continue
+        first = page_start
+        while old[first] == new[first]:
+            first += 1
+        last = page_end - 1
+        while old[last] == new[last]:
+            last -= 1
+        change = MemoryChange(
+            timestamp,
+            sweep,
+            region.location,
+            region.address + first,
+            bytes(old[first : last + 1]),
+            bytes(new[first : last + 1]),
+        )
+        # Join with a change that ends exactly where this one starts, so writes across a page boundary stay together.
+        if changes and changes[-1].address + len(changes[-1].new) == change.address:
+            previous = changes.pop()
+            change = MemoryChange(
+                timestamp,
+                sweep,
+                region.location,
+                previous.address,
+                previous.old + change.old,
+                previous.new + change.new,
+            )
+        changes.append(change)
+    return changes
+
+
+class MemoryWatch(BackgroundPoller):
+    """Tracks changes of memory regions across sweeps and keeps them as a timeline of deltas."""
+
+    # The baseline is read by start(), so the first sweep waits one interval.
+    _sweep_on_start = False
+
+    def __init__(
+        self,
+        regions: Iterable[WatchRegion],
+        interval: float = 0.1,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        history_size: int = 100000,
+        max_workers: int = 8,
+        safe_mode: bool | None = None,
+    ):
+        if interval <= 0:
+            raise TTException(f"Polling interval must be greater than 0, got {interval}.")
+        if page_size <= 0:
+            raise TTException(f"Page size must be greater than 0, got {page_size}.")
+        self.regions = list(regions)
+        if not self.regions:
+            raise TTException("At least one region must be watched.")
+        super().__init__("Memory watch", interval, max_workers)
+        self._page_size = page_size
+        self._history_size = history_size
+        self._safe_mode = safe_mode
+
+        self._baseline: list[bytearray] = []  # memory at self._baseline_sweep
+        self._baseline_sweep = 0
+        self._current: list[bytearray] = []
+        self._changes: deque[MemoryChange] = deque()
+        self._region_index = {(region.location, region.address): index for index, region in enumerate(self.regions)}
+        self._lock = threading.Lock()
+        self._sweep_lock = threading.Lock()
+        self._start_time: float | None = None
+
+    @property
+    def start_time(self) -> float | None:
+        """time.time() when the baseline was read."""
+        return self._start_time
+
+    def _read_all(self) -> list[bytearray]:
+        def read(region: WatchRegion) -> bytearray:
+            buffer = bytearray(region.size)
+            region.location.noc_read(region.address, buffer, safe_mode=self._safe_mode)
+            return buffer
+
+        return self._map(read, self.regions)
+
+    def take_baseline(self) -> None:
+        """Reads all regions and starts a new, empty timeline."""
+        with self._sweep_lock:
+            data = self._read_all()
+            with self._lock:
+                self._start_time = time.time()
+                self._current = data
+                self._baseline = [bytearray(buffer) for buffer in data]
+                self._baseline_sweep = 0
+                self._changes.clear()
+                self._sweep_count = 0
+
+    def poll_once(self) -> list[MemoryChange]:
+        """Re-reads all regions, records what changed since the previous sweep and returns it."""
+        with self._sweep_lock:
+            if self._start_time is None:
+                raise TTException("Baseline was not taken.")
+            data = self._read_all()
+            timestamp = time.time()
+            sweep = self._sweep_count + 1
+            changes: list[MemoryChange] = []
+            for region, old, new in zip(self.regions, self._current, data):
+                if old != new:
+                    changes.extend(_changed_pages(region, old, new, self._page_size, sweep, timestamp))
+            with self._lock:
+                self._current = data
+                self._changes.extend(changes)
+                while len(self._changes) > self._history_size:
+                    self._fold_oldest()
+                self._sweep_count = sweep
+            return changes
+
+    def _fold_oldest(self) -> None:
+        # Applies the oldest change to the baseline; the baseline then is memory after that sweep.
+        change = self._changes.popleft()
+        region_index = self._find_region(change.location, change.address)
+        offset = change.address - self.regions[region_index].address
+        self._baseline[region_index][offset : offset + len(change.new)] = change.new
+        self._baseline_sweep = change.sweep
+
+    def _find_region(self, location: OnChipCoordinate, address: int) -> int:
+        for index, region in enumerate(self.regions):
+            if region.location == location and region.address <= address < region.address + region.size:
+                return index
+        raise TTException(f"Address 0x{address:08x} at {location.to_user_str()} is not watched.")
+
+    def _on_start(self) -> None:
+        # Takes the baseline if needed before sweeping on the background thread.
+        if self._start_time is None:
+            self.take_baseline()
+
+    def _sweep(self) -> list[MemoryChange]:
+        return self.poll_once()
+
+    def changes(
+        self,
+        location: OnChipCoordinate | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        since_sweep: int = 0,
+    ) -> list[MemoryChange]:
+        """Returns recorded changes, oldest first, optionally only those touching ``[start, end)`` of ``location``."""
+        with self._lock:
+            changes = list(self._changes)
+        return [
+            change
+            for change in changes
+            if change.sweep > since_sweep
+            and (location is None or change.location == location)
+            and (start is None or change.address + len(change.new) > start)
+            and (end is None or change.address < end)
+        ]
+
+    def memory_at(self, sweep: int, region: WatchRegion) -> bytes:
+        """Reconstructs the content of ``region`` after ``sweep`` (0 is the baseline) from the timeline."""
+        region_index = self._region_index.get((region.location, region.address))
+        if region_index is None:
+            raise TTException(f"Region 0x{region.address:08x} at {region.location.to_user_str()} is not watched.")
+        with self._lock:
+            if sweep < self._baseline_sweep:
+                raise TTException(f"Sweep {sweep} is no longer in the timeline, oldest is {self._baseline_sweep}.")
+            data = bytearray(self._baseline[region_index])
+            changes = [change for change in self._changes if change.sweep <= sweep]
+        for change in changes:
+            if change.location == region.location and region.address <= change.address < region.address + region.size:
+                offset = change.address - region.address
+                data[offset : offset + len(change.new)] = change.new
+        return bytes(data)
+
+
+@_lib_helpers.trace_api
+def start_memory_watch(
+    locations: list[str | OnChipCoordinate],
+    address: int | None = None,
+    size: int | None = None,
+    block_name: str = DEFAULT_BLOCK_NAME,
+    interval: float = 0.1,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    history_size: int = 100000,
+    device_id: int = 0,
+    context: Context | None = None,
+    max_workers: int = 8,
+    safe_mode: bool | None = None,
+) -> MemoryWatch:
+    """
+    Reads a baseline of a memory region on many cores and starts tracking its changes on a background thread.
+    Call stop() on the returned watch (or use it as a context manager) to end tracking.
+
+    Args:
+        locations (list[str | OnChipCoordinate]): Cores to watch, given as strings or OnChipCoordinate objects.
+        address (int, optional): NOC address of the region to watch. If None, the whole memory block block_name is watched.
+        size (int, optional): Size of the region in bytes. Required if address is given.
+        block_name (str, default "l1"): NOC memory block to watch when address is not given.
+        interval (float, default 0.1): Time between two sweeps in seconds.
+        page_size (int, default 256): Granularity in bytes at which changes are detected and recorded.
+        history_size (int, default 100000): Number of changes kept; older ones are folded into the baseline.
+        device_id (int, default 0): ID of the device the locations refer to.
+        context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
+        max_workers (int, default 8): Number of threads reading from the device.
+        safe_mode (bool, optional): If True, apply additional safety checks to prevent access to known unsafe memory regions.
+
+    Returns:
+        MemoryWatch: Running watch that exposes the timeline of changes.
+    """
+    context = _lib_helpers.check_context(context)
+    coordinates = [_lib_helpers.convert_coordinate(location, device_id, context) for location in locations]
+    if address is not None:
+        if size is None or size <= 0:
+            raise TTException("Size of the watched region must be given and greater than 0.")
+        _lib_helpers.validate_addr(address)
+        regions = [WatchRegion(coordinate, address, size) for coordinate in coordinates]
+    else:
+        regions = [WatchRegion.from_block(coordinate, block_name) for coordinate in coordinates]
+    watch = MemoryWatch(regions, interval, page_size, history_size, max_workers, safe_mode)
+    return watch.start()
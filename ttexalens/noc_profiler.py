@@ -0,0 +1,257 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""Opt-in accounting of NOC transactions.
+
+While a ``NocProfiler`` is active, every NOC transaction issued by ``UmdDevice``
+is recorded with its byte count, access path (DMA or MMIO) and latency, and is
+attributed to the stack of enclosing library calls (``trace_api``), CLI commands
+and ``Device.noc_read``/``noc_write`` calls of the issuing thread. Results are
+available as summary tables and in the collapsed-stack format consumed by
+flame graph tools (``flamegraph.pl``, speedscope, ...).
+
+When no profiler is active, the hooks cost one global lookup.
+"""
+
+from __future__ import annotations
+from contextlib import nullcontext
+from dataclasses import dataclass
+import threading
+import time
+from typing import ContextManager, Iterator
+
+from tabulate import tabulate
+
+from ttexalens.exceptions import TTException
+
+__all__ = [
+    "NocProfiler",
+    "start_noc_profiler",
+    "stop_noc_profiler",
+]
+
+_active_profiler: NocProfiler | None = None
+_frames = threading.local()
+_NULL_FRAME = nullcontext()
+
+NO_API_FRAME = "<no api>"
+
+
+@dataclass
+class NocTransactionStats:
+    count: int = 0
+    num_bytes: int = 0
+    total_ns: int = 0
+    max_ns: int = 0
+
+
+@dataclass
+class ApiCallStats:
+    calls: int = 0
+    total_ns: int = 0
+
+
+def get_active_profiler() -> NocProfiler | None:
+    return _active_profiler
+
+
+def _frame_stack() -> list[str]:
+    stack = getattr(_frames, "stack", None)
+    if stack is None:
+        stack = []
+        _frames.stack = stack
+    return stack
+
+
+class _Frame:
+    __slots__ = ("_profiler", "_name", "_start")
+
+    def __init__(self, profiler: NocProfiler, name: str):
+        self._profiler = profiler
+        self._name = name
+        self._start = 0
+
+    def __enter__(self) -> None:
+        _frame_stack().append(self._name)
+        self._start = time.perf_counter_ns()
+
+    def __exit__(self, exc_type, exc_value, tb) -> None:
+        elapsed = time.perf_counter_ns() - self._start
+        _frame_stack().pop()
+        self._profiler._record_call(self._name, elapsed)
+
+
+def frame(name: str) -> ContextManager[None]:
+    """Attributes NOC transactions issued inside the ``with`` block to ``name``. No-op when profiling is off."""
+    profiler = _active_profiler
+    if profiler is None:
+        return _NULL_FRAME
+    return _Frame(profiler, name)
+
+
+class NocProfiler:
+    """Aggregates NOC transactions per (call stack, operation, access path).
+
+    Use as a context manager or call start()/stop(). Only one profiler can be active at a time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._transactions: dict[tuple[tuple[str, ...], str, str], NocTransactionStats] = {}
+        self._api_calls: dict[str, ApiCallStats] = {}
+
+    def start(self) -> NocProfiler:
+        global _active_profiler
+        if _active_profiler is not None:
+            raise TTException("NOC profiler is already running.")
+        _active_profiler = self
+        return self
+
+    def stop(self) -> NocProfiler:
+        global _active_profiler
+        if _active_profiler is self:
+            _active_profiler = None
+        return self
+
+    @property
+    def is_running(self) -> bool:
+        return _active_profiler is self
+
+    def __enter__(self) -> NocProfiler:
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, tb) -> None:
+        self.stop()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._transactions.clear()
+            self._api_calls.clear()
+
+    def record_transaction(self, operation: str, num_bytes: int, use_dma: bool, elapsed_ns: int) -> None:
+        """Records one NOC transaction under the current call stack of the calling thread."""
+        key = (tuple(_frame_stack()), operation, "dma" if use_dma else "mmio")
+        with self._lock:
+            stats = self._transactions.get(key)
+            if stats is None:
+                stats = self._transactions[key] = NocTransactionStats()
+            stats.count += 1
+            stats.num_bytes += num_bytes
+            stats.total_ns += elapsed_ns
+            stats.max_ns = max(stats.max_ns, elapsed_ns)
+
+    def _record_call(self, name: str, elapsed_ns: int) -> None:
+        with self._lock:
+            stats = self._api_calls.get(name)
+            if stats is None:
+                stats = self._api_calls[name] = ApiCallStats()
+            stats.calls += 1
+            stats.total_ns += elapsed_ns
+
+    def transactions(self) -> dict[tuple[tuple[str, ...], str, str], NocTransactionStats]:
+        """Returns a copy of the aggregated transactions keyed by (call stack, operation, path)."""
+        with self._lock:
+            return {key: NocTransactionStats(**vars(stats)) for key, stats in self._transactions.items()}
+
+    def collapsed_stacks(self, weight: str = "time") -> Iterator[str]:
+        """Yields lines in collapsed-stack format: ``frame;frame;operation;path value``.
+
+        Args:
+            weight (str, default "time"): What the value counts: "time" (microseconds), "bytes" or "count".
+        """
+        if weight not in ("time", "bytes", "count"):
+            raise TTException(f"Unknown weight '{weight}', expected 'time', 'bytes' or 'count'.")
+        for (stack, operation, path), stats in sorted(self.transactions().items()):
+            if weight == "time":
+                value = stats.total_ns // 1000
+            elif weight == "bytes":
+                value = stats.num_bytes
+            else:
+                value = stats.count
+            frames = [f.replace(";", ":").replace(" ", "_") for f in stack or (NO_API_FRAME,)]
+            yield f"{';'.join([*frames, operation, path])} {value}"
+
+    def write_collapsed_stacks(self, file_name: str, weight: str = "time") -> None:
+        with open(file_name, "w") as f:
+            for line in self.collapsed_stacks(weight):
+                f.write(line + "\n")
+
+    def summary(self, depth: int = 1) -> list[list]:
+        """Returns summary rows grouped by the outermost ``depth`` frames of the call stack.
+
+        Each row is [frames, calls, NOC ops, reads, writes, DMA ops, MMIO ops, bytes, avg bytes/op, NOC time ms, call time ms].
+        """
+        rows: dict[str, list] = {}
+        with self._lock:
+            api_calls = {name: ApiCallStats(**vars(stats)) for name, stats in self._api_calls.items()}
+        for (stack, operation, path), stats in self.transactions().items():
+            name = " > ".join(stack[:depth]) if stack else NO_API_FRAME
+            row = rows.get(name)
+            if row is None:
+                row = rows[name] = [name, 0, 0, 0, 0, 0, 0, 0]
+            row[1] += stats.count
+            row[2 if operation == "read" else 3] += stats.count
+            row[4 if path == "dma" else 5] += stats.count
+            row[6] += stats.num_bytes
+            row[7] += stats.total_ns
+        result = []
+        for name, (_, ops, reads, writes, dma, mmio, num_bytes, noc_ns) in sorted(
+            rows.items(), key=lambda item: item[1][7], reverse=True
+        ):
+            innermost = name.split(" > ")[-1]
+            call_stats = api_calls.get(innermost)
+            result.append(
+                [
+                    name,
+                    call_stats.calls if call_stats else "-",
+                    ops,
+                    reads,
+                    writes,
+                    dma,
+                    mmio,
+                    num_bytes,
+                    num_bytes // ops if ops else 0,
+                    f"{noc_ns / 1e6:.3f}",
+                    f"{call_stats.total_ns / 1e6:.3f}" if call_stats else "-",
+                ]
+            )
+        return result
+
+    def summary_table(self, depth: int = 1) -> str:
+        headers = [
+            "Call",
+            "Calls",
+            "NOC ops",
+            "Reads",
+            "Writes",
+            "DMA",
+            "MMIO",
+            "Bytes",
+            "Avg bytes",
+            "NOC ms",
+            "Call ms",
+        ]
+        return tabulate(self.summary(depth), headers=headers, disable_numparse=True)
+
+
+def start_noc_profiler() -> NocProfiler:
+    """
+    Starts recording NOC transactions and returns the active profiler.
+
+    Returns:
+        NocProfiler: Profiler that collects transactions until stop_noc_profiler() is called.
+    """
+    return NocProfiler().start()
+
+
+def stop_noc_profiler() -> NocProfiler | None:
+    """
+    Stops the active NOC profiler.
+
+    Returns:
+        NocProfiler | None: The profiler that was stopped, with its recorded data, or None if none was running.
+    """
+    profiler = _active_profiler
+    if profiler is not None:
+        profiler.stop()
+    return profiler
@@ -0,0 +1,154 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""Grid-wide snapshots of NOC/NIU registers.
+
+Registers of one core are read with a few bulk NOC reads over the covering address ranges
+computed once per block type (``RegisterStore.get_read_plan``). Cores are read in parallel
+and all values are decoded only after the last read, so the transaction counters of the whole
+grid are captured within a short window. The difference of two snapshots gives transaction
+counts, and with the elapsed time, per-link throughput.
+"""
+
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import time
+
+from ttexalens import _lib_helpers
+from ttexalens.context import Context, NocId
+from ttexalens.coordinate import OnChipCoordinate
+from ttexalens.register_store import RegisterReadPlan, RegisterStore
+
+__all__ = [
+    "NIU_TRANSACTION_COUNTERS",
+    "NocRegisterSnapshot",
+    "capture_noc_registers",
+    "snapshot_noc_registers",
+]
+
+NIU_TRANSACTION_COUNTERS = [
+    "NIU_MST_NONPOSTED_WR_REQ_SENT",
+    "NIU_MST_POSTED_WR_REQ_SENT",
+    "NIU_MST_NONPOSTED_WR_DATA_WORD_SENT",
+    "NIU_MST_POSTED_WR_DATA_WORD_SENT",
+    "NIU_MST_WR_ACK_RECEIVED",
+    "NIU_MST_RD_REQ_SENT",
+    "NIU_MST_RD_DATA_WORD_RECEIVED",
+    "NIU_MST_RD_RESP_RECEIVED",
+    "NIU_SLV_NONPOSTED_WR_REQ_RECEIVED",
+    "NIU_SLV_POSTED_WR_REQ_RECEIVED",
+    "NIU_SLV_NONPOSTED_WR_DATA_WORD_RECEIVED",
+    "NIU_SLV_POSTED_WR_DATA_WORD_RECEIVED",
+    "NIU_SLV_WR_ACK_SENT",
+    "NIU_SLV_RD_REQ_RECEIVED",
+    "NIU_SLV_RD_DATA_WORD_SENT",
+    "NIU_SLV_RD_RESP_SENT",
+]
+
+_COUNTER_MASK = 0xFFFFFFFF
+
+
+@dataclass
+class NocRegisterSnapshot:
+    """Register values per (location, NOC), captured between ``start_ns`` and ``end_ns`` (time.monotonic_ns)."""
+
+    values: dict[tuple[OnChipCoordinate, NocId], dict[str, int]]
+    start_ns: int
+    end_ns: int
+
+    @property
+    def timestamp_ns(self) -> int:
+        return (self.start_ns + self.end_ns) // 2
+
+    def delta(self, previous: NocRegisterSnapshot) -> dict[tuple[OnChipCoordinate, NocId], dict[str, int]]:
+        """Returns how much every register counted since ``previous``, assuming 32-bit counters that may wrap."""
+        result = {}
+        for key, registers in self.values.items():
+            previous_registers = previous.values.get(key)
+            if previous_registers is None:
+                continue
+            result[key] = {
+                name: (value - previous_registers[name]) & _COUNTER_MASK
+                for name, value in registers.items()
+                if name in previous_registers
+            }
+        return result
+
+    def rates(self, previous: NocRegisterSnapshot) -> dict[tuple[OnChipCoordinate, NocId], dict[str, float]]:
+        """Returns counts per second since ``previous``. Data word counters give per-link throughput."""
+        seconds = (self.timestamp_ns - previous.timestamp_ns) / 1e9
+        if seconds <= 0:
+            raise ValueError("Snapshot must be taken after the previous one.")
+        return {
+            key: {name: count / seconds for name, count in counts.items()}
+            for key, counts in self.delta(previous).items()
+        }
+
+
+def capture_noc_registers(
+    locations: list[OnChipCoordinate],
+    register_names: list[str] | None = None,
+    noc_ids: list[NocId] | None = None,
+    max_workers: int = 8,
+    safe_mode: bool | None = None,
+) -> NocRegisterSnapshot:
+    """Captures NOC registers of all locations. See snapshot_noc_registers."""
+    register_names = register_names if register_names is not None else NIU_TRANSACTION_COUNTERS
+    noc_ids = noc_ids if noc_ids is not None else [NocId.NOC0, NocId.NOC1]
+
+    # Plans are cached per block type, so this is cheap after the first snapshot.
+    targets: list[tuple[tuple[OnChipCoordinate, NocId], RegisterStore, RegisterReadPlan]] = []
+    for location in locations:
+        for noc_id in noc_ids:
+            register_store = location.noc_block.get_register_store(noc_id)
+            targets.append(((location, noc_id), register_store, register_store.get_read_plan(register_names)))
+
+    def read(target: tuple[tuple[OnChipCoordinate, NocId], RegisterStore, RegisterReadPlan]) -> list[bytearray]:
+        _, register_store, plan = target
+        return register_store.read_register_ranges(plan, safe_mode)
+
+    start_ns = time.monotonic_ns()
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        range_data = list(executor.map(read, targets))
+    end_ns = time.monotonic_ns()
+
+    values: dict[tuple[OnChipCoordinate, NocId], dict[str, int]] = {}
+    for (key, register_store, plan), data in zip(targets, range_data):
+        registers = plan.decode(data)
+        for register_name in plan.unplanned_registers:
+            registers[register_name] = register_store.read_register(register_name, safe_mode)
+        values[key] = {register_name: registers[register_name] for register_name in register_names}
+    return NocRegisterSnapshot(values, start_ns, end_ns)
+
+
+@_lib_helpers.trace_api
+def snapshot_noc_registers(
+    locations: list[str | OnChipCoordinate],
+    register_names: list[str] | None = None,
+    noc_ids: list[NocId | int] | None = None,
+    device_id: int = 0,
+    context: Context | None = None,
+    max_workers: int = 8,
+    safe_mode: bool | None = None,
+) -> NocRegisterSnapshot:
+    """
+    Captures NOC registers of many cores at once: a few bulk reads per core, with cores read in parallel.
+    Take two snapshots and call delta() or rates() on the later one to get transaction counts or throughput.
+
+    Args:
+        locations (list[str | OnChipCoordinate]): Cores to capture, given as strings or OnChipCoordinate objects.
+        register_names (list[str], optional): NOC registers to capture. If None, NIU transaction counters are captured.
+        noc_ids (list[NocId | int], optional): NOCs to capture. If None, both NOC0 and NOC1 are captured.
+        device_id (int, default 0): ID of the device the locations refer to.
+        context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
+        max_workers (int, default 8): Number of threads reading from the device.
+        safe_mode (bool, optional): If True, apply additional safety checks to prevent access to known unsafe memory regions.
+
+    Returns:
+        NocRegisterSnapshot: Register values per (location, NOC).
+    """
+    context = _lib_helpers.check_context(context)
+    coordinates = [_lib_helpers.convert_coordinate(location, device_id, context) for location in locations]
+    checked_noc_ids = [_lib_helpers.check_noc_id(noc_id, context) for noc_id in noc_ids] if noc_ids else None
+    return capture_noc_registers(coordinates, register_names, checked_noc_ids, max_workers, safe_mode)
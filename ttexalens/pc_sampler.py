@@ -0,0 +1,209 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""Statistical PC sampling through the debug bus.
+
+A ``PcSampler`` repeatedly reads the ``<risc>_pc`` debug-bus signals of a set of
+cores. Reading a debug-bus signal does not halt the core, so the sampled kernels
+keep running undisturbed. Samples are counted per (core, RISC, PC) and can be
+symbolized through the ELF/DWARF layer into per-function histograms or into the
+collapsed-stack format consumed by flame graph tools.
+
+Since cores are not halted, there is no stack walk: the symbolized "stack" of a
+sample is the function containing the PC together with the chain of functions
+inlined at that PC.
+"""
+
+from __future__ import annotations
+from collections import Counter
+import threading
+from typing import Iterable
+
+from tabulate import tabulate
+
+from ttexalens import _lib_helpers
+from ttexalens.background_poller import BackgroundPoller
+from ttexalens.context import Context
+from ttexalens.coordinate import OnChipCoordinate
+from ttexalens.debug_bus_signal_store import DebugBusSignalStore
+from ttexalens.elf import ElfFile, get_frame_callstack
+from ttexalens.exceptions import TTException
+from ttexalens.tt_exalens_lib import parse_elfs
+
+__all__ = [
+    "PcSampler",
+    "start_pc_sampler",
+]
+
+UNKNOWN_FUNCTION = "<unknown>"
+
+
+class PcSampler(BackgroundPoller):
+    """Samples PCs of RISC cores through the debug bus at a fixed rate.
+
+    Args:
+        locations (Iterable[OnChipCoordinate]): Cores to sample.
+        risc_names (Iterable[str], optional): RISC cores to sample on every location. If None, all RISCs with a PC signal are sampled.
+        elfs (dict[str, list[ElfFile]] | list[ElfFile], optional): ELF files used for symbolization, either one list for all RISCs or a list per RISC name.
+        interval (float, default 0.001): Time between two sampling sweeps in seconds. 0 samples as fast as possible.
+        neo_id (int, optional): NEO ID of the debug bus to use.
+    """
+
+    def __init__(
+        self,
+        locations: Iterable[OnChipCoordinate],
+        risc_names: Iterable[str] | None = None,
+        elfs: dict[str, list[ElfFile]] | list[ElfFile] | None = None,
+        interval: float = 0.001,
+        neo_id: int | None = None,
+    ):
+        if interval < 0:
+            raise TTException(f"Sampling interval must not be negative, got {interval}.")
+        super().__init__("PC sampler", interval)
+        self._elfs = elfs
+        requested_riscs = [risc_name.lower() for risc_name in risc_names] if risc_names is not None else None
+
+        # (location, debug bus, [(risc_name, pc signal name)])
+        self._targets: list[tuple[OnChipCoordinate, DebugBusSignalStore, list[tuple[str, str]]]] = []
+        for location in locations:
+            debug_bus = location.noc_block.get_debug_bus(neo_id)
+            if debug_bus is None:
+                raise TTException(f"Debug bus is not available on {location.to_user_str()}.")
+            riscs = requested_riscs or [risc_name.lower() for risc_name in location.noc_block.risc_names]
+            signals: list[tuple[str, str]] = []
+            for risc_name in riscs:
+                signal_name = f"{risc_name}_pc"
+                if signal_name not in debug_bus.signal_names:
+                    if requested_riscs is not None:
+                        raise TTException(f"Debug bus on {location.to_user_str()} has no PC signal for {risc_name}.")
+                    continue
+                signals.append((risc_name, signal_name))
+            if signals:
+                self._targets.append((location, debug_bus, signals))
+        if not self._targets:
+            raise TTException("No PC signals to sample.")
+
+        self._counts: dict[tuple[OnChipCoordinate, str], Counter[int]] = {
+            (location, risc_name): Counter() for location, _, signals in self._targets for risc_name, _ in signals
+        }
+        self._counts_lock = threading.Lock()
+        self._symbol_cache: dict[tuple[str, int], tuple[str, ...]] = {}
+
+    def sample_once(self) -> None:
+        """Reads every configured PC signal once."""
+        pcs: list[tuple[tuple[OnChipCoordinate, str], int]] = []
+        for location, debug_bus, signals in self._targets:
+            for risc_name, signal_name in signals:
+                try:
+                    pcs.append(((location, risc_name), debug_bus.read_signal(signal_name)))
+                except Exception:
+                    self._report_failed_read(
+                        (location, risc_name), f"Failed to read {signal_name} on {location.to_user_str()}, skipping it."
+                    )
+        with self._counts_lock:
+            for key, pc in pcs:
+                self._counts[key][pc] += 1
+            self._sweep_count += 1
+
+    def _sweep(self) -> None:
+        self.sample_once()
+
+    def pc_counts(self) -> dict[tuple[OnChipCoordinate, str], Counter[int]]:
+        """Returns a copy of sample counts per PC for every sampled (location, risc_name)."""
+        with self._counts_lock:
+            return {key: Counter(counts) for key, counts in self._counts.items()}
+
+    def _elfs_for(self, risc_name: str) -> list[ElfFile]:
+        if self._elfs is None:
+            return []
+        if isinstance(self._elfs, dict):
+            return self._elfs.get(risc_name, [])
+        return self._elfs
+
+    def symbolize(self, risc_name: str, pc: int) -> tuple[str, ...]:
+        """Returns function names at ``pc``, outermost first (the function, then functions inlined into it)."""
+        key = (risc_name, pc)
+        frames = self._symbol_cache.get(key)
+        if frames is None:
+            elfs = self._elfs_for(risc_name)
+            entries = get_frame_callstack(elfs, pc, False) if elfs else []
+            names = [entry.function_name for entry in entries if entry.function_name]
+            frames = tuple(reversed(names)) if names else (f"{UNKNOWN_FUNCTION}@0x{pc:x}",)
+            self._symbol_cache[key] = frames
+        return frames
+
+    def function_histogram(self, per_core: bool = False) -> dict[tuple[str, ...], int]:
+        """Returns sample counts per innermost function.
+
+        Keys are (risc_name, function) or, with ``per_core``, (location, risc_name, function).
+        """
+        histogram: Counter[tuple[str, ...]] = Counter()
+        for (location, risc_name), counts in self.pc_counts().items():
+            for pc, count in counts.items():
+                function = self.symbolize(risc_name, pc)[-1]
+                key = (location.to_user_str(), risc_name, function) if per_core else (risc_name, function)
+                histogram[key] += count
+        return dict(histogram)
+
+    def histogram_table(self, per_core: bool = False, limit: int | None = None) -> str:
+        histogram = self.function_histogram(per_core)
+        totals: Counter[tuple[str, ...]] = Counter()
+        for key, count in histogram.items():
+            totals[key[:-1]] += count
+        rows = []
+        for key, count in sorted(histogram.items(), key=lambda item: item[1], reverse=True)[:limit]:
+            rows.append([*key, count, f"{100 * count / totals[key[:-1]]:.1f}%"])
+        headers = (["Location"] if per_core else []) + ["RISC", "Function", "Samples", "Share"]
+        return tabulate(rows, headers=headers, disable_numparse=True)
+
+    def collapsed_stacks(self, per_core: bool = True) -> Iterable[str]:
+        """Yields lines in collapsed-stack format: ``[location;]risc;function;inlined function count``."""
+        stacks: Counter[str] = Counter()
+        for (location, risc_name), counts in self.pc_counts().items():
+            prefix = [location.to_user_str(), risc_name] if per_core else [risc_name]
+            for pc, count in counts.items():
+                frames = [*prefix, *self.symbolize(risc_name, pc)]
+                stacks[";".join(frame.replace(";", ":").replace(" ", "_") for frame in frames)] += count
+        for stack, count in sorted(stacks.items()):
+            yield f"{stack} {count}"
+
+    def write_collapsed_stacks(self, file_name: str, per_core: bool = True) -> None:
+        with open(file_name, "w") as f:
+            for line in self.collapsed_stacks(per_core):
+                f.write(line + "\n")
+
+
+@_lib_helpers.trace_api
+def start_pc_sampler(
+    locations: list[str | OnChipCoordinate],
+    elfs: dict[str, list[str | ElfFile]] | list[str | ElfFile] | str | ElfFile | None = None,
+    risc_names: list[str] | None = None,
+    interval: float = 0.001,
+    device_id: int = 0,
+    neo_id: int | None = None,
+    context: Context | None = None,
+) -> PcSampler:
+    """
+    Starts sampling PCs of RISC cores through the debug bus on a background thread, without halting the cores.
+    Call stop() on the returned sampler (or use it as a context manager) to end sampling.
+
+    Args:
+        locations (list[str | OnChipCoordinate]): Cores to sample, given as strings or OnChipCoordinate objects.
+        elfs (dict[str, list[str | ElfFile]] | list[str | ElfFile] | str | ElfFile, optional): ELF files used for symbolization, either for all RISCs or per RISC name.
+        risc_names (list[str], optional): RISC cores to sample (e.g. "brisc", "trisc0"). If None, all RISCs with a PC signal are sampled.
+        interval (float, default 0.001): Time between two sampling sweeps in seconds.
+        device_id (int, default 0): ID of the device the locations refer to.
+        neo_id (int, optional): NEO ID of the debug bus to use.
+        context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
+
+    Returns:
+        PcSampler: Running sampler that exposes histograms and collapsed stacks.
+    """
+    context = _lib_helpers.check_context(context)
+    coordinates = [_lib_helpers.convert_coordinate(location, device_id, context) for location in locations]
+    parsed_elfs: dict[str, list[ElfFile]] | list[ElfFile] | None = None
+    if isinstance(elfs, dict):
+        parsed_elfs = {risc_name.lower(): parse_elfs(risc_elfs, None, context) for risc_name, risc_elfs in elfs.items()}
+    elif elfs is not None:
+        parsed_elfs = parse_elfs(elfs, None, context)
+    return PcSampler(coordinates, risc_names, parsed_elfs, interval, neo_id).start()
@@ -2,12 +2,12 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from copy import deepcopy
 from enum import Enum
 from functools import cached_property
 import re
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, Sequence
 
 from ttexalens.context import Context, NocId
 from ttexalens.pack_unpack_regfile import TensixDataFormat
@@ -160,10 +160,34 @@ class ArcRomRegisterDescription(RegisterDescription):
     pass
 
 
+@dataclass
+class RegisterReadPlan:
+    """
+    Covering NOC address ranges of a set of registers, so that they can be read with a few bulk reads.
+    Registers without a NOC address (bar0, configuration and private registers) are read one by one.
+    """
+
+    # (noc_address, size, noc_id) of every covering range
+    ranges: list[tuple[int, int, NocId | None]]
+    # (register_name, range_index, offset in range, mask, shift)
+    registers: list[tuple[str, int, int, int, int]]
+    unplanned_registers: list[str]
+
+    def decode(self, range_data: Sequence[bytes | bytearray]) -> dict[str, int]:
+        """Decodes register values from data read from ``ranges``."""
+        values = {}
+        for register_name, range_index, offset, mask, shift in self.registers:
+            value = int.from_bytes(range_data[range_index][offset : offset + 4], byteorder="little")
+            values[register_name] = (value & mask) >> shift
+        return values
+
+
 @dataclass
 class RegisterStoreInitialization:
     registers_map: dict[str, RegisterDescription]
     get_register_base_address: Callable[[RegisterDescription], DeviceAddress]
+    # Read plans are shared by all register stores of a block type.
+    read_plans: dict[tuple[str, ...], RegisterReadPlan] = field(default_factory=dict)
 
 
 class RegisterStore:
@@ -172,6 +196,7 @@ class RegisterStore:
     ):
         self.registers = initialization.registers_map
         self._get_register_base_address = initialization.get_register_base_address
+        self._read_plans = initialization.read_plans
         self.location = location
         self.neo_id = neo_id
 
@@ -316,6 +341,67 @@ class RegisterStore:
                 value = risc_debug.read_memory(register.private_address)
         return (value & register.mask) >> register.shift
 
+    def get_read_plan(self, register_names: list[str], max_gap: int = 0x10) -> RegisterReadPlan:
+        """
+        Returns the covering NOC address ranges of registers, merging registers that are at most max_gap bytes apart.
+        Plans are computed once per block type and list of register names.
+        """
+        key = tuple(register_names)
+        plan = self._read_plans.get(key)
+        if plan is not None:
+            return plan
+
+        unplanned_registers: list[str] = []
+        addresses: list[tuple[NocId | None, int, str]] = []
+        for register_name in register_names:
+            register = self.get_register_description(register_name)
+            if register.bar0_address is None and register.noc_address is not None:
+                addresses.append((register.noc_id, register.noc_address, register_name))
+            else:
+                unplanned_registers.append(register_name)
+        addresses.sort(key=lambda item: (str(item[0]), item[1]))
+
+        ranges: list[tuple[int, int, NocId | None]] = []
+        registers: list[tuple[str, int, int, int, int]] = []
+        for noc_id, address, register_name in addresses:
+            if ranges and ranges[-1][2] == noc_id and address <= ranges[-1][0] + ranges[-1][1] + max_gap:
+                start, size, _ = ranges[-1]
+                ranges[-1] = (start, max(size, address + 4 - start), noc_id)
+            else:
+                ranges.append((address, 4, noc_id))
+            register = self.registers[register_name]
+            registers.append((register_name, len(ranges) - 1, address - ranges[-1][0], register.mask, register.shift))
+
+        plan = RegisterReadPlan(ranges, registers, unplanned_registers)
+        self._read_plans[key] = plan
+        return plan
+
+    def read_register_ranges(self, plan: RegisterReadPlan, safe_mode: bool | None = None) -> list[bytearray]:
+        """Reads the covering ranges of a read plan, one NOC read per range."""
+        range_data = []
+        for address, size, noc_id in plan.ranges:
+            data = bytearray(size)
+            self.location.noc_read(address, data, noc_id, safe_mode=safe_mode)
+            range_data.append(data)
+        return range_data
+
+    def read_registers(self, register_names: list[str], safe_mode: bool | None = None) -> dict[str, int]:
+        """
+        Reads many registers with a few bulk NOC reads instead of one read per register.
+
+        Args:
+            register_names (list[str]): Names of the registers to read.
+            safe_mode (bool | None): If True, apply additional safety checks to prevent access to known unsafe memory regions.
+
+        Returns:
+            dict[str, int]: Register values in the order of register_names.
+        """
+        plan = self.get_read_plan(register_names)
+        values = plan.decode(self.read_register_ranges(plan, safe_mode))
+        for register_name in plan.unplanned_registers:
+            values[register_name] = self.read_register(register_name, safe_mode)
+        return {register_name: values[register_name] for register_name in register_names}
+
     def write_register(self, register: str | RegisterDescription, value: int, safe_mode: bool | None = None) -> None:
         if isinstance(register, str):
             register = self.get_register_description(register)
@@ -0,0 +1,224 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""Collective run control: reset, halt and continue many RISC cores at (nearly) the same time.
+
+Calling ``set_reset_signal``, ``halt`` or ``cont`` on one ``RiscDebug`` after another staggers the
+cores by the cost of every call, which includes read-modify-write round trips and status checks.
+A ``RiscGroup`` splits every operation into two phases instead:
+
+1. Prepare: read the current soft-reset registers and debug states of all RISCs, compute the
+   register values to write, and load the debug command into ``RISC_DBG_CNTL_1`` of every core.
+2. Fire: issue only the writes that take effect, back to back, with nothing else in between.
+   RISCs of one core share a soft-reset register, so a reset change is one write per core.
+   A debug command is one trigger write per RISC (followed by a clearing write once all cores
+   were triggered).
+
+The host time after every firing write is recorded, so the result reports the skew between the
+first and the last RISC.
+
+The NOC interface used by ttexalens only has unicast writes, so the fire phase does not use
+multicast. RISCs without baby RISC debug registers fall back to per-RISC calls in the fire phase.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+import time
+from typing import Callable, Iterable
+
+from ttexalens import _lib_helpers
+from ttexalens.context import Context
+from ttexalens.coordinate import OnChipCoordinate
+from ttexalens.elf import ElfFile
+from ttexalens.exceptions import RiscHaltError, TTException
+from ttexalens.hardware.baby_risc_debug import (
+    COMMAND_CONTINUE,
+    COMMAND_DEBUG_MODE,
+    COMMAND_HALT,
+    REG_COMMAND,
+    BabyRiscDebug,
+)
+from ttexalens.hardware.risc_debug import RiscDebug, RiscLocation
+
+__all__ = [
+    "RiscGroup",
+    "RunControlResult",
+    "risc_group",
+]
+
+
+@dataclass
+class RunControlResult:
+    operation: str
+    issue_times_ns: dict[RiscLocation, int] = field(default_factory=dict)  # time.perf_counter_ns() after the write
+    transaction_count: int = 0  # NOC writes issued in the fire phase
+
+    @property
+    def risc_count(self) -> int:
+        return len(self.issue_times_ns)
+
+    @property
+    def skew_ns(self) -> int:
+        """Time between triggering the first and the last RISC, as seen by the host."""
+        if not self.issue_times_ns:
+            return 0
+        return max(self.issue_times_ns.values()) - min(self.issue_times_ns.values())
+
+    def __str__(self) -> str:
+        return (
+            f"{self.operation}: {self.risc_count} RISC(s), {self.transaction_count} write(s), "
+            f"skew {self.skew_ns / 1000:.1f} us"
+        )
+
+
+class RiscGroup:
+    """A set of RISC cores that are reset, halted and continued together."""
+
+    def __init__(self, risc_debugs: Iterable[RiscDebug]):
+        self.risc_debugs = list(risc_debugs)
+        if not self.risc_debugs:
+            raise TTException("RISC group is empty.")
+
+    def _partition(self, risc_debugs: list[RiscDebug]) -> tuple[list[BabyRiscDebug], list[RiscDebug]]:
+        baby = [risc_debug for risc_debug in risc_debugs if isinstance(risc_debug, BabyRiscDebug)]
+        return baby, [risc_debug for risc_debug in risc_debugs if not isinstance(risc_debug, BabyRiscDebug)]
+
+    def set_reset(self, value: bool) -> RunControlResult:
+        """Asserts (True) or deasserts (False) the soft reset of all RISCs with one write per core."""
+        result = RunControlResult("reset" if value else "release reset")
+        baby, other = self._partition(self.risc_debugs)
+
+        # Prepare: one read-modify-write value per soft-reset register.
+        registers: dict[tuple[OnChipCoordinate, int], tuple[int, list[BabyRiscDebug]]] = {}
+        for risc_debug in baby:
+            address = risc_debug.RISC_DBG_SOFT_RESET0
+            assert address is not None, "Register RISCV_DEBUG_REG_SOFT_RESET_0 does not have a NOC address"
+            key = (risc_debug.location, address)
+            if key not in registers:
+                registers[key] = (risc_debug.location.noc_read32(address), [])
+            reset_value, riscs = registers[key]
+            mask = 1 << risc_debug.baby_risc_info.reset_flag_shift
+            registers[key] = ((reset_value | mask) if value else (reset_value & ~mask), riscs + [risc_debug])
+
+        # Fire
+        for (location, address), (reset_value, riscs) in registers.items():
+            location.noc_write32(address, reset_value)
+            now = time.perf_counter_ns()
+            result.transaction_count += 1
+            for risc_debug in riscs:
+                result.issue_times_ns[risc_debug.risc_location] = now
+        self._fire_each(other, lambda risc_debug: risc_debug.set_reset_signal(value), result)
+        return result
+
+    def _fire_each(
+        self, risc_debugs: list[RiscDebug], operation: Callable[[RiscDebug], None], result: RunControlResult
+    ) -> None:
+        for risc_debug in risc_debugs:
+            operation(risc_debug)
+            result.issue_times_ns[risc_debug.risc_location] = time.perf_counter_ns()
+
+    def _debug_command(
+        self, operation: str, command: int, halted: bool, fallback: Callable[[RiscDebug], None]
+    ) -> RunControlResult:
+        # Sends a debug command to every RISC that is not already halted (halted=True) or running (halted=False).
+        # RISCs without baby RISC debug registers get fallback(risc_debug) instead.
+        result = RunControlResult(operation)
+        targets = []
+        for risc_debug in self.risc_debugs:
+            if risc_debug.is_in_reset():
+                raise TTException(f"Cannot {operation} {risc_debug.risc_location}: RISC is in reset.")
+            if not risc_debug.can_debug():
+                raise TTException(f"Cannot {operation} {risc_debug.risc_location}: RISC has no debug hardware.")
+            if risc_debug.is_halted() != halted:
+                targets.append(risc_debug)
+        baby, other = self._partition(targets)
+
+        # Prepare: load the command into the shared data register of every core, and sort RISCs of each core
+        # into rounds. A trigger write must be cleared before the next RISC of the same core is triggered.
+        cores: dict[tuple[OnChipCoordinate, int], list[BabyRiscDebug]] = {}
+        for risc_debug in baby:
+            if command == COMMAND_CONTINUE:
+                risc_debug.prepare_cont()
+            debug_hardware = risc_debug.debug_hardware
+            assert debug_hardware is not None
+            cores.setdefault((risc_debug.location, debug_hardware.RISC_DBG_CNTL0), []).append(risc_debug)
+        rounds: list[list[tuple[OnChipCoordinate, int, int, RiscLocation]]] = []
+        for (location, control_address), riscs in cores.items():
+            debug_hardware = riscs[0].debug_hardware
+            assert debug_hardware is not None
+            location.noc_write32(debug_hardware.RISC_DBG_CNTL1, COMMAND_DEBUG_MODE + command)
+            for round_index, risc_debug in enumerate(riscs):
+                assert risc_debug.debug_hardware is not None
+                if round_index == len(rounds):
+                    rounds.append([])
+                trigger = risc_debug.debug_hardware.CONTROL0_WRITE + REG_COMMAND
+                rounds[round_index].append((location, control_address, trigger, risc_debug.risc_location))
+
+        # Fire
+        for triggers in rounds:
+            for location, control_address, trigger, risc_location in triggers:
+                location.noc_write32(control_address, trigger)
+                result.issue_times_ns[risc_location] = time.perf_counter_ns()
+            for location, control_address, _, _ in triggers:
+                location.noc_write32(control_address, 0)
+            result.transaction_count += 2 * len(triggers)
+        self._fire_each(other, fallback, result)
+        return result
+
+    def halt(self) -> RunControlResult:
+        """Halts all RISCs that are running."""
+        result = self._debug_command("halt", COMMAND_HALT, True, lambda risc_debug: risc_debug.halt())
+        for risc_debug in self.risc_debugs:
+            if not risc_debug.is_halted():
+                raise RiscHaltError(risc_debug.risc_location.risc_name, risc_debug.risc_location.location)
+        return result
+
+    def cont(self) -> RunControlResult:
+        """Continues all RISCs that are halted."""
+        return self._debug_command("continue", COMMAND_CONTINUE, False, lambda risc_debug: risc_debug.cont())
+
+    def run_elf(self, elf_file: ElfFile, verify_write: bool = True) -> RunControlResult:
+        """Loads ``elf_file`` into every RISC while it is in reset, then takes all of them out of reset together."""
+        from ttexalens.elf_loader import ElfLoader
+
+        self.set_reset(True)
+        for risc_debug in self.risc_debugs:
+            ElfLoader(risc_debug).load_elf(elf_file, verify_write=verify_write)
+        result = self.set_reset(False)
+        for risc_debug in self.risc_debugs:
+            assert not risc_debug.is_in_reset(), f"RISC at location {risc_debug.risc_location} is still in reset."
+            if risc_debug.can_debug():
+                assert (
+                    not risc_debug.is_halted() or risc_debug.is_ebreak_hit()
+                ), f"RISC at location {risc_debug.risc_location} is still halted, but not because of ebreak."
+        return result
+
+
+@_lib_helpers.trace_api
+def risc_group(
+    locations: list[str | OnChipCoordinate],
+    risc_names: list[str] | None = None,
+    neo_id: int | None = None,
+    device_id: int = 0,
+    context: Context | None = None,
+) -> RiscGroup:
+    """
+    Creates a group of RISC cores that are reset, halted, continued or started with an ELF together, with minimal skew.
+
+    Args:
+        locations (list[str | OnChipCoordinate]): Cores of the group, given as strings or OnChipCoordinate objects.
+        risc_names (list[str], optional): RISC cores of every location (e.g. "brisc", "trisc0"). If None, all RISCs are included.
+        neo_id (int, optional): NEO ID of the RISC cores.
+        device_id (int, default 0): ID of the device the locations refer to.
+        context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
+
+    Returns:
+        RiscGroup: Group whose set_reset, halt, cont and run_elf report the achieved skew.
+    """
+    context = _lib_helpers.check_context(context)
+    coordinates = [_lib_helpers.convert_coordinate(location, device_id, context) for location in locations]
+    risc_debugs: list[RiscDebug] = []
+    for coordinate in coordinates:
+        names = risc_names if risc_names is not None else coordinate.noc_block.risc_names
+        risc_debugs.extend(coordinate.noc_block.get_risc_debug(risc_name, neo_id) for risc_name in names)
+    return RiscGroup(risc_debugs)
@@ -2,6 +2,8 @@
 
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
+from contextlib import contextmanager
+import copy
 from dataclasses import dataclass
 import inspect
 import io
@@ -13,9 +15,9 @@ from typing import TYPE_CHECKING
 from ttexalens import util as util
 import tt_umd
 
-
 if TYPE_CHECKING:
-    from ttexalens.context import Context
+    from ttexalens.context import Context, NocId
+    from ttexalens.server_sessions import SessionManager
     from ttexalens.umd_api import UmdApi
 
 
@@ -40,6 +42,44 @@ class FileAccessApi:
             return f.read()
 
 
+@Pyro5.api.expose
+class OperationApi:
+    """
+    Runs named library operations (see ttexalens.server_operations) in client sessions.
+    Failures are returned as data so that clients get them even for exception types Pyro5 cannot transport.
+    """
+
+    def __init__(self, sessions: SessionManager):
+        self.sessions = sessions
+
+    def list_operations(self) -> list[str]:
+        from ttexalens.server_operations import list_server_operations
+
+        return list_server_operations()
+
+    def open_session(self, noc_id: str | None = None, safe_mode: bool | None = None) -> str:
+        client = Pyro5.api.current_context.client_sock_addr
+        return self.sessions.open(noc_id, safe_mode, str(client) if client is not None else None)
+
+    def configure_session(self, session_id: str, noc_id: str, safe_mode: bool) -> None:
+        from ttexalens.context import to_noc_id
+
+        context = self.sessions.get(session_id).context
+        context.noc_id = to_noc_id(noc_id)
+        context.safe_mode = safe_mode
+
+    def close_session(self, session_id: str) -> None:
+        self.sessions.close(session_id)
+
+    def run(self, name: str, kwargs: dict, session_id: str | None = None) -> dict:
+        from ttexalens.exceptions import HardwareError
+
+        try:
+            return {"result": self.sessions.run(session_id, name, kwargs)}
+        except (Exception, HardwareError) as e:
+            return {"error": type(e).__name__, "message": str(e), "is_hardware_error": isinstance(e, HardwareError)}
+
+
 class TTExaLensServer:
     @dataclass
     class UmdRegisteredObject:
@@ -47,10 +87,16 @@ class TTExaLensServer:
         wrapped_object: object
         proxy: object | None = None
 
-    def __init__(self, port: int, umd_api: UmdApi, file_api: FileAccessApi):
+    def __init__(self, port: int, umd_api: UmdApi, file_api: FileAccessApi, context: Context | None = None):
+        from ttexalens.server_sessions import DeviceAccessScheduler, SessionManager
+
         self.port = port
         self.umd_api = umd_api
         self.file_api = file_api
+        # Device accesses of all clients go through the scheduler; see ttexalens.server_sessions.
+        self.scheduler = DeviceAccessScheduler()
+        self.sessions = SessionManager(context, self.scheduler) if context is not None else None
+        self.operation_api = OperationApi(self.sessions) if self.sessions is not None else None
         self.daemon: Pyro5.api.Daemon | None = None
         self.thread: threading.Thread | None = None
         self.umd_registered_objects: dict[int, TTExaLensServer.UmdRegisteredObject] = {}
@@ -65,12 +111,16 @@ class TTExaLensServer:
         self.umd_registered_objects[id(self.umd_api)] = TTExaLensServer.UmdRegisteredObject("umd_api", self.umd_api)
         self.daemon.register(umd_wrapper, objectId="umd_api")
         self.daemon.register(self.file_api, objectId="file_api")
+        if self.operation_api is not None:
+            self.daemon.register(self.operation_api, objectId="operation_api")
         self.thread = threading.Thread(target=self.daemon.requestLoop, daemon=True)
         self.thread.start()
 
     def stop(self):
         if self.daemon:
             self.daemon.unregister(self.file_api)
+            if self.operation_api is not None:
+                self.daemon.unregister(self.operation_api)
             with self.umd_registered_objects_lock:
                 for obj in self.umd_registered_objects.values():
                     self.daemon.unregister(obj.pyro5_id)
@@ -126,6 +176,10 @@ class TTExaLensServer:
         if cached is not None:
             return cached
 
+        from ttexalens.umd_device import UmdDevice
+
+        scheduled = issubclass(obj_type, UmdDevice)
+
         @Pyro5.api.expose
         class UmdApiWrapper:
             def __init__(self, obj, server: TTExaLensServer):
@@ -140,7 +194,10 @@ class TTExaLensServer:
                     return fset(self.obj, *args, **kwargs)
                 else:
                     assert method_name is not None
-                    result = getattr(self.obj, method_name)(*args, **kwargs)
+                    if scheduled:
+                        result = self.server.scheduler.call(self.obj.device_id, self.obj, method_name, args, kwargs)
+                    else:
+                        result = getattr(self.obj, method_name)(*args, **kwargs)
                 return self.server._wrap_result(result)
 
             return wrapper_method
@@ -257,7 +314,7 @@ Pyro5.configure.global_config.SERPENT_BYTES_REPR = True  # pyright: ignore[repor
 
 def start_server(port: int, context: Context):
     try:
-        server = TTExaLensServer(port, context.umd_api, context.file_api)
+        server = TTExaLensServer(port, context.umd_api, context.file_api, context)
         server.start()
         util.INFO(f"ttexalens-server listening on port {port}")
         return server
@@ -266,13 +323,57 @@ def start_server(port: int, context: Context):
         raise util.TTFatalException("Could not start ttexalens-server.")
 
 
-class RemoteUmdDevice:
+class _ThreadSafeProxy:
     """
-    Client-side adapter around a Pyro5 UmdDevice proxy.
+    Pyro5 proxies can only be used by the thread that owns them, one call at a time. This adapter keeps a small
+    pool of connections to the same remote object: every call borrows an idle connection (opening a new one while
+    the pool is not full) and hands its ownership to the calling thread. Worker threads therefore only wait for
+    each other when all connections of this remote object are busy, and never for calls to other devices.
     """
 
+    max_connections = 4
+
     def __init__(self, proxy):
         self._proxy = proxy
+        self._idle_proxies = [proxy]
+        self._connection_count = 1
+        self._pool_condition = threading.Condition()
+
+    @contextmanager
+    def _borrow(self):
+        with self._pool_condition:
+            while not self._idle_proxies and self._connection_count >= self.max_connections:
+                self._pool_condition.wait()
+            if self._idle_proxies:
+                proxy = self._idle_proxies.pop()
+            else:
+                # A copy of a proxy is a new, not yet connected proxy of the same remote object.
+                proxy = copy.copy(self._proxy)
+                self._connection_count += 1
+        try:
+            proxy._pyroClaimOwnership()
+            yield proxy
+        finally:
+            with self._pool_condition:
+                self._idle_proxies.append(proxy)
+                self._pool_condition.notify()
+
+    def _call(self, name: str, *args, **kwargs):
+        with self._borrow() as proxy:
+            return getattr(proxy, name)(*args, **kwargs)
+
+    def __getattr__(self, name):
+        with self._borrow() as proxy:
+            attribute = getattr(proxy, name)
+        if callable(attribute):
+            return lambda *args, **kwargs: self._call(name, *args, **kwargs)
+        return attribute
+
+
+class RemoteUmdDevice(_ThreadSafeProxy):
+    """
+    Client-side adapter around a Pyro5 UmdDevice proxy.
+    """
 
     def noc_read(
         self,
@@ -283,41 +384,25 @@ class RemoteUmdDevice:
         buffer: bytearray | memoryview,
         dma_threshold: int,
     ) -> None:
-        data = self._proxy.noc_read_bytes(noc_id, noc0_x, noc0_y, address, len(buffer), dma_threshold)
+        data = self._call("noc_read_bytes", noc_id, noc0_x, noc0_y, address, len(buffer), dma_threshold)
         # Pyro5/serpent returns bytes either as real bytes or as a base64-encoded dict.
         buffer[:] = serpent.tobytes(data) if isinstance(data, dict) else data
 
-    def __getattr__(self, name):
-        return getattr(self._proxy, name)
 
-
-class RemoteUmdApiWrapper:
+class RemoteUmdApiWrapper(_ThreadSafeProxy):
     """
     Client-side adapter around a Pyro5 UmdApi proxy.
     """
 
-    def __init__(self, proxy):
-        self._proxy = proxy
-
     def get_device(self, chip_id: int) -> RemoteUmdDevice:
-        return RemoteUmdDevice(self._proxy.get_device(chip_id))
-
-    def __getattr__(self, name):
-        return getattr(self._proxy, name)
+        return RemoteUmdDevice(self._call("get_device", chip_id))
 
 
-class FileAccessApiWrapper:
+class FileAccessApiWrapper(_ThreadSafeProxy):
     """
     A wrapper around the Pyro5 proxy to convert base64-encoded bytes back to bytes.
     """
 
-    def __init__(self, proxy):
-        self.proxy = proxy
-
-    def __getattr__(self, name):
-        function = getattr(self.proxy, name)
-        return lambda *args, **kwargs: function(*args, **kwargs)
-
     def is_local(self) -> bool:
         return False
 
@@ -326,11 +411,87 @@ class FileAccessApiWrapper:
         Handle get_binary by calling get_binary_content and wrapping result in BytesIO.
         """
         # Try to call get_binary_content which returns serializable data
-        data = self.proxy.get_binary_content(binary_path)
+        data = self._call("get_binary_content", binary_path)
         binary_data = serpent.tobytes(data)
         return io.BytesIO(binary_data)
 
 
+class RemoteOperationApi(_ThreadSafeProxy):
+    """
+    Client-side adapter around a Pyro5 OperationApi proxy. Operations run in a server session of this client,
+    opened on first use and kept in sync with the NOC and safe mode of the client's context.
+    """
+
+    def __init__(self, proxy):
+        super().__init__(proxy)
+        self._lock = threading.RLock()
+        self._session_id: str | None = None
+        self._session_options: tuple[str, bool] | None = None
+
+    def _session(self, noc_id: NocId, safe_mode: bool) -> str:
+        options = (noc_id.name, safe_mode)
+        with self._lock:
+            if self._session_id is None:
+                self._session_id = self._call("open_session", *options)
+            elif self._session_options != options:
+                self._call("configure_session", self._session_id, *options)
+            self._session_options = options
+            return self._session_id
+
+    def run(self, name: str, kwargs: dict, noc_id: NocId, safe_mode: bool):
+        from ttexalens.exceptions import HardwareError, TTException
+
+        response = self._call("run", name, kwargs, self._session(noc_id, safe_mode))
+        if "error" in response:
+            message = f"Server operation {name} failed with {response['error']}: {response['message']}"
+            if response["is_hardware_error"]:
+                raise HardwareError(message)
+            raise TTException(message)
+        return _decode_bytes(response["result"])
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session_id is not None:
+                self._call("close_session", self._session_id)
+            self._session_id = None
+            self._session_options = None
+
+    def __enter__(self) -> RemoteOperationApi:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __del__(self):
+        # The server also closes idle sessions, but closing here frees the session context right away.
+        if "_session_id" not in self.__dict__:
+            return  # __init__ did not finish
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+def _decode_bytes(value):
+    # Serpent sends bytes as base64-encoded dicts; turn them back into bytes anywhere in the result.
+    if isinstance(value, dict):
+        if set(value.keys()) == {"data", "encoding"} and value["encoding"] == "base64":
+            return serpent.tobytes(value)
+        return {key: _decode_bytes(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_decode_bytes(item) for item in value]
+    return value
+
+
+def connect_to_operation_api(server_host="localhost", port=5555) -> RemoteOperationApi:
+    pyro_operation_api_address = f"PYRO:operation_api@{server_host}:{port}"
+    if util.VERBOSE_ENABLED:
+        util.VERBOSE(f"Connecting operation API to ttexalens-server at {pyro_operation_api_address}...")
+    proxy = Pyro5.api.Proxy(pyro_operation_api_address)
+    proxy._pyroSerializer = "serpent"
+    return RemoteOperationApi(proxy)
+
+
 def connect_to_server(server_host="localhost", port=5555) -> tuple[UmdApi, FileAccessApi]:
     try:
         # Connect to UmdApi
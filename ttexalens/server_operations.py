@@ -0,0 +1,190 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""Named library operations that a ttexalens server runs against its own context.
+
+High-level operations such as a callstack walk or reading the Tensix state issue hundreds of
+small device accesses. Over a remote connection each of them is a round trip, so a client can
+instead ask the server to run the whole operation next to the device and send back only the
+result. Operations take and return plain data (ints, strings, bytes, lists and dicts), so they
+can be sent over the wire as they are. Locations are given as strings and ELF paths refer to
+files on the server, the same way remote ELF loading already reads them through ``file_api``.
+
+``run_server_operation`` runs the operation on the server when the context is connected to
+one, and locally otherwise, so callers get the same result either way.
+"""
+
+from __future__ import annotations
+from dataclasses import asdict
+from typing import Any, Callable
+
+from ttexalens import _lib_helpers
+from ttexalens import tt_exalens_lib as lib
+from ttexalens.context import Context
+from ttexalens.coordinate import OnChipCoordinate
+from ttexalens.exceptions import TTException
+
+__all__ = [
+    "execute_server_operation",
+    "is_exclusive_server_operation",
+    "list_server_operations",
+    "run_server_operation",
+    "server_operation",
+]
+
+_OPERATIONS: dict[str, Callable[..., Any]] = {}
+_EXCLUSIVE_OPERATIONS: set[str] = set()
+
+
+def server_operation(name: str, exclusive: bool = False) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Registers a function ``f(context, **kwargs)`` as the operation ``name``. Arguments and result must be plain data.
+
+    Operations that control RISC execution (halt, step, reset) should be ``exclusive``: a server shared by
+    several clients runs them while holding the device lock of their ``device_id`` argument.
+    """
+
+    def register(func: Callable[..., Any]) -> Callable[..., Any]:
+        if name in _OPERATIONS:
+            raise TTException(f"Server operation {name} is already registered.")
+        _OPERATIONS[name] = func
+        if exclusive:
+            _EXCLUSIVE_OPERATIONS.add(name)
+        return func
+
+    return register
+
+
+def list_server_operations() -> list[str]:
+    return sorted(_OPERATIONS)
+
+
+def is_exclusive_server_operation(name: str) -> bool:
+    return name in _EXCLUSIVE_OPERATIONS
+
+
+def execute_server_operation(context: Context, name: str, kwargs: dict[str, Any]) -> Any:
+    """Runs the operation ``name`` against ``context`` in this process."""
+    operation = _OPERATIONS.get(name)
+    if operation is None:
+        raise TTException(f"Unknown server operation {name}. Known operations: {', '.join(list_server_operations())}.")
+    return operation(context, **kwargs)
+
+
+@_lib_helpers.trace_api
+def run_server_operation(name: str, context: Context | None = None, **kwargs: Any) -> Any:
+    """
+    Runs a named library operation next to the device: on the server if the context is connected to one,
+    in this process otherwise. Use list_server_operations() to see the available operations.
+
+    Args:
+        name (str): Name of the operation (e.g. "callstack", "get_tensix_state").
+        context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
+        **kwargs: Arguments of the operation. They must be plain data: locations as strings, ELF files as paths on the server.
+
+    Returns:
+        Any: Result of the operation as plain data.
+    """
+    context = _lib_helpers.check_context(context)
+    if context.server_operations is not None:
+        return context.server_operations.run(name, kwargs, context.noc_id, context.safe_mode)
+    return execute_server_operation(context, name, kwargs)
+
+
+def _frame_to_dict(frame) -> dict[str, Any]:
+    file_info = frame.file_info
+    return {
+        "pc": frame.pc,
+        "function_name": frame.function_name,
+        "file": file_info.file if file_info is not None else None,
+        "line": file_info.line if file_info is not None else None,
+        "column": file_info.column if file_info is not None else None,
+    }
+
+
+@server_operation("read_from_device")
+def _read_from_device(
+    context: Context, location: str, addr: int, num_bytes: int = 4, device_id: int = 0, noc_id: int | None = None
+) -> bytes:
+    return lib.read_from_device(location, addr, device_id, num_bytes, context, noc_id)
+
+
+@server_operation("read_words_from_device")
+def _read_words_from_device(
+    context: Context, locations: list[str], addr: int, word_count: int = 1, device_id: int = 0
+) -> dict[str, list[int]]:
+    return {
+        location: lib.read_words_from_device(location, addr, device_id, word_count, context=context)
+        for location in locations
+    }
+
+
+@server_operation("read_register")
+def _read_register(
+    context: Context, location: str, registers: list[str], neo_id: int | None = None, device_id: int = 0
+) -> dict[str, int]:
+    return {
+        register: lib.read_register(location, register, neo_id=neo_id, device_id=device_id, context=context)
+        for register in registers
+    }
+
+
+@server_operation("get_tensix_state", exclusive=True)
+def _get_tensix_state(
+    context: Context, location: str, l1_address: int | None = None, device_id: int = 0
+) -> dict[str, Any]:
+    return asdict(lib.get_tensix_state(location, l1_address, device_id, context))
+
+
+@server_operation("callstack", exclusive=True)
+def _callstack(
+    context: Context,
+    location: str,
+    elfs: list[str] | str,
+    offsets: int | None | list[int | None] = None,
+    risc_name: str = "brisc",
+    neo_id: int | None = None,
+    max_depth: int = 100,
+    stop_on_main: bool = True,
+    device_id: int = 0,
+) -> list[dict[str, Any]]:
+    frames = lib.callstack(
+        location,
+        elfs,
+        offsets,
+        risc_name,
+        neo_id,
+        max_depth,
+        stop_on_main,
+        device_id,
+        context,
+        extract_variables=False,
+    )
+    return [_frame_to_dict(frame) for frame in frames]
+
+
+@server_operation("load_elf", exclusive=True)
+def _load_elf(
+    context: Context,
+    elf_file: str,
+    location: str | list[str | OnChipCoordinate],
+    risc_name: str,
+    neo_id: int | None = None,
+    device_id: int = 0,
+    verify_write: bool = True,
+) -> int | list[int] | None:
+    return lib.load_elf(
+        elf_file, location, risc_name, neo_id, device_id, context, return_start_address=True, verify_write=verify_write
+    )
+
+
+@server_operation("run_elf", exclusive=True)
+def _run_elf(
+    context: Context,
+    elf_file: str,
+    location: str | list[str | OnChipCoordinate],
+    risc_name: str,
+    neo_id: int | None = None,
+    device_id: int = 0,
+    verify_write: bool = True,
+) -> None:
+    lib.run_elf(elf_file, location, risc_name, neo_id, device_id, context, verify_write)
@@ -0,0 +1,339 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""Client sessions and device-access arbitration for a ttexalens server shared by several clients.
+
+Every client that runs operations on the server opens a ``ServerSession``. A session has its
+own ``Context`` on top of the server's UMD and file APIs, so NOC selection, safe mode, loaded
+devices and their caches are not shared with other clients. Sessions that were not used for
+``idle_timeout`` seconds are closed.
+
+All device accesses of all clients go through one ``DeviceAccessScheduler``: raw UMD calls of
+remote clients, and every access that an operation makes through its session context.
+
+- Writes and ARC messages run one at a time per device.
+- Operations that control RISC execution (halt, step, reset, ELF loading) run in an exclusive
+  section of their session. While it is held, reads and writes of every other owner wait, so a
+  halt/read/continue sequence of one client is not interleaved with accesses of another.
+- Reads run concurrently. A read that is identical to one already in flight waits for its
+  result instead of going to the device again. A read only joins another one if no write or
+  exclusive section started or finished on the device in the meantime, so it never returns
+  data older than a write that finished before it was issued.
+"""
+
+from __future__ import annotations
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Generator, Hashable, TypeVar
+import uuid
+
+from ttexalens.exceptions import TTException
+
+if TYPE_CHECKING:
+    from ttexalens.context import Context
+    from ttexalens.umd_api import UmdApi
+    from ttexalens.umd_device import UmdDevice
+
+__all__ = [
+    "DeviceAccessScheduler",
+    "ScheduledUmdApi",
+    "ScheduledUmdDevice",
+    "ServerSession",
+    "SessionManager",
+]
+
+T = TypeVar("T")
+
+# UmdDevice methods, by how they are scheduled.
+READ_METHODS = frozenset(["noc_read_bytes", "bar0_read32", "read_arc_telemetry_entry", "get_firmware_version"])
+WRITE_METHODS = frozenset(["noc_write", "bar0_write32", "arc_msg"])
+
+
+@dataclass
+class _InFlightRead:
+    generation: int
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Any = None
+    error: BaseException | None = None
+
+
+@dataclass
+class _DeviceState:
+    changed: threading.Condition  # shares the scheduler lock
+    write_lock: threading.Lock = field(default_factory=threading.Lock)
+    generation: int = 0  # incremented whenever a write or an exclusive section starts or finishes
+    exclusive_owner: Hashable | None = None
+    exclusive_depth: int = 0
+    accesses: int = 0  # reads and writes in progress outside of the exclusive section
+
+
+class DeviceAccessScheduler:
+    """Serializes conflicting device accesses of all clients and coalesces identical concurrent reads.
+
+    Accesses and exclusive sections are made on behalf of an owner (a session). Accesses of the owner of
+    an exclusive section run inside it, accesses of everybody else (including owner None) wait for it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._devices: dict[int, _DeviceState] = {}
+        self._in_flight: dict[tuple, _InFlightRead] = {}
+        self.read_count = 0
+        self.coalesced_read_count = 0
+        self.write_count = 0
+
+    def _device(self, device_id: int) -> _DeviceState:
+        # Caller must hold self._lock.
+        state = self._devices.get(device_id)
+        if state is None:
+            state = self._devices[device_id] = _DeviceState(threading.Condition(self._lock))
+        return state
+
+    def _is_blocked(self, state: _DeviceState, owner: Hashable | None) -> bool:
+        # Caller must hold self._lock.
+        return state.exclusive_depth > 0 and (owner is None or state.exclusive_owner != owner)
+
+    @contextmanager
+    def _access(self, device_id: int, owner: Hashable | None) -> Generator[_DeviceState, Any, None]:
+        # Waits for exclusive sections of other owners and counts the access until it finishes.
+        with self._lock:
+            state = self._device(device_id)
+            state.changed.wait_for(lambda: not self._is_blocked(state, owner))
+            inside = state.exclusive_depth > 0
+            if not inside:
+                state.accesses += 1
+        try:
+            yield state
+        finally:
+            if not inside:
+                with self._lock:
+                    state.accesses -= 1
+                    state.changed.notify_all()
+
+    def read(self, device_id: int, key: tuple, read: Callable[[], T], owner: Hashable | None = None) -> T:
+        """Runs ``read``, or waits for an identical in-flight read (same ``key``) and returns its result."""
+        key = (device_id, *key)
+        with self._access(device_id, owner) as state:
+            with self._lock:
+                entry = self._in_flight.get(key)
+                if entry is not None and entry.generation == state.generation and state.exclusive_depth == 0:
+                    self.coalesced_read_count += 1
+                    owner_of_read = False
+                else:
+                    entry = _InFlightRead(state.generation)
+                    self._in_flight[key] = entry
+                    self.read_count += 1
+                    owner_of_read = True
+            if not owner_of_read:
+                entry.done.wait()
+                if entry.error is not None:
+                    raise entry.error
+                return entry.result
+            try:
+                entry.result = read()
+                return entry.result
+            except BaseException as e:
+                entry.error = e
+                raise
+            finally:
+                with self._lock:
+                    if self._in_flight.get(key) is entry:
+                        del self._in_flight[key]
+                entry.done.set()
+
+    def write(self, device_id: int, write: Callable[[], T], owner: Hashable | None = None) -> T:
+        """Runs ``write`` after all other writes to the device finished."""
+        with self._access(device_id, owner) as state:
+            with state.write_lock:
+                with self._lock:
+                    self.write_count += 1
+                    state.generation += 1
+                try:
+                    return write()
+                finally:
+                    # Reads issued after the write finished must not join reads that started while it ran.
+                    with self._lock:
+                        state.generation += 1
+
+    @contextmanager
+    def exclusive(self, device_id: int, owner: Hashable) -> Generator[None, Any, None]:
+        """Runs a whole operation of ``owner`` without accesses of other owners in between. Reads in it are not coalesced."""
+        with self._lock:
+            state = self._device(device_id)
+            state.changed.wait_for(
+                lambda: state.exclusive_owner == owner or (state.exclusive_depth == 0 and state.accesses == 0)
+            )
+            state.exclusive_owner = owner
+            state.exclusive_depth += 1
+            state.generation += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                state.exclusive_depth -= 1
+                if state.exclusive_depth == 0:
+                    state.exclusive_owner = None
+                state.generation += 1
+                state.changed.notify_all()
+
+    def call(
+        self,
+        device_id: int,
+        obj: object,
+        method_name: str,
+        args: tuple,
+        kwargs: dict,
+        owner: Hashable | None = None,
+    ) -> Any:
+        """Calls ``obj.method_name(*args, **kwargs)`` of a UmdDevice, scheduled by the kind of the method."""
+        method = getattr(obj, method_name)
+        if method_name in READ_METHODS:
+            key = (method_name, *args, *sorted(kwargs.items()))
+            return self.read(device_id, key, lambda: method(*args, **kwargs), owner)
+        if method_name in WRITE_METHODS:
+            return self.write(device_id, lambda: method(*args, **kwargs), owner)
+        return method(*args, **kwargs)
+
+
+class ScheduledUmdDevice:
+    """UmdDevice whose reads and writes go through a DeviceAccessScheduler on behalf of ``owner``."""
+
+    def __init__(self, device: UmdDevice, scheduler: DeviceAccessScheduler, owner: Hashable):
+        self._device = device
+        self._scheduler = scheduler
+        self._owner = owner
+
+    def noc_read(
+        self, noc_id: Any, noc0_x: int, noc0_y: int, address: int, buffer: bytearray | memoryview, dma_threshold: int
+    ) -> None:
+        # Coalesced reads share their result, so read into a new buffer and copy it.
+        buffer[:] = self.noc_read_bytes(noc_id, noc0_x, noc0_y, address, len(buffer), dma_threshold)
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._device, name)
+        if name in READ_METHODS or name in WRITE_METHODS:
+            return lambda *args, **kwargs: self._scheduler.call(
+                self._device.device_id, self._device, name, args, kwargs, self._owner
+            )
+        return attribute
+
+
+class ScheduledUmdApi:
+    """UmdApi whose devices are ScheduledUmdDevices of ``owner``."""
+
+    def __init__(self, umd_api: UmdApi, scheduler: DeviceAccessScheduler, owner: Hashable):
+        self._umd_api = umd_api
+        self._scheduler = scheduler
+        self._owner = owner
+        self._devices: dict[int, ScheduledUmdDevice] = {}
+
+    def get_device(self, chip_id: int) -> ScheduledUmdDevice:
+        device = self._devices.get(chip_id)
+        if device is None:
+            device = self._devices[chip_id] = ScheduledUmdDevice(
+                self._umd_api.get_device(chip_id), self._scheduler, self._owner
+            )
+        return device
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._umd_api, name)
+
+
+@dataclass
+class ServerSession:
+    session_id: str
+    context: Context
+    client: str | None
+    opened: float = field(default_factory=time.time)
+    last_used: float = field(default_factory=time.time)
+    running: int = 0  # operations in progress; a running session is never idle
+
+
+# Owner of exclusive sections of operations that run in the server's own context.
+_SERVER_OWNER = "server"
+
+
+class SessionManager:
+    """Keeps the sessions of all clients of one server. Session contexts share the server's UMD and file APIs."""
+
+    def __init__(self, context: Context, scheduler: DeviceAccessScheduler, idle_timeout: float | None = 3600.0):
+        self.context = context
+        self.scheduler = scheduler
+        self.idle_timeout = idle_timeout  # None keeps sessions until they are closed
+        self._sessions: dict[str, ServerSession] = {}
+        self._lock = threading.Lock()
+
+    def open(self, noc_id: str | None = None, safe_mode: bool | None = None, client: str | None = None) -> str:
+        from ttexalens.context import Context, to_noc_id
+
+        self.close_idle()
+        session_id = uuid.uuid4().hex
+        context = Context(
+            ScheduledUmdApi(self.context.umd_api, self.scheduler, session_id),  # type: ignore[arg-type]
+            self.context.file_api,
+            short_name=self.context.short_name,
+            noc_id=to_noc_id(noc_id) if noc_id is not None else self.context.noc_id,
+            dma_read_threshold=self.context.dma_read_threshold,
+            dma_write_threshold=self.context.dma_write_threshold,
+            noc_failover=self.context.noc_failover,
+            safe_mode=safe_mode if safe_mode is not None else self.context.safe_mode,
+        )
+        session = ServerSession(session_id, context, client)
+        with self._lock:
+            self._sessions[session.session_id] = session
+        return session.session_id
+
+    def get(self, session_id: str) -> ServerSession:
+        with self._lock:
+            session = self._sessions.get(session_id)
+        if session is None:
+            raise TTException(f"Unknown session {session_id}. It was closed or expired after being idle.")
+        session.last_used = time.time()
+        return session
+
+    def close(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def close_idle(self) -> list[str]:
+        """Closes sessions that were not used for ``idle_timeout`` seconds and returns their IDs."""
+        if self.idle_timeout is None:
+            return []
+        deadline = time.time() - self.idle_timeout
+        with self._lock:
+            idle = [
+                session_id
+                for session_id, session in self._sessions.items()
+                if session.running == 0 and session.last_used < deadline
+            ]
+            for session_id in idle:
+                del self._sessions[session_id]
+        return idle
+
+    def sessions(self) -> list[ServerSession]:
+        with self._lock:
+            return list(self._sessions.values())
+
+    def run(self, session_id: str | None, name: str, kwargs: dict[str, Any]) -> Any:
+        """Runs a server operation in a session (the server's own context if None) under the scheduler."""
+        if session_id is None:
+            return self._run(self.context, _SERVER_OWNER, name, kwargs)
+        session = self.get(session_id)
+        with self._lock:
+            session.running += 1
+        try:
+            return self._run(session.context, session_id, name, kwargs)
+        finally:
+            with self._lock:
+                session.running -= 1
+            session.last_used = time.time()
+
+    def _run(self, context: Context, owner: str, name: str, kwargs: dict[str, Any]) -> Any:
+        from ttexalens.server_operations import execute_server_operation, is_exclusive_server_operation
+
+        if not is_exclusive_server_operation(name):
+            return execute_server_operation(context, name, kwargs)
+        with self.scheduler.exclusive(kwargs.get("device_id", 0), owner):
+            return execute_server_operation(context, name, kwargs)
@@ -0,0 +1,223 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""Background ARC telemetry polling.
+
+A ``TelemetryPoller`` reads a fixed set of telemetry tags from a set of devices
+on a background thread and keeps the most recent samples of every
+``(device_id, tag)`` pair in a fixed-size ring buffer. Readers never touch the
+device: they only copy samples out of the history under a lock.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+import threading
+import time
+from typing import Iterable
+
+from ttexalens import _lib_helpers
+from ttexalens.background_poller import BackgroundPoller
+from ttexalens.context import Context, NocId
+from ttexalens.exceptions import TTException
+
+__all__ = [
+    "TelemetryPoller",
+    "TelemetrySample",
+    "start_telemetry_poller",
+]
+
+
+@dataclass(frozen=True)
+class TelemetrySample:
+    timestamp: float  # time.time() when the entry was read
+    device_id: int
+    tag_name: str
+    value: int
+
+
+class TelemetryRingBuffer:
+    """Fixed-capacity ring buffer of samples; once full, the oldest sample is overwritten."""
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError(f"Ring buffer capacity must be greater than 0, got {capacity}.")
+        self._samples: list[TelemetrySample | None] = [None] * capacity
+        self._next = 0
+        self._count = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self._samples)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, sample: TelemetrySample) -> None:
+        self._samples[self._next] = sample
+        self._next = (self._next + 1) % len(self._samples)
+        self._count = min(self._count + 1, len(self._samples))
+
+    def latest(self) -> TelemetrySample | None:
+        if self._count == 0:
+            return None
+        return self._samples[(self._next - 1) % len(self._samples)]
+
+    def to_list(self, since: float | None = None) -> list[TelemetrySample]:
+        """Returns samples ordered from oldest to newest, optionally only those newer than ``since``."""
+        start = (self._next - self._count) % len(self._samples)
+        result: list[TelemetrySample] = []
+        for i in range(self._count):
+            sample = self._samples[(start + i) % len(self._samples)]
+            assert sample is not None
+            if since is None or sample.timestamp > since:
+                result.append(sample)
+        return result
+
+
+class TelemetryPoller(BackgroundPoller):
+    """Polls ARC telemetry tags of multiple devices at a fixed rate on a background thread.
+
+    Tag names are resolved against each device's ARC block once, when the poller is created,
+    so unknown tags and unsupported firmware are reported to the caller instead of the thread.
+    """
+
+    def __init__(
+        self,
+        context: Context,
+        tags: Iterable[str],
+        device_ids: Iterable[int] | None = None,
+        interval: float = 0.1,
+        history_size: int = 1000,
+        noc_id: NocId | None = None,
+    ):
+        from ttexalens.hardware.arc_block import CUTOFF_FIRMWARE_VERSION
+
+        if interval <= 0:
+            raise TTException(f"Polling interval must be greater than 0, got {interval}.")
+        super().__init__("Telemetry poller", interval)
+        self._context = context
+        self._history_size = history_size
+        self._noc_id = noc_id
+
+        # device_id -> [(tag_name, tag_id)]
+        self._tags: dict[int, list[tuple[str, int]]] = {}
+        tag_names = [tag.upper() for tag in tags]
+        if not tag_names:
+            raise TTException("At least one telemetry tag must be specified.")
+        for device_id in device_ids if device_ids is not None else context.device_ids:
+            device = context.find_device_by_id(device_id)
+            if device.firmware_version < CUTOFF_FIRMWARE_VERSION:
+                raise TTException(
+                    f"We no longer support ARC telemetry for firmware versions 18.3 and lower. Device {device.id} is running firmware version {device.firmware_version}"
+                )
+            resolved: list[tuple[str, int]] = []
+            for tag_name in tag_names:
+                tag_id = device.arc_block.get_telemetry_tag_id(tag_name)
+                if tag_id is None:
+                    raise TTException(f"Telemetry tag {tag_name} does not exist.")
+                resolved.append((tag_name, tag_id))
+            self._tags[device.id] = resolved
+
+        self._history: dict[tuple[int, str], TelemetryRingBuffer] = {
+            (device_id, tag_name): TelemetryRingBuffer(history_size)
+            for device_id, device_tags in self._tags.items()
+            for tag_name, _ in device_tags
+        }
+        self._history_lock = threading.Lock()
+
+    @property
+    def device_ids(self) -> list[int]:
+        return list(self._tags.keys())
+
+    @property
+    def tag_names(self) -> list[str]:
+        return list(dict.fromkeys(tag_name for device_tags in self._tags.values() for tag_name, _ in device_tags))
+
+    @property
+    def sample_count(self) -> int:
+        """Number of completed polling sweeps over all devices."""
+        return self._sweep_count
+
+    def poll_once(self) -> list[TelemetrySample]:
+        """Reads every configured tag on every device once and records the samples in history."""
+        samples: list[TelemetrySample] = []
+        for device_id, device_tags in self._tags.items():
+            device = self._context.find_device_by_id(device_id)
+            for tag_name, tag_id in device_tags:
+                try:
+                    value = device.read_arc_telemetry_entry(self._noc_id, tag_id)
+                except Exception:
+                    # Report each failing entry once; keep polling the rest.
+                    self._report_failed_read(
+                        (device_id, tag_name),
+                        f"Device {device_id}: failed to read telemetry tag {tag_name}, skipping it.",
+                    )
+                    continue
+                samples.append(TelemetrySample(time.time(), device_id, tag_name, value))
+        with self._history_lock:
+            for sample in samples:
+                self._history[(sample.device_id, sample.tag_name)].append(sample)
+            self._sweep_count += 1
+        return samples
+
+    def _sweep(self) -> list[TelemetrySample]:
+        return self.poll_once()
+
+    def history(self, device_id: int, tag_name: str, since: float | None = None) -> list[TelemetrySample]:
+        """Returns recorded samples of one tag on one device, oldest first."""
+        key = (device_id, tag_name.upper())
+        if key not in self._history:
+            raise TTException(f"Telemetry tag {tag_name} on device {device_id} is not polled.")
+        with self._history_lock:
+            return self._history[key].to_list(since)
+
+    def latest(self) -> dict[tuple[int, str], TelemetrySample]:
+        """Returns the most recent sample of every polled (device_id, tag_name) pair."""
+        result: dict[tuple[int, str], TelemetrySample] = {}
+        with self._history_lock:
+            for key, buffer in self._history.items():
+                sample = buffer.latest()
+                if sample is not None:
+                    result[key] = sample
+        return result
+
+    def wait_for_samples(self, count: int = 1, timeout: float | None = None) -> bool:
+        """Blocks until at least ``count`` polling sweeps have completed. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._sweep_count < count:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            if not self.is_running:
+                return self._sweep_count >= count
+            time.sleep(min(self._interval, 0.01))
+        return True
+
+
+@_lib_helpers.trace_api
+def start_telemetry_poller(
+    tags: list[str],
+    device_ids: list[int] | None = None,
+    interval: float = 0.1,
+    history_size: int = 1000,
+    context: Context | None = None,
+    noc_id: NocId | int | None = None,
+) -> TelemetryPoller:
+    """
+    Starts polling ARC telemetry tags on a background thread and returns the running poller.
+    Call stop() on the returned poller (or use it as a context manager) to end polling.
+
+    Args:
+        tags (list[str]): Names of telemetry tags to poll (e.g. "ASIC_TEMPERATURE", "AICLK").
+        device_ids (list[int], optional): IDs of devices to poll. If None, all devices are polled.
+        interval (float, default 0.1): Time between two polling sweeps in seconds.
+        history_size (int, default 1000): Number of samples kept per device and tag.
+        context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
+        noc_id (NocId, int, optional): NOC ID to use. If None, it will be set based on context initialization.
+
+    Returns:
+        TelemetryPoller: Running poller that exposes the recorded history.
+    """
+    context = _lib_helpers.check_context(context)
+    resolved_noc_id = _lib_helpers.check_noc_id(noc_id, context) if noc_id is not None else None
+    poller = TelemetryPoller(context, tags, device_ids, interval, history_size, resolved_noc_id)
+    return poller.start()
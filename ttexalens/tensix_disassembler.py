@@ -0,0 +1,179 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""Disassembler for 32-bit Tensix instruction words.
+
+The per-architecture ``tensix_ops`` modules only encode instructions: ``TT_OP_<MNEMONIC>(field, ...)``
+puts an 8-bit opcode in the top byte and every field at a fixed bit offset in the lower 24 bits.
+``TensixDisassembler`` calls every encoder once per field to find where the field lands, and builds a
+table indexed by opcode from that. The table therefore always matches the encoders of the device's
+architecture, and decoding a word is one table lookup plus a shift and a mask per field.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+import inspect
+import struct
+from types import ModuleType
+from typing import Sequence
+
+from ttexalens import _lib_helpers
+from ttexalens.context import Context
+from ttexalens.exceptions import TTException
+
+__all__ = [
+    "TensixDisassembler",
+    "TensixInstruction",
+    "TensixInstructionField",
+    "TensixInstructionFormat",
+    "disassemble_tensix_instructions",
+]
+
+_ENCODER_PREFIX = "TT_OP_"
+_PARAMS_BITS = 24
+
+
+@dataclass(frozen=True)
+class TensixInstructionField:
+    name: str
+    shift: int
+    width: int
+
+    @property
+    def mask(self) -> int:
+        return (1 << self.width) - 1
+
+
+@dataclass(frozen=True)
+class TensixInstructionFormat:
+    mnemonic: str
+    opcode: int
+    fields: tuple[TensixInstructionField, ...]  # in the argument order of the encoder
+
+    def decode_fields(self, word: int) -> dict[str, int]:
+        return {field.name: (word >> field.shift) & field.mask for field in self.fields}
+
+
+@dataclass(frozen=True)
+class TensixInstruction:
+    address: int
+    word: int
+    format: TensixInstructionFormat | None  # None if the opcode is unknown
+    fields: dict[str, int]
+
+    @property
+    def opcode(self) -> int:
+        return self.word >> _PARAMS_BITS
+
+    @property
+    def mnemonic(self) -> str:
+        return self.format.mnemonic if self.format is not None else f"UNKNOWN_0x{self.opcode:02x}"
+
+    def operands_str(self) -> str:
+        if self.format is None:
+            return f"0x{self.word & ((1 << _PARAMS_BITS) - 1):06x}"
+        return ", ".join(f"{name}={value}" for name, value in self.fields.items())
+
+    def __str__(self) -> str:
+        return f"{self.mnemonic} {self.operands_str()}".rstrip()
+
+
+def _encode(encoder, args: Sequence[int]) -> int:
+    return int.from_bytes(encoder(*args), byteorder="little")
+
+
+def _probe_format(mnemonic: str, encoder) -> TensixInstructionFormat:
+    field_names = list(inspect.signature(encoder).parameters)
+    base = _encode(encoder, [0] * len(field_names))
+    if base & ((1 << _PARAMS_BITS) - 1) != 0:
+        raise TTException(f"Encoder {_ENCODER_PREFIX}{mnemonic} sets parameter bits when all fields are zero.")
+
+    shifts: dict[str, int] = {}
+    for index, name in enumerate(field_names):
+        args = [0] * len(field_names)
+        args[index] = 1
+        bit = _encode(encoder, args) ^ base
+        if bit == 0:
+            continue  # Field is not encoded
+        if bit & (bit - 1) != 0:
+            raise TTException(f"Field {name} of {_ENCODER_PREFIX}{mnemonic} is not a plain shifted value.")
+        shifts[name] = bit.bit_length() - 1
+
+    # A field extends up to the next field above it, or to the opcode.
+    ordered = sorted(set(shifts.values()))
+    limits = {shift: next_shift for shift, next_shift in zip(ordered, ordered[1:] + [_PARAMS_BITS])}
+    fields = tuple(TensixInstructionField(name, shift, limits[shift] - shift) for name, shift in shifts.items())
+    return TensixInstructionFormat(mnemonic, base >> _PARAMS_BITS, fields)
+
+
+class TensixDisassembler:
+    """Decodes Tensix instruction words using a table built from a ``tensix_ops`` module."""
+
+    def __init__(self, ops: ModuleType):
+        self.formats: dict[int, TensixInstructionFormat] = {}
+        for name in sorted(dir(ops)):
+            encoder = getattr(ops, name)
+            if not name.startswith(_ENCODER_PREFIX) or not callable(encoder):
+                continue
+            instruction_format = _probe_format(name[len(_ENCODER_PREFIX) :], encoder)
+            existing = self.formats.get(instruction_format.opcode)
+            if existing is not None:
+                raise TTException(
+                    f"Opcode 0x{instruction_format.opcode:02x} is used by both {existing.mnemonic} and {instruction_format.mnemonic}."
+                )
+            self.formats[instruction_format.opcode] = instruction_format
+        self.by_mnemonic = {
+            instruction_format.mnemonic: instruction_format for instruction_format in self.formats.values()
+        }
+
+        # Flat lookup table: opcode -> (format, ((name, shift, mask), ...)).
+        self._table: list[tuple[TensixInstructionFormat, tuple[tuple[str, int, int], ...]] | None] = [None] * 256
+        for opcode, instruction_format in self.formats.items():
+            self._table[opcode] = (
+                instruction_format,
+                tuple((field.name, field.shift, field.mask) for field in instruction_format.fields),
+            )
+
+    def decode(self, word: int, address: int = 0) -> TensixInstruction:
+        entry = self._table[(word >> _PARAMS_BITS) & 0xFF]
+        if entry is None:
+            return TensixInstruction(address, word, None, {})
+        instruction_format, fields = entry
+        return TensixInstruction(
+            address, word, instruction_format, {name: (word >> shift) & mask for name, shift, mask in fields}
+        )
+
+    def disassemble(self, data: bytes | bytearray | Sequence[int], address: int = 0) -> list[TensixInstruction]:
+        """Decodes a buffer of little-endian instruction words, or a sequence of words, starting at ``address``."""
+        if isinstance(data, (bytes, bytearray)):
+            if len(data) % 4 != 0:
+                raise TTException(f"Instruction buffer size must be a multiple of 4 bytes, got {len(data)}.")
+            words: Sequence[int] = [word for (word,) in struct.iter_unpack("<I", data)]
+        else:
+            words = data
+        decode = self.decode
+        return [decode(word, address + 4 * index) for index, word in enumerate(words)]
+
+
+@_lib_helpers.trace_api
+def disassemble_tensix_instructions(
+    data: bytes | bytearray | Sequence[int], address: int = 0, device_id: int = 0, context: Context | None = None
+) -> list[TensixInstruction]:
+    """
+    Decodes Tensix instruction words (e.g. from a kernel binary, a replay buffer or the debug bus) into mnemonics and fields.
+
+    Args:
+        data (bytes | list[int]): Little-endian instruction buffer or a list of 32-bit instruction words.
+        address (int, default 0): Address of the first instruction, used only to label the results.
+        device_id (int, default 0): ID of the device whose architecture defines the instruction set.
+        context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
+
+    Returns:
+        list[TensixInstruction]: Decoded instructions. Unknown opcodes have format None.
+    """
+    context = _lib_helpers.check_context(context)
+    device = context.find_device_by_id(device_id)
+    instructions = getattr(device, "instructions", None)
+    if instructions is None:
+        raise TTException(f"Tensix instructions are not defined for device {device_id} ({device._arch}).")
+    return instructions.disassembler.disassemble(data, address)
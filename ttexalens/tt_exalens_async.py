@@ -0,0 +1,127 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""Asyncio facade over the TTExaLens library API.
+
+``AsyncTTExaLens`` exposes the functions of ``tt_exalens_lib`` as coroutines that run
+on a private pool of worker threads, so they do not block the event loop and can be
+overlapped with ``asyncio.gather``. Every call resolves its NOC up front and the device
+layer selects it on the worker thread before touching UMD, so concurrent coroutines
+using different NOCs do not interfere through the thread-local NOC selection.
+
+Cancelling a coroutine whose call has not started yet removes it from the queue;
+a call that is already running on a worker completes and its result is discarded.
+"""
+
+from __future__ import annotations
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+import inspect
+from typing import Any, Awaitable, Callable, Iterable, Literal, TypeVar, overload
+
+from ttexalens import tt_exalens_lib as lib
+from ttexalens._lib_helpers import check_context, check_noc_id
+from ttexalens.context import Context, NocId
+
+__all__ = [
+    "AsyncTTExaLens",
+]
+
+T = TypeVar("T")
+
+
+def _async_api(func: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    """Turns a library function into a coroutine method that fills in the facade's context and NOC."""
+    signature = inspect.signature(func)
+    assert "context" in signature.parameters, f"{func.__name__} must accept a context argument"
+    has_noc_id = "noc_id" in signature.parameters
+
+    @wraps(func)
+    async def wrapper(self: AsyncTTExaLens, *args: Any, **kwargs: Any) -> T:
+        bound = signature.bind(*args, **kwargs)
+        if bound.arguments.get("context") is None:
+            bound.arguments["context"] = self.context
+        if has_noc_id and bound.arguments.get("noc_id") is None:
+            bound.arguments["noc_id"] = self.noc_id
+        return await self.run(func, *bound.args, **bound.kwargs)
+
+    return wrapper
+
+
+class AsyncTTExaLens:
+    """Coroutine versions of the library API bound to one context.
+
+    Args:
+        context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
+        max_workers (int, optional): Number of worker threads. If None, one worker per device (at least 4) is used.
+        noc_id (NocId, int, optional): NOC ID used by calls that do not pass one. If None, the context's NOC is used.
+    """
+
+    def __init__(
+        self,
+        context: Context | None = None,
+        max_workers: int | None = None,
+        noc_id: NocId | int | None = None,
+    ):
+        self.context = check_context(context)
+        self.noc_id = check_noc_id(noc_id, self.context)
+        if max_workers is None:
+            max_workers = max(4, len(self.context.device_ids))
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ttexalens-async")
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Runs any blocking callable on the worker pool and returns its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    @overload
+    async def gather(self, calls: Iterable[Awaitable[T]], return_exceptions: Literal[False] = False) -> list[T]: ...
+
+    @overload
+    async def gather(
+        self, calls: Iterable[Awaitable[T]], return_exceptions: Literal[True]
+    ) -> list[T | BaseException]: ...
+
+    async def gather(
+        self, calls: Iterable[Awaitable[T]], return_exceptions: bool = False
+    ) -> list[T] | list[T | BaseException]:
+        """Awaits a batch of calls concurrently. If one fails (and return_exceptions is False), the rest are cancelled."""
+        tasks = [asyncio.ensure_future(call) for call in calls]
+        try:
+            return list(await asyncio.gather(*tasks, return_exceptions=return_exceptions))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    def close(self, wait: bool = True) -> None:
+        """Stops the worker pool. Calls that have not started yet are cancelled."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    async def __aenter__(self) -> AsyncTTExaLens:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, tb) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    read_word_from_device = _async_api(lib.read_word_from_device)
+    read_words_from_device = _async_api(lib.read_words_from_device)
+    read_from_device = _async_api(lib.read_from_device)
+    write_words_to_device = _async_api(lib.write_words_to_device)
+    write_to_device = _async_api(lib.write_to_device)
+    load_elf = _async_api(lib.load_elf)
+    run_elf = _async_api(lib.run_elf)
+    arc_msg = _async_api(lib.arc_msg)
+    read_arc_telemetry_entry = _async_api(lib.read_arc_telemetry_entry)
+    read_register = _async_api(lib.read_register)
+    write_register = _async_api(lib.write_register)
+    parse_elf = _async_api(lib.parse_elf)
+    get_global = _async_api(lib.get_global)
+    gather_global = _async_api(lib.gather_global)
+    top_callstack = _async_api(lib.top_callstack)
+    callstack = _async_api(lib.callstack)
+    coverage = _async_api(lib.coverage)
+    read_riscv_memory = _async_api(lib.read_riscv_memory)
+    write_riscv_memory = _async_api(lib.write_riscv_memory)
+    get_tensix_state = _async_api(lib.get_tensix_state)
@@ -4,7 +4,7 @@
 import atexit
 
 from ttexalens.umd_api import UmdApi, local_init
-from ttexalens.server import FileAccessApi, connect_to_server
+from ttexalens.server import FileAccessApi, connect_to_operation_api, connect_to_server
 from ttexalens import util as util
 from ttexalens.context import Context, NocId, to_noc_id
 
@@ -68,7 +68,9 @@ def init_ttexalens_remote(
 
     umd_api, file_api = connect_to_server(ip_address, port)
     noc_id = umd_api.initialization_noc_id
-    return load_context(umd_api, file_api, noc_id, noc_failover, safe_mode)
+    context = load_context(umd_api, file_api, noc_id, noc_failover, safe_mode)
+    context.server_operations = connect_to_operation_api(ip_address, port)
+    return context
 
 
 def load_context(
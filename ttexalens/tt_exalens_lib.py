@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: © 2024 Tenstorrent AI ULC
 
 # SPDX-License-Identifier: Apache-2.0
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import datetime
 import os
@@ -21,7 +22,7 @@ from ttexalens.context import Context, NocId
 from ttexalens.elf import read_elf, CallstackEntry, ElfFile, ElfVariable, get_callstack, get_frame_callstack
 from ttexalens.exceptions import TTException
 from ttexalens.hardware.rocket_core_debug import RocketCoreDebug
-from ttexalens.memory_access import create_memory_access
+from ttexalens.memory_access import NO_MEMORY_ACCESS, FixedMemoryAccess, MemoryAccess, create_memory_access
 
 
 @trace_api
@@ -297,7 +298,7 @@ def run_elf(
         context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
         verify_write (bool, default True): If True, verifies that the ELF was written correctly to the device.
     """
-    from ttexalens.elf_loader import ElfLoader
+    from ttexalens.run_control import RiscGroup
 
     locations: list[OnChipCoordinate] = []
     if isinstance(location, OnChipCoordinate):
@@ -323,10 +324,9 @@ def run_elf(
         elf_file = read_elf(context.file_api, elf_file, require_debug_symbols=False)
 
     assert locations, "No valid core locations provided."
-    for loc in locations:
-        risc_debug = loc.noc_block.get_risc_debug(risc_name, neo_id)
-        elf_loader = ElfLoader(risc_debug)
-        elf_loader.run_elf(elf_file, verify_write=verify_write)
+    # Load all cores first and take them out of reset together, so they start with minimal skew.
+    risc_debugs = [loc.noc_block.get_risc_debug(risc_name, neo_id) for loc in locations]
+    RiscGroup(risc_debugs).run_elf(elf_file, verify_write=verify_write)
 
 
 @trace_api
@@ -572,6 +572,92 @@ def get_global(
     return parsed_elf.get_global(name, memory_access)
 
 
+@trace_api
+def gather_global(
+    locations: list[str | OnChipCoordinate],
+    elf: str | ElfFile,
+    name: str,
+    risc_names: list[str] | str,
+    neo_id: int | None = None,
+    device_id: int = 0,
+    context: Context | None = None,
+    safe_mode: bool | None = None,
+    max_workers: int = 8,
+    skip_errors: bool = False,
+) -> dict[tuple[OnChipCoordinate, str], ElfVariable]:
+    """
+    Reads the same global (or static) variable from many cores. The symbol is resolved once
+    and its whole address range is read from every (location, RISC) pair with a single read each.
+    Returned variables are snapshots: they decode the bytes read during the gather and are read-only.
+
+    Args:
+        locations (list[str | OnChipCoordinate]): Locations to read from, as strings or OnChipCoordinate objects.
+        elf (str | ElfFile): ELF file (path or already-parsed) that defines the variable. All cores must run this ELF.
+        name (str): Name of the variable to resolve.
+        risc_names (list[str] | str): RISC-V core name(s) to read from on every location (e.g. "brisc", "trisc0", etc.).
+        neo_id (int | None, optional): NEO ID of the RISC-V cores.
+        device_id (int, optional): ID of the device the locations refer to. Default 0.
+        context (Context | None, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
+        safe_mode (bool | None, optional): Whether to use safe mode for memory access. If None, it is decided based on context.
+        max_workers (int, optional): Number of cores read at the same time. RISCs of one core are read one after another. Default 8.
+        skip_errors (bool, optional): If True, cores that cannot be read are reported with a warning and left out of the result. Default False.
+
+    Returns:
+        dict[tuple[OnChipCoordinate, str], ElfVariable]: Snapshot of the variable per (location, risc_name).
+    """
+    context = check_context(context)
+    coordinates = [convert_coordinate(location, device_id, context) for location in locations]
+    parsed_elf = parse_elf(elf, context) if isinstance(elf, str) else elf
+    if isinstance(risc_names, str):
+        risc_names = [risc_names]
+
+    layout = parsed_elf.get_global(name, NO_MEMORY_ACCESS)
+    address = layout.get_address()
+    size = layout.get_size()
+
+    # Memory accesses are created up front so that invalid RISC names fail before any read is issued.
+    # Reading private memory halts the RISC through the debug interface its core shares with the other RISCs,
+    # so the RISCs of one core are read one after another by the same worker.
+    groups: dict[OnChipCoordinate, list[tuple[tuple[OnChipCoordinate, str], MemoryAccess]]] = {}
+    for coordinate in coordinates:
+        group = groups.setdefault(coordinate, [])
+        for risc_name in risc_names:
+            risc_debug = coordinate.noc_block.get_risc_debug(risc_name, neo_id)
+            group.append(((coordinate, risc_name), create_memory_access(risc_debug, safe_mode=safe_mode)))
+
+    def _read_group(
+        group: list[tuple[tuple[OnChipCoordinate, str], MemoryAccess]],
+    ) -> list[tuple[tuple[OnChipCoordinate, str], bytes | Exception]]:
+        data: list[tuple[tuple[OnChipCoordinate, str], bytes | Exception]] = []
+        for key, memory_access in group:
+            buffer = bytearray(size)
+            try:
+                memory_access.read(address, buffer)
+            except Exception as e:
+                if not skip_errors:
+                    raise
+                data.append((key, e))
+                continue
+            data.append((key, bytes(buffer)))
+        return data
+
+    if max_workers > 1 and len(groups) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(groups)), thread_name_prefix="ttexalens-gather"
+        ) as executor:
+            results = list(executor.map(_read_group, groups.values()))
+    else:
+        results = [_read_group(group) for group in groups.values()]
+
+    result: dict[tuple[OnChipCoordinate, str], ElfVariable] = {}
+    for key, data in (item for group_result in results for item in group_result):
+        if isinstance(data, Exception):
+            util.WARN(f"Failed to read {name} from {key[1]} at {key[0].to_user_str()}: {data}")
+            continue
+        result[key] = ElfVariable(layout.type_die, address, FixedMemoryAccess(data, address))
+    return result
+
+
 @trace_api
 def top_callstack(
     pc: int,
@@ -2,13 +2,17 @@
 
 # SPDX-License-Identifier: Apache-2.0
 import datetime
-import traceback
-from typing import Sequence
+import time
+from dataclasses import asdict
+from typing import Any, Callable, Sequence, TypeVar
 import tt_umd
-from ttexalens import util
+from ttexalens import noc_profiler, util
+from ttexalens.eth_routing import EthLinkRouter
 from ttexalens.exceptions import TimeoutDeviceRegisterError
 from ttexalens.umd_api import UmdApi
 
+T = TypeVar("T")
+
 
 class UmdDevice:
     def __init__(
@@ -38,16 +42,23 @@ class UmdDevice:
         self._is_simulation = is_simulation
         self.__device_coords = UmdDevice.initialize_device_coords_cache(self._soc_descriptor, self._arch)
 
-        # On T3K we observed slower communication over default active ETH, so we try to switch to another active ETH if available.
-        if (
-            device.is_remote()
-            and cluster_descriptor is not None
-            and cluster_descriptor.get_board_type(device_id) == tt_umd.BoardType.N300
-        ):
-            if len(active_eth_coords_on_mmio_chip) > 1:
+        # Remote transfers are routed over all active ETH cores that connect the MMIO chip to this device.
+        self.__eth_router: EthLinkRouter | None = None
+        if device.is_remote() and not is_simulation and len(active_eth_coords_on_mmio_chip) > 0:
+            # On T3K we observed slower communication over default active ETH, so we prefer another active ETH if available.
+            if (
+                cluster_descriptor is not None
+                and cluster_descriptor.get_board_type(device_id) == tt_umd.BoardType.N300
+                and len(active_eth_coords_on_mmio_chip) > 1
+            ):
                 self._active_eth_coords_on_mmio_chip = (
                     active_eth_coords_on_mmio_chip[1:] + active_eth_coords_on_mmio_chip[:1]
                 )
+            self.__eth_router = EthLinkRouter(
+                self._active_eth_coords_on_mmio_chip,
+                self.__select_remote_transfer_eth_core,
+                passthrough_errors=(TimeoutDeviceRegisterError, tt_umd.SigbusError),
+            )
             self.__configure_working_active_eth()
 
     @staticmethod
@@ -118,22 +129,26 @@ class UmdDevice:
     def __select_noc_id(self, noc_id: tt_umd.NocId):
         UmdApi.select_noc_id(noc_id, self._arch)
 
+    def __select_remote_transfer_eth_core(self, translated_coord: tuple[int, int]):
+        self.__device.get_remote_communication().set_remote_transfer_ethernet_cores([translated_coord])
+
     def __configure_working_active_eth(self):
+        # Finds a working active ETH core with a small read. The others are measured when transfers first use them.
+        assert self.__eth_router is not None
         tensix_coord = tt_umd.CoreCoord(0, 0, tt_umd.CoreType.TENSIX, tt_umd.CoordSystem.LOGICAL)
         tensix_translated_coord = self._soc_descriptor.translate_chip_coord_to_translated_coord(tensix_coord)
         buffer = bytearray(4)
-        for translated_coord in self._active_eth_coords_on_mmio_chip:
-            self.__device.get_remote_communication().set_remote_transfer_ethernet_cores([translated_coord])
-            try:
-                self.__read_from_device_reg(tensix_translated_coord, 0, buffer, 8)
-                return
-            except Exception:
-                if util.DEBUG_ENABLED:
-                    util.DEBUG(
-                        f"Active ETH core {translated_coord} not working, trying next:\n{traceback.format_exc()}"
-                    )
-                continue
-        raise RuntimeError("Failed to configure working active Ethernet")  # TODO: Improve error message
+        if not self.__eth_router.probe(lambda: self.__read_from_device_reg(tensix_translated_coord, 0, buffer, 8)):
+            raise RuntimeError(
+                f"Failed to configure working active Ethernet for device {self._device_id}: none of the active ETH cores "
+                f"{self._active_eth_coords_on_mmio_chip} (translated coordinates) on the MMIO chip responded."
+            )
+
+    def __run_remote(self, operation: Callable[[], T]) -> T:
+        # Runs an operation that talks to the device through remote communication (e.g. ARC telemetry).
+        if self.__eth_router is None:
+            return operation()
+        return self.__eth_router.run(operation)
 
     def __convert_noc0_to_device_coords(self, noc_id: tt_umd.NocId, noc0_x: int, noc0_y: int):
         noc_coords = self.__device_coords[int(noc_id)]
@@ -143,8 +158,12 @@ class UmdDevice:
     def __read_from_device_reg(
         self, coord: tt_umd.CoreCoord, address: int, buffer: bytearray | memoryview, dma_threshold: int
     ) -> None:
+        profiler = noc_profiler.get_active_profiler()
+        start = time.perf_counter_ns() if profiler is not None else 0
+
         # Check if we can use DMA read
-        if len(buffer) >= dma_threshold and self.can_use_dma:
+        use_dma = len(buffer) >= dma_threshold and self.can_use_dma
+        if use_dma:
             self.__device.dma_read_from_device(0, coord.x, coord.y, address, buffer)
         else:
             try:
@@ -162,11 +181,18 @@ class UmdDevice:
                 # Translate the UMD error into a TimeoutDeviceRegisterError and raise it
                 raise TimeoutDeviceRegisterError(self.device_id, translated_coord, address, len(buffer), True, error)
 
+        if profiler is not None:
+            profiler.record_transaction("read", len(buffer), use_dma, time.perf_counter_ns() - start)
+
     def __write_to_device_reg(
         self, coord: tt_umd.CoreCoord, address: int, data: bytes | bytearray | memoryview, dma_threshold: int
     ):
+        profiler = noc_profiler.get_active_profiler()
+        start = time.perf_counter_ns() if profiler is not None else 0
+
         # Check if we can use DMA write
-        if len(data) >= dma_threshold and self.can_use_dma:
+        use_dma = len(data) >= dma_threshold and self.can_use_dma
+        if use_dma:
             self.__device.dma_write_to_device(coord.x, coord.y, address, data)
         else:
             try:
@@ -182,6 +208,9 @@ class UmdDevice:
                         translated_coord = coord
                 raise TimeoutDeviceRegisterError(self.device_id, translated_coord, address, len(data), False, error)
 
+        if profiler is not None:
+            profiler.record_transaction("write", len(data), use_dma, time.perf_counter_ns() - start)
+
     def __read_from_device_reg_unaligned_helper(
         self,
         coord: tt_umd.CoreCoord,
@@ -232,17 +261,14 @@ class UmdDevice:
     ) -> None:
         coord = self.__convert_noc0_to_device_coords(noc_id, noc0_x, noc0_y)
         assert coord is not None, f"Invalid NoC0 coordinates: ({noc0_x}, {noc0_y})"
-        try:
-            self.__read_from_device_reg_unaligned_helper(coord, address, buffer, dma_threshold)
-        except TimeoutDeviceRegisterError:
-            raise
-        except Exception:
-            if self._is_simulation or self._is_mmio_capable:
-                raise
-            if util.DEBUG_ENABLED:
-                util.DEBUG(f"Read failed, retrying via ETH reconfiguration:\n{traceback.format_exc()}")
-            self.__configure_working_active_eth()
+        if self.__eth_router is None:
             self.__read_from_device_reg_unaligned_helper(coord, address, buffer, dma_threshold)
+            return
+
+        # Remote device: the router picks the ETH link and fails over if a link breaks.
+        self.__eth_router.run(
+            lambda: self.__read_from_device_reg_unaligned_helper(coord, address, buffer, dma_threshold), len(buffer)
+        )
 
     def __write_to_device_reg_unaligned_helper(
         self,
@@ -302,22 +328,21 @@ class UmdDevice:
     ):
         coord = self.__convert_noc0_to_device_coords(noc_id, noc0_x, noc0_y)
         assert coord is not None, f"Invalid NoC0 coordinates: ({noc0_x}, {noc0_y})"
-        try:
-            self.__write_to_device_reg_unaligned_helper(coord, address, data, dma_threshold)
-        except TimeoutDeviceRegisterError:
-            raise
-        except Exception:
-            if self._is_simulation or self._is_mmio_capable:
-                raise
-            if util.DEBUG_ENABLED:
-                util.DEBUG(f"Write failed, retrying via ETH reconfiguration:\n{traceback.format_exc()}")
-            self.__configure_working_active_eth()
+        if self.__eth_router is None:
             self.__write_to_device_reg_unaligned_helper(coord, address, data, dma_threshold)
+            return
+
+        # Remote device: the router picks the ETH link and fails over if a link breaks.
+        self.__eth_router.run(
+            lambda: self.__write_to_device_reg_unaligned_helper(coord, address, data, dma_threshold), len(data)
+        )
 
     def _update_device_after_sigbus(self, new_device: tt_umd.TTDevice):
         # Device was reset, we did new topology discovery, but we want to reuse the same UmdDevice instance to make it easier for users.
         self.__device = new_device
         self._soc_descriptor = tt_umd.SocDescriptor(new_device)
+        if self.__eth_router is not None:
+            self.__eth_router.invalidate_selection()
 
     def __reinit_device_after_sigbus(self):
         # Device was reset, so we need to reinitialize it. Since this probably hit all devices, we do topology discovery again to be safe.
@@ -440,26 +465,12 @@ class UmdDevice:
             return arc_telemetry_reader.read_entry(telemetry_tag)
 
         try:
-            return do_read(telemetry_tag)
+            return self.__run_remote(lambda: do_read(telemetry_tag))
         except tt_umd.SigbusError:
             if util.DEBUG_ENABLED:
                 util.DEBUG("Reset detected during read_arc_telemetry_entry, reinitializing device and retrying...")
             self.__reinit_device_after_sigbus()
             return self.read_arc_telemetry_entry(noc_id, telemetry_tag)
-        except Exception:
-            if not self._is_mmio_capable:
-                raise
-            try:
-                if util.DEBUG_ENABLED:
-                    util.DEBUG(f"Telemetry read failed, retrying via ETH reconfiguration:\n{traceback.format_exc()}")
-                # TODO: We should retry only if it was remote read error
-                self.__configure_working_active_eth()
-                return do_read(telemetry_tag)
-            except tt_umd.SigbusError:
-                if util.DEBUG_ENABLED:
-                    util.DEBUG("Reset detected during read_arc_telemetry_entry, reinitializing device and retrying...")
-                self.__reinit_device_after_sigbus()
-                return self.read_arc_telemetry_entry(noc_id, telemetry_tag)
 
     def get_firmware_version(self, noc_id: tt_umd.NocId) -> tt_umd.FirmwareBundleVersion:
         """Returns firmware version"""
@@ -470,29 +481,12 @@ class UmdDevice:
             return firmware_info_provider.get_firmware_version()
 
         try:
-            firmware_version = do_read()
+            return self.__run_remote(do_read)
         except tt_umd.SigbusError:
             if util.DEBUG_ENABLED:
                 util.DEBUG("Reset detected during get_firmware_version, reinitializing device and retrying...")
             self.__reinit_device_after_sigbus()
             return self.get_firmware_version(noc_id)
-        except Exception:
-            if not self._is_mmio_capable:
-                raise
-            try:
-                if util.DEBUG_ENABLED:
-                    util.DEBUG(
-                        f"Firmware version read failed, retrying via ETH reconfiguration:\n{traceback.format_exc()}"
-                    )
-                # TODO: We should retry only if it was remote read error
-                self.__configure_working_active_eth()
-                firmware_version = do_read()
-            except tt_umd.SigbusError:
-                if util.DEBUG_ENABLED:
-                    util.DEBUG("Reset detected during get_firmware_version, reinitializing device and retrying...")
-                self.__reinit_device_after_sigbus()
-                return self.get_firmware_version(noc_id)
-        return firmware_version
 
     def get_remote_transfer_eth_core(self) -> tuple[int, int] | None:
         """Returns currently active Ethernet core in logical coordinates"""
@@ -502,6 +496,11 @@ class UmdDevice:
         ):  # pyright: ignore[reportUnnecessaryComparison]  # tt_umd stub claims non-Optional but runtime may return None
             return None
         translated_coord = remote_communication.get_remote_transfer_ethernet_core()
+        return self.__eth_core_to_logical(remote_communication, translated_coord)
+
+    def __eth_core_to_logical(
+        self, remote_communication: tt_umd.RemoteCommunication, translated_coord: tuple[int, int]
+    ) -> tuple[int, int]:
         local_device = remote_communication.get_local_device()
         logical_coord = tt_umd.SocDescriptor(local_device).translate_coord_to(
             tt_umd.CoreCoord(
@@ -511,6 +510,20 @@ class UmdDevice:
         )
         return (logical_coord.x, logical_coord.y)
 
+    def get_remote_transfer_eth_link_stats(self) -> list[dict[str, Any]]:
+        """Returns health and latency statistics of every Ethernet core used for remote transfers, in logical coordinates"""
+        if self.__eth_router is None:
+            return []
+        remote_communication = self.__device.get_remote_communication()
+        link_stats = []
+        for stats in self.__eth_router.stats():
+            link_stat = asdict(stats)
+            link_stat["link"] = self.__eth_core_to_logical(remote_communication, stats.link)
+            # Monotonic time means nothing to a client of the server, so report the remaining quarantine instead.
+            link_stat["quarantine_remaining"] = max(0.0, link_stat.pop("quarantined_until") - time.monotonic())
+            link_stats.append(link_stat)
+        return link_stats
+
     def get_local_tt_device(self) -> tt_umd.TTDevice:
         if self._is_mmio_capable:
             return self.__device
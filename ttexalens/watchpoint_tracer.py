@@ -0,0 +1,317 @@
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""Tracing of memory writes with RISC data watchpoints.
+
+A ``WatchpointTracer`` arms write (or access) watchpoints on the same addresses on many
+RISC cores and polls their debug status. RISCs of one core share the debug interface, so
+they are polled one after another while cores are polled in parallel. A RISC that halted on
+one of the armed watchpoints is recorded (PC, watched address and the value found there)
+and continued right away, which turns the usual ``riscv wchpt``/``cont`` loop into an
+ordered log of who touched an address.
+
+Hits are ordered by the time their halt was observed. Two hits seen in the same sweep on
+different cores happened between two polls, so their relative order is only as precise as
+the polling interval.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+import threading
+import time
+from typing import Iterable
+
+from tabulate import tabulate
+
+from ttexalens import _lib_helpers
+from ttexalens import util
+from ttexalens.background_poller import BackgroundPoller
+from ttexalens.context import Context
+from ttexalens.coordinate import OnChipCoordinate
+from ttexalens.elf import ElfFile, get_frame_callstack
+from ttexalens.exceptions import HardwareError, TTException
+from ttexalens.hardware.risc_debug import RiscDebug, RiscDebugWatchpointState, RiscLocation
+from ttexalens.tt_exalens_lib import parse_elfs
+
+__all__ = [
+    "WatchpointHit",
+    "WatchpointTracer",
+    "start_watchpoint_tracer",
+]
+
+
+@dataclass(frozen=True)
+class WatchpointHit:
+    sequence: int
+    timestamp_ns: int  # time.monotonic_ns() when the halt was observed
+    risc_location: RiscLocation
+    watchpoint_index: int
+    address: int
+    pc: int
+    value: int | None  # little-endian value at address after the hit, None if it could not be read
+    function: str | None  # symbolized PC, None without ELF files
+
+
+class WatchpointTracer(BackgroundPoller):
+    """Arms memory watchpoints on many RISC cores and logs every hit, continuing the core after it.
+
+    Args:
+        risc_debugs (Iterable[RiscDebug]): RISC cores to trace.
+        addresses (Iterable[int]): Addresses to watch, in the RISC address space. One watchpoint is used per address.
+        access (bool, default False): Watch reads as well as writes.
+        elfs (dict[str, list[ElfFile]] | list[ElfFile], optional): ELF files used for symbolization, either one list for all RISCs or a list per RISC name.
+        interval (float, default 0.001): Time between two polling sweeps in seconds.
+        value_size (int, default 4): Number of bytes read at the watched address on a hit.
+        max_workers (int, default 8): Number of threads polling cores.
+    """
+
+    def __init__(
+        self,
+        risc_debugs: Iterable[RiscDebug],
+        addresses: Iterable[int],
+        access: bool = False,
+        elfs: dict[str, list[ElfFile]] | list[ElfFile] | None = None,
+        interval: float = 0.001,
+        value_size: int = 4,
+        max_workers: int = 8,
+    ):
+        self.addresses = list(addresses)
+        if not self.addresses:
+            raise TTException("At least one address must be watched.")
+        super().__init__("Watchpoint tracer", interval, max_workers)
+        self._access = access
+        self._elfs = elfs
+        self._value_size = value_size
+
+        # RISCs of one core share the debug interface, so they are polled together by one worker.
+        self._groups: dict[OnChipCoordinate, list[RiscDebug]] = {}
+        for risc_debug in risc_debugs:
+            if not risc_debug.can_debug():
+                raise TTException(f"RISC {risc_debug.risc_location} does not have debug hardware.")
+            self._groups.setdefault(risc_debug.risc_location.location, []).append(risc_debug)
+        if not self._groups:
+            raise TTException("At least one RISC must be traced.")
+
+        self._saved: dict[RiscLocation, list[tuple[RiscDebugWatchpointState, int]]] = {}
+        self._hits: list[WatchpointHit] = []
+        self._hits_lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+        self._symbol_cache: dict[tuple[str, int], str | None] = {}
+
+    @property
+    def risc_debugs(self) -> list[RiscDebug]:
+        return [risc_debug for group in self._groups.values() for risc_debug in group]
+
+    @property
+    def is_armed(self) -> bool:
+        return bool(self._saved)
+
+    def arm(self) -> None:
+        """Sets watchpoints on all RISCs, remembering the watchpoints they replace."""
+        if self.is_armed:
+            return
+        for risc_debug in self.risc_debugs:
+            states = risc_debug.read_watchpoints_state()
+            if len(self.addresses) > len(states):
+                self.disarm()
+                raise TTException(
+                    f"RISC {risc_debug.risc_location} has {len(states)} watchpoints, {len(self.addresses)} are needed."
+                )
+            self._saved[risc_debug.risc_location] = [
+                (state, risc_debug.read_watchpoint_address(index))
+                for index, state in enumerate(states[: len(self.addresses)])
+            ]
+            for index, address in enumerate(self.addresses):
+                if self._access:
+                    risc_debug.set_watchpoint_on_memory_access(index, address)
+                else:
+                    risc_debug.set_watchpoint_on_memory_write(index, address)
+
+    def disarm(self) -> None:
+        """Restores the watchpoints that were replaced by arm()."""
+        for risc_debug in self.risc_debugs:
+            saved = self._saved.pop(risc_debug.risc_location, None)
+            if saved is None:
+                continue
+            for index, (state, address) in enumerate(saved):
+                if not state.is_enabled:
+                    risc_debug.disable_watchpoint(index)
+                elif state.is_breakpoint:
+                    risc_debug.set_watchpoint_on_pc_address(index, address)
+                elif state.is_access:
+                    risc_debug.set_watchpoint_on_memory_access(index, address)
+                elif state.is_write:
+                    risc_debug.set_watchpoint_on_memory_write(index, address)
+                else:
+                    risc_debug.set_watchpoint_on_memory_read(index, address)
+
+    def _poll_group(self, risc_debugs: list[RiscDebug]) -> list[tuple[int, RiscDebug, int, int, int | None]]:
+        hits: list[tuple[int, RiscDebug, int, int, int | None]] = []
+        for risc_debug in risc_debugs:
+            status = risc_debug.read_status()
+            observed_ns = time.monotonic_ns()
+            if not status.is_halted or not status.is_memory_watchpoint_hit:
+                continue
+            indices = [index for index in range(len(self.addresses)) if status.watchpoints_hit[index]]
+            if not indices:
+                # Halted for a reason that is not ours (ebreak, another watchpoint, halted by user); leave it alone.
+                continue
+            pc = risc_debug.read_gpr(32)
+            for index in indices:
+                value: int | None = None
+                buffer = bytearray(self._value_size)
+                try:
+                    risc_debug.read_memory_bytes(self.addresses[index], buffer)
+                    value = int.from_bytes(buffer, byteorder="little")
+                except TTException as e:
+                    util.WARN(f"Cannot read 0x{self.addresses[index]:08x} on {risc_debug.risc_location}: {e}")
+                hits.append((observed_ns, risc_debug, index, pc, value))
+            risc_debug.cont()
+        return hits
+
+    def poll_once(self) -> list[WatchpointHit]:
+        """Polls all RISCs once, records hits and continues RISCs halted on them. Returns the new hits."""
+        if not self.is_armed:
+            raise TTException("Watchpoints are not armed.")
+        with self._poll_lock:
+            results = self._map(self._poll_group, self._groups.values())
+            raw_hits = sorted((hit for result in results for hit in result), key=lambda hit: hit[0])
+            with self._hits_lock:
+                new_hits = [
+                    WatchpointHit(
+                        len(self._hits) + i,
+                        observed_ns,
+                        risc_debug.risc_location,
+                        index,
+                        self.addresses[index],
+                        pc,
+                        value,
+                        self.symbolize(risc_debug.risc_location.risc_name, pc),
+                    )
+                    for i, (observed_ns, risc_debug, index, pc, value) in enumerate(raw_hits)
+                ]
+                self._hits.extend(new_hits)
+                self._sweep_count += 1
+            return new_hits
+
+    def _sweep(self) -> list[WatchpointHit]:
+        return self.poll_once()
+
+    def _on_start(self) -> None:
+        # Watchpoints are armed before polling starts on the background thread.
+        self.arm()
+
+    def _on_stop(self) -> None:
+        # Continues RISCs that hit a watchpoint since the last sweep and restores the replaced watchpoints.
+        try:
+            if self.is_armed and self._error is None:
+                # A RISC that hit a watchpoint after the last sweep would otherwise stay halted.
+                self.poll_once()
+        except HardwareError as e:
+            util.WARN(f"Final watchpoint tracer sweep failed: {e}")
+        finally:
+            self.disarm()
+
+    def _elfs_for(self, risc_name: str) -> list[ElfFile]:
+        if self._elfs is None:
+            return []
+        if isinstance(self._elfs, dict):
+            return self._elfs.get(risc_name, [])
+        return self._elfs
+
+    def symbolize(self, risc_name: str, pc: int) -> str | None:
+        """Returns ``function (file:line)`` of the innermost frame at ``pc``, or None if it is not known."""
+        key = (risc_name, pc)
+        if key not in self._symbol_cache:
+            elfs = self._elfs_for(risc_name)
+            entries = get_frame_callstack(elfs, pc, False) if elfs else []
+            symbol = None
+            if entries and entries[0].function_name:
+                symbol = entries[0].function_name
+                if entries[0].file_info is not None:
+                    symbol += f" ({entries[0].file_info.file}:{entries[0].file_info.line})"
+            self._symbol_cache[key] = symbol
+        return self._symbol_cache[key]
+
+    def hits(self, address: int | None = None, risc_location: RiscLocation | None = None) -> list[WatchpointHit]:
+        """Returns recorded hits in order, optionally only those of one address or one RISC."""
+        with self._hits_lock:
+            hits = list(self._hits)
+        return [
+            hit
+            for hit in hits
+            if (address is None or hit.address == address)
+            and (risc_location is None or hit.risc_location == risc_location)
+        ]
+
+    def hits_table(self, hits: list[WatchpointHit] | None = None) -> str:
+        """Returns ``hits`` (all by default) as a table, with times relative to the first recorded hit."""
+        hits = hits if hits is not None else self.hits()
+        with self._hits_lock:
+            start_ns = self._hits[0].timestamp_ns if self._hits else 0
+        rows = [
+            [
+                hit.sequence,
+                f"+{(hit.timestamp_ns - start_ns) / 1e6:.3f}ms",
+                hit.risc_location.location.to_user_str(),
+                hit.risc_location.risc_name,
+                f"0x{hit.address:08x}",
+                f"0x{hit.pc:08x}",
+                f"0x{hit.value:0{2 * self._value_size}x}" if hit.value is not None else "?",
+                hit.function or "",
+            ]
+            for hit in hits
+        ]
+        headers = ["#", "Time", "Location", "RISC", "Address", "PC", "Value", "Function"]
+        return tabulate(rows, headers=headers, disable_numparse=True)
+
+
+@_lib_helpers.trace_api
+def start_watchpoint_tracer(
+    locations: list[str | OnChipCoordinate],
+    addresses: list[int] | int,
+    risc_names: list[str] | None = None,
+    access: bool = False,
+    elfs: dict[str, list[str | ElfFile]] | list[str | ElfFile] | str | ElfFile | None = None,
+    interval: float = 0.001,
+    device_id: int = 0,
+    context: Context | None = None,
+    max_workers: int = 8,
+) -> WatchpointTracer:
+    """
+    Arms write (or access) watchpoints on many RISC cores and logs every hit on a background thread, continuing
+    the core after each hit. Call stop() on the returned tracer (or use it as a context manager) to end tracing
+    and restore the watchpoints that were replaced.
+
+    Args:
+        locations (list[str | OnChipCoordinate]): Cores to trace, given as strings or OnChipCoordinate objects.
+        addresses (list[int] | int): Addresses to watch, in the RISC address space.
+        risc_names (list[str], optional): RISC cores to trace (e.g. "brisc", "trisc0"). If None, all RISCs with debug hardware are traced.
+        access (bool, default False): Watch reads as well as writes.
+        elfs (dict[str, list[str | ElfFile]] | list[str | ElfFile] | str | ElfFile, optional): ELF files used for symbolization, either for all RISCs or per RISC name.
+        interval (float, default 0.001): Time between two polling sweeps in seconds.
+        device_id (int, default 0): ID of the device the locations refer to.
+        context (Context, optional): TTExaLens context object used for interaction with device. If None, global context is used and potentially initialized.
+        max_workers (int, default 8): Number of threads polling cores.
+
+    Returns:
+        WatchpointTracer: Running tracer that exposes the ordered log of hits.
+    """
+    context = _lib_helpers.check_context(context)
+    coordinates = [_lib_helpers.convert_coordinate(location, device_id, context) for location in locations]
+    addresses = [addresses] if isinstance(addresses, int) else addresses
+    for address in addresses:
+        _lib_helpers.validate_addr(address)
+    names = [risc_name.lower() for risc_name in risc_names] if risc_names is not None else None
+    risc_debugs = [
+        risc_debug
+        for coordinate in coordinates
+        for risc_debug in coordinate.noc_block.all_riscs
+        if (names is None or risc_debug.risc_location.risc_name.lower() in names) and risc_debug.can_debug()
+    ]
+    parsed_elfs: dict[str, list[ElfFile]] | list[ElfFile] | None = None
+    if isinstance(elfs, dict):
+        parsed_elfs = {risc_name.lower(): parse_elfs(risc_elfs, None, context) for risc_name, risc_elfs in elfs.items()}
+    elif elfs is not None:
+        parsed_elfs = parse_elfs(elfs, None, context)
+    return WatchpointTracer(risc_debugs, addresses, access, parsed_elfs, interval, max_workers=max_workers).start()